@@ -1,13 +1,28 @@
-from PyQt5.QtWidgets import QFileDialog, QVBoxLayout, QMessageBox, QSlider, QLabel
+from PyQt5.QtWidgets import QApplication, QFileDialog, QVBoxLayout, QMessageBox, QSlider, QLabel, QCheckBox, QProgressDialog
 from PyQt5.QtCore import QSettings, Qt
 import numpy as np
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from scipy.signal import savgol_filter, find_peaks
-from scipy.interpolate import interp1d, splrep, BSpline
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 import os
 
-from app.select_calibration_tab import preset_lib
+from app.reference_profiles import preset_lib
+from app.disk_cache import DEFAULT_CACHE_ROOT, DiskCache, hash_key
+from app import pipeline
+from app.pipeline import PipelineError, PipelineParameters
+from app.alignment_engine import (
+    DEFAULT_MEMORY_BUDGET_MB,
+    NearestIndex,
+    apply_lin_offset,
+    apply_parameters_to_data,
+    closest_pxls,
+    differentiate_for_peak_finding,
+    fine_quality_batch,
+    finealign_profiles_via_spline_matching,
+    find_step_pos,
+    nearest_reference,
+)
 import numpy as np  # kept as in your original file
 
 
@@ -48,6 +63,8 @@ class AlignmentTab:
         self.Y_c = np.array([])      # Calibration Y data
         self.X_data = np.array([])   # Measurement X data 
         self.Y_data = np.array([])   # Measurement Y data
+        self._measurement_index = None
+        self._measurement_index_source = None
 
         self.cal_is_flipped = False
         self.data_is_flipped = False
@@ -70,6 +87,21 @@ class AlignmentTab:
         self.G_alignment_filterorder = 1      # Savgol filter polynomial order
         self.G_alignment_increase_searcharea = False
         self.G_stretch_allowed_window = [-5, 5]
+        self.G_alignment_memory_budget_mb = DEFAULT_MEMORY_BUDGET_MB  # Working-set cap of the rough search
+        self.G_alignment_search_mode = "dense"  # "dense", "pyramid" (coarse-to-fine) or "fft" (cross-correlation)
+        self.G_alignment_pyramid_levels = 3     # Number of pyramid levels (stride 4**(levels-1) on the coarsest, fewer on small grids)
+        self.G_alignment_pyramid_keep = 8       # Regions refined per pyramid level
+        self.G_alignment_nms_radius_m = 2       # Stretch rows suppressed around each fine-alignment candidate
+        self.G_alignment_nms_radius_t = 2       # Shift columns suppressed around each fine-alignment candidate
+        self.G_alignment_refine = False         # Sub-grid Nelder-Mead refinement after the fine alignment
+        self.G_alignment_refine_max_evals = 60  # Objective evaluations allowed for the refinement
+        self.G_alignment_fine_workers = os.cpu_count() or 1  # Processes evaluating fine-alignment candidates
+        self.fine_pool = None
+        self.G_alignment_cache_enabled = True  # Reuse rough/fine results of identical inputs across runs
+        self.G_alignment_cache_dir = os.path.join(DEFAULT_CACHE_ROOT, "alignment_cache")
+        self.G_alignment_cache_max_mb = 512
+        self.alignment_cache = DiskCache(self.G_alignment_cache_dir, self.G_alignment_cache_max_mb * 1024 * 1024)
+        self.last_rough_key = None  # key of the last rough alignment, the fine cache keys build on it
 
         print(
             "Alignment parameters initialized: t_res=%d, m_res=%d, filterwidth=%d, "
@@ -209,6 +241,42 @@ class AlignmentTab:
             print(f"Error: {e}. Ensure Increase_Search_area_checkbox exists in UI.")
             raise SystemExit(1)
 
+        # Pyramid (coarse-to-fine) rough search toggle, placed next to the search-area checkbox
+        try:
+            self.pyramid_search_checkbox = QCheckBox("Pyramid search", self.ui.Increase_Search_area_checkbox.parent())
+            checkbox_rect = self.ui.Increase_Search_area_checkbox.geometry()
+            self.pyramid_search_checkbox.setGeometry(checkbox_rect.x() + 100, checkbox_rect.y(), 150, checkbox_rect.height())
+            self.pyramid_search_checkbox.setToolTip(
+                "Evaluate a coarse grid first and refine only the best regions (much faster for high resolutions)"
+            )
+            self.pyramid_search_checkbox.stateChanged.connect(lambda state: self.update_search_mode(state, "pyramid"))
+            print("pyramid_search_checkbox connected")
+
+            self.fft_search_checkbox = QCheckBox("FFT search", self.ui.Increase_Search_area_checkbox.parent())
+            self.fft_search_checkbox.setGeometry(checkbox_rect.x() + 250, checkbox_rect.y(), 120, checkbox_rect.height())
+            self.fft_search_checkbox.setToolTip(
+                "Compute all shifts of a stretch at once by FFT cross-correlation (linear instead of nearest sampling)"
+            )
+            self.fft_search_checkbox.stateChanged.connect(lambda state: self.update_search_mode(state, "fft"))
+            print("fft_search_checkbox connected")
+        except AttributeError as e:
+            print(f"Error: {e}. Ensure Increase_Search_area_checkbox exists in UI.")
+            raise SystemExit(1)
+
+        # Sub-grid refinement toggle, placed next to the start button
+        try:
+            self.refine_alignment_checkbox = QCheckBox("Sub-grid refinement", self.ui.start_alignment_button.parent())
+            button_rect = self.ui.start_alignment_button.geometry()
+            self.refine_alignment_checkbox.setGeometry(button_rect.x() + button_rect.width() + 20, button_rect.y() + 3, 180, 24)
+            self.refine_alignment_checkbox.setToolTip(
+                "Refine the best fine-alignment result between grid nodes (Nelder-Mead, within one grid step)"
+            )
+            self.refine_alignment_checkbox.stateChanged.connect(self.update_refine)
+            print("refine_alignment_checkbox connected")
+        except AttributeError as e:
+            print(f"Error: {e}. Ensure start_alignment_button exists in UI.")
+            raise SystemExit(1)
+
         try:
             self.ui.Search_resol_shift_lineedit.textChanged.connect(self.update_resolution_t)
             self.ui.Search_resol_Stretch_lineedit.textChanged.connect(self.update_resolution_m)
@@ -297,6 +365,25 @@ class AlignmentTab:
         self.G_alignment_increase_searcharea = bool(state)
         print("G_alignment_increase_searcharea updated to: %s" % self.G_alignment_increase_searcharea)
 
+    def update_search_mode(self, state, source="pyramid"):
+        # Pyramid and FFT search exclude each other: the box just ticked wins
+        if state and source == "fft":
+            self.pyramid_search_checkbox.setChecked(False)
+        elif state and source == "pyramid":
+            self.fft_search_checkbox.setChecked(False)
+
+        if self.fft_search_checkbox.isChecked():
+            self.G_alignment_search_mode = "fft"
+        elif self.pyramid_search_checkbox.isChecked():
+            self.G_alignment_search_mode = "pyramid"
+        else:
+            self.G_alignment_search_mode = "dense"
+        print("G_alignment_search_mode updated to: %s" % self.G_alignment_search_mode)
+
+    def update_refine(self, state):
+        self.G_alignment_refine = bool(state)
+        print("G_alignment_refine updated to: %s" % self.G_alignment_refine)
+
     def update_resolution_t(self, text):
         try:
             self.G_alignment_resolution_t = int(float(text))
@@ -383,84 +470,17 @@ class AlignmentTab:
         idx = np.argmin(np.abs(X - value))
         return idx, X[idx]
 
+    def get_closest_pxls_to_values(self, X, values):
+        """Vectorised get_closest_pxl_to_value: nearest indices in X for all values."""
+        return closest_pxls(X, values)
+
     def apply_parameters_to_data(self, X, Y, borders, is_flipped):
         """Apply borders and flip parameters to data."""
-        # print(f"Applying parameters: borders={borders}, is_flipped={is_flipped}")
-
-        X_out, Y_out = X.copy(), Y.copy()
-
-        borders_i = [
-            int(self.get_closest_pxl_to_value(X_out, borders[0])[0]),
-            int(self.get_closest_pxl_to_value(X_out, borders[1])[0]),
-        ]
-        borders_i = sorted(borders_i)
-
-        if borders_i[0] >= len(X_out) or borders_i[1] >= len(X_out):
-            print("Warning: Border indices out of range")
-            return X_out, Y_out
-
-        X_out = X_out[borders_i[0] : borders_i[1] + 1]
-        Y_out = Y_out[borders_i[0] : borders_i[1] + 1]
-
-        if is_flipped:
-            X_out = X_out[::-1]
-            Y_out = Y_out[::-1]
-            # print(f"Data flipped: X range {np.min(X_out):.3f} to {np.max(X_out):.3f}, Y range {np.min(Y_out):.3f} to {np.max(Y_out):.3f}")
-
-        # print(f"X_out range: {np.min(X_out):.3f} to {np.max(X_out):.3f}, Y_out shape: {Y_out.shape}")
-        return X_out, Y_out
+        return apply_parameters_to_data(X, Y, borders, is_flipped)
 
     def apply_lin_offset(self, X_cal, Y_cal, X_dat, Y_dat, m, t):
         """Apply linear offset to align X_cal and X_dat ranges."""
-        # print(f"Applying lin offset: m={m:.3f}, t={t:.3f}, ...")
-        X_cal = m * X_cal + t
-
-        X_dat_low_to_high = np.sign(X_dat[0] - X_dat[-1]) == -1
-        X_cal_low_to_high = np.sign(X_cal[0] - X_cal[-1]) == -1
-
-        if np.min(X_cal) > np.min(X_dat):
-            cutoff_pxl = int(self.get_closest_pxl_to_value(X_dat, np.min(X_cal))[0])
-            if X_dat_low_to_high:
-                X_dat = X_dat[cutoff_pxl:]
-                Y_dat = Y_dat[cutoff_pxl:]
-            else:
-                X_dat = X_dat[:cutoff_pxl]
-                Y_dat = Y_dat[:cutoff_pxl]
-                X_dat = X_dat[::-1]
-                Y_dat = Y_dat[::-1]
-        else:
-            cutoff_pxl = int(self.get_closest_pxl_to_value(X_cal, np.min(X_dat))[0])
-            if X_cal_low_to_high:
-                X_cal = X_cal[cutoff_pxl:]
-                Y_cal = Y_cal[cutoff_pxl:]
-            else:
-                X_cal = X_cal[:cutoff_pxl]
-                Y_cal = Y_cal[:cutoff_pxl]
-                X_cal = X_cal[::-1]
-                Y_cal = Y_cal[::-1]
-
-        if np.max(X_cal) < np.max(X_dat):
-            cutoff_pxl = int(self.get_closest_pxl_to_value(X_dat, np.max(X_cal))[0]) + 1
-            if X_dat_low_to_high:
-                X_dat = X_dat[:cutoff_pxl]
-                Y_dat = Y_dat[:cutoff_pxl]
-            else:
-                X_dat = X_dat[cutoff_pxl:]
-                Y_dat = Y_dat[cutoff_pxl:]
-                X_dat = X_dat[::-1]
-                Y_dat = Y_dat[::-1]
-        else:
-            cutoff_pxl = int(self.get_closest_pxl_to_value(X_cal, np.max(X_dat))[0]) + 1
-            if X_cal_low_to_high:
-                X_cal = X_cal[:cutoff_pxl]
-                Y_cal = Y_cal[:cutoff_pxl]
-            else:
-                X_cal = X_cal[cutoff_pxl:]
-                Y_cal = Y_cal[cutoff_pxl:]
-                X_cal = X_cal[::-1]
-                Y_cal = Y_cal[::-1]
-
-        return X_cal, Y_cal, X_dat, Y_dat
+        return apply_lin_offset(X_cal, Y_cal, X_dat, Y_dat, m, t)
 
     # =========================================================================
     # State resets
@@ -693,20 +713,7 @@ class AlignmentTab:
 
     def differentiate_for_peak_finding(self, test_data, filterwidth):
         """Differentiate data for peak finding, with optional smoothing."""
-        if filterwidth != 0:
-            test_data = savgol_filter(test_data, 1 + filterwidth * 2, 1)
-        test_data = np.diff(test_data, 1)
-        non_zero = test_data[np.where(test_data != 0)]
-        if non_zero.size == 0:
-            print("PyQt - Warning: All derivatives are zero, returning zeros")
-            return np.zeros_like(test_data)
-        test_data = test_data / np.min(np.abs(non_zero))
-        test_data = np.abs(test_data)
-        print(
-            "PyQt - differentiate_for_peak_finding: test_data shape=%s, min=%.3f, max=%.3f"
-            % (test_data.shape, np.min(test_data), np.max(test_data))
-        )
-        return test_data
+        return differentiate_for_peak_finding(test_data, filterwidth)
 
     def find_step_pos(self, X, Y, Mode="automatic Mode", fixed_filterwidth=None, variable_set="Alignment"):
         step_dist = self.main_window.select_calibration_tab.G_step_distance
@@ -730,49 +737,74 @@ class AlignmentTab:
             print("PyQt - Error: Missing step_dist or step_num for %s in %s" % (cal_name, preset_key))
             return None
 
-        x_interval = np.abs(X[-1] - X[0])
-        if x_interval == 0:
-            print("PyQt - Error: X range is zero, cannot compute steps")
-            return None
+        return find_step_pos(X, Y, step_dist, step_num, fixed_filterwidth)
 
-        step_distance_pxls = max(1, int(step_dist / x_interval * X.size))
-        print(
-            "PyQt - Step detection: filterwidth=%s, step_dist=%s, step_num=%s, x_interval=%.3f, step_distance_pxls=%d"
-            % (fixed_filterwidth, step_dist, step_num, x_interval, step_distance_pxls)
+    # =========================================================================
+    # Rough alignment
+    # =========================================================================
+
+    def rough_cache_key(self, X_cal, Y_cal, X_dat, Y_dat, G_stretch_allowed_window):
+        """Cache key of a rough alignment: trimmed profiles plus every parameter the search depends on."""
+        select_tab = self.main_window.select_calibration_tab
+        return hash_key(
+            "rough-v1", X_cal, Y_cal, X_dat, Y_dat, list(G_stretch_allowed_window),
+            self.G_alignment_resolution_t, self.G_alignment_resolution_m,
+            self.G_alignment_filterwidth, self.G_alignment_filterorder,
+            bool(self.G_alignment_increase_searcharea), self.G_alignment_search_mode,
+            self.G_alignment_pyramid_levels, self.G_alignment_pyramid_keep,
+            select_tab.G_step_distance, select_tab.G_number_of_steps,
         )
 
-        test_data = self.differentiate_for_peak_finding(Y, fixed_filterwidth)
-        height_threshold = np.percentile(test_data, 10) if np.max(test_data) > 0 else 1
-        peaks, properties = find_peaks(test_data, distance=step_distance_pxls, height=height_threshold)
-        peak_pos_pxls = peaks.tolist()
-        peak_height = properties['peak_heights'].tolist()
-
-        if len(peak_pos_pxls) < (step_num - 1):
-            print("PyQt - Warning: Found %d peaks, expected %d, retrying with smoothing" % (len(peak_pos_pxls), (step_num - 1)))
-            test_data = self.differentiate_for_peak_finding(Y, filterwidth=1)
-            peaks, properties = find_peaks(test_data, distance=step_distance_pxls, height=height_threshold)
-            peak_pos_pxls = peaks.tolist()
-            peak_height = properties['peak_heights'].tolist()
-
-        if len(peak_pos_pxls) < (step_num - 1):
-            print("PyQt - Warning: Still found %d peaks, using fallback" % len(peak_pos_pxls))
-            total_width = min(x_interval, step_dist * (step_num - 1))
-            start = X[0] + step_dist / 2
-            end = X[0] + total_width
-            peak_pos = np.linspace(start, end, step_num - 1)
-        else:
-            while len(peak_pos_pxls) > (step_num - 1):
-                smallest_peak = peak_height.index(min(peak_height))
-                del peak_height[smallest_peak]
-                del peak_pos_pxls[smallest_peak]
-            peak_pos = X[peak_pos_pxls]
+    def fine_cache_key(self, problem):
+        """Cache key of a fine alignment: the rough result it starts from, the trimmed profiles and the fine settings."""
+        return hash_key(
+            "fine-v2", self.last_rough_key, problem.X_cal, problem.Y_cal, problem.X_dat, problem.Y_dat,
+            problem.X_ref, problem.Y_ref,
+            problem.step_dist, problem.step_num, bool(problem.descending),
+            self.G_alignment_fine_iterations, self.G_alignment_nms_radius_m, self.G_alignment_nms_radius_t,
+            bool(self.G_alignment_refine), self.G_alignment_refine_max_evals,
+        )
 
-        print("PyQt - Steps found: %d, positions=%s..." % (len(peak_pos), peak_pos[:min(len(peak_pos), 5)]))
-        return peak_pos
+    def pipeline_parameters(self, G_stretch_allowed_window=None):
+        """Collect the G_* settings of all tabs into the parameter object of the headless pipeline."""
+        select_tab = self.main_window.select_calibration_tab
+        if G_stretch_allowed_window is None:
+            G_stretch_allowed_window = [self.ui.minStretch_slider.value(), self.ui.MaxStretch_slider.value()]
+        return PipelineParameters(
+            step_distance=select_tab.G_step_distance,
+            number_of_steps=select_tab.G_number_of_steps,
+            cal_setting=select_tab.G_cal_setting,
+            dopant_type=getattr(select_tab, "G_dopant_type", "B"),
+            borders_cal=self.borders_cal,
+            cal_is_flipped=self.cal_is_flipped,
+            borders_data=self.borders_data,
+            data_is_flipped=self.data_is_flipped,
+            stretch_window=list(G_stretch_allowed_window),
+            resolution_t=self.G_alignment_resolution_t,
+            resolution_m=self.G_alignment_resolution_m,
+            filterwidth=self.G_alignment_filterwidth,
+            filterorder=self.G_alignment_filterorder,
+            increase_searcharea=bool(self.G_alignment_increase_searcharea),
+            search_mode=self.G_alignment_search_mode,
+            pyramid_levels=self.G_alignment_pyramid_levels,
+            pyramid_keep=self.G_alignment_pyramid_keep,
+            memory_budget_mb=self.G_alignment_memory_budget_mb,
+            workers=self.G_alignment_fine_workers,
+            fine_iterations=self.G_alignment_fine_iterations,
+            nms_radius_m=self.G_alignment_nms_radius_m,
+            nms_radius_t=self.G_alignment_nms_radius_t,
+            refine=bool(self.G_alignment_refine),
+            refine_max_evals=self.G_alignment_refine_max_evals,
+        )
 
-    # =========================================================================
-    # Rough alignment
-    # =========================================================================
+    def compute_rough_quality(self, X_cal, Y_cal, X_dat, Y_dat, G_stretch_allowed_window):
+        """Rough alignment quality surface of the trimmed profiles: (quality, t_arr, m_arr) or None."""
+        try:
+            return pipeline.rough_alignment(X_cal, Y_cal, X_dat, Y_dat, self.pipeline_parameters(G_stretch_allowed_window))
+        except PipelineError as e:
+            print("PyQt - Error: %s Aborting rough plot" % e)
+            QMessageBox.critical(self.main_window, "Error", str(e))
+            return None
 
     def redraw_rough_plot(self):
         """Redraw the rough alignment heatmap and update result labels."""
@@ -801,53 +833,23 @@ class AlignmentTab:
             print("PyQt - Calibration sample: %s" % cal_name)
             self.cal_name = cal_name
 
-            steps_c = self.find_step_pos(X_cal, Y_cal, Mode="automatic Mode", fixed_filterwidth=0, variable_set="Alignment")
-            if steps_c is None:
-                print("PyQt - Error: No steps found, aborting rough plot")
-                return
-            print("PyQt - Calibration steps: %d, positions=%s..." % (len(steps_c), steps_c[:min(len(steps_c), 5)]))
-
             G_stretch_allowed_window = [self.ui.minStretch_slider.value(), self.ui.MaxStretch_slider.value()]
             print("PyQt - G_stretch_allowed_window (from sliders): %s" % G_stretch_allowed_window)
-            print("PyQt - G_alignment_increase_searcharea: %s" % self.G_alignment_increase_searcharea)
 
-            if self.G_alignment_increase_searcharea:
-                t_min = np.min((np.min(X_dat) - np.max(X_cal)) / (np.array(G_stretch_allowed_window) / 100 + 1))
-                t_max = np.max((np.max(X_dat) - np.min(X_cal)) / (np.array(G_stretch_allowed_window) / 100 + 1))
+            rough_key = self.rough_cache_key(X_cal, Y_cal, X_dat, Y_dat, G_stretch_allowed_window)
+            cached = self.alignment_cache.get(rough_key) if self.G_alignment_cache_enabled else None
+            if cached is not None:
+                quality, t_arr, m_arr = cached["quality"], cached["t_arr"], cached["m_arr"]
+                print("PyQt - Rough alignment restored from cache (%s)" % rough_key[:12])
             else:
-                t_min = np.min((np.min(X_dat) - np.min(steps_c)) / (np.array(G_stretch_allowed_window) / 100 + 1))
-                t_max = np.max((np.max(X_dat) - np.max(steps_c)) / (np.array(G_stretch_allowed_window) / 100 + 1))
-                if t_max < t_min:
-                    t_max, t_min = min(t_min, t_max), max(t_min, t_max)
-            print("PyQt - Shift range: t_min=%.3f, t_max=%.3f" % (t_min, t_max))
-
-            t_arr = np.linspace(t_min, t_max, self.G_alignment_resolution_t)
-            m_arr = np.linspace(*G_stretch_allowed_window, self.G_alignment_resolution_m) / 100 + 1
-            print("PyQt - t_arr range: %.3f to %.3f, length=%d" % (t_arr[0], t_arr[-1], len(t_arr)))
-            print("PyQt - m_arr range: %.3f to %.3f, length=%d" % (m_arr[0], m_arr[-1], len(m_arr)))
-            print("PyQt - G_alignment_resolution_t: %d, G_alignment_resolution_m: %d" % (self.G_alignment_resolution_t, self.G_alignment_resolution_m))
-
-            mx_arr = np.einsum('i,j->ij', m_arr, steps_c)
-            mxt_arr = np.expand_dims(mx_arr, 1) + t_arr[None, :, None]
-            try:
-                Y_input = np.abs(savgol_filter(np.diff(Y_dat), self.G_alignment_filterwidth, self.G_alignment_filterorder))
-                print("PyQt - Y_input (filtered gradient) shape=%s, min=%.3f, max=%.3f, mean=%.3f" % (Y_input.shape, np.min(Y_input), np.max(Y_input), np.mean(Y_input)))
-            except Exception as e:
-                print("PyQt - Error in savgol_filter: %s" % e)
-                QMessageBox.critical(self.main_window, "Error", "Filtering failed. Adjust filter parameters.")
-                return
-
-            multi = (np.max(mxt_arr) - np.min(mxt_arr)) / (np.max(X_dat) - np.min(X_dat))
-            X_search = np.linspace(np.min(mxt_arr), np.max(mxt_arr), int(X_dat.size * multi))
-            Y_interp = interp1d(X_dat[:-1] + (X_dat[1] - X_dat[0]) / 2, Y_input, kind='linear', bounds_error=False, fill_value=0)
-            Y_search = Y_interp(X_search)
-            print("PyQt - X_search range: %.3f to %.3f, Y_search shape=%s, min=%.3f, max=%.3f" % (np.min(X_search), np.max(X_search), Y_search.shape, np.min(Y_search), np.max(Y_search)))
-
-            X_idx = np.searchsorted(X_search, mxt_arr, side='left')
-            X_idx -= (X_search[X_idx] - mxt_arr) > (mxt_arr - X_search[X_idx - 1])
-            X_idx[X_idx < 0] = 0
-            quality = np.sum(Y_search[X_idx], axis=2)
-            print("PyQt - Quality matrix shape: %s, min=%.7f, max=%.3f, mean=%.3f" % (quality.shape, np.min(quality), np.max(quality), np.mean(quality)))
+                result = self.compute_rough_quality(X_cal, Y_cal, X_dat, Y_dat, G_stretch_allowed_window)
+                if result is None:
+                    return
+                quality, t_arr, m_arr = result
+                if self.G_alignment_cache_enabled:
+                    self.alignment_cache.put(rough_key, {"quality": quality, "t_arr": t_arr, "m_arr": m_arr})
+            self.last_rough_key = rough_key
+            t_min, t_max = t_arr[0], t_arr[-1]
 
             optimal_t = np.mean(t_arr[np.where(quality == np.max(quality))[1]])
             optimal_m = np.mean(m_arr[np.where(quality == np.max(quality))[0]])
@@ -895,14 +897,16 @@ class AlignmentTab:
             self.canvas_rough.draw_idle()
             print("PyQt - Rough plot drawn")
 
+    def measurement_index(self):
+        """Nearest-index lookup of the measurement X axis, rebuilt only when X_data changes."""
+        if self._measurement_index_source is not self.X_data:
+            self._measurement_index = NearestIndex(self.X_data)
+            self._measurement_index_source = self.X_data
+        return self._measurement_index
+
     def ref(self, X_cal):
         """Map X_cal to corresponding Y_dat values using nearest-neighbor matching."""
-        X_dat = self.X_data
-        Y_dat = self.Y_data
-        R = np.zeros(X_cal.shape)
-        for i in range(X_cal.shape[0]):
-            R[i] = Y_dat[np.argmin(np.abs(X_cal[i] - X_dat))]
-        return R
+        return nearest_reference(X_cal, self.X_data, self.Y_data, self.measurement_index())
 
     def estimate_plateaus(self, X, Y, plot_plateau=True, variable_set="Alignment"):
         """Estimate plateau positions for red bars."""
@@ -935,114 +939,99 @@ class AlignmentTab:
     # Fine alignment
     # =========================================================================
 
+    def fine_alignment_problem(self, X_cal, Y_cal, X_dat, Y_dat):
+        """Bundle the trimmed profiles and step settings for the fine alignment engine."""
+        return pipeline.fine_alignment_problem(X_cal, Y_cal, X_dat, Y_dat, self.X_data, self.Y_data, self.pipeline_parameters())
+
     def finealign_profiles_via_spline_matching(self, X_cal, Y_cal, X_dat, Y_dat, m, t, plot=False):
         """Perform fine alignment using spline matching, return quality score or plot."""
-        arr_factor = 5
-        window_param = 51
-        window_order = 1
-        inter_s = 0.5
-        inter_k = 2
-
-        X_cal, Y_cal, X_dat, Y_dat = self.apply_lin_offset(X_cal, Y_cal, X_dat, Y_dat, m, t)
-
-        X_plateaus_cal, step_pos = self.estimate_plateaus(X_cal, Y_cal, plot_plateau=False, variable_set="Alignment")
-        Y_plateaus_cal = [Y_cal[self.get_closest_pxl_to_value(X_cal, i)[0]] for i in X_plateaus_cal]
-        X_plateaus_cal = [X_cal[self.get_closest_pxl_to_value(Y_cal, i)[0]] for i in Y_plateaus_cal]
-        X_plateaus_dat = [X_dat[self.get_closest_pxl_to_value(X_dat, i)[0]] for i in X_plateaus_cal]
-        Y_plateaus_dat = [Y_dat[self.get_closest_pxl_to_value(X_dat, i)[0]] for i in X_plateaus_dat]
-
-        if self.main_window.select_calibration_tab.G_cal_setting == 1:
-            plateau_order = sorted(range(len(Y_plateaus_cal)), key=lambda k: Y_plateaus_cal[k])[::-1]
-        else:
-            plateau_order = sorted(range(len(Y_plateaus_cal)), key=lambda k: Y_plateaus_cal[k])
-
-        Y_plateaus_cal = [Y_plateaus_cal[i] for i in plateau_order]
-        Y_plateaus_dat = [Y_plateaus_dat[i] for i in plateau_order]
+        problem = self.fine_alignment_problem(X_cal, Y_cal, X_dat, Y_dat)
+        if not plot:
+            return finealign_profiles_via_spline_matching(problem, m, t)
 
-        my_data = np.c_[self.ref(X_cal), Y_cal]
-        my_data = my_data[my_data[:, 0].argsort()]
-
-        x_spaced = np.linspace(my_data[0, 0], my_data[-1, 0], my_data.shape[0] * arr_factor)
-        y_spaced = np.zeros(x_spaced.shape)
-        for i in range(x_spaced.size):
-            closest_idx = np.sort(np.argsort(np.abs(x_spaced[i] - my_data[:, 0]))[:2])
-            if np.diff(my_data[:, 0][closest_idx]) == 0:
-                y_spaced[i] = my_data[closest_idx[0], 1]
-            else:
-                y_spaced[i] = np.interp(x_spaced[i], my_data[:, 0][closest_idx], my_data[:, 1][closest_idx])
-
-        y_spaced = savgol_filter(y_spaced, window_param, window_order)
-
-        diff_left = []
-        diff_right = []
-        for i in range(len(Y_plateaus_dat) - 1):
-            slice_point_left = np.argmin(np.abs(Y_plateaus_dat[i] - x_spaced))
-            slice_point_right = np.argmin(np.abs(Y_plateaus_dat[i + 1] - x_spaced))
-            if slice_point_right == slice_point_left:
-                diff_left.append(np.min(Y_cal))
-                diff_right.append(np.max(Y_cal))
-                break
-            elif slice_point_right < slice_point_left:
-                slice_point_right, slice_point_left = slice_point_left, slice_point_right
-
-            if slice_point_right - slice_point_left < 3:
-                if slice_point_right - slice_point_left < 2:
-                    try:
-                        slice_point_left -= 1
-                        tck = splrep(
-                            x_spaced[slice_point_left:slice_point_right],
-                            y_spaced[slice_point_left:slice_point_right],
-                            s=inter_s,
-                            k=1,
-                        )
-                    except:
-                        slice_point_left += 1
-                        slice_point_right += 1
-                    tck = splrep(
-                        x_spaced[slice_point_left:slice_point_right],
-                        y_spaced[slice_point_left:slice_point_right],
-                        s=inter_s,
-                        k=1,
-                    )
-                else:
-                    tck = splrep(
-                        x_spaced[slice_point_left:slice_point_right],
-                        y_spaced[slice_point_left:slice_point_right],
-                        s=inter_s,
-                        k=1,
-                    )
-            else:
-                tck = splrep(
-                    x_spaced[slice_point_left:slice_point_right],
-                    y_spaced[slice_point_left:slice_point_right],
-                    s=inter_s,
-                    k=inter_k,
-                )
-
-            spline = BSpline(*tck)(x_spaced[slice_point_left:slice_point_right])
-            diff_left.append(np.diff(spline)[0])
-            diff_right.append(np.diff(spline)[-1])
-
-            if plot:
-                ax = self.figure_fine.gca()
-                ax.plot(x_spaced[slice_point_left:slice_point_right], spline, ls="--", color="r", lw=2)
-
-        if plot:
-            ax = self.figure_fine.gca()
-            ax.scatter(self.ref(X_cal), Y_cal, color="blue", alpha=0.25, label="Datapoints")
-            self.draw_xlabel(Quantity="Data", is_log=False)
-            self.draw_ylabel(
-                Quantity="Calibration",
-                is_log=not self.main_window.select_calibration_tab.scale_cal_data,
-                figure=self.figure_fine,
-            )
-            # self.draw_grid()
-            ax.scatter(Y_plateaus_dat, Y_plateaus_cal, color="red", alpha=1, label="Plateau points")
-            handles, labels = ax.get_legend_handles_labels()
-            ax.legend(handles, labels, loc="best", fontsize=10)
-            self.figure_fine.tight_layout()
-
-        return np.sum(np.abs(np.array(diff_left[1:]) - np.array(diff_right[:-1])))
+        quality, plot_data = finealign_profiles_via_spline_matching(problem, m, t, return_plot_data=True)
+        ax = self.figure_fine.gca()
+        for x_segment, spline in plot_data["segments"]:
+            ax.plot(x_segment, spline, ls="--", color="r", lw=2)
+
+        ax.scatter(plot_data["ref_X_cal"], plot_data["Y_cal"], color="blue", alpha=0.25, label="Datapoints")
+        self.draw_xlabel(Quantity="Data", is_log=False)
+        self.draw_ylabel(
+            Quantity="Calibration",
+            is_log=not self.main_window.select_calibration_tab.scale_cal_data,
+            figure=self.figure_fine,
+        )
+        # self.draw_grid()
+        ax.scatter(plot_data["Y_plateaus_dat"], plot_data["Y_plateaus_cal"], color="red", alpha=1, label="Plateau points")
+        handles, labels = ax.get_legend_handles_labels()
+        ax.legend(handles, labels, loc="best", fontsize=10)
+        self.figure_fine.tight_layout()
+        return quality
+
+    def get_fine_pool(self):
+        """Process pool for the fine alignment, created on first use and then reused."""
+        if self.fine_pool is None:
+            self.fine_pool = ProcessPoolExecutor(max_workers=self.G_alignment_fine_workers)
+            print("PyQt - Fine alignment pool started with %d workers" % self.G_alignment_fine_workers)
+        return self.fine_pool
+
+    def shutdown_fine_pool(self):
+        if self.fine_pool is not None:
+            self.fine_pool.shutdown(wait=False)
+            self.fine_pool = None
+
+    def evaluate_fine_candidates(self, problem, candidates, progress):
+        """Fine alignment quality of every (m, t) candidate, in candidate order.
+
+        Candidates are split into batches and fanned out over the process pool;
+        with a single worker, or if the pool breaks, they are evaluated here.
+        Returns None if the user cancelled.
+        """
+        quals = np.zeros(len(candidates))
+        workers = max(1, int(self.G_alignment_fine_workers))
+        # A few batches per worker keeps the progress dialog moving without paying per-candidate IPC
+        batch = max(1, -(-len(candidates) // (workers * 4)))
+        batches = [(start, candidates[start:start + batch]) for start in range(0, len(candidates), batch)]
+
+        if workers > 1 and len(batches) > 1:
+            try:
+                pool = self.get_fine_pool()
+                futures = {pool.submit(fine_quality_batch, problem, chunk): start for start, chunk in batches}
+                done = 0
+                for future in as_completed(futures):
+                    start = futures[future]
+                    result = future.result()
+                    quals[start:start + len(result)] = result
+                    done += len(result)
+                    progress.setValue(done)
+                    QApplication.processEvents()
+                    if progress.wasCanceled():
+                        for pending in futures:
+                            pending.cancel()
+                        return None
+                return quals
+            except BrokenProcessPool as e:
+                print("PyQt - Fine alignment pool failed (%s), evaluating candidates serially" % e)
+                self.fine_pool = None
+
+        for start, chunk in batches:
+            quals[start:start + len(chunk)] = fine_quality_batch(problem, chunk)
+            progress.setValue(start + len(chunk))
+            QApplication.processEvents()
+            if progress.wasCanceled():
+                return None
+        return quals
+
+    def evaluate_fine_candidates_with_progress(self, problem, candidates):
+        """evaluate_fine_candidates behind a cancellable progress dialog (evaluate hook of pipeline.fine_alignment)."""
+        progress = QProgressDialog("Fine alignment...", "Cancel", 0, len(candidates), self.main_window)
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(0)
+        progress.setValue(0)
+        try:
+            return self.evaluate_fine_candidates(problem, candidates, progress)
+        finally:
+            progress.close()
 
     def redraw_fine_plot(self):
         """Redraw the fine alignment plot in FineAlign_verticalLayout."""
@@ -1063,20 +1052,22 @@ class AlignmentTab:
         X_cal, Y_cal = self.apply_parameters_to_data(self.X_c, self.Y_c, self.borders_cal, self.cal_is_flipped)
         X_dat, Y_dat = self.apply_parameters_to_data(self.X_data, self.Y_data, self.borders_data, self.data_is_flipped)
 
-        quality_ = np.copy(self.quality)
-        best_fits = np.zeros((2, self.G_alignment_fine_iterations))
-        print("PyQt2222 - AlignmentTab: G_alignment_fine_iterations set to****************************************************** %d" % self.G_alignment_fine_iterations)
-
-        for i in range(self.G_alignment_fine_iterations):
-            max_index = np.argwhere(quality_ == np.max(quality_))[0]
-            best_fits[:, i] = max_index
-            quality_[tuple(max_index)] = 0
-
-        quals = np.zeros(self.G_alignment_fine_iterations)
-        for i in range(self.G_alignment_fine_iterations):
+        params = self.pipeline_parameters()
+        problem = self.fine_alignment_problem(X_cal, Y_cal, X_dat, Y_dat)
+
+        fine_key = self.fine_cache_key(problem)
+        cached = self.alignment_cache.get(fine_key) if self.G_alignment_cache_enabled else None
+        if cached is not None:
+            quals = cached["quals"]
+            self.best_m = float(cached["best_m"])
+            self.best_t = float(cached["best_t"])
+            best_quality = float(cached["best_quality"])
+            print("PyQt - Fine alignment restored from cache (%s)" % fine_key[:12])
+        else:
             try:
-                quals[i] = self.finealign_profiles_via_spline_matching(
-                    X_cal, Y_cal, X_dat, Y_dat, self.m_arr[int(best_fits[0, i])], self.t_arr[int(best_fits[1, i])]
+                result = pipeline.fine_alignment(
+                    problem, self.quality, self.t_arr, self.m_arr, params,
+                    evaluate=self.evaluate_fine_candidates_with_progress,
                 )
             except Exception as e:
                 print(f"Error in spline generation: {e}")
@@ -1087,12 +1078,20 @@ class AlignmentTab:
                 )
                 return
 
-        i = np.argmin(quals)
-        self.best_m = self.m_arr[int(best_fits[0, i])]
-        self.best_t = self.t_arr[int(best_fits[1, i])]
-        print("Fine alignment results: quality=%.7f, stretch=%.1f%%, shift=%.0fnm" % (quals[i], (self.best_m - 1) * 100, self.best_t * 1000))
+            if result is None:
+                print("PyQt - Fine alignment cancelled")
+                return
+            self.best_m, self.best_t, best_quality, quals = result
+
+            if self.G_alignment_cache_enabled:
+                self.alignment_cache.put(fine_key, {
+                    "quals": quals,
+                    "best_m": self.best_m,
+                    "best_t": self.best_t,
+                    "best_quality": best_quality,
+                })
 
-        self.quality = quals[i]
+        self.quality = best_quality
         self.stretch_percent = (self.best_m - 1) * 100
         self.shift_nm = self.best_t * 1000
         self.finealign_profiles_via_spline_matching(X_cal, Y_cal, X_dat, Y_dat, self.best_m, self.best_t, plot=True)
@@ -1100,7 +1099,7 @@ class AlignmentTab:
         try:
             self.ui.get_stretch_in_percentage.setText(f"{(self.best_m - 1) * 100:.1f}")
             self.ui.get_shift_in_nm.setText(f"{self.best_t * 1000:.0f}")
-            self.ui.label_20.setText(f"{quals[i]:.2f}")
+            self.ui.label_20.setText(f"{best_quality:.2f}")
             self.quals = quals
         except AttributeError as e:
             print(f"Error: {e}. Ensure get_stretch_in_percentage, get_shift_in_nm, and label_20 exist in UI.")
@@ -0,0 +1,756 @@
+"""Numerical core of the alignment tab (no Qt / matplotlib imports)."""
+
+from concurrent.futures import ThreadPoolExecutor
+import os
+
+import numpy as np
+from scipy.signal import savgol_filter, find_peaks
+from scipy.interpolate import interp1d, splrep, BSpline
+from scipy.optimize import minimize
+
+
+# Working set per FFT-correlation bin and stretch row: comb spectrum (complex128),
+# correlation (float64) and comb (float64)
+FFT_BYTES_PER_ELEMENT = 16 + 8 + 8
+
+# Working set of one rough-alignment block: shifted step positions (float64),
+# nearest indices (int64), gathered search values (float64) and the boolean
+# rounding mask.
+ROUGH_BYTES_PER_ELEMENT = 8 + 8 + 8 + 1
+DEFAULT_MEMORY_BUDGET_MB = 256
+
+
+# =============================================================================
+# Rough alignment
+# =============================================================================
+
+def rough_search_range(steps_c, t_arr, m_arr):
+    """Return (min, max) of all shifted/stretched step positions m * x + t."""
+    mx_arr = np.einsum('i,j->ij', m_arr, steps_c)
+    return np.min(mx_arr) + np.min(t_arr), np.max(mx_arr) + np.max(t_arr)
+
+
+def build_search_profile(X_dat, Y_input, search_min, search_max):
+    """Resample the filtered measurement gradient onto the rough search axis."""
+    multi = (search_max - search_min) / (np.max(X_dat) - np.min(X_dat))
+    X_search = np.linspace(search_min, search_max, int(X_dat.size * multi))
+    Y_interp = interp1d(X_dat[:-1] + (X_dat[1] - X_dat[0]) / 2, Y_input, kind='linear', bounds_error=False, fill_value=0)
+    Y_search = Y_interp(X_search)
+    return X_search, Y_search
+
+
+def rough_block_size(resolution_t, n_steps, memory_budget_mb=DEFAULT_MEMORY_BUDGET_MB):
+    """Number of stretch values evaluated per block for the given memory budget."""
+    bytes_per_row = max(1, resolution_t * n_steps * ROUGH_BYTES_PER_ELEMENT)
+    return max(1, int(memory_budget_mb * 1024 * 1024 // bytes_per_row))
+
+
+def rough_quality_chunked(steps_c, t_arr, m_arr, X_search, Y_search, memory_budget_mb=DEFAULT_MEMORY_BUDGET_MB):
+    """Quality matrix (len(m_arr) x len(t_arr)) evaluated in blocks of stretch values.
+
+    Gives the same result as materialising the full (m, t, step) tensor at once,
+    but never holds more than ``memory_budget_mb`` of intermediate arrays.
+    """
+    steps_c = np.asarray(steps_c, dtype=float)
+    quality = np.zeros((m_arr.size, t_arr.size))
+    block = rough_block_size(t_arr.size, steps_c.size, memory_budget_mb)
+
+    for start in range(0, m_arr.size, block):
+        stop = min(start + block, m_arr.size)
+        mx_arr = np.einsum('i,j->ij', m_arr[start:stop], steps_c)
+        mxt_arr = np.expand_dims(mx_arr, 1) + t_arr[None, :, None]
+
+        X_idx = np.searchsorted(X_search, mxt_arr, side='left')
+        X_idx -= (X_search[X_idx] - mxt_arr) > (mxt_arr - X_search[X_idx - 1])
+        X_idx[X_idx < 0] = 0
+        quality[start:stop] = np.sum(Y_search[X_idx], axis=2)
+
+    return quality
+
+
+def select_candidates(quality, count, radius_m=0, radius_t=0):
+    """Best `count` (m, t) grid nodes of a rough quality surface, with non-maximum suppression.
+
+    Nodes are taken in order of decreasing quality (lowest flat index first on
+    ties, like np.argwhere(quality == max)) and a node is skipped when it lies
+    within radius_m stretch rows and radius_t shift columns of an already
+    accepted one. Only a partial sort of the surface is needed. Returns a
+    (2, n) integer array of (m index, t index), n <= count.
+    """
+    flat = np.asarray(quality, dtype=float).ravel()
+    n_t = quality.shape[1]
+    count = min(int(count), flat.size)
+    if count <= 0:
+        return np.zeros((2, 0), dtype=int)
+
+    # Every accepted node suppresses at most this many others
+    footprint = (2 * radius_m + 1) * (2 * radius_t + 1)
+    pool_size = min(flat.size, count * footprint)
+    while True:
+        if pool_size < flat.size:
+            pool = np.argpartition(-flat, pool_size - 1)[:pool_size]
+            # argpartition does not keep ties with the last pooled value, so widen the pool to all of them
+            pool = np.union1d(pool, np.flatnonzero(flat >= flat[pool].min()))
+        else:
+            pool = np.arange(flat.size)
+        pool = pool[np.lexsort((pool, -flat[pool]))]
+
+        rows, cols = pool // n_t, pool % n_t
+        accepted_m, accepted_t = [], []
+        for i, j in zip(rows, cols):
+            if accepted_m:
+                near = (np.abs(np.array(accepted_m) - i) <= radius_m) & (np.abs(np.array(accepted_t) - j) <= radius_t)
+                if np.any(near):
+                    continue
+            accepted_m.append(i)
+            accepted_t.append(j)
+            if len(accepted_m) >= count:
+                break
+
+        if len(accepted_m) >= count or pool.size >= flat.size:
+            return np.array([accepted_m, accepted_t], dtype=int)
+        pool_size = min(flat.size, pool_size * 4)
+
+
+def _fft_length(n):
+    """Smallest 2**a * 3**b * 5**c >= n (fast FFT sizes)."""
+    best = 1 << int(np.ceil(np.log2(max(n, 1))))
+    p5 = 1
+    while p5 < best:
+        p35 = p5
+        while p35 < best:
+            size = p35
+            while size < n:
+                size *= 2
+            best = min(best, size)
+            p35 *= 3
+        p5 *= 5
+    return best
+
+
+def rough_quality_fft(steps_c, t_arr, m_arr, X_search, Y_search, memory_budget_mb=DEFAULT_MEMORY_BUDGET_MB,
+                      workers=None):
+    """Quality matrix (len(m_arr) x len(t_arr)) via FFT cross-correlation, one stretch row at a time.
+
+    For a fixed stretch m the quality over all shifts is the correlation of the
+    step comb {m * x_k} with Y_search. The comb is splatted onto the uniform
+    search grid with linear weights, correlated with Y_search through one FFT
+    for all shifts and read off at the (fractional) shifts of t_arr. Compared to
+    rough_quality_chunked this samples Y_search by linear interpolation instead
+    of nearest neighbour, so values differ slightly. Rows are processed in blocks
+    within memory_budget_mb on a thread pool of `workers` threads.
+    """
+    steps_c = np.asarray(steps_c, dtype=float)
+    n = Y_search.size
+    x0 = X_search[0]
+    h = (X_search[-1] - X_search[0]) / (n - 1)
+
+    # Comb positions in fractional grid units relative to t = 0
+    positions = (np.einsum('i,j->ij', m_arr, steps_c) - x0) / h
+    base = np.floor(positions.min(axis=1)).astype(int)
+    offsets = positions - base[:, None]
+    span = int(np.floor(offsets.max())) + 2
+    size = _fft_length(n + span - 1)
+
+    Y_spectrum = np.fft.rfft(Y_search, size)
+    lags = np.arange(-(span - 1), n)
+    shifts = t_arr / h
+    quality = np.zeros((m_arr.size, t_arr.size))
+
+    def correlate_block(start, stop):
+        rows = np.arange(start, stop)
+        lower = np.floor(offsets[start:stop]).astype(int)
+        weight = offsets[start:stop] - lower
+        comb = np.zeros((rows.size, size))
+        row_idx = np.repeat(np.arange(rows.size), steps_c.size)
+        np.add.at(comb, (row_idx, lower.ravel()), (1 - weight).ravel())
+        np.add.at(comb, (row_idx, lower.ravel() + 1), weight.ravel())
+        # corr[a] = sum_j comb[j] * Y[a + j]; negative lags wrap to the end of the circular result
+        corr = np.fft.irfft(Y_spectrum[None, :] * np.conj(np.fft.rfft(comb, size, axis=1)), size, axis=1)
+        corr = corr[:, lags % size]
+        for r, row in enumerate(rows):
+            quality[row] = np.interp(base[row] + shifts, lags, corr[r], left=0, right=0)
+
+    block = max(1, int(memory_budget_mb * 1024 * 1024 // max(1, size * FFT_BYTES_PER_ELEMENT)))
+    blocks = [(start, min(start + block, m_arr.size)) for start in range(0, m_arr.size, block)]
+    workers = max(1, min(workers or os.cpu_count() or 1, len(blocks)))
+    if workers == 1:
+        for start, stop in blocks:
+            correlate_block(start, stop)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(lambda b: correlate_block(*b), blocks))
+    return quality
+
+
+def _linear_weights(nodes, targets):
+    """Left-node index and weight for linear interpolation of targets between sorted nodes."""
+    if nodes.size == 1:
+        return np.zeros(targets.size, dtype=int), np.zeros(targets.size)
+    k = np.clip(np.searchsorted(nodes, targets, side='right') - 1, 0, nodes.size - 2)
+    w = (targets - nodes[k]) / (nodes[k + 1] - nodes[k])
+    return k, w
+
+
+def _fill_by_interpolation(quality, q_sub, mi, tj):
+    """Bilinearly spread a sub-grid of evaluations over its bounding box in quality."""
+    t_targets = np.arange(tj[0], tj[-1] + 1)
+    m_targets = np.arange(mi[0], mi[-1] + 1)
+    k_t, w_t = _linear_weights(tj, t_targets)
+    k_m, w_m = _linear_weights(mi, m_targets)
+    q_sub = np.atleast_2d(q_sub)
+    if tj.size > 1:
+        rows = q_sub[:, k_t] * (1 - w_t) + q_sub[:, k_t + 1] * w_t
+    else:
+        rows = q_sub[:, k_t]
+    if mi.size > 1:
+        box = rows[k_m] * (1 - w_m)[:, None] + rows[k_m + 1] * w_m[:, None]
+    else:
+        box = rows[k_m]
+    quality[mi[0]:mi[-1] + 1, tj[0]:tj[-1] + 1] = box
+
+
+def _strided_nodes(start, stop, stride):
+    """Grid indices start, start + stride, ... always including stop."""
+    nodes = np.arange(start, stop + 1, stride)
+    if nodes[-1] != stop:
+        nodes = np.append(nodes, stop)
+    return nodes
+
+
+PYRAMID_MIN_COARSE_NODES = 32
+
+
+def pyramid_coarse_stride(n_m, n_t, levels, factor=4, min_nodes=PYRAMID_MIN_COARSE_NODES):
+    """Coarsest stride factor**(levels - 1), reduced until both axes keep at least min_nodes nodes.
+
+    A narrow quality ridge can fall between coarse nodes that are too far apart
+    and is then never refined; small grids therefore get fewer levels (stride 1
+    is the dense search).
+    """
+    stride = max(1, factor ** (levels - 1))
+    while stride > 1 and min(n_m, n_t) / stride < min_nodes:
+        stride //= factor
+    return max(1, stride)
+
+
+def rough_quality_pyramid(steps_c, t_arr, m_arr, X_search, Y_search, levels=3, keep=8, factor=4,
+                          memory_budget_mb=DEFAULT_MEMORY_BUDGET_MB):
+    """Coarse-to-fine rough search returning a full-size quality surface.
+
+    The whole (m, t) grid is first evaluated at a stride of factor**(levels - 1)
+    nodes, with fewer levels on grids too small to keep PYRAMID_MIN_COARSE_NODES
+    coarse nodes per axis (see pyramid_coarse_stride). At every following level the ``keep`` best nodes of the previous level
+    are refined with a ``factor`` times finer stride inside a window of one
+    previous stride around them. Nodes that were never evaluated are filled by
+    bilinear interpolation, so the heatmap and the fine alignment see the same
+    shape as in the dense search. Returns (quality, evaluated_mask).
+    """
+    n_m, n_t = m_arr.size, t_arr.size
+    quality = np.zeros((n_m, n_t))
+    exact = np.zeros((n_m, n_t))
+    evaluated = np.zeros((n_m, n_t), dtype=bool)
+
+    def evaluate(mi, tj):
+        q_sub = rough_quality_chunked(steps_c, t_arr[tj], m_arr[mi], X_search, Y_search, memory_budget_mb)
+        _fill_by_interpolation(quality, q_sub, mi, tj)
+        exact[np.ix_(mi, tj)] = q_sub
+        evaluated[np.ix_(mi, tj)] = True
+        return q_sub
+
+    stride = pyramid_coarse_stride(n_m, n_t, levels, factor)
+    mi = _strided_nodes(0, n_m - 1, stride)
+    tj = _strided_nodes(0, n_t - 1, stride)
+    q_sub = evaluate(mi, tj)
+    if stride > 1:
+        candidates = [(q_sub[a, b], mi[a], tj[b]) for a in range(mi.size) for b in range(tj.size)]
+
+    while stride > 1:
+        prev_stride = stride
+        stride = max(1, stride // factor)
+
+        # Best nodes of the previous level, at most one per previous-stride neighbourhood
+        candidates.sort(key=lambda c: -c[0])
+        seeds = []
+        for value, i, j in candidates:
+            if all(abs(i - si) > prev_stride or abs(j - sj) > prev_stride for si, sj in seeds):
+                seeds.append((i, j))
+            if len(seeds) >= keep:
+                break
+
+        candidates = []
+        for i, j in seeds:
+            mi = _strided_nodes(max(0, i - prev_stride), min(n_m - 1, i + prev_stride), stride)
+            tj = _strided_nodes(max(0, j - prev_stride), min(n_t - 1, j + prev_stride), stride)
+            q_sub = evaluate(mi, tj)
+            candidates.extend((q_sub[a, b], mi[a], tj[b]) for a in range(mi.size) for b in range(tj.size))
+
+    # Overlapping windows may have interpolated over nodes evaluated earlier
+    quality[evaluated] = exact[evaluated]
+    return quality, evaluated
+
+
+# =============================================================================
+# Alignment primitives
+# =============================================================================
+
+def get_closest_pxl_to_value(X, value):
+    idx = np.argmin(np.abs(X - value))
+    return idx, X[idx]
+
+
+class NearestIndex:
+    """Nearest-element lookup in a fixed 1D array, vectorised over the queries.
+
+    query(values) returns, for every value, the index np.argmin(np.abs(X - value))
+    would return (the lowest index on ties), but in O(log N) per value via a
+    presorted copy of X, or O(1) when X is uniformly spaced and monotonic.
+    Build it once per array and reuse it for all lookups.
+    """
+
+    # Largest deviation from the ideal grid x0 + i * dx (in units of dx) for the
+    # uniform fast path; below 0.25 the nearest element is always within +-1 of
+    # the rounded grid position
+    UNIFORM_TOLERANCE = 0.25
+
+    def __init__(self, X):
+        self.X = np.asarray(X, dtype=float).ravel()
+        n = self.X.size
+        self.uniform = False
+        if n >= 2:
+            dx = (self.X[-1] - self.X[0]) / (n - 1)
+            grid = self.X[0] + np.arange(n) * dx
+            if dx != 0 and np.all(np.abs(self.X - grid) < self.UNIFORM_TOLERANCE * abs(dx)):
+                self.uniform = True
+                self.x0 = self.X[0]
+                self.dx = dx
+        if not self.uniform:
+            # Stable sort: within a run of equal values the first entry has the lowest index
+            self.order = np.argsort(self.X, kind='mergesort')
+            self.X_sorted = self.X[self.order]
+            new_run = np.r_[True, self.X_sorted[1:] != self.X_sorted[:-1]] if n else np.zeros(0, dtype=bool)
+            run_start = np.maximum.accumulate(np.where(new_run, np.arange(n), 0)) if n else np.zeros(0, dtype=int)
+            self.first_of_run = self.order[run_start]
+
+    def query(self, values):
+        """Indices of the elements of X closest to values (same shape as values)."""
+        values = np.asarray(values, dtype=float)
+        flat = values.ravel()
+        n = self.X.size
+        if n == 0:
+            raise ValueError("NearestIndex of an empty array")
+        if n == 1:
+            return np.zeros(values.shape, dtype=np.intp)
+
+        if self.uniform:
+            centre = np.clip(np.rint((flat - self.x0) / self.dx).astype(np.intp), 0, n - 1)
+            candidates = np.stack([np.maximum(centre - 1, 0), centre, np.minimum(centre + 1, n - 1)], axis=1)
+            candidates.sort(axis=1)
+            dist = np.abs(self.X[candidates] - flat[:, None])
+            idx = candidates[np.arange(flat.size), np.argmin(dist, axis=1)]
+            return idx.reshape(values.shape)
+
+        right = np.clip(np.searchsorted(self.X_sorted, flat, side='left'), 0, n - 1)
+        left = np.maximum(right - 1, 0)
+        dist_left = np.abs(self.X_sorted[left] - flat)
+        dist_right = np.abs(self.X_sorted[right] - flat)
+        idx_left = self.first_of_run[left]
+        idx_right = self.first_of_run[right]
+        idx = np.where(
+            dist_left < dist_right, idx_left,
+            np.where(dist_right < dist_left, idx_right, np.minimum(idx_left, idx_right)),
+        )
+        return idx.reshape(values.shape)
+
+
+def closest_pxls(X, values):
+    """Vectorised get_closest_pxl_to_value: nearest index in X for every value."""
+    return NearestIndex(X).query(values)
+
+
+def nearest_reference(X_cal, X_ref, Y_ref, ref_index=None):
+    """Map X_cal to corresponding Y_ref values using nearest-neighbor matching."""
+    if ref_index is None:
+        ref_index = NearestIndex(X_ref)
+    return np.asarray(Y_ref)[ref_index.query(X_cal)].astype(float)
+
+
+def apply_parameters_to_data(X, Y, borders, is_flipped):
+    """Apply borders and flip parameters to data."""
+    X_out, Y_out = X.copy(), Y.copy()
+
+    borders_i = [
+        int(get_closest_pxl_to_value(X_out, borders[0])[0]),
+        int(get_closest_pxl_to_value(X_out, borders[1])[0]),
+    ]
+    borders_i = sorted(borders_i)
+
+    if borders_i[0] >= len(X_out) or borders_i[1] >= len(X_out):
+        print("Warning: Border indices out of range")
+        return X_out, Y_out
+
+    X_out = X_out[borders_i[0] : borders_i[1] + 1]
+    Y_out = Y_out[borders_i[0] : borders_i[1] + 1]
+
+    if is_flipped:
+        X_out = X_out[::-1]
+        Y_out = Y_out[::-1]
+
+    return X_out, Y_out
+
+
+def apply_lin_offset(X_cal, Y_cal, X_dat, Y_dat, m, t):
+    """Apply linear offset to align X_cal and X_dat ranges."""
+    X_cal = m * X_cal + t
+
+    X_dat_low_to_high = np.sign(X_dat[0] - X_dat[-1]) == -1
+    X_cal_low_to_high = np.sign(X_cal[0] - X_cal[-1]) == -1
+
+    if np.min(X_cal) > np.min(X_dat):
+        cutoff_pxl = int(get_closest_pxl_to_value(X_dat, np.min(X_cal))[0])
+        if X_dat_low_to_high:
+            X_dat = X_dat[cutoff_pxl:]
+            Y_dat = Y_dat[cutoff_pxl:]
+        else:
+            X_dat = X_dat[:cutoff_pxl]
+            Y_dat = Y_dat[:cutoff_pxl]
+            X_dat = X_dat[::-1]
+            Y_dat = Y_dat[::-1]
+    else:
+        cutoff_pxl = int(get_closest_pxl_to_value(X_cal, np.min(X_dat))[0])
+        if X_cal_low_to_high:
+            X_cal = X_cal[cutoff_pxl:]
+            Y_cal = Y_cal[cutoff_pxl:]
+        else:
+            X_cal = X_cal[:cutoff_pxl]
+            Y_cal = Y_cal[:cutoff_pxl]
+            X_cal = X_cal[::-1]
+            Y_cal = Y_cal[::-1]
+
+    if np.max(X_cal) < np.max(X_dat):
+        cutoff_pxl = int(get_closest_pxl_to_value(X_dat, np.max(X_cal))[0]) + 1
+        if X_dat_low_to_high:
+            X_dat = X_dat[:cutoff_pxl]
+            Y_dat = Y_dat[:cutoff_pxl]
+        else:
+            X_dat = X_dat[cutoff_pxl:]
+            Y_dat = Y_dat[cutoff_pxl:]
+            X_dat = X_dat[::-1]
+            Y_dat = Y_dat[::-1]
+    else:
+        cutoff_pxl = int(get_closest_pxl_to_value(X_cal, np.max(X_dat))[0]) + 1
+        if X_cal_low_to_high:
+            X_cal = X_cal[:cutoff_pxl]
+            Y_cal = Y_cal[:cutoff_pxl]
+        else:
+            X_cal = X_cal[cutoff_pxl:]
+            Y_cal = Y_cal[cutoff_pxl:]
+            X_cal = X_cal[::-1]
+            Y_cal = Y_cal[::-1]
+
+    return X_cal, Y_cal, X_dat, Y_dat
+
+
+def differentiate_for_peak_finding(test_data, filterwidth):
+    """Differentiate data for peak finding, with optional smoothing."""
+    if filterwidth != 0:
+        test_data = savgol_filter(test_data, 1 + filterwidth * 2, 1)
+    test_data = np.diff(test_data, 1)
+    non_zero = test_data[np.where(test_data != 0)]
+    if non_zero.size == 0:
+        print("PyQt - Warning: All derivatives are zero, returning zeros")
+        return np.zeros_like(test_data)
+    test_data = test_data / np.min(np.abs(non_zero))
+    test_data = np.abs(test_data)
+    print(
+        "PyQt - differentiate_for_peak_finding: test_data shape=%s, min=%.3f, max=%.3f"
+        % (test_data.shape, np.min(test_data), np.max(test_data))
+    )
+    return test_data
+
+
+def find_step_pos(X, Y, step_dist, step_num, fixed_filterwidth=None):
+    """Positions of the step_num - 1 steps between the plateaus of a staircase profile."""
+    x_interval = np.abs(X[-1] - X[0])
+    if x_interval == 0:
+        print("PyQt - Error: X range is zero, cannot compute steps")
+        return None
+
+    step_distance_pxls = max(1, int(step_dist / x_interval * X.size))
+    print(
+        "PyQt - Step detection: filterwidth=%s, step_dist=%s, step_num=%s, x_interval=%.3f, step_distance_pxls=%d"
+        % (fixed_filterwidth, step_dist, step_num, x_interval, step_distance_pxls)
+    )
+
+    test_data = differentiate_for_peak_finding(Y, fixed_filterwidth)
+    height_threshold = np.percentile(test_data, 10) if np.max(test_data) > 0 else 1
+    peaks, properties = find_peaks(test_data, distance=step_distance_pxls, height=height_threshold)
+    peak_pos_pxls = peaks.tolist()
+    peak_height = properties['peak_heights'].tolist()
+
+    if len(peak_pos_pxls) < (step_num - 1):
+        print("PyQt - Warning: Found %d peaks, expected %d, retrying with smoothing" % (len(peak_pos_pxls), (step_num - 1)))
+        test_data = differentiate_for_peak_finding(Y, filterwidth=1)
+        peaks, properties = find_peaks(test_data, distance=step_distance_pxls, height=height_threshold)
+        peak_pos_pxls = peaks.tolist()
+        peak_height = properties['peak_heights'].tolist()
+
+    if len(peak_pos_pxls) < (step_num - 1):
+        print("PyQt - Warning: Still found %d peaks, using fallback" % len(peak_pos_pxls))
+        total_width = min(x_interval, step_dist * (step_num - 1))
+        start = X[0] + step_dist / 2
+        end = X[0] + total_width
+        peak_pos = np.linspace(start, end, step_num - 1)
+    else:
+        while len(peak_pos_pxls) > (step_num - 1):
+            smallest_peak = peak_height.index(min(peak_height))
+            del peak_height[smallest_peak]
+            del peak_pos_pxls[smallest_peak]
+        peak_pos = X[peak_pos_pxls]
+
+    print("PyQt - Steps found: %d, positions=%s..." % (len(peak_pos), peak_pos[:min(len(peak_pos), 5)]))
+    return peak_pos
+
+
+def estimate_plateaus(X, Y, step_dist, step_num):
+    """Estimate plateau centres from the detected step positions."""
+    step_pos = find_step_pos(X, Y, step_dist, step_num, fixed_filterwidth=0)
+    if step_pos is None:
+        print("Error: Could not find all required steps!")
+        return None, None
+
+    x_0 = X[0]
+    x_f = X[-1]
+    estimate_plateaus_pos = [(x_0 + step_pos[0]) / 2]
+    for i in range(len(step_pos) - 1):
+        estimate_plateaus_pos.append((step_pos[i] + step_pos[i + 1]) / 2)
+    estimate_plateaus_pos.append((step_pos[-1] + x_f) / 2)
+
+    print("Plateau positions:", estimate_plateaus_pos)
+    return estimate_plateaus_pos, step_pos
+
+
+def resample_uniform(x_data, y_data, x_new):
+    """Resample a cloud sorted by x_data onto x_new from its two nearest points.
+
+    For every new x the two nearest cloud points are taken (ties going to the
+    lower index, as a stable sort would pick them). If they share the same x the
+    first one's y is used, otherwise the value is linearly interpolated between
+    them, clamped to the nearer one outside their span. Vectorised, O(log N)
+    per point.
+    """
+    x_data = np.asarray(x_data, dtype=float)
+    y_data = np.asarray(y_data, dtype=float)
+    x_new = np.asarray(x_new, dtype=float)
+    n = x_data.size
+    if n == 1:
+        return np.full(x_new.shape, y_data[0])
+
+    # Runs of identical x values
+    new_run = np.r_[True, x_data[1:] != x_data[:-1]]
+    run_id = np.cumsum(new_run) - 1
+    run_start = np.flatnonzero(new_run)
+    run_len = np.diff(np.r_[run_start, n])
+    n_runs = run_start.size
+
+    # Nearest point (left one on ties)
+    pos = np.searchsorted(x_data, x_new, side='left')
+    left = np.clip(pos - 1, 0, n - 1)
+    right = np.clip(pos, 0, n - 1)
+    use_left = (pos > 0) & ((pos >= n) | (np.abs(x_new - x_data[left]) <= np.abs(x_data[right] - x_new)))
+    a_run = run_id[np.where(use_left, left, right)]
+    a_idx = run_start[a_run]
+
+    # Second nearest point: first element of the closer neighbouring run (left on ties)
+    prev_run = np.maximum(a_run - 1, 0)
+    next_run = np.minimum(a_run + 1, n_runs - 1)
+    dist_prev = np.where(a_run > 0, np.abs(x_new - x_data[run_start[prev_run]]), np.inf)
+    dist_next = np.where(a_run < n_runs - 1, np.abs(x_data[run_start[next_run]] - x_new), np.inf)
+    b_idx = np.where(dist_prev <= dist_next, run_start[prev_run], run_start[next_run])
+
+    x_a, y_a = x_data[a_idx], y_data[a_idx]
+    x_b, y_b = x_data[b_idx], y_data[b_idx]
+    b_is_left = x_b < x_a
+    x_lo = np.where(b_is_left, x_b, x_a)
+    x_hi = np.where(b_is_left, x_a, x_b)
+    y_lo = np.where(b_is_left, y_b, y_a)
+    y_hi = np.where(b_is_left, y_a, y_b)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        slope = (y_hi - y_lo) / (x_hi - x_lo)
+        y_new = slope * (x_new - x_lo) + y_lo
+    y_new = np.where(x_new == x_hi, y_hi, y_new)
+    y_new = np.where((x_new < x_lo) | (x_new > x_hi), y_a, y_new)
+    # Two copies of the same x: take the first one
+    return np.where(run_len[a_run] > 1, y_a, y_new)
+
+
+# =============================================================================
+# Fine alignment
+# =============================================================================
+
+class FineAlignmentProblem:
+    """Everything a fine-alignment candidate (m, t) needs, in a picklable form.
+
+    X_ref / Y_ref is the untrimmed measurement used for the nearest-neighbour
+    reference mapping; descending sorts the plateaus from high to low
+    calibration value (charge-carrier calibrations).
+    """
+
+    def __init__(self, X_cal, Y_cal, X_dat, Y_dat, X_ref, Y_ref, step_dist, step_num, descending):
+        self.X_cal = X_cal
+        self.Y_cal = Y_cal
+        self.X_dat = X_dat
+        self.Y_dat = Y_dat
+        self.X_ref = X_ref
+        self.Y_ref = Y_ref
+        self.step_dist = step_dist
+        self.step_num = step_num
+        self.descending = descending
+        self.ref_index = NearestIndex(X_ref)
+
+    def ref(self, X_cal):
+        return nearest_reference(X_cal, self.X_ref, self.Y_ref, self.ref_index)
+
+
+def finealign_profiles_via_spline_matching(problem, m, t, return_plot_data=False):
+    """Fine alignment quality of one (m, t) candidate (lower is better).
+
+    With return_plot_data the spline segments and plateau points are returned
+    as well, as (quality, plot_data).
+    """
+    arr_factor = 5
+    window_param = 51
+    window_order = 1
+    inter_s = 0.5
+    inter_k = 2
+
+    X_cal, Y_cal, X_dat, Y_dat = apply_lin_offset(problem.X_cal, problem.Y_cal, problem.X_dat, problem.Y_dat, m, t)
+
+    X_plateaus_cal, step_pos = estimate_plateaus(X_cal, Y_cal, problem.step_dist, problem.step_num)
+    dat_index = NearestIndex(X_dat)
+    Y_plateaus_cal = list(Y_cal[closest_pxls(X_cal, X_plateaus_cal)])
+    X_plateaus_cal = X_cal[closest_pxls(Y_cal, Y_plateaus_cal)]
+    X_plateaus_dat = X_dat[dat_index.query(X_plateaus_cal)]
+    Y_plateaus_dat = list(Y_dat[dat_index.query(X_plateaus_dat)])
+
+    if problem.descending:
+        plateau_order = sorted(range(len(Y_plateaus_cal)), key=lambda k: Y_plateaus_cal[k])[::-1]
+    else:
+        plateau_order = sorted(range(len(Y_plateaus_cal)), key=lambda k: Y_plateaus_cal[k])
+
+    Y_plateaus_cal = [Y_plateaus_cal[i] for i in plateau_order]
+    Y_plateaus_dat = [Y_plateaus_dat[i] for i in plateau_order]
+
+    ref_X_cal = problem.ref(X_cal)
+    my_data = np.c_[ref_X_cal, Y_cal]
+    my_data = my_data[my_data[:, 0].argsort(kind='mergesort')]
+
+    x_spaced = np.linspace(my_data[0, 0], my_data[-1, 0], my_data.shape[0] * arr_factor)
+    y_spaced = resample_uniform(my_data[:, 0], my_data[:, 1], x_spaced)
+
+    y_spaced = savgol_filter(y_spaced, window_param, window_order)
+
+    slice_points = closest_pxls(x_spaced, Y_plateaus_dat)
+    diff_left = []
+    diff_right = []
+    segments = []
+    for i in range(len(Y_plateaus_dat) - 1):
+        slice_point_left = int(slice_points[i])
+        slice_point_right = int(slice_points[i + 1])
+        if slice_point_right == slice_point_left:
+            diff_left.append(np.min(Y_cal))
+            diff_right.append(np.max(Y_cal))
+            break
+        elif slice_point_right < slice_point_left:
+            slice_point_right, slice_point_left = slice_point_left, slice_point_right
+
+        if slice_point_right - slice_point_left < 3:
+            if slice_point_right - slice_point_left < 2:
+                try:
+                    slice_point_left -= 1
+                    tck = splrep(
+                        x_spaced[slice_point_left:slice_point_right],
+                        y_spaced[slice_point_left:slice_point_right],
+                        s=inter_s,
+                        k=1,
+                    )
+                except:
+                    slice_point_left += 1
+                    slice_point_right += 1
+                tck = splrep(
+                    x_spaced[slice_point_left:slice_point_right],
+                    y_spaced[slice_point_left:slice_point_right],
+                    s=inter_s,
+                    k=1,
+                )
+            else:
+                tck = splrep(
+                    x_spaced[slice_point_left:slice_point_right],
+                    y_spaced[slice_point_left:slice_point_right],
+                    s=inter_s,
+                    k=1,
+                )
+        else:
+            tck = splrep(
+                x_spaced[slice_point_left:slice_point_right],
+                y_spaced[slice_point_left:slice_point_right],
+                s=inter_s,
+                k=inter_k,
+            )
+
+        spline = BSpline(*tck)(x_spaced[slice_point_left:slice_point_right])
+        diff_left.append(np.diff(spline)[0])
+        diff_right.append(np.diff(spline)[-1])
+        if return_plot_data:
+            segments.append((x_spaced[slice_point_left:slice_point_right], spline))
+
+    quality = np.sum(np.abs(np.array(diff_left[1:]) - np.array(diff_right[:-1])))
+    if not return_plot_data:
+        return quality
+
+    plot_data = {
+        "segments": segments,
+        "ref_X_cal": ref_X_cal,
+        "Y_cal": Y_cal,
+        "Y_plateaus_dat": Y_plateaus_dat,
+        "Y_plateaus_cal": Y_plateaus_cal,
+    }
+    return quality, plot_data
+
+
+def fine_quality_batch(problem, candidates):
+    """Fine alignment quality for a list of (m, t) candidates; runs in worker processes."""
+    return [finealign_profiles_via_spline_matching(problem, m, t) for m, t in candidates]
+
+
+def refine_alignment(problem, m0, t0, dm, dt, max_evals=60, quality0=None):
+    """Sub-grid refinement of a fine-alignment result with Nelder-Mead.
+
+    Searches (m, t) within one grid step (dm, dt) of (m0, t0), working in grid-step
+    units so both axes are equally scaled; candidates outside that box or whose
+    spline matching fails count as infinitely bad. At most max_evals objective
+    evaluations are spent. Returns (m, t, quality, evaluations); the start point is
+    returned unchanged when nothing better was found.
+    """
+    dm = dm if dm != 0 else max(abs(m0), 1.0) * 1e-3
+    dt = dt if dt != 0 else max(abs(t0), 1.0) * 1e-3
+    if quality0 is None:
+        quality0 = finealign_profiles_via_spline_matching(problem, m0, t0)
+
+    def objective(u):
+        if np.any(np.abs(u) > 1):
+            return np.inf
+        try:
+            return finealign_profiles_via_spline_matching(problem, m0 + u[0] * dm, t0 + u[1] * dt)
+        except Exception:
+            return np.inf
+
+    simplex = np.array([[0.0, 0.0], [0.5, 0.0], [0.0, 0.5]])
+    result = minimize(
+        objective, np.zeros(2), method='Nelder-Mead',
+        options={'initial_simplex': simplex, 'maxfev': max(3, int(max_evals)), 'xatol': 1e-3, 'fatol': 1e-9},
+    )
+    if np.isfinite(result.fun) and result.fun < quality0:
+        return m0 + result.x[0] * dm, t0 + result.x[1] * dt, result.fun, result.nfev
+    return m0, t0, quality0, result.nfev
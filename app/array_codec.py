@@ -0,0 +1,143 @@
+"""Storage of numpy arrays in database documents as typed, optionally compressed binary blobs (no Qt imports).
+
+An encoded array is the subdocument
+    {"__ndarray__": 1, "dtype": "<f8", "shape": [n, 2], "codec": "zlib" | "raw", "data": Binary}
+Blobs larger than INLINE_MAX_BYTES are moved to GridFS; "data" is then
+replaced by "gridfs_id". Arrays with fewer than ENCODE_MIN_ELEMENTS elements
+stay plain lists so that short fields (fit points, initial guess) remain
+readable in MongoDB Compass.
+"""
+
+import base64
+import zlib
+
+import numpy as np
+
+
+ARRAY_MARKER = "__ndarray__"
+ARRAY_CODEC_VERSION = 1
+ENCODE_MIN_ELEMENTS = 16
+COMPRESS_MIN_BYTES = 512
+COMPRESSION_LEVEL = 6
+INLINE_MAX_BYTES = 4 * 1024 * 1024  # documents are limited to 16 MB
+NUMERIC_KINDS = "biuf"
+LIST_KINDS = "iuf"  # lists of flags (bool) stay lists
+
+
+def _binary(data):
+    try:
+        from bson import Binary
+    except ImportError:  # in-process stand-ins without bson store plain bytes
+        return bytes(data)
+    return Binary(data)
+
+
+def is_encoded(value):
+    return isinstance(value, dict) and ARRAY_MARKER in value
+
+
+def encode_array(array, compress=True):
+    """Encoded subdocument of a numeric array (stored little-endian, C order)."""
+    array = np.asarray(array)
+    array = np.ascontiguousarray(array.astype(array.dtype.newbyteorder("<")))
+    data = array.tobytes()
+    codec = "raw"
+    if compress and len(data) >= COMPRESS_MIN_BYTES:
+        packed = zlib.compress(data, COMPRESSION_LEVEL)
+        if len(packed) < len(data):
+            data, codec = packed, "zlib"
+    return {ARRAY_MARKER: ARRAY_CODEC_VERSION, "dtype": array.dtype.str, "shape": list(array.shape),
+            "codec": codec, "data": _binary(data)}
+
+
+def decode_array(value, gridfs_factory=None):
+    """numpy array of an encoded subdocument; gridfs_factory is needed for arrays stored in GridFS."""
+    if "data" in value:
+        data = bytes(value["data"])
+    elif gridfs_factory is not None:
+        data = gridfs_factory().get(value["gridfs_id"]).read()
+    else:
+        raise ValueError("array stored in GridFS (%s) but no GridFS given" % value.get("gridfs_id"))
+    if value.get("codec") == "zlib":
+        data = zlib.decompress(data)
+    elif value.get("codec") != "raw":
+        raise ValueError("unknown array codec %r" % value.get("codec"))
+    return np.frombuffer(data, dtype=np.dtype(value["dtype"])).reshape(value["shape"]).copy()
+
+
+def _numeric_array(value):
+    """value as a numeric ndarray if it is a rectangular list of numbers, else None."""
+    try:
+        array = np.asarray(value)
+    except ValueError:  # ragged
+        return None
+    return array if array.dtype.kind in LIST_KINDS and array.ndim >= 1 else None
+
+
+def encode_arrays(value, min_elements=ENCODE_MIN_ELEMENTS, lists=False):
+    """Copy of a document with numeric arrays of min_elements or more encoded.
+
+    Smaller arrays become lists, numpy scalars become numbers and tuples become
+    lists. With lists=True numeric (nested) lists are encoded as well, which is
+    what the migration of old documents uses.
+    """
+    if isinstance(value, dict):
+        if is_encoded(value):
+            return value
+        return {key: encode_arrays(item, min_elements, lists) for key, item in value.items()}
+    if isinstance(value, np.ndarray):
+        if value.dtype.kind in NUMERIC_KINDS and value.size >= min_elements:
+            return encode_array(value)
+        return encode_arrays(value.tolist(), min_elements, lists)
+    if isinstance(value, (list, tuple)):
+        if lists and len(value) and isinstance(value[0], (list, tuple, int, float)):
+            array = _numeric_array(value)
+            if array is not None and array.size >= min_elements:
+                return encode_array(array)
+        return [encode_arrays(item, min_elements, lists) for item in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def decode_arrays(value, gridfs_factory=None):
+    """Copy of a document with every encoded array decoded back to numpy."""
+    if isinstance(value, dict):
+        if is_encoded(value):
+            return decode_array(value, gridfs_factory)
+        return {key: decode_arrays(item, gridfs_factory) for key, item in value.items()}
+    if isinstance(value, list):
+        return [decode_arrays(item, gridfs_factory) for item in value]
+    return value
+
+
+def offload_large_arrays(value, gridfs_factory, max_inline=INLINE_MAX_BYTES):
+    """Move blobs over max_inline bytes of an encoded document to GridFS, in place.
+
+    gridfs_factory is only called if there is such a blob. Returns the GridFS
+    ids of the moved blobs, so a caller whose write fails can delete them.
+    """
+    moved = []
+    items = value.items() if isinstance(value, dict) else enumerate(value) if isinstance(value, list) else ()
+    for _, item in items:
+        if is_encoded(item):
+            if "data" in item and len(item["data"]) > max_inline:
+                item["gridfs_id"] = gridfs_factory().put(bytes(item["data"]))
+                del item["data"]
+                moved.append(item["gridfs_id"])
+        else:
+            moved.extend(offload_large_arrays(item, gridfs_factory, max_inline))
+    return moved
+
+
+def json_default(value):
+    """json.dumps default for encoded blobs when bson is not available."""
+    if isinstance(value, bytes):
+        return {"$base64": base64.b64encode(value).decode("ascii")}
+    return str(value)
+
+
+def json_object_hook(value):
+    if set(value) == {"$base64"}:
+        return base64.b64decode(value["$base64"])
+    return value
@@ -1,24 +1,23 @@
 from PyQt5.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QTextEdit,
-    QPushButton, QFileDialog, QMessageBox
+    QApplication, QDialog, QVBoxLayout, QHBoxLayout, QLabel, QTextEdit,
+    QPushButton, QFileDialog, QMessageBox, QInputDialog, QProgressDialog
 )
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFont
 import numpy as np
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from copy import deepcopy
-from scipy.optimize import curve_fit
-from scipy.interpolate import interp1d
 from datetime import datetime
+from copy import deepcopy
 import zipfile
 import io
 import os
-from openpyxl import load_workbook
-import gwyfile
-from gwyfile.objects import GwyContainer, GwySIUnit
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import json
-from pymongo import MongoClient
+
+from app import calibration_queries, database, gwyddion_batch, pipeline
+from app.image_calibration import DEFAULT_LUT_SIZE, DEFAULT_TILE_MB, CalibrationLUT, calibrate_image
+from app.calibration_model import G_ELECTRON_CONST, G_MAX_N, convert_N_to_rho, convert_rho_to_N, mobility_masetti
 
 
 class calibrationset:
@@ -27,10 +26,8 @@ class calibrationset:
         self.ident = now.strftime("%d/%m/%Y %H:%M") + "F" + data_path
         self.version = version
         
-        #MongoDB
-        self.client = MongoClient("mongodb://localhost:27017/")
-        self.db = self.client["calibration_db"]
-        self.collection = self.db["calibrations"]
+        #MongoDB: documents go through the shared background writer (app/database.py)
+        self.write_queue = database.write_queue()
 
     def fill_set_v05(self, cal_name, quality, X_cal, Y_cal, initialguess, res, cc, meas):
         self.sample = cal_name
@@ -48,17 +45,22 @@ class calibrationset:
         if self.version == "v0.5":
             self.fill_set_v05(*args)
 
-    def save_to_database(self, settings):
+    def save_to_database(self, settings, cal_setting=None):
+        """Queue settings for MongoDB; cal_setting is the G_cal_setting (1/2/3) the calibration was made with."""
         data = settings.copy()
         data["ident"] = self.ident
         
         # Add calibration-specific values directly
         data["sample"] = settings["select_calibration"].get("Calibration sample", "")
         data["dopant_type"] = settings["select_calibration"].get("dopant_type", "")
-        data["carrier_type"] = settings["select_calibration"].get("carrier_type", "")
-        data["cal_setting"] = settings["select_calibration"].get("data_type", "unknown")    
-        result = self.collection.insert_one(data)
-        print(f"Saved to MongoDB: ID {result.inserted_id}")
+        # Canonical values, so that the browser filters work for presets too (their data type combo is hidden)
+        data["carrier_type"] = calibration_queries.carrier_type_of(data["dopant_type"])
+        if cal_setting is not None:
+            data["cal_setting"] = calibration_queries.cal_setting_name(cal_setting)
+        else:
+            data["cal_setting"] = settings["select_calibration"].get("data_type") or "unknown"
+        document_id = self.write_queue.submit(data)
+        print(f"Queued for MongoDB: ID {document_id}")
     
 def save_measurement_settings_to_json(main_window):
     """Save parameters with user-chosen name (or default timestamp)."""
@@ -129,6 +131,9 @@ def save_measurement_settings_to_json(main_window):
             "min_stretch": align.ui.minStretch_slider.value(),
             "max_stretch": align.ui.MaxStretch_slider.value(),
             "increase_search_area": align.ui.Increase_Search_area_checkbox.isChecked(),
+            "pyramid_search": align.pyramid_search_checkbox.isChecked(),
+            "fft_search": align.fft_search_checkbox.isChecked(),
+            "subgrid_refinement": align.refine_alignment_checkbox.isChecked(),
             "stretch_resolution": align.ui.Search_resol_Stretch_lineedit.text(),
             "shift_resolution": align.ui.Search_resol_shift_lineedit.text(),
             "fine-alignment_number_of_evaluated_points": align.ui.fine_alignement_lineedit.text(),
@@ -167,8 +172,15 @@ class CalibrationTab:
         # Global settings
         # ---------------------------------------------------------------------
         self.G_alignment_fine_iterations = 50
-        self.G_electron_const = 1.6E-19
-        self.G_max_N = [1E14, 1E22]
+        self.G_electron_const = G_ELECTRON_CONST
+        self.G_max_N = list(G_MAX_N)
+        self.G_image_tile_mb = DEFAULT_TILE_MB      # Working set per tile when calibrating Gwyddion channels
+        self.G_image_workers = os.cpu_count() or 1  # Threads calibrating the tiles of a channel
+        self.G_image_use_lut = True                 # Map channels through a lookup table of the final curve
+        self.G_image_lut_size = DEFAULT_LUT_SIZE
+        self.G_image_lut_max_error = 1E-3           # Largest accepted LUT deviation (log10 units)
+        self.G_batch_workers = os.cpu_count() or 1  # Processes calibrating Gwyddion files in folder mode
+        self.gwyddion_cache = gwyddion_batch.GwyddionFileCache()  # Parsed .gwy files, cleared when a file apply ends
         self.export_excel_metadata = False
         # self.XLS = r"C:\Users\allani\Desktop\Internship\Tasks\Task3\LoadNPZ\Template.xlsx"
         self.XLS = r"Z:\2_Reference\Quantification_SAMPLE_PROBE__ID.xlsx"
@@ -249,6 +261,21 @@ class CalibrationTab:
             print(f"Error: {e}. Ensure Apply_To_Gwyddion_File_Button exists in UI.")
             raise SystemExit(1)
 
+        try:
+            self.batch_gwyddion_button = QPushButton("Apply To Gwyddion Folder", self.ui.Apply_To_Gwyddion_File_Button.parent())
+            button_rect = self.ui.Apply_To_Gwyddion_File_Button.geometry()
+            self.batch_gwyddion_button.setGeometry(button_rect.x(), button_rect.y() + button_rect.height() + 6,
+                                                   button_rect.width(), button_rect.height())
+            self.batch_gwyddion_button.setToolTip(
+                "Calibrate the same channels of every .gwy file in a folder (or glob) with the current calibration"
+            )
+            self.batch_gwyddion_button.setStyleSheet("background-color: red; color: black")
+            self.batch_gwyddion_button.clicked.connect(self.apply_to_gwyddion_folder)
+            print("batch_gwyddion_button connected")
+        except AttributeError as e:
+            print(f"Error: {e}. Ensure Apply_To_Gwyddion_File_Button exists in UI.")
+            raise SystemExit(1)
+
     # -------------------------------------------------------------------------
     # UI helpers
     # -------------------------------------------------------------------------
@@ -265,6 +292,7 @@ class CalibrationTab:
         self.ui.Create_excel_File_Button.setStyleSheet("background-color: red; color: black")
         self.ui.Save_As_Png_Button.setStyleSheet("background-color: red; color: black")
         self.ui.Apply_To_Gwyddion_File_Button.setStyleSheet("background-color: red; color: black")
+        self.batch_gwyddion_button.setStyleSheet("background-color: red; color: black")
 
     def draw_xlabel(self, Quantity="Depth", is_log=False, figure=None):
         """Set x-axis label for the specified figure."""
@@ -356,56 +384,15 @@ class CalibrationTab:
 
     def mobility_masetti(self, N, Dopant_type):
         """Compute mobility using Masetti model."""
-        mu_0 = [52.2, 68.5, 44.9]
-        mu_max = [1417, 1414, 470.5]
-        mu_1 = [43.4, 56.1, 29]
-        C_r = [9.68E16, 9.20E16, 2.23E17]
-        C_s = [3.43E20, 3.41E20, 6.1E20]
-        alpha = [0.680, 0.711, 0.719]
-        beta = [2.00, 1.98, 2.00]
-        if Dopant_type == 'As':
-            i = 0
-        elif Dopant_type == 'P':
-            i = 1
-        elif Dopant_type == 'B':
-            i = 2
-        else:
-            print('Dopant type must be B, P, or As')
-            return None
-
-        if i < 2:
-            mu = mu_0[i] + (mu_max[i] - mu_0[i]) / (1 + np.power(N / C_r[i], alpha[i])) - mu_1[i] / (1 + np.power(C_s[i] / N, beta[i]))
-        else:
-            P_c = 9.23E16
-            mu = mu_0[i] * np.exp(-P_c / N) + mu_max[i] / (1 + np.power(N / C_r[i], alpha[i])) - mu_1[i] / (1 + np.power(C_s[i] / N, beta[i]))
-        return mu
+        return mobility_masetti(N, Dopant_type)
 
     def convert_N_to_rho(self, N, Dopant_type):
         """Convert carrier concentration to resistivity."""
-        mu = self.mobility_masetti(N, Dopant_type)
-        if mu is None:
-            return None
-        return 1 / (N * mu * self.G_electron_const)
+        return convert_N_to_rho(N, Dopant_type, self.G_electron_const)
 
     def convert_rho_to_N(self, array):
         """Convert resistivity to carrier concentration."""
-        Dopant_type = self.select_calibration_tab.G_dopant_type
-        N_values = np.logspace(np.log10(self.G_max_N[0] * 0.5), np.log10(self.G_max_N[1] * 2), 1000)
-        rho_values = self.convert_N_to_rho(N_values, Dopant_type)
-        if rho_values is None:
-            print(f"Error: convert_N_to_rho returned None for Dopant_type={Dopant_type}")
-            return None
-        convert_rho_to_N_func = interp1d(
-            rho_values, N_values, bounds_error=False,
-            fill_value=(self.G_max_N[1] * 2, self.G_max_N[0] * 0.5)
-        )
-        rho_allowed_interval = self.convert_N_to_rho(np.array(self.G_max_N), Dopant_type)
-        if rho_allowed_interval is None:
-            print(f"Error: rho_allowed_interval is None for Dopant_type={Dopant_type}")
-            return None
-        array = np.array(array)
-        array = np.clip(array, rho_allowed_interval[1], rho_allowed_interval[0])
-        return convert_rho_to_N_func(array)
+        return convert_rho_to_N(array, self.select_calibration_tab.G_dopant_type, self.G_max_N, self.G_electron_const)
 
     # -------------------------------------------------------------------------
     # Main actions
@@ -480,6 +467,7 @@ class CalibrationTab:
             self.ui.Save_As_Png_Button.setStyleSheet("background-color: yellow; color: black")
             self.ui.Save_As_Png_Button.setEnabled(True)
             self.ui.Apply_To_Gwyddion_File_Button.setStyleSheet("background-color: yellow; color: black")
+            self.batch_gwyddion_button.setStyleSheet("background-color: yellow; color: black")
             self.ui.Apply_To_Gwyddion_File_Button.setEnabled(True)
             print("PyQt - Export buttons updated")
         except AttributeError as e:
@@ -522,20 +510,11 @@ class CalibrationTab:
         print(f"PyQt - calibration_start: test_output min={np.min(test_output):.3f}, max={np.max(test_output):.3f}, len={len(test_output)}")
 
         try:
-            popt, pcov = curve_fit(interpolation, X_cal, Y_cal, p0=self.fitpoints_tab.initialguess)
+            popt, self.fitpoints_dat_opt = pipeline.fit_calibration_curve(
+                self.fitpoints_tab.Y_plateaus_cal, self.alignment_tab.ref, X_cal, Y_cal, self.fitpoints_tab.initialguess)
             print(f"PyQt - calibration_start: popt={popt}")
-            self.fitpoints_dat_opt = deepcopy(self.fitpoints_tab.Y_plateaus_dat)
             Y_dat_optimized_calibrated = interpolation(X_dat, *popt)
             print(f"PyQt - calibration_start: Y_dat_optimized_calibrated min={np.min(Y_dat_optimized_calibrated):.3f}, max={np.max(Y_dat_optimized_calibrated):.3f}, len={len(Y_dat_optimized_calibrated)}")
-
-            sign_data = np.sign(np.sum(popt[1:]))
-            j = 0
-            for i in range(len(popt)):
-                if i == 0:
-                    self.fitpoints_dat_opt[i] = j + popt[i]
-                else:
-                    self.fitpoints_dat_opt[i] = j + sign_data * abs(popt[i])
-                j = self.fitpoints_dat_opt[i]
             print(f"PyQt - calibration_start: fitpoints_dat_opt={self.fitpoints_dat_opt}")
         except Exception as e:
             QMessageBox.critical(self.main_window, "Error", "Fit did not converge. Please change Fitpoints and try again")
@@ -592,6 +571,7 @@ class CalibrationTab:
             self.ui.Create_excel_File_Button.setStyleSheet("background-color: yellow; color: black")
             self.ui.Save_As_Png_Button.setStyleSheet("background-color: yellow; color: black")
             self.ui.Apply_To_Gwyddion_File_Button.setStyleSheet("background-color: yellow; color: black")
+            self.batch_gwyddion_button.setStyleSheet("background-color: yellow; color: black")
 
             if self.select_calibration_tab.G_cal_setting == 2:
                 self.ui.Convert_to_Charge_Carriers_Button.setStyleSheet("background-color: yellow; color: black")
@@ -664,6 +644,9 @@ class CalibrationTab:
                 "min_stretch": self.alignment_tab.ui.minStretch_slider.value(),
                 "max_stretch": self.alignment_tab.ui.MaxStretch_slider.value(),
                 "increase_search_area": self.alignment_tab.ui.Increase_Search_area_checkbox.isChecked(),
+                "pyramid_search": self.alignment_tab.pyramid_search_checkbox.isChecked(),
+                "fft_search": self.alignment_tab.fft_search_checkbox.isChecked(),
+                "subgrid_refinement": self.alignment_tab.refine_alignment_checkbox.isChecked(),
                 "stretch_resolution": self.alignment_tab.ui.Search_resol_Stretch_lineedit.text(),
                 "shift_resolution": self.alignment_tab.ui.Search_resol_shift_lineedit.text(),
                 "fine-alignment_number_of_evaluated_points": self.alignment_tab.ui.fine_alignement_lineedit.text(),
@@ -677,8 +660,8 @@ class CalibrationTab:
                 "intermediate_points": [s.value() for s in self.fitpoints_tab.sliders],
             },
             "calibration_data": {
-                "dat": np.c_[self.alignment_tab.ref(X_cal), Y_cal].tolist(),
-                "quality": quality.tolist() if hasattr(quality, 'tolist') else quality,
+                "dat": np.c_[self.alignment_tab.ref(X_cal), Y_cal],  # arrays are stored as binary blobs
+                "quality": quality,
                 "initialguess": self.fitpoints_tab.initialguess,
                 "res": res,
                 "cc": cc,
@@ -689,9 +672,9 @@ class CalibrationTab:
         settings["alignment"]["stretch_percent"] = self.alignment_tab.stretch_percent
         settings["alignment"]["shift_nm"] = self.alignment_tab.shift_nm
         db = calibrationset(data_path=data_path, version="v0.5")
-        db.save_to_database(settings)   # MongoDB
+        db.save_to_database(settings, self.select_calibration_tab.G_cal_setting)   # MongoDB
     
-        print("Saved (MongoDB + NPZ)")
+        print("Saved (MongoDB queue + NPZ)")
         save_measurement_settings_to_json(self.main_window)
     
         try:
@@ -706,6 +689,7 @@ class CalibrationTab:
         self.export_excel_metadata = True
         if self.export_excel_metadata:
             try:
+                from openpyxl import load_workbook  # imported on first use, only needed for the export
                 workbook = load_workbook(filename=self.XLS)
                 sheet = workbook['Generic 10-step staircase']
     
@@ -804,8 +788,7 @@ class CalibrationTab:
             file_ext = os.path.splitext(file)[1].lower()
             if file_ext == ".gwy":
                 try:
-                    obj = gwyfile.load(file)
-                    gwyfile.util.get_datafields(obj)
+                    self.gwyddion_cache.datafields(file)
                     return True
                 except Exception as e:
                     QMessageBox.critical(self.main_window, "Error", "Gwyddion file is corrupted. Cannot be opened. Process aborted.")
@@ -827,8 +810,7 @@ class CalibrationTab:
                         )
                         if reply == QMessageBox.Yes:
                             try:
-                                obj = gwyfile.load(new_file)
-                                gwyfile.util.get_datafields(obj)
+                                self.gwyddion_cache.datafields(new_file)
                                 return True
                             except Exception as e:
                                 reply = QMessageBox.question(
@@ -854,6 +836,21 @@ class CalibrationTab:
                 return False
         return False
 
+    def compile_calibration(self, curve, images):
+        """Lookup table of curve(., *popt) over the value range of images, or the exact curve.
+
+        Returns (callable, params) for calibrate_image. The table is used only if
+        its interpolation error stays within G_image_lut_max_error.
+        """
+        if not self.G_image_use_lut:
+            return curve, self.popt
+        lut = CalibrationLUT.for_images(curve, self.popt, images, self.G_image_lut_size, knots=self.fitpoints_dat_opt)
+        print(f"PyQt - Calibration LUT: {lut.size} samples over [{lut.lo:.3f}, {lut.hi:.3f}], max error {lut.max_error:.2e}")
+        if lut.max_error > self.G_image_lut_max_error:
+            print(f"PyQt - Calibration LUT error above {self.G_image_lut_max_error:.1e}, evaluating the exact curve")
+            return curve, self.popt
+        return lut, ()
+
     def apply_to_gwyddion_file(self):
         """Apply calibration to Gwyddion file data channels."""
         print("Applying calibration to Gwyddion file")
@@ -874,12 +871,12 @@ class CalibrationTab:
                 file, _ = QFileDialog.getOpenFileName(self.main_window, "Select Gwyddion File", "", "Gwyddion Files (*.gwy *.spm)")
                 if not self.check_for_gwyddion_file(file):
                     return
+                from gwyfile.objects import GwyContainer, GwySIUnit  # imported on first use
 
                 if os.path.splitext(file)[1].lower() == ".spm":
                     file = os.path.splitext(file)[0] + ".gwy"
 
-                obj = gwyfile.load(file)
-                df = gwyfile.util.get_datafields(obj)
+                df = self.gwyddion_cache.datafields(file)
                 datachannels = "\n".join(list(df.keys()))
 
                 dialog = QDialog(self.main_window)
@@ -940,16 +937,14 @@ class CalibrationTab:
                     ok_button.setStyleSheet("background-color: red; color: black")
 
                 def import_channels():
-                    obj = gwyfile.load(file)
-                    df = gwyfile.util.get_datafields(obj)
+                    df = self.gwyddion_cache.datafields(file)
                     output_text.setText("\n".join(list(df.keys())))
                     check_button.setStyleSheet("background-color: yellow; color: black")
                     check_button.metadata = False
                     ok_button.setStyleSheet("background-color: red; color: black")
 
                 def check_channels():
-                    obj = gwyfile.load(file)
-                    df = gwyfile.util.get_datafields(obj)
+                    df = self.gwyddion_cache.datafields(file)
                     channels = input_text.toPlainText().splitlines()
                     valid = all(channel in df for channel in channels if channel.strip())
                     if not valid:
@@ -966,8 +961,7 @@ class CalibrationTab:
                 dialog.rejected.connect(lambda: None)
 
                 if dialog.exec_() == QDialog.Accepted and check_button.metadata:
-                    obj_read = gwyfile.load(file)
-                    df = gwyfile.util.get_datafields(obj_read)
+                    df = self.gwyddion_cache.datafields(file)
                     obj_write = GwyContainer()
                     channels = input_text.toPlainText().splitlines()
                     channels = [c for c in channels if c.strip()]
@@ -982,22 +976,25 @@ class CalibrationTab:
                     if self.select_calibration_tab.G_cal_setting == 2 and self.calibration_convert_metadata[1]:
                         print(f"  Y_plateaus_cal_conv: {self.fitpoints_tab.Y_plateaus_cal_conv}")
 
+                    curve = self.fitpoints_tab.linint_
+                    if self.select_calibration_tab.G_cal_setting == 2 and self.calibration_convert_metadata[1]:
+                        interpolation_cc, curve = self.fitpoints_tab.make_func(self.fitpoints_tab.Y_plateaus_cal_conv)
+                    elif self.select_calibration_tab.G_cal_setting == 2:
+                        QMessageBox.information(
+                            self.main_window, "Info",
+                            "Calibration data is in resistivity, but charge carrier conversion was not done. Output will be in resistivity."
+                        )
+
+                    curve, params = self.compile_calibration(curve, [df[channel]['data'] for channel in channels])
+
                     for i, channel in enumerate(channels):
-                        dfi = df[channel]
+                        dfi = deepcopy(df[channel])  # the cached datafield stays unmodified
                         xres = dfi['xres']
                         yres = dfi['yres']
-                        datac = self.fitpoints_tab.linint_(dfi['data'], *self.popt).reshape((yres, xres))
-
-                        if self.select_calibration_tab.G_cal_setting == 2 and self.calibration_convert_metadata[1]:
-                            interpolation_cc, linint_cc = self.fitpoints_tab.make_func(self.fitpoints_tab.Y_plateaus_cal_conv)
-                            datac = linint_cc(dfi['data'], *self.popt).reshape((yres, xres))
-                        elif self.select_calibration_tab.G_cal_setting == 2:
-                            if i == 0:
-                                QMessageBox.information(
-                                    self.main_window, "Info",
-                                    "Calibration data is in resistivity, but charge carrier conversion was not done. Output will be in resistivity."
-                                )
-
+                        datac = calibrate_image(
+                            dfi['data'], curve, params, shape=(yres, xres),
+                            tile_mb=self.G_image_tile_mb, workers=self.G_image_workers,
+                        )
                         obj_write[f"/{i}/data/title"] = f"{channel}_cal"
                         dfi.data = datac
                         dfi.si_unit_z = GwySIUnit([('unitstr', '')])
@@ -1018,6 +1015,8 @@ class CalibrationTab:
             except Exception as e:
                 print(f"Error during Gwyddion file export: {e}")
                 QMessageBox.critical(self.main_window, "Error", "Failed to process Gwyddion file. Check file and data.")
+            finally:
+                self.gwyddion_cache.clear()  # the parsed datafields are only needed while the file is applied
         else:
             QMessageBox.critical(
                 self.main_window, "Error",
@@ -1027,3 +1026,102 @@ class CalibrationTab:
             print("Gwyddion file export failed: Missing prerequisites")
 
 
+
+    def apply_to_gwyddion_folder(self):
+        """Apply the calibration to the selected channels of every Gwyddion file in a folder."""
+        print("Applying calibration to Gwyddion folder")
+        if not (getattr(self, 'fitpoints_dat_opt', None) is not None and getattr(self, 'popt', None) is not None and
+                getattr(self.fitpoints_tab, 'Y_plateaus_cal', None) is not None):
+            QMessageBox.critical(
+                self.main_window, "Error",
+                "This action is missing required previous steps. Red: This step is missing previous steps. "
+                "Yellow: This step has not been done. Green: This step has been done"
+            )
+            print("Gwyddion folder export failed: Missing prerequisites")
+            return
+
+        folder = QFileDialog.getExistingDirectory(self.main_window, "Select Folder with Gwyddion Files", "")
+        if not folder:
+            return
+        pattern, ok = QInputDialog.getText(
+            self.main_window, "Files", "File pattern inside the folder:", text="*.gwy"
+        )
+        if not ok or not pattern.strip():
+            return
+        files = gwyddion_batch.find_gwyddion_files(os.path.join(folder, pattern.strip()))
+        if not files:
+            QMessageBox.critical(self.main_window, "Error", f"No Gwyddion files match {pattern} in {folder}.")
+            return
+
+        text, ok = QInputDialog.getMultiLineText(
+            self.main_window, "Select Data Channels",
+            "Channel names or patterns (e.g. *Resistance*), one per line.\n"
+            "Every matching channel of every file is calibrated.",
+        )
+        patterns = gwyddion_batch.parse_channel_patterns(text) if ok else []
+        if not patterns:
+            QMessageBox.critical(self.main_window, "Error", "Selection process aborted or not validated.")
+            return
+
+        if self.select_calibration_tab.G_cal_setting == 2 and self.calibration_convert_metadata[1]:
+            Dopants = list(self.fitpoints_tab.Y_plateaus_cal_conv)
+        else:
+            Dopants = list(self.fitpoints_tab.Y_plateaus_cal)
+            if self.select_calibration_tab.G_cal_setting == 2:
+                QMessageBox.information(
+                    self.main_window, "Info",
+                    "Calibration data is in resistivity, but charge carrier conversion was not done. Output will be in resistivity."
+                )
+        options = {
+            "use_lut": self.G_image_use_lut,
+            "lut_size": self.G_image_lut_size,
+            "lut_max_error": self.G_image_lut_max_error,
+            "tile_mb": self.G_image_tile_mb,
+        }
+        popt = [float(p) for p in self.popt]
+
+        progress = QProgressDialog("Calibrating Gwyddion files...", "Cancel", 0, len(files), self.main_window)
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(0)
+        progress.setValue(0)
+        results = []
+        workers = max(1, min(int(self.G_batch_workers), len(files)))
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(gwyddion_batch.run_batch_job, path, patterns, Dopants, popt, options) for path in files]
+                for future in as_completed(futures):
+                    path, output, channels, error = future.result()
+                    results.append((path, output, channels, error))
+                    if error:
+                        print(f"PyQt - Batch: {path} failed: {error}")
+                    else:
+                        print(f"PyQt - Batch: {path} -> {output} ({', '.join(channels)})")
+                    progress.setValue(len(results))
+                    QApplication.processEvents()
+                    if progress.wasCanceled():
+                        for pending in futures:
+                            pending.cancel()
+                        break
+        except Exception as e:
+            print(f"Error during Gwyddion folder export: {e}")
+            QMessageBox.critical(self.main_window, "Error", f"Batch calibration failed:\n{e}")
+            return
+        finally:
+            progress.close()
+
+        failed = [(path, error) for path, output, channels, error in results if error]
+        done = len(results) - len(failed)
+        summary = f"{done} of {len(files)} files calibrated into *{gwyddion_batch.CALIBRATED_SUFFIX}."
+        if len(results) < len(files):
+            summary += f"\n{len(files) - len(results)} files skipped (cancelled)."
+        if failed:
+            summary += "\n\nFailed:\n" + "\n".join(f"{os.path.basename(path)}: {error}" for path, error in failed[:20])
+            if len(failed) > 20:
+                summary += f"\n... and {len(failed) - 20} more"
+        print(f"PyQt - Batch summary: {summary}")
+        if done:
+            self.batch_gwyddion_button.setStyleSheet("background-color: green; color: black")
+        if failed:
+            QMessageBox.warning(self.main_window, "Batch calibration", summary)
+        else:
+            QMessageBox.information(self.main_window, "Batch calibration", summary)
@@ -0,0 +1,193 @@
+"""Dialog listing the calibrations stored in MongoDB, opened by Import Parameters -> Browse Database...
+
+Queries go through app/calibration_queries.py, so only one page of summaries
+is read at a time; a calibration's parameters are only fetched on Load or
+Details.
+"""
+
+import json
+
+from PyQt5.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem, QPushButton, QLabel,
+    QHeaderView, QMessageBox, QComboBox, QSpinBox, QTextEdit, QWidget
+)
+from PyQt5.QtCore import Qt
+
+from app import calibration_queries
+
+
+DATA_TYPES = [""] + list(calibration_queries.CAL_SETTINGS.values())
+DOPANT_TYPES = ["", "P", "As", "B"]
+CARRIER_TYPES = [""] + list(calibration_queries.CARRIER_TYPES)
+DEFAULT_DAYS = 90
+
+
+class CalibrationBrowserDialog(QDialog):
+    """Filtered, paginated list of the calibrations stored in MongoDB.
+
+    Load applies the stored project parameters through load_callback(settings),
+    e.g. ImportParametersDialog.apply_settings.
+    """
+
+    def __init__(self, parent, load_callback=None, page_size=calibration_queries.DEFAULT_PAGE_SIZE):
+        super().__init__(parent)
+        self.load_callback = load_callback
+        self.page_size = page_size
+        self.page = 0
+        self.total = 0
+        self.query = {}
+        self.setWindowTitle("Calibration Database")
+        self.setMinimumSize(1150, 550)
+
+        layout = QVBoxLayout()
+
+        # Filters
+        filter_layout = QHBoxLayout()
+        self.sample_combo = QComboBox()
+        self.sample_combo.setEditable(True)
+        self.sample_combo.setMinimumWidth(140)
+        self.data_type_combo = QComboBox()
+        self.data_type_combo.addItems(DATA_TYPES)
+        self.dopant_combo = QComboBox()
+        self.dopant_combo.addItems(DOPANT_TYPES)
+        self.carrier_combo = QComboBox()
+        self.carrier_combo.addItems(CARRIER_TYPES)
+        self.days_spin = QSpinBox()
+        self.days_spin.setRange(0, 36500)
+        self.days_spin.setSpecialValueText("all")  # 0 = no date filter
+        self.days_spin.setValue(DEFAULT_DAYS)
+        search_btn = QPushButton("Search")
+        search_btn.clicked.connect(self.search)
+        for label, widget in (("Sample:", self.sample_combo), ("Data type:", self.data_type_combo),
+                              ("Dopant:", self.dopant_combo), ("Carrier:", self.carrier_combo),
+                              ("Last days:", self.days_spin)):
+            filter_layout.addWidget(QLabel(label))
+            filter_layout.addWidget(widget)
+        filter_layout.addWidget(search_btn)
+        layout.addLayout(filter_layout)
+
+        # Table
+        self.columns = ["Date", "Sample", "Data Type", "Dopant", "Carrier", "Measurement File", "Stretch [%]", "Shift [nm]", "Actions"]
+        self.table = QTableWidget(0, len(self.columns))
+        self.table.setHorizontalHeaderLabels(self.columns)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.table.setColumnWidth(5, 300)
+        self.table.setWordWrap(False)
+        self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        layout.addWidget(self.table)
+
+        # Paging
+        page_layout = QHBoxLayout()
+        self.prev_btn = QPushButton("< Previous")
+        self.prev_btn.clicked.connect(lambda: self.show_page(self.page - 1))
+        self.next_btn = QPushButton("Next >")
+        self.next_btn.clicked.connect(lambda: self.show_page(self.page + 1))
+        self.page_label = QLabel("")
+        page_layout.addWidget(self.prev_btn)
+        page_layout.addWidget(self.page_label, 1, Qt.AlignCenter)
+        page_layout.addWidget(self.next_btn)
+        layout.addLayout(page_layout)
+
+        self.setLayout(layout)
+        self.load_filter_choices()
+        self.search()
+
+    def load_filter_choices(self):
+        try:
+            samples = calibration_queries.distinct_values("sample")
+        except Exception as e:
+            print(f"Warning: sample list not loaded from the database: {e}")
+            samples = []
+        self.sample_combo.addItems([""] + samples)
+
+    def search(self):
+        self.query = calibration_queries.build_query(
+            sample=self.sample_combo.currentText().strip(),
+            cal_setting=self.data_type_combo.currentText(),
+            dopant_type=self.dopant_combo.currentText(),
+            carrier_type=self.carrier_combo.currentText(),
+            days=self.days_spin.value(),
+        )
+        self.show_page(0)
+
+    def show_page(self, page):
+        page = max(0, page)
+        try:
+            rows, total = calibration_queries.find_calibrations(self.query, page, self.page_size)
+            pages = max(1, (total + self.page_size - 1) // self.page_size)
+            if page > pages - 1:  # fewer matches than when the page was chosen
+                page = pages - 1
+                rows, _ = calibration_queries.find_calibrations(self.query, page, self.page_size, with_total=False)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Database query failed:\n{e}")
+            return
+        self.page, self.total = page, total
+        self.page_label.setText(f"Page {page + 1} of {pages} ({total} calibrations)")
+        self.prev_btn.setEnabled(page > 0)
+        self.next_btn.setEnabled(page + 1 < pages)
+
+        self.table.setRowCount(0)
+        for document in rows:
+            row = self.table.rowCount()
+            self.table.insertRow(row)
+            alignment = document.get("alignment", {})
+            meas_path = document.get("import_measurement", {}).get("measurement_file", "")
+            values = [
+                document.get("project_saved_at", "—"), document.get("sample", ""), document.get("cal_setting", ""),
+                document.get("dopant_type", ""), document.get("carrier_type", ""), meas_path,
+                self.format_number(alignment.get("stretch_percent")), self.format_number(alignment.get("shift_nm")),
+            ]
+            for col, value in enumerate(values):
+                item = QTableWidgetItem(str(value))
+                item.setToolTip(str(value))
+                self.table.setItem(row, col, item)
+
+            action_widget = QWidget()
+            hbox = QHBoxLayout(action_widget)
+            hbox.setContentsMargins(0, 0, 0, 0)
+            load_btn = QPushButton("Load")
+            load_btn.setStyleSheet("background-color: #4CAF50; color: white;")
+            load_btn.setEnabled(self.load_callback is not None)
+            load_btn.clicked.connect(lambda _, i=document["_id"]: self.load(i))
+            details_btn = QPushButton("Details")
+            details_btn.clicked.connect(lambda _, i=document["_id"]: self.show_details(i))
+            hbox.addWidget(load_btn)
+            hbox.addWidget(details_btn)
+            self.table.setCellWidget(row, len(self.columns) - 1, action_widget)
+
+    @staticmethod
+    def format_number(value):
+        return "" if value is None else f"{value:.3f}" if isinstance(value, float) else str(value)
+
+    def fetch(self, document_id):
+        try:
+            document = calibration_queries.load_calibration(document_id, with_arrays=False)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Database query failed:\n{e}")
+            return None
+        if document is None:
+            QMessageBox.warning(self, "Not Found", "The calibration was deleted from the database.")
+        return document
+
+    def load(self, document_id):
+        document = self.fetch(document_id)
+        if document is not None and self.load_callback(document):
+            self.accept()
+
+    def show_details(self, document_id):
+        document = self.fetch(document_id)
+        if document is None:
+            return
+        dialog = QDialog(self)
+        dialog.setWindowTitle(f"Calibration {document.get('sample', '')} {document.get('project_saved_at', '')}")
+        dialog.setMinimumSize(600, 500)
+        text = QTextEdit()
+        text.setReadOnly(True)
+        text.setPlainText(json.dumps(document, indent=2, default=str))
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(dialog.accept)
+        vbox = QVBoxLayout(dialog)
+        vbox.addWidget(text)
+        vbox.addWidget(close_btn)
+        dialog.exec_()
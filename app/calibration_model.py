@@ -0,0 +1,291 @@
+"""Calibration curve model, curve fit and mobility conversion (no Qt / matplotlib imports)."""
+
+import numpy as np
+from scipy.optimize import curve_fit
+
+
+G_ELECTRON_CONST = 1.6E-19
+G_MAX_N = [1E14, 1E22]
+
+
+# =============================================================================
+# Interpolation model
+# =============================================================================
+
+def _locate_segments(R, r):
+    """Index i of the segment [r_i, r_(i+1)] used for every R (outer segments extrapolate), or None.
+
+    Also returns the two-knot mask: with only two knots the curve is defined on
+    the r_0 side of r_1 and zero beyond it, as the former tanh-step formulation was.
+    """
+    sign_data = np.sign(r[-1] - r[0]) if r.size >= 2 else 0
+    if sign_data == 0:
+        return None, None
+    r_sorted = r if sign_data > 0 else r[::-1]
+    segment = np.clip(np.searchsorted(r_sorted, R, side="right") - 1, 0, r.size - 2)
+    if sign_data < 0:
+        segment = r.size - 2 - segment
+    defined = (R - r[1]) * sign_data < 0 if r.size == 2 else None
+    return segment, defined
+
+
+def evaluate_piecewise_linear(R, r, Dopants):
+    """Linear interpolation through the (r_i, Dopants[i]) knots, extrapolating the outer segments.
+
+    r must be monotone.
+    """
+    R = np.asarray(R, dtype=float)
+    r = np.asarray(r, dtype=float)
+    D = np.asarray(Dopants, dtype=float)[:r.size]
+    segment, defined = _locate_segments(R, r)
+    if segment is None:
+        return np.zeros(R.shape)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slopes = np.diff(D) / np.diff(r)
+    y = D[segment] + (R - r[segment]) * slopes[segment]
+    if defined is not None:
+        y = np.where(defined, y, 0.)
+    return y
+
+
+def piecewise_linear_knot_gradient(R, r, Dopants):
+    """Derivative of evaluate_piecewise_linear with respect to every knot, shape R.shape + (len(r),)."""
+    R = np.asarray(R, dtype=float)
+    r = np.asarray(r, dtype=float)
+    D = np.asarray(Dopants, dtype=float)[:r.size]
+    gradient = np.zeros(R.shape + (r.size,))
+    segment, defined = _locate_segments(R, r)
+    if segment is None:
+        return gradient
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        widths = np.diff(r)
+        slopes = np.diff(D) / widths
+    slope = slopes[segment] / widths[segment]
+    # y = D_i + (R - r_i) * (D_(i+1) - D_i) / (r_(i+1) - r_i)
+    d_left = slope * (R - r[segment + 1])
+    d_right = -slope * (R - r[segment])
+    if defined is not None:
+        d_left = np.where(defined, d_left, 0.)
+        d_right = np.where(defined, d_right, 0.)
+    np.put_along_axis(gradient, segment[..., None], d_left[..., None], axis=-1)
+    np.put_along_axis(gradient, segment[..., None] + 1, d_right[..., None], axis=-1)
+    return gradient
+
+
+def make_linint(Dopants):
+    """Piecewise-linear calibration curve through the (r_i, Dopants[i]) knots.
+
+    The parameters are r_0 followed by the increments between successive knots;
+    only monotone curves are allowed, so every increment takes the sign of
+    their sum.
+    """
+    def _function_linint_(R, *args):
+        # only monotone changes allowed (so far)
+        sign_data = np.sign(np.sum(args[1:]))
+        if sign_data == 0:
+            return np.zeros(np.shape(R))
+        return evaluate_piecewise_linear(R, knots_from_params(args, sign_data), Dopants)
+
+    return _function_linint_
+
+
+def make_linint_jacobian(Dopants):
+    """Jacobian of make_linint(Dopants) with respect to its parameters, shape (len(R), len(args)).
+
+    r_i = r_0 + sign * sum_(j<=i) |p_j|, so column 0 sums the knot derivatives
+    and column j sums those of the knots j and above, times sign * sign(p_j).
+    """
+    def _jacobian_linint_(R, *args):
+        sign_data = np.sign(np.sum(args[1:]))
+        R = np.asarray(R, dtype=float)
+        if sign_data == 0:
+            return np.zeros(R.shape + (len(args),))
+        knot_gradient = piecewise_linear_knot_gradient(R, knots_from_params(args, sign_data), Dopants)
+        tail_sums = np.cumsum(knot_gradient[..., ::-1], axis=-1)[..., ::-1]
+        jacobian = tail_sums * (sign_data * np.sign(np.asarray(args, dtype=float)))
+        jacobian[..., 0] = tail_sums[..., 0]
+        return jacobian
+
+    return _jacobian_linint_
+
+
+def make_calibration_function(Dopants, ref):
+    """(function of depth, function of measurement value) for the calibration curve.
+
+    ref maps depths to measurement values (AlignmentTab.ref or
+    FineAlignmentProblem.ref); the first function is what curve_fit fits
+    against the calibration profile.
+    """
+    _function_linint_ = make_linint(Dopants)
+
+    def _function_main(X, *args):
+        ref_X_dat = ref(X)
+        print(f"PyQt - calibration_start: ref_X_dat min={np.min(ref_X_dat):.3f}, max={np.max(ref_X_dat):.3f}, len={len(ref_X_dat)}")
+        return _function_linint_(ref_X_dat, *args)
+
+    return _function_main, _function_linint_
+
+
+def knots_from_params(params, sign_data=None):
+    """Knot positions r_i: r_0 = params[0], r_i = r_(i-1) + sign * |params[i]|."""
+    if sign_data is None:
+        sign_data = np.sign(np.sum(params[1:]))
+    r = []
+    for n, value in enumerate(params):
+        if n > 0:
+            value = r[-1] + sign_data * abs(value)
+        r.append(value)
+    return r
+
+
+def initial_guess(Y_plateaus_dat):
+    """Model parameters putting the knots on the measured plateau values."""
+    guess = []
+    for i in range(0, len(Y_plateaus_dat)):
+        if i == 0:
+            guess.append(Y_plateaus_dat[i])
+        else:
+            guess.append(Y_plateaus_dat[i] - Y_plateaus_dat[i - 1])
+    return guess
+
+
+class CalibrationFitSession:
+    """Curve fit of the calibration curve against one fixed calibration profile.
+
+    ref(X_cal) does not change while curve_fit iterates, so it is mapped once
+    here and the optimiser only evaluates the piecewise-linear curve (and its
+    analytic Jacobian) on the mapped measurement values.
+    """
+
+    def __init__(self, Dopants, ref, X_cal):
+        self.Dopants = Dopants
+        self.X_cal = X_cal
+        self.ref_X_cal = ref(X_cal)
+        self.linint = make_linint(Dopants)
+        self.jacobian = make_linint_jacobian(Dopants)
+        print(f"PyQt - calibration_start: ref_X_dat min={np.min(self.ref_X_cal):.3f}, max={np.max(self.ref_X_cal):.3f}, len={len(self.ref_X_cal)}")
+
+    def model(self, *args):
+        """Calibration curve on X_cal for the parameters args."""
+        return self.linint(self.ref_X_cal, *args)
+
+    def fit(self, Y_cal, p0):
+        """Least-squares fit; returns (popt, pcov)."""
+        return curve_fit(self.linint, self.ref_X_cal, Y_cal, p0=p0, jac=self.jacobian)
+
+
+# =============================================================================
+# Physics helpers
+# =============================================================================
+
+MASETTI_DOPANTS = ['As', 'P', 'B']
+MASETTI_PARAMETERS = {
+    'mu_0': [52.2, 68.5, 44.9],
+    'mu_max': [1417, 1414, 470.5],
+    'mu_1': [43.4, 56.1, 29],
+    'C_r': [9.68E16, 9.20E16, 2.23E17],
+    'C_s': [3.43E20, 3.41E20, 6.1E20],
+    'alpha': [0.680, 0.711, 0.719],
+    'beta': [2.00, 1.98, 2.00],
+}
+MASETTI_P_C = 9.23E16  # Boron only
+RHO_GRID_POINTS = 257  # Starting points of the Newton inversion
+RHO_NEWTON_STEPS = 2
+
+
+def _masetti_terms(N, Dopant_type):
+    """(mu, N * dmu/dN) of the Masetti model, or None for an unknown dopant."""
+    if Dopant_type not in MASETTI_DOPANTS:
+        print('Dopant type must be B, P, or As')
+        return None
+    i = MASETTI_DOPANTS.index(Dopant_type)
+    mu_0, mu_max, mu_1 = (MASETTI_PARAMETERS[key][i] for key in ('mu_0', 'mu_max', 'mu_1'))
+    C_r, C_s = MASETTI_PARAMETERS['C_r'][i], MASETTI_PARAMETERS['C_s'][i]
+    alpha, beta = MASETTI_PARAMETERS['alpha'][i], MASETTI_PARAMETERS['beta'][i]
+
+    x = np.power(N / C_r, alpha)
+    u = np.power(C_s / N, beta)
+    if i < 2:
+        mu = mu_0 + (mu_max - mu_0) / (1 + x) - mu_1 / (1 + u)
+        N_dmu = -(mu_max - mu_0) * alpha * x / (1 + x) ** 2 - mu_1 * beta * u / (1 + u) ** 2
+    else:
+        decay = mu_0 * np.exp(-MASETTI_P_C / N)
+        mu = decay + mu_max / (1 + x) - mu_1 / (1 + u)
+        N_dmu = decay * MASETTI_P_C / N - mu_max * alpha * x / (1 + x) ** 2 - mu_1 * beta * u / (1 + u) ** 2
+    return mu, N_dmu
+
+
+def mobility_masetti(N, Dopant_type):
+    """Compute mobility using Masetti model."""
+    terms = _masetti_terms(N, Dopant_type)
+    if terms is None:
+        return None
+    return terms[0]
+
+
+def convert_N_to_rho(N, Dopant_type, electron_const=G_ELECTRON_CONST):
+    """Convert carrier concentration to resistivity."""
+    mu = mobility_masetti(N, Dopant_type)
+    if mu is None:
+        return None
+    return 1 / (N * mu * electron_const)
+
+
+class ResistivityConverter:
+    """N <-> rho conversion of one dopant, with N limited to max_N.
+
+    rho -> N starts from a log-log interpolation of a RHO_GRID_POINTS grid and
+    takes RHO_NEWTON_STEPS Newton steps on ln(rho(N)) with the analytic Masetti
+    derivative, so the accuracy does not depend on the grid density.
+    """
+
+    def __init__(self, Dopant_type, max_N=G_MAX_N, electron_const=G_ELECTRON_CONST):
+        self.Dopant_type = Dopant_type
+        self.max_N = (float(max_N[0]), float(max_N[1]))
+        self.electron_const = electron_const
+        self.log_N_bounds = np.log(self.max_N)
+        self.log_N_grid = np.linspace(self.log_N_bounds[0], self.log_N_bounds[1], RHO_GRID_POINTS)
+        # rho falls with N: store the grid with ascending ln(rho) for np.interp
+        self.log_rho_grid = np.log(self.N_to_rho(np.exp(self.log_N_grid)))[::-1]
+        self.log_N_grid = self.log_N_grid[::-1]
+        self.rho_bounds = (np.exp(self.log_rho_grid[0]), np.exp(self.log_rho_grid[-1]))
+
+    def N_to_rho(self, N):
+        return convert_N_to_rho(np.asarray(N, dtype=float), self.Dopant_type, self.electron_const)
+
+    def rho_to_N(self, rho):
+        """Carrier concentration of resistivities, clipped to the rho range of max_N."""
+        log_rho = np.log(np.clip(np.asarray(rho, dtype=float), self.rho_bounds[0], self.rho_bounds[1]))
+        log_N = np.interp(log_rho, self.log_rho_grid, self.log_N_grid)
+        for _ in range(RHO_NEWTON_STEPS):
+            N = np.exp(log_N)
+            mu, N_dmu = _masetti_terms(N, self.Dopant_type)
+            residual = -np.log(N * mu * self.electron_const) - log_rho
+            slope = -1 - N_dmu / mu  # d ln(rho) / d ln(N)
+            log_N = np.clip(log_N - residual / slope, self.log_N_bounds[0], self.log_N_bounds[1])
+        return np.exp(log_N)
+
+
+_converters = {}
+
+
+def resistivity_converter(Dopant_type, max_N=G_MAX_N, electron_const=G_ELECTRON_CONST):
+    """Shared ResistivityConverter per (dopant, max_N, electron_const), or None for an unknown dopant."""
+    key = (Dopant_type, float(max_N[0]), float(max_N[1]), float(electron_const))
+    if key not in _converters:
+        if Dopant_type not in MASETTI_DOPANTS:
+            print('Dopant type must be B, P, or As')
+            return None
+        _converters[key] = ResistivityConverter(Dopant_type, max_N, electron_const)
+    return _converters[key]
+
+
+def convert_rho_to_N(array, Dopant_type, max_N=G_MAX_N, electron_const=G_ELECTRON_CONST):
+    """Convert resistivity to carrier concentration."""
+    converter = resistivity_converter(Dopant_type, max_N, electron_const)
+    if converter is None:
+        print(f"Error: convert_N_to_rho returned None for Dopant_type={Dopant_type}")
+        return None
+    return converter.rho_to_N(array)
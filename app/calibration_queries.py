@@ -0,0 +1,107 @@
+"""Indexed queries over the stored calibrations (calibration_db.calibrations), no Qt imports.
+
+Lists are served from index-backed filters with a summary projection, so the
+heavy calibration_data arrays are never transferred when browsing. Only
+load_calibration reads (and decodes) a whole document.
+"""
+
+from datetime import datetime, timedelta
+import threading
+
+from app import database
+
+
+SAVED_AT_FORMAT = "%Y-%m-%d %H:%M:%S"  # project_saved_at strings sort chronologically
+DEFAULT_PAGE_SIZE = 50
+FILTER_FIELDS = ("sample", "dopant_type", "carrier_type", "cal_setting")
+INDEXES = [
+    [("sample", 1)],
+    [("dopant_type", 1)],
+    [("carrier_type", 1)],
+    [("cal_setting", 1)],
+    [("project_saved_at", -1)],
+    # Serves the common "sample + data type, newest first" lookups without an in-memory sort
+    [("sample", 1), ("cal_setting", 1), ("project_saved_at", -1)],
+]
+SUMMARY_PROJECTION = {
+    "ident": 1, "sample": 1, "dopant_type": 1, "carrier_type": 1, "cal_setting": 1, "project_saved_at": 1,
+    "import_measurement.measurement_file": 1, "select_calibration.preset": 1,
+    "alignment.stretch_percent": 1, "alignment.shift_nm": 1,
+}
+WITHOUT_ARRAYS_PROJECTION = {"calibration_data.dat": 0, "calibration_data.quality": 0}
+SORT_NEWEST_FIRST = [("project_saved_at", -1), ("_id", -1)]
+# Stored cal_setting of the calibration tab's G_cal_setting
+CAL_SETTINGS = {1: "charge carrier density", 2: "resistivity", 3: "Other"}
+CARRIER_TYPES = ("n-type", "p-type")
+
+
+def cal_setting_name(cal_setting):
+    """Stored cal_setting of a G_cal_setting value (1/2/3), "unknown" for anything else."""
+    return CAL_SETTINGS.get(cal_setting, "unknown")
+
+
+def carrier_type_of(dopant_type):
+    """Stored carrier_type of a dopant ("B" is p-type, "P" and "As" are n-type), "" if unknown."""
+    return "p-type" if dopant_type == "B" else "n-type" if dopant_type in ("P", "As") else ""
+
+
+def ensure_indexes(collection=None):
+    """Create the query indexes (a no-op for the ones that exist); returns their names."""
+    collection = collection if collection is not None else database.get_collection()
+    return [collection.create_index(keys) for keys in INDEXES]
+
+
+def ensure_indexes_in_background():
+    """ensure_indexes on a daemon thread, so an unreachable server never delays the application."""
+    def run():
+        try:
+            names = ensure_indexes()
+            print("PyQt - Database indexes ready: %s" % ", ".join(names))
+        except Exception as e:
+            print("Warning: database indexes not created: %s" % e)
+
+    thread = threading.Thread(target=run, name="database-indexes", daemon=True)
+    thread.start()
+    return thread
+
+
+def build_query(sample=None, cal_setting=None, dopant_type=None, carrier_type=None, days=None, since=None,
+                until=None, now=None):
+    """MongoDB filter; None/empty arguments do not filter. days selects the last `days` days."""
+    values = {"sample": sample, "cal_setting": cal_setting, "dopant_type": dopant_type, "carrier_type": carrier_type}
+    query = {field: values[field] for field in FILTER_FIELDS if values[field]}
+    if days:
+        since = (now or datetime.now()) - timedelta(days=days)
+    saved_at = {}
+    if since is not None:
+        saved_at["$gte"] = since.strftime(SAVED_AT_FORMAT) if isinstance(since, datetime) else since
+    if until is not None:
+        saved_at["$lte"] = until.strftime(SAVED_AT_FORMAT) if isinstance(until, datetime) else until
+    if saved_at:
+        query["project_saved_at"] = saved_at
+    return query
+
+
+def find_calibrations(query=None, page=0, page_size=DEFAULT_PAGE_SIZE, collection=None, with_total=True):
+    """(summaries of one page, total matches or None), newest first."""
+    collection = collection if collection is not None else database.get_collection()
+    query = query or {}
+    cursor = collection.find(query, SUMMARY_PROJECTION).sort(SORT_NEWEST_FIRST) \
+        .skip(max(0, page) * page_size).limit(page_size)
+    rows = list(cursor)
+    total = collection.count_documents(query) if with_total else None
+    return rows, total
+
+
+def distinct_values(field, query=None, collection=None):
+    """Sorted distinct non-empty values of an indexed field (for filter choices)."""
+    collection = collection if collection is not None else database.get_collection()
+    return sorted(value for value in collection.distinct(field, query or {}) if value not in (None, ""))
+
+
+def load_calibration(document_id, with_arrays=True, collection=None, gridfs_factory=database.get_gridfs):
+    """Whole stored document (arrays decoded to numpy), or None if it does not exist."""
+    collection = collection if collection is not None else database.get_collection()
+    projection = None if with_arrays else WITHOUT_ARRAYS_PROJECTION
+    document = collection.find_one({"_id": document_id}, projection)
+    return database.decode_document(document, gridfs_factory) if document is not None else None
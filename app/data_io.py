@@ -0,0 +1,121 @@
+"""Shared reader of two-column XY text exports (measurement and calibration profiles), no Qt imports."""
+
+import os
+import time
+
+import numpy as np
+
+from app.disk_cache import DEFAULT_CACHE_ROOT, ArrayCache, hash_key
+
+try:
+    import pandas as pd
+except ImportError:  # pandas is optional, np.loadtxt is used without it
+    pd = None
+
+
+DEFAULT_SEPARATORS = [";", "\t", ",", " "]
+SNIFF_LINES = 64
+XY_CACHE_DIR = os.path.join(DEFAULT_CACHE_ROOT, "xy_cache")
+XY_CACHE_MAX_MB = 1024
+
+_xy_cache = None
+
+
+class DataImportError(ValueError):
+    """The file cannot be read as XY data; the message is meant for the user."""
+
+
+def _split(line, delimiter):
+    return line.split() if delimiter is None else [part.strip() for part in line.split(delimiter)]
+
+
+def _numeric_fields(line, delimiter):
+    """Number of float fields of line, or 0 if any field is not a number."""
+    fields = _split(line, delimiter)
+    try:
+        [float(field) for field in fields]
+    except ValueError:
+        return 0
+    return len(fields)
+
+
+def sniff_format(lines, separators=DEFAULT_SEPARATORS):
+    """(delimiter, header line count, column count) of sample lines; delimiter None means whitespace.
+
+    Separators are tried in order (whitespace-only entries mean any whitespace);
+    the first one that splits every line after the header into the same number
+    (>= 2) of numbers wins. Lines before the first numeric line are the header.
+    """
+    candidates = []
+    for separator in separators:
+        delimiter = None if not separator.strip() else separator
+        if delimiter not in candidates:
+            candidates.append(delimiter)
+
+    while lines and not lines[-1].strip():
+        lines = lines[:-1]
+    for delimiter in candidates:
+        counts = [_numeric_fields(line, delimiter) for line in lines]
+        first = next((i for i, count in enumerate(counts) if count >= 2), None)
+        if first is None:
+            continue
+        if all(count == counts[first] for count in counts[first:]):
+            return delimiter, first, counts[first]
+    raise DataImportError("No valid delimiter found")
+
+
+def xy_cache():
+    """Shared local cache of parsed XY files (XY_CACHE_DIR, capped at XY_CACHE_MAX_MB)."""
+    global _xy_cache
+    if _xy_cache is None:
+        _xy_cache = ArrayCache(XY_CACHE_DIR, XY_CACHE_MAX_MB * 1024 * 1024)
+    return _xy_cache
+
+
+def read_xy(path, separators=DEFAULT_SEPARATORS, exact_columns=True, cache=None):
+    """Read the first two columns of a numeric text file as an (n, 2) float array.
+
+    The delimiter and header are sniffed from the first SNIFF_LINES lines, then
+    the file is parsed once (pandas' C reader if available, else np.loadtxt).
+    With exact_columns the file must have exactly two columns. With a cache
+    (see xy_cache) the parsed array is stored keyed by absolute path, size and
+    mtime, and later reads of the unchanged file only stat it.
+    """
+    start = time.perf_counter()
+    key = None
+    if cache is not None:
+        stat = os.stat(path)
+        key = hash_key("xy-v1", os.path.abspath(path), stat.st_size, stat.st_mtime_ns,
+                       list(separators), bool(exact_columns))
+        data = cache.get(key)
+        if data is not None:
+            print("PyQt - Read %d rows of %s from the local cache in %.3f s" % (
+                data.shape[0], path, time.perf_counter() - start))
+            return data
+
+    with open(path, "r", errors="replace") as f:
+        lines = [line for _, line in zip(range(SNIFF_LINES), f)]
+    delimiter, header_lines, columns = sniff_format(lines, separators)
+    if exact_columns and columns != 2:
+        raise DataImportError(f"Expected 2 columns, got {columns}")
+
+    try:
+        if pd is not None:
+            kwargs = {"sep": r"\s+"} if delimiter is None else {"sep": delimiter}
+            frame = pd.read_csv(path, header=None, skiprows=header_lines, usecols=[0, 1],
+                                dtype=float, engine="c", float_precision="high", **kwargs)
+            data = frame.values
+        else:
+            data = np.loadtxt(path, delimiter=delimiter, skiprows=header_lines, usecols=(0, 1), ndmin=2)
+    except Exception as e:
+        raise DataImportError(f"Cannot parse file: {e}")
+
+    data = np.ascontiguousarray(data, dtype=float)
+    if data.ndim != 2 or data.shape[1] != 2:
+        raise DataImportError(f"Expected 2 columns, got shape {data.shape}")
+    print("PyQt - Read %d rows from %s in %.3f s (delimiter %r, %d header lines, %s)" % (
+        data.shape[0], path, time.perf_counter() - start, delimiter or "whitespace", header_lines,
+        "pandas" if pd is not None else "numpy"))
+    if key is not None:
+        cache.put(key, data)
+    return data
@@ -0,0 +1,309 @@
+"""Calibration database: one shared MongoDB client and a background write queue (no Qt imports).
+
+The server is taken from the CALIBRATION_MONGO_URI environment variable
+(default mongodb://localhost:27017/). Saving only puts the document on a
+queue. numpy arrays in the document are stored as binary blobs (see
+app/array_codec.py). A worker thread writes the queued documents in batches with
+insert_many and retries failed writes. Documents that still cannot be written
+are appended to a local spool file, which is replayed right after the next
+successful write.
+
+For tests, WriteQueue takes a collection_factory, so it can write to a local
+mongod, to an in-process stand-in such as mongomock, or to any object with an
+insert_many(documents, ordered=False) method.
+"""
+
+import json
+import os
+import queue
+import threading
+import time
+
+from app.array_codec import decode_arrays, encode_arrays, json_default, json_object_hook, offload_large_arrays
+from app.disk_cache import DEFAULT_CACHE_ROOT
+
+
+MONGO_URI_ENV = "CALIBRATION_MONGO_URI"
+DEFAULT_MONGO_URI = "mongodb://localhost:27017/"
+DATABASE_NAME = "calibration_db"
+COLLECTION_NAME = "calibrations"
+MAX_POOL_SIZE = 10
+SERVER_SELECTION_TIMEOUT_MS = 3000
+WRITE_BATCH_SIZE = 50
+WRITE_RETRIES = 3
+RETRY_DELAY_S = 1.0  # doubled after every failed attempt
+SPOOL_PATH = os.path.join(DEFAULT_CACHE_ROOT, "database_spool.jsonl")
+DUPLICATE_KEY_ERROR = 11000
+
+_client = None
+_client_lock = threading.Lock()
+_gridfs = None
+_write_queue = None
+
+
+def mongo_uri():
+    return os.environ.get(MONGO_URI_ENV) or DEFAULT_MONGO_URI
+
+
+def get_client():
+    """Process-wide MongoClient (connection pool), created on first use."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            from pymongo import MongoClient  # imported on first use, pymongo is slow to import
+            _client = MongoClient(mongo_uri(), maxPoolSize=MAX_POOL_SIZE,
+                                  serverSelectionTimeoutMS=SERVER_SELECTION_TIMEOUT_MS, connect=False)
+            print("PyQt - MongoDB client created for %s" % mongo_uri())
+        return _client
+
+
+def get_collection(name=COLLECTION_NAME):
+    return get_client()[DATABASE_NAME][name]
+
+
+def get_gridfs():
+    """GridFS of the calibration database, holding arrays too large to store inline."""
+    global _gridfs
+    if _gridfs is None:
+        import gridfs
+        _gridfs = gridfs.GridFS(get_client()[DATABASE_NAME])
+    return _gridfs
+
+
+def decode_document(document, gridfs_factory=get_gridfs):
+    """Stored document with its encoded arrays decoded back to numpy."""
+    return decode_arrays(document, gridfs_factory)
+
+
+def new_document_id():
+    """ObjectId for a new document (None without bson, the server then assigns one)."""
+    try:
+        from bson import ObjectId
+    except ImportError:
+        return None
+    return ObjectId()
+
+
+def _dumps(document):
+    try:
+        from bson import json_util
+        return json_util.dumps(document)
+    except ImportError:
+        return json.dumps(document, default=json_default)
+
+
+def _loads(line):
+    try:
+        from bson import json_util
+        return json_util.loads(line)
+    except ImportError:
+        return json.loads(line, object_hook=json_object_hook)
+
+
+def _only_duplicate_keys(error):
+    """True if a bulk write failed only because documents were already stored (by an earlier attempt)."""
+    details = getattr(error, "details", None) or {}
+    write_errors = details.get("writeErrors") or []
+    return bool(write_errors) and not details.get("writeConcernErrors") and \
+        all(e.get("code") == DUPLICATE_KEY_ERROR for e in write_errors)
+
+
+class WriteQueue:
+    """Writes submitted documents on a background thread; submit() never blocks on the server.
+
+    Every document gets its _id at submit time, so a retry after a partly
+    successful insert_many only hits duplicate keys, which count as written.
+    """
+
+    def __init__(self, collection_factory=get_collection, spool_path=SPOOL_PATH, batch_size=WRITE_BATCH_SIZE,
+                 retries=WRITE_RETRIES, retry_delay_s=RETRY_DELAY_S, gridfs_factory=get_gridfs):
+        self.collection_factory = collection_factory
+        self.gridfs_factory = gridfs_factory
+        self.spool_path = spool_path
+        self.batch_size = batch_size
+        self.retries = retries
+        self.retry_delay_s = retry_delay_s
+        self.queue = queue.Queue()
+        self.lock = threading.Lock()
+        self.spool_lock = threading.Lock()
+        self.thread = None
+        self.closing = False
+        self.in_flight = []  # batch the worker is writing right now
+        self.written = 0
+        self.spooled = 0
+        self._recover_replay()
+
+    def submit(self, document):
+        """Queue document for writing; returns its _id."""
+        document = encode_arrays(document)
+        if "_id" not in document:
+            document_id = new_document_id()
+            if document_id is not None:
+                document["_id"] = document_id
+        with self.lock:
+            if self.closing:
+                raise RuntimeError("database write queue is closed")
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, name="database-writer", daemon=True)
+                self.thread.start()
+            self.queue.put(document)
+        return document.get("_id")
+
+    def pending(self):
+        return self.queue.qsize()
+
+    def close(self, timeout=None):
+        """Write what is queued (failures go to the spool without further retries) and stop the thread.
+
+        If the worker is still busy after timeout, the batch it is writing and
+        everything still queued are spooled, so nothing is lost when the
+        process exits. A batch that is written after all is then stored
+        twice in the spool; the replay skips it as a duplicate key.
+        """
+        with self.lock:
+            self.closing = True
+            thread = self.thread
+            if thread is not None:
+                self.queue.put(None)
+        if thread is None:
+            return
+        thread.join(timeout)
+        if thread.is_alive():
+            left = list(self.in_flight)
+            while True:
+                try:
+                    document = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                if document is not None:
+                    left.append(document)
+            print("Warning: database writer still busy after %s s" % timeout)
+            if left:
+                self._spool(left)
+
+    def _run(self):
+        stop = False
+        while not stop:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            if None in batch:
+                stop = True
+                batch = [document for document in batch if document is not None]
+            self.in_flight = batch
+            if batch and self._write(batch):
+                self.in_flight = []
+                self._replay_spool()
+            self.in_flight = []
+        print("PyQt - Database writer stopped (%d written, %d spooled)" % (self.written, self.spooled))
+
+    def _write(self, documents):
+        """insert_many with retries; spools the documents and returns False if all attempts fail."""
+        delay = self.retry_delay_s
+        for attempt in range(1, self.retries + 1):
+            try:
+                for document in documents:
+                    offload_large_arrays(document, self.gridfs_factory)
+                self.collection_factory().insert_many(documents, ordered=False)
+                self.written += len(documents)
+                print("PyQt - Saved %d document(s) to MongoDB" % len(documents))
+                return True
+            except Exception as e:
+                if _only_duplicate_keys(e):
+                    self.written += len(documents)
+                    return True
+                print("Warning: MongoDB write failed (attempt %d of %d): %s" % (attempt, self.retries, e))
+                if attempt == self.retries or self.closing:
+                    break
+                time.sleep(delay)
+                delay *= 2
+        self._spool(documents)
+        return False
+
+    def _spool(self, documents):
+        try:
+            os.makedirs(os.path.dirname(self.spool_path), exist_ok=True)
+            lines = "".join(_dumps(document) + "\n" for document in documents)
+            with self.spool_lock, open(self.spool_path, "a", encoding="utf-8") as f:
+                f.write(lines)
+            self.spooled += len(documents)
+            print("PyQt - %d document(s) spooled to %s, they are written once the server is reachable"
+                  % (len(documents), self.spool_path))
+        except OSError as e:
+            print("Error: cannot spool %d document(s) to %s: %s" % (len(documents), self.spool_path, e))
+
+    def _recover_replay(self):
+        """Append the documents of an interrupted replay (<spool>.replay) back to the spool."""
+        replay_path = self.spool_path + ".replay"
+        if not os.path.exists(replay_path):
+            return
+        try:
+            with self.spool_lock:
+                with open(replay_path, "r", encoding="utf-8") as f:
+                    lines = [line if line.endswith("\n") else line + "\n" for line in f if line.strip()]
+                with open(self.spool_path, "a", encoding="utf-8") as f:
+                    f.writelines(lines)
+                os.remove(replay_path)
+            print("PyQt - %d document(s) of an interrupted replay moved back to %s" % (len(lines), self.spool_path))
+        except OSError as e:
+            print("Error: cannot recover the interrupted database replay %s: %s" % (replay_path, e))
+
+    def _replay_spool(self):
+        """Write the spooled documents; the spool file is moved aside first and whatever fails is spooled again.
+
+        Until the replay has finished, the documents stay in <spool>.replay,
+        which is merged back into the spool if the replay is interrupted.
+        """
+        self._recover_replay()
+        replay_path = self.spool_path + ".replay"
+        if not os.path.exists(self.spool_path) or os.path.exists(replay_path):
+            return
+        try:
+            with self.spool_lock:
+                os.replace(self.spool_path, replay_path)
+            with open(replay_path, "r", encoding="utf-8") as f:
+                lines = [line for line in f if line.strip()]
+        except OSError as e:
+            print("Error: cannot read the database spool %s: %s" % (self.spool_path, e))
+            return
+        documents = []
+        for line in lines:
+            try:
+                documents.append(_loads(line))
+            except ValueError as e:
+                # Kept aside for manual inspection instead of blocking every later replay
+                print("Error: unreadable spooled document moved to %s.bad: %s" % (self.spool_path, e))
+                with open(self.spool_path + ".bad", "a", encoding="utf-8") as f:
+                    f.write(line if line.endswith("\n") else line + "\n")
+        print("PyQt - Replaying %d spooled document(s)" % len(documents))
+        for start in range(0, len(documents), self.batch_size):
+            if not self._write(documents[start:start + self.batch_size]):
+                rest = documents[start + self.batch_size:]
+                if rest:
+                    self._spool(rest)
+                break
+        os.remove(replay_path)
+
+
+def write_queue():
+    """Process-wide WriteQueue writing to the shared client's calibrations collection."""
+    global _write_queue
+    if _write_queue is None:
+        _write_queue = WriteQueue()
+    return _write_queue
+
+
+def shutdown(timeout=SERVER_SELECTION_TIMEOUT_MS / 1000. * 2):
+    """Flush the write queue and close the client (connected to QApplication.aboutToQuit)."""
+    global _client, _gridfs, _write_queue
+    if _write_queue is not None:
+        _write_queue.close(timeout)
+        _write_queue = None
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+            _gridfs = None
@@ -0,0 +1,157 @@
+"""Size-bounded on-disk cache of numpy results, keyed by a hash of the inputs."""
+
+import hashlib
+import os
+import tempfile
+
+import numpy as np
+
+
+DEFAULT_CACHE_ROOT = os.path.join(os.path.expanduser("~"), ".calibration_app")
+
+
+def hash_key(*parts):
+    """sha256 hex digest of arrays, numbers, strings and (nested) lists/tuples of them."""
+    digest = hashlib.sha256()
+
+    def feed(part):
+        if isinstance(part, np.ndarray):
+            array = np.ascontiguousarray(part)
+            digest.update(("ndarray:%s:%s;" % (array.dtype.str, array.shape)).encode())
+            digest.update(array.tobytes())
+        elif isinstance(part, (list, tuple)):
+            digest.update(("seq:%d;" % len(part)).encode())
+            for item in part:
+                feed(item)
+        else:
+            digest.update(("%s:%r;" % (type(part).__name__, part)).encode())
+
+    for part in parts:
+        feed(part)
+    return digest.hexdigest()
+
+
+class DiskCache:
+    """Directory of .npz entries with least-recently-used eviction.
+
+    Entries are dicts of numpy arrays (scalars are stored as 0-d arrays). Reading
+    an entry refreshes its modification time, which is what eviction orders by
+    once the directory grows beyond max_bytes. Every I/O error is reported and
+    treated as a cache miss, so a broken cache never breaks the caller.
+    """
+
+    SUFFIX = ".npz"
+
+    def __init__(self, directory, max_bytes):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def path(self, key):
+        return os.path.join(self.directory, key + self.SUFFIX)
+
+    def get(self, key):
+        """Stored dict for key, or None."""
+        path = self.path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                entry = {name: data[name] for name in data.files}
+            os.utime(path, None)
+            return entry
+        except Exception as e:
+            print("PyQt - Warning: unreadable cache entry %s (%s), ignoring it" % (path, e))
+            self.discard(key)
+            return None
+
+    def put(self, key, entry):
+        """Store a dict of arrays under key, then evict old entries above max_bytes."""
+        tmp_path = None
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(suffix=self.SUFFIX, dir=self.directory)
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, **{name: np.asarray(value) for name, value in entry.items()})
+            os.replace(tmp_path, self.path(key))
+        except Exception as e:
+            print("PyQt - Warning: could not write cache entry %s (%s)" % (key, e))
+            self._remove_temporary(tmp_path)
+            return
+        self.evict()
+
+    @staticmethod
+    def _remove_temporary(tmp_path):
+        if tmp_path is None:
+            return
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+    def discard(self, key):
+        try:
+            os.remove(self.path(key))
+        except OSError:
+            pass
+
+    def evict(self):
+        """Remove least recently used entries until the cache fits into max_bytes."""
+        try:
+            entries = []
+            for name in os.listdir(self.directory):
+                if name.endswith(self.SUFFIX):
+                    stat = os.stat(os.path.join(self.directory, name))
+                    entries.append((stat.st_mtime, stat.st_size, name))
+        except OSError:
+            return
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+                total -= size
+            except OSError as e:
+                # e.g. an entry that is still memory-mapped by a caller (Windows), removed on a later eviction
+                print("PyQt - Warning: cache entry %s not evicted (%s)" % (name, e))
+
+
+class ArrayCache(DiskCache):
+    """Directory of single-array .npy entries; entries of MMAP_MIN_BYTES or more are memory-mapped copy-on-write.
+
+    Smaller entries are read into memory, so the files are not held open and
+    can be replaced or evicted (on Windows a mapped file cannot be removed).
+    """
+
+    SUFFIX = ".npy"
+    MMAP_MIN_BYTES = 64 * 1024 * 1024
+
+    def get(self, key):
+        """Stored array for key (writable, changes stay in memory), or None."""
+        path = self.path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            mmap_mode = "c" if os.path.getsize(path) >= self.MMAP_MIN_BYTES else None
+            array = np.load(path, mmap_mode=mmap_mode, allow_pickle=False)
+            os.utime(path, None)
+            return array.view(np.ndarray)
+        except Exception as e:
+            print("PyQt - Warning: unreadable cache entry %s (%s), ignoring it" % (path, e))
+            self.discard(key)
+            return None
+
+    def put(self, key, array):
+        """Store one array under key, then evict old entries above max_bytes."""
+        tmp_path = None
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(suffix=self.SUFFIX, dir=self.directory)
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, np.asarray(array), allow_pickle=False)
+            os.replace(tmp_path, self.path(key))
+        except Exception as e:
+            print("PyQt - Warning: could not write cache entry %s (%s)" % (key, e))
+            self._remove_temporary(tmp_path)
+            return
+        self.evict()
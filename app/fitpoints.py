@@ -3,7 +3,10 @@ from PyQt5.QtCore import Qt
 import numpy as np
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from app.select_calibration_tab import preset_lib
+from app.reference_profiles import preset_lib
+from app import pipeline
+from app.calibration_model import initial_guess, make_calibration_function
+from app.pipeline import PipelineError
 
 
 class FitpointsTab:
@@ -407,46 +410,25 @@ class FitpointsTab:
         print(f"PyQt - show_fit_anchor_points: X_dat after alignment min={np.min(X_dat):.3f}, max={np.max(X_dat):.3f}, len={len(X_dat)}")
 
         # Build plateau lists
+        params = self.pipeline_parameters()
         if self.G_fit_Mode == self.fit_settings_selection[0]:  # Automatic mode
-            X_plateaus_cal, step_pos = self.alignment_tab.estimate_plateaus(
-                X_cal, Y_cal, plot_plateau=False, variable_set="Get Fitpoints")
-            Y_plateaus_cal = [Y_cal[self.alignment_tab.get_closest_pxl_to_value(X_cal, i)[0]] for i in X_plateaus_cal]
-            print(f"PyQt - Initial X_plateaus_cal: {X_plateaus_cal}")
-            print(f"PyQt - Initial Y_plateaus_cal: {Y_plateaus_cal}")
-
-            if self.fit_includeleft:
-                Y_plateaus_cal.insert(0, Y_cal[0])
-                X_plateaus_cal.insert(0, X_cal[0])
-            if self.fit_includeright:
-                Y_plateaus_cal.append(Y_cal[-1])
-                X_plateaus_cal.append(X_cal[-1])
-
-            # Insert intermediate fitpoints
-            k = 0
-            for i in range(len(X_plateaus_cal) - 1):
-                if i < len(self.G_fitpoints) and self.G_fitpoints[i] != 0:
-                    inbetween_fitpoints = self.G_fitpoints[i]
-                    sign_of_step = np.sign(Y_plateaus_cal[i + 1 + k] - Y_plateaus_cal[i + k])
-                    start_of_step = Y_plateaus_cal[i + k]
-                    height_of_step = np.abs(Y_plateaus_cal[i + 1 + k] - Y_plateaus_cal[i + k])
-                    for j in range(inbetween_fitpoints):
-                        Y_plateaus_cal.insert(i + 1 + k, start_of_step + (j + 1) * sign_of_step * height_of_step / (inbetween_fitpoints + 1))
-                        X_plateaus_cal.insert(i + 1 + k, X_cal[self.alignment_tab.get_closest_pxl_to_value(Y_cal, Y_plateaus_cal[i + 1 + k])[0]])
-                        k += 1
+            manual_Y_plateaus_cal = None
         else:  # Manual mode
             if not hasattr(self, 'X_plateaus_cal') or not hasattr(self, 'Y_plateaus_cal'):
                 print("Error: Manual fitpoints not set. Using empty lists.")
                 self.X_plateaus_cal = []
                 self.Y_plateaus_cal = []
-            X_plateaus_cal = self.X_plateaus_cal
-            Y_plateaus_cal = self.Y_plateaus_cal
+            manual_Y_plateaus_cal = self.Y_plateaus_cal
 
+        try:
+            X_plateaus_cal, Y_plateaus_cal, X_plateaus_dat, Y_plateaus_dat = pipeline.find_fitpoints(
+                X_cal, Y_cal, X_dat, Y_dat, params, manual_Y_plateaus_cal)
+        except PipelineError as e:
+            self.ui.Fit_go_pushButton.setStyleSheet("background-color: red; color: black")
+            QMessageBox.critical(self.main_window, "Error", str(e))
+            print(f"Error: {e}")
+            return
         print(f"PyQt - Y_plateaus_cal (final): {Y_plateaus_cal}")
-
-        # Map calibration plateaus to measurement data
-        X_plateaus_cal = [X_cal[self.alignment_tab.get_closest_pxl_to_value(Y_cal, i)[0]] for i in Y_plateaus_cal]
-        X_plateaus_dat = [X_dat[self.alignment_tab.get_closest_pxl_to_value(X_dat, i)[0]] for i in X_plateaus_cal]
-        Y_plateaus_dat = [Y_dat[self.alignment_tab.get_closest_pxl_to_value(X_dat, i)[0]] for i in X_plateaus_dat]
         print(f"PyQt - Y_plateaus_dat: {Y_plateaus_dat}")
 
         # Store as attributes
@@ -584,60 +566,17 @@ class FitpointsTab:
     # Interpolation builder
     # =========================================================================
 
+    def pipeline_parameters(self):
+        """Alignment-tab pipeline parameters plus the fitpoint settings of this tab."""
+        return self.alignment_tab.pipeline_parameters().copy(
+            fit_includeleft=bool(self.fit_includeleft),
+            fit_includeright=bool(self.fit_includeright),
+            fitpoints=list(self.G_fitpoints),
+        )
+
     def make_func(self, Dopants):
-        def _function_linint_(R, *args):
-            # only monotone changes allowed (so far)
-            sign_data = np.sign(np.sum(args[1:]))
-            G_u = 1E6
-
-            def halfstep_l(x, val):
-                return 0.5 * (1 + np.tanh(-G_u * (x - val)))
-
-            def halfstep_r(x, val):
-                return 0.5 * (1 + np.tanh(G_u * (x - val)))
-
-            def step(x, val_l, val_r):
-                return 0.5 * (np.tanh(G_u * (x - val_l)) - np.tanh(G_u * (x - val_r)))
-
-            def interval(x, val_l, val_r, D_l, D_r):
-                return ((x - val_l) * (D_r - D_l) / (val_r - val_l) + D_l) * step(x, val_l, val_r)
-
-            # build resistance values along axis (only positive changes allowed)
-            r = []
-            j = 0
-            for i in args:
-                if j is not 0:
-                    i = j + sign_data * abs(i)
-                j = i
-                r.append(i)
-
-            # list of segments (each segment will be an array)
-            y = []
-            for i in range(0, len(r) - 1):
-                if i == 0:  # first segment for extrapolation to lower r vals
-                    if sign_data == -1:
-                        y.append(((R - r[i + 1]) * (Dopants[i + 1] - Dopants[i]) / (r[i + 1] - r[i]) + Dopants[1]) * halfstep_r(R, r[i + 1]))
-                    elif sign_data == 1:
-                        y.append(((R - r[i + 1]) * (Dopants[i + 1] - Dopants[i]) / (r[i + 1] - r[i]) + Dopants[1]) * halfstep_l(R, r[i + 1]))
-                elif i == (len(r) - 2):  # last segment for extrapolation to higher r vals
-                    if sign_data == -1:
-                        y.append(((R - r[i]) * (Dopants[i + 1] - Dopants[i]) / (r[i + 1] - r[i]) + Dopants[i]) * halfstep_l(R, r[i]))
-                    elif sign_data == 1:
-                        y.append(((R - r[i]) * (Dopants[i + 1] - Dopants[i]) / (r[i + 1] - r[i]) + Dopants[i]) * halfstep_r(R, r[i]))
-                else:  # interpolation
-                    if sign_data == 1:
-                        y.append(interval(R, r[i], r[i + 1], Dopants[i], Dopants[i + 1]))
-                    elif sign_data == -1:
-                        y.append(-interval(R, r[i], r[i + 1], Dopants[i], Dopants[i + 1]))
-
-            return np.sum(np.array(y), axis=0)
-
-        def _function_main(X, *args):
-            ref_X_dat = self.alignment_tab.ref(X)
-            print(f"PyQt - calibration_start: ref_X_dat min={np.min(ref_X_dat):.3f}, max={np.max(ref_X_dat):.3f}, len={len(ref_X_dat)}")
-            return _function_linint_(self.alignment_tab.ref(X), *args)
-
-        return _function_main, _function_linint_
+        """(function of depth, function of measurement value) of the calibration curve through Dopants."""
+        return make_calibration_function(Dopants, self.alignment_tab.ref)
 
     # =========================================================================
     # Final plotting on Calibration tab
@@ -664,16 +603,9 @@ class FitpointsTab:
         print(f"PyQt - fit_go: Y_dat min={np.min(Y_dat):.3f}, max={np.max(Y_dat):.3f}, len={len(Y_dat)}")
 
         # Sort plateaus
-        G_cal_setting = self.select_calibration_tab.G_cal_setting
-        if G_cal_setting == 1:
-            plateau_order = sorted(range(len(self.Y_plateaus_cal)), key=lambda k: self.Y_plateaus_cal[k])[::-1]
-        elif G_cal_setting == 2:
-            plateau_order = sorted(range(len(self.Y_plateaus_cal)), key=lambda k: self.Y_plateaus_cal[k])
-
-        X_plateaus_cal = [self.X_plateaus_cal[i] for i in plateau_order]
-        X_plateaus_dat = [self.X_plateaus_dat[i] for i in plateau_order]
-        Y_plateaus_cal = [self.Y_plateaus_cal[i] for i in plateau_order]
-        Y_plateaus_dat = [self.Y_plateaus_dat[i] for i in plateau_order]
+        X_plateaus_cal, Y_plateaus_cal, X_plateaus_dat, Y_plateaus_dat = pipeline.order_fitpoints(
+            self.X_plateaus_cal, self.Y_plateaus_cal, self.X_plateaus_dat, self.Y_plateaus_dat,
+            self.select_calibration_tab.G_cal_setting)
         print(f"Ordered steps: X_plateaus_cal={X_plateaus_cal}, X_plateaus_dat={X_plateaus_dat}, Y_plateaus_cal={Y_plateaus_cal}, Y_plateaus_dat={Y_plateaus_dat}")
 
         # Store ordered versions
@@ -683,12 +615,7 @@ class FitpointsTab:
         self.Y_plateaus_dat = Y_plateaus_dat
 
         # Initial guess
-        self.initialguess = []
-        for i in range(0, len(Y_plateaus_dat)):
-            if i == 0:
-                self.initialguess.append(Y_plateaus_dat[i])
-            else:
-                self.initialguess.append(Y_plateaus_dat[i] - Y_plateaus_dat[i - 1])
+        self.initialguess = initial_guess(Y_plateaus_dat)
         print(f"PyQt - fit_go: initialguess={self.initialguess}")
         print(f"PyQt - fit_go: initialguess stored: {hasattr(self, 'initialguess')}")
 
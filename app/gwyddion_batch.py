@@ -0,0 +1,117 @@
+"""Gwyddion file helpers: cached loading and batch calibration (no Qt imports, runs in worker processes).
+
+gwyfile is imported inside the functions so that importing this module (done
+at application start) does not load it.
+"""
+
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+import glob
+import os
+
+from app.calibration_model import knots_from_params, make_linint
+from app.image_calibration import DEFAULT_LUT_SIZE, DEFAULT_TILE_MB, CalibrationLUT, calibrate_image
+
+
+CALIBRATED_SUFFIX = "_calibrated.gwy"
+
+
+class GwyddionFileCache:
+    """Parsed Gwyddion files keyed by path, reused while the file's mtime and size are unchanged.
+
+    Keeps the max_entries most recently used files. Callers get the cached
+    datafields and must copy a datafield before modifying it.
+    """
+
+    def __init__(self, max_entries=4):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+
+    def datafields(self, path):
+        """{channel name: GwyDataField} of path, parsed only if the file changed on disk."""
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        entry = self.entries.get(path)
+        if entry is not None and entry[0] == signature:
+            self.entries.move_to_end(path)
+            return entry[1]
+
+        import gwyfile
+
+        df = gwyfile.util.get_datafields(gwyfile.load(path))
+        print("PyQt - Gwyddion file parsed: %s (%d channels)" % (path, len(df)))
+        self.entries[path] = (signature, df)
+        self.entries.move_to_end(path)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return df
+
+    def clear(self):
+        self.entries.clear()
+
+
+def calibrated_path(path):
+    return os.path.splitext(path)[0] + CALIBRATED_SUFFIX
+
+
+def find_gwyddion_files(location):
+    """Sorted .gwy files of a directory or a glob pattern, without previously calibrated outputs."""
+    if os.path.isdir(location):
+        location = os.path.join(location, "*.gwy")
+    return sorted(
+        path for path in glob.glob(location)
+        if os.path.isfile(path) and not path.endswith(CALIBRATED_SUFFIX)
+    )
+
+
+def parse_channel_patterns(text):
+    """Channel names or fnmatch patterns, one per line or comma separated."""
+    return [part.strip() for line in text.splitlines() for part in line.split(",") if part.strip()]
+
+
+def match_channels(names, patterns):
+    """Channels matching any pattern, in file order."""
+    return [name for name in names if any(fnmatchcase(name, pattern) for pattern in patterns)]
+
+
+def calibrate_gwyddion_file(path, patterns, Dopants, popt, use_lut=True, lut_size=DEFAULT_LUT_SIZE,
+                            lut_max_error=1E-3, tile_mb=DEFAULT_TILE_MB):
+    """Write <name>_calibrated.gwy with every matching channel calibrated; returns (output path, channels)."""
+    import gwyfile
+    from gwyfile.objects import GwyContainer, GwySIUnit
+
+    obj = gwyfile.load(path)
+    df = gwyfile.util.get_datafields(obj)
+    channels = match_channels(list(df.keys()), patterns)
+    if not channels:
+        raise ValueError("no channel matches %s" % ", ".join(patterns))
+
+    curve, params = make_linint(Dopants), tuple(popt)
+    if use_lut:
+        lut = CalibrationLUT.for_images(curve, params, [df[channel]['data'] for channel in channels], lut_size,
+                                        knots=knots_from_params(popt))
+        if lut.max_error <= lut_max_error:
+            curve, params = lut, ()
+
+    obj_write = GwyContainer()
+    for i, channel in enumerate(channels):
+        dfi = df[channel]
+        dfi.data = calibrate_image(dfi['data'], curve, params, shape=(dfi['yres'], dfi['xres']),
+                                   tile_mb=tile_mb, workers=1)
+        dfi.si_unit_z = GwySIUnit([('unitstr', '')])
+        obj_write[f"/{i}/data/title"] = f"{channel}_cal"
+        obj_write[f"/{i}/data"] = dfi
+
+    output = calibrated_path(path)
+    obj_write.tofile(output)
+    return output, channels
+
+
+def run_batch_job(path, patterns, Dopants, popt, options):
+    """calibrate_gwyddion_file that never raises: (path, output, channels, error message)."""
+    try:
+        output, channels = calibrate_gwyddion_file(path, patterns, Dopants, popt, **options)
+        return path, output, channels, None
+    except Exception as e:
+        return path, None, [], "%s: %s" % (type(e).__name__, e)
@@ -0,0 +1,111 @@
+"""Tiled calibration of 2-D measurement maps (Gwyddion channels), no Qt imports."""
+
+from concurrent.futures import ThreadPoolExecutor
+import os
+
+import numpy as np
+
+
+DEFAULT_TILE_MB = 16
+# float64 temporaries per pixel while a tile is calibrated (input copy, segment
+# index, gathered knots/slopes, result)
+CALIBRATION_BYTES_PER_PIXEL = 6 * 8
+
+
+def tile_rows(shape, tile_mb=DEFAULT_TILE_MB):
+    """Rows per tile so that one tile's working set stays within tile_mb."""
+    row_bytes = max(1, int(np.prod(shape[1:], dtype=np.int64))) * CALIBRATION_BYTES_PER_PIXEL
+    return max(1, int(tile_mb * 1024 * 1024 // row_bytes))
+
+
+def calibrate_image(data, curve, params, shape=None, tile_mb=DEFAULT_TILE_MB, workers=None):
+    """Apply curve(values, *params) to a map tile by tile; returns a new float64 array.
+
+    data is reshaped to shape (yres, xres) if given. Row tiles are calibrated on
+    a thread pool of `workers` threads (numpy releases the GIL) and written into
+    a preallocated output, so the extra memory is bounded by
+    workers * tile_mb however large the map is.
+    """
+    data = np.asarray(data, dtype=float)
+    if shape is not None:
+        data = data.reshape(shape)
+    if data.ndim < 2:
+        data = data.reshape(1, -1)
+    out = np.empty(data.shape)
+
+    rows = tile_rows(data.shape, tile_mb)
+    tiles = [(start, min(start + rows, data.shape[0])) for start in range(0, data.shape[0], rows)]
+
+    def calibrate_tile(start, stop):
+        out[start:stop] = curve(data[start:stop], *params)
+
+    workers = max(1, min(workers or os.cpu_count() or 1, len(tiles)))
+    if workers == 1:
+        for start, stop in tiles:
+            calibrate_tile(start, stop)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(lambda tile: calibrate_tile(*tile), tiles))
+    return out
+
+
+DEFAULT_LUT_SIZE = 16384
+LUT_CHECK_OVERSAMPLING = 4
+
+
+class CalibrationLUT:
+    """Calibration curve compiled into a lookup table on a uniform grid over [lo, hi].
+
+    Values are mapped by linear interpolation between the table entries; values
+    outside [lo, hi] (or NaN) fall back to the exact curve. max_error is the
+    largest deviation from the exact curve found on a grid LUT_CHECK_OVERSAMPLING
+    times finer than the table plus the given knots. For the piecewise-linear
+    calibration curve the error peaks at the knots, so passing them makes
+    max_error a true bound.
+    """
+
+    def __init__(self, curve, params, lo, hi, size=DEFAULT_LUT_SIZE, knots=None):
+        self.curve = curve
+        self.params = tuple(params)
+        self.lo = float(lo)
+        self.hi = float(hi) if hi > lo else float(lo) + 1.
+        self.size = max(2, int(size))
+        self.step = (self.hi - self.lo) / (self.size - 1)
+        self.x = np.linspace(self.lo, self.hi, self.size)
+        self.y = np.asarray(curve(self.x, *self.params), dtype=float)
+
+        check = np.linspace(self.lo, self.hi, (self.size - 1) * LUT_CHECK_OVERSAMPLING + 1)
+        if knots is not None:
+            knots = np.asarray(knots, dtype=float)
+            check = np.concatenate([check, knots[(knots >= self.lo) & (knots <= self.hi)]])
+        self.max_error = float(np.max(np.abs(self.lookup(check) - curve(check, *self.params))))
+
+    @classmethod
+    def for_images(cls, curve, params, images, size=DEFAULT_LUT_SIZE, knots=None):
+        """LUT covering the finite value range of all images."""
+        lo, hi = np.inf, -np.inf
+        for image in images:
+            image = np.asarray(image, dtype=float)
+            finite = image[np.isfinite(image)]
+            if finite.size:
+                lo, hi = min(lo, finite.min()), max(hi, finite.max())
+        if not np.isfinite(lo):
+            lo, hi = 0., 1.
+        return cls(curve, params, lo, hi, size, knots)
+
+    def lookup(self, values):
+        """Table interpolation; only valid inside [lo, hi]."""
+        position = (np.asarray(values, dtype=float) - self.lo) / self.step
+        index = np.clip(position.astype(np.intp), 0, self.size - 2)
+        weight = position - index
+        left = self.y[index]
+        return left + weight * (self.y[index + 1] - left)
+
+    def __call__(self, values):
+        values = np.asarray(values, dtype=float)
+        outside = ~((values >= self.lo) & (values <= self.hi))
+        if not outside.any():
+            return self.lookup(values)
+        result = self.lookup(np.where(outside, self.lo, values))
+        result[outside] = self.curve(values[outside], *self.params)
+        return result
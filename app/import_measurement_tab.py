@@ -8,6 +8,7 @@ from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 import json
 from app.import_parameters import ImportParametersDialog
+from app.data_io import DataImportError, read_xy, xy_cache
 
 
 
@@ -144,6 +145,9 @@ def load_project_settings_from_historique(main_window):
     align.ui.minStretch_slider.setValue(alg.get("min_stretch", -5))
     align.ui.MaxStretch_slider.setValue(alg.get("max_stretch", 5))
     align.ui.Increase_Search_area_checkbox.setChecked(alg.get("increase_search_area", False))
+    align.pyramid_search_checkbox.setChecked(alg.get("pyramid_search", False))
+    align.fft_search_checkbox.setChecked(alg.get("fft_search", False))
+    align.refine_alignment_checkbox.setChecked(alg.get("subgrid_refinement", False))
     align.ui.Search_resol_shift_lineedit.setText(str(alg.get("shift_resolution", "1000")))
     align.ui.Search_resol_Stretch_lineedit.setText(str(alg.get("stretch_resolution", "1000")))
     align.ui.fine_alignement_lineedit.setText(str(alg.get("fine-alignment_number_of_evaluated_points", "50")))
@@ -266,18 +270,13 @@ class ImportMeasurementTab:
         data = None
         debug = False
 
-        # Try multiple separators
-        for delim in self.G_data_separators:
-            try:
-                data = np.loadtxt(path_data, delimiter=delim)
-                if len(data.shape) != 2 or data.shape[1] != 2:
-                    raise ValueError(f"Expected 2 columns, got shape {data.shape}")
-                successful_data_import = True
-                break
-            except Exception as e:
-                if debug:
-                    print(f"Failed with delimiter '{delim}': {e}")
-                continue
+        # Sniff delimiter/header and parse once
+        try:
+            data = read_xy(path_data, self.G_data_separators, exact_columns=True, cache=xy_cache())
+            successful_data_import = True
+        except (DataImportError, OSError) as e:
+            if debug:
+                print(f"Failed to read '{path_data}': {e}")
 
         if successful_data_import:
             try:
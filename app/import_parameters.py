@@ -27,6 +27,9 @@ class ImportParametersDialog(QDialog):
         self.search_edit.textChanged.connect(self.filter_table)
         search_layout.addWidget(QLabel("Filter:"))
         search_layout.addWidget(self.search_edit)
+        database_btn = QPushButton("Browse Database...")
+        database_btn.clicked.connect(self.open_database_browser)
+        search_layout.addWidget(database_btn)
         layout.addLayout(search_layout)
 
         # Table (5 columns now)
@@ -129,17 +132,27 @@ class ImportParametersDialog(QDialog):
             )
             self.table.setRowHidden(row, not visible)
 
+    def open_database_browser(self):
+        from app.calibration_browser import CalibrationBrowserDialog  # Qt dialog of the database, built on demand
+        CalibrationBrowserDialog(self, load_callback=self.apply_settings).exec_()
+
     def import_parameters(self, path):
-        # Same as before – no change needed here
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                settings = json.load(f)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Import failed:\n{e}")
+            return
+        self.apply_settings(settings)
+
+    def apply_settings(self, settings):
+        """Apply saved project parameters (JSON project file or database document); True on success."""
         if not self.main_window.import_measurement_tab.X_data.size > 0:
             QMessageBox.warning(self, "No Data Loaded", 
                                 "Please load a measurement file first.")
-            return
+            return False
 
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                settings = json.load(f)
-
             meas = self.main_window.import_measurement_tab
             calib = self.main_window.select_calibration_tab
             align = self.main_window.alignment_tab
@@ -186,6 +199,9 @@ class ImportParametersDialog(QDialog):
             align.ui.minStretch_slider.setValue(alg.get("min_stretch", -5))
             align.ui.MaxStretch_slider.setValue(alg.get("max_stretch", 5))
             align.ui.Increase_Search_area_checkbox.setChecked(alg.get("increase_search_area", False))
+            align.pyramid_search_checkbox.setChecked(alg.get("pyramid_search", False))
+            align.fft_search_checkbox.setChecked(alg.get("fft_search", False))
+            align.refine_alignment_checkbox.setChecked(alg.get("subgrid_refinement", False))
             align.ui.Search_resol_shift_lineedit.setText(str(alg.get("shift_resolution", "1000")))
             align.ui.Search_resol_Stretch_lineedit.setText(str(alg.get("stretch_resolution", "1000")))
             align.ui.fine_alignement_lineedit.setText(str(alg.get("fine-alignment_number_of_evaluated_points", "50")))
@@ -213,9 +229,11 @@ class ImportParametersDialog(QDialog):
 
             #QMessageBox.information(self, "Success", "Parameters imported.")
             self.close()
+            return True
 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Import failed:\n{e}")
+            return False
 
     def delete_project(self, row, path):
         reply = QMessageBox.question(self, "Confirm", "Delete this project?")
@@ -0,0 +1,169 @@
+"""Convert stored calibrations from nested number lists to binary array blobs.
+
+    python -m app.migrate_database [--dry-run] [--batch-size N] [--uri mongodb://host:27017/]
+
+Documents written before the array encoding (app/array_codec.py) keep "dat"
+and "quality" of calibration_data as nested lists of doubles. This rewrites
+those two fields (ENCODED_FIELDS, the arrays new saves store as blobs) as
+encoded arrays when they hold ENCODE_MIN_ELEMENTS or more values; the other
+fields stay lists, as in newly saved documents. It also fills in the
+canonical cal_setting and carrier_type the calibration browser filters on
+(see app/calibration_queries.py), which older documents store empty. Already
+converted documents are skipped, so the migration can be interrupted and run
+again.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from app import database
+from app.array_codec import encode_arrays, is_encoded, offload_large_arrays
+from app.calibration_queries import CAL_SETTINGS, cal_setting_name, carrier_type_of
+
+
+MIGRATED_FIELD = "calibration_data"
+ENCODED_FIELDS = ("dat", "quality")  # the calibration_data fields export_database saves as arrays
+MIGRATION_BATCH_SIZE = 100
+
+
+def _bson_size(document):
+    import bson
+    encode = getattr(bson, "encode", None) or bson.BSON.encode
+    return len(encode(document))
+
+
+def _gridfs_ids(value):
+    """GridFS ids referenced by the encoded arrays of a (sub)document."""
+    if isinstance(value, dict):
+        if is_encoded(value):
+            return [value["gridfs_id"]] if "gridfs_id" in value else []
+        return [file_id for item in value.values() for file_id in _gridfs_ids(item)]
+    if isinstance(value, list):
+        return [file_id for item in value for file_id in _gridfs_ids(item)]
+    return []
+
+
+def _delete_orphans(collection, gridfs_factory, uploaded):
+    """Delete the GridFS files of {document _id: [file ids]} that the stored documents do not reference."""
+    try:
+        cursor = collection.find({"_id": {"$in": list(uploaded)}}, {MIGRATED_FIELD: 1})
+        referenced = {document["_id"]: set(_gridfs_ids(document)) for document in cursor}
+        for document_id, file_ids in uploaded.items():
+            for file_id in file_ids:
+                if file_id not in referenced.get(document_id, ()):
+                    gridfs_factory().delete(file_id)
+    except Exception as e:
+        print("Warning: GridFS files of the failed batch not cleaned up (%s): %s" % (
+            e, ", ".join(str(file_id) for file_ids in uploaded.values() for file_id in file_ids)))
+
+
+def _cal_setting_of(document):
+    """Canonical cal_setting of a stored document, or None if it cannot be told."""
+    select = document.get("select_calibration") or {}
+    if select.get("data_type") in CAL_SETTINGS.values():  # own sample, the data type combo was shown
+        return select["data_type"]
+    from app.reference_profiles import preset_lib
+    preset = preset_lib.get(document.get("sample"), {}).get(select.get("preset"))
+    if preset is not None:
+        return cal_setting_name(preset["-cal_setting-"])
+    calibration = document.get(MIGRATED_FIELD) or {}
+    if calibration.get("res") is None and calibration.get("cc") is not None:  # only charge carrier calibrations
+        return CAL_SETTINGS[1]
+    return None
+
+
+def _backfilled_fields(document):
+    """{field: value} of the canonical cal_setting and carrier_type a document lacks."""
+    changes = {}
+    if document.get("cal_setting") not in CAL_SETTINGS.values():
+        cal_setting = _cal_setting_of(document)
+        if cal_setting is not None:
+            changes["cal_setting"] = cal_setting
+    carrier_type = carrier_type_of(document.get("dopant_type"))
+    if carrier_type and document.get("carrier_type") != carrier_type:
+        changes["carrier_type"] = carrier_type
+    return changes
+
+
+def _write_batch(collection, gridfs_factory, pending):
+    """Move large blobs of the pending (_id, {field: value}) updates to GridFS and update the documents together.
+
+    If the update fails or is interrupted, the GridFS files that no document
+    ended up referencing are deleted again, so a re-run does not leave orphans.
+    """
+    from pymongo import UpdateOne
+
+    uploaded = {}
+    try:
+        updates = []
+        for document_id, changes in pending:
+            file_ids = offload_large_arrays(changes.get(MIGRATED_FIELD, {}), gridfs_factory)
+            if file_ids:
+                uploaded[document_id] = file_ids
+            updates.append(UpdateOne({"_id": document_id}, {"$set": changes}))
+        collection.bulk_write(updates, ordered=False)
+    except BaseException:
+        if uploaded:
+            _delete_orphans(collection, gridfs_factory, uploaded)
+        raise
+
+
+def migrate(collection, gridfs_factory, batch_size=MIGRATION_BATCH_SIZE, dry_run=False):
+    """Encode the list arrays and backfill the filter fields of every document of collection.
+
+    Returns (documents, bytes before, bytes after).
+    """
+    pending, converted, size_before, size_after = [], 0, 0, 0
+    for document in collection.find({}, no_cursor_timeout=True).batch_size(batch_size):
+        changes = _backfilled_fields(document)
+        if MIGRATED_FIELD in document:
+            encoded = dict(document[MIGRATED_FIELD])
+            for field in ENCODED_FIELDS:
+                if field in encoded:
+                    encoded[field] = encode_arrays(encoded[field], lists=True)
+            if encoded != document[MIGRATED_FIELD]:
+                changes[MIGRATED_FIELD] = encoded
+        if not changes:
+            continue
+        size_before += _bson_size(document)
+        size_after += _bson_size(dict(document, **changes))
+        converted += 1
+        pending.append((document["_id"], changes))
+        if len(pending) >= batch_size:
+            if not dry_run:
+                _write_batch(collection, gridfs_factory, pending)
+            print("Migrated %d documents" % converted)
+            pending = []
+    if pending and not dry_run:
+        _write_batch(collection, gridfs_factory, pending)
+    return converted, size_before, size_after
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m app.migrate_database", description=__doc__.splitlines()[0])
+    parser.add_argument("--uri", help="MongoDB URI (default: $%s or %s)" % (database.MONGO_URI_ENV, database.DEFAULT_MONGO_URI))
+    parser.add_argument("--batch-size", type=int, default=MIGRATION_BATCH_SIZE)
+    parser.add_argument("--dry-run", action="store_true", help="report what would change without writing")
+    args = parser.parse_args(argv)
+    if args.uri:
+        os.environ[database.MONGO_URI_ENV] = args.uri
+
+    start = time.perf_counter()
+    try:
+        converted, size_before, size_after = migrate(database.get_collection(), database.get_gridfs,
+                                                     args.batch_size, args.dry_run)
+    except Exception as e:
+        print("Error: migration failed: %s" % e)
+        return 1
+    finally:
+        database.shutdown()
+    print("%s %d documents in %.1f s: %.1f kB -> %.1f kB" % (
+        "Would migrate" if args.dry_run else "Migrated", converted, time.perf_counter() - start,
+        size_before / 1024., size_after / 1024.))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
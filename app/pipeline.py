@@ -0,0 +1,359 @@
+"""Headless calibration pipeline: import -> trim/flip -> rough -> fine -> fitpoints -> fit -> convert.
+
+Every stage is a plain function of numpy arrays and a PipelineParameters object,
+so the pipeline runs without a QApplication (batch jobs, worker processes,
+profiling). The tabs collect their widget state into a PipelineParameters and
+call the same functions. Nothing here may import PyQt5 or matplotlib.
+"""
+
+import numpy as np
+from scipy.signal import savgol_filter
+
+from app.alignment_engine import (
+    FineAlignmentProblem,
+    NearestIndex,
+    apply_lin_offset,
+    apply_parameters_to_data,
+    build_search_profile,
+    closest_pxls,
+    estimate_plateaus,
+    fine_quality_batch,
+    find_step_pos,
+    get_closest_pxl_to_value,
+    nearest_reference,
+    refine_alignment,
+    rough_quality_chunked,
+    rough_quality_fft,
+    rough_quality_pyramid,
+    rough_search_range,
+    select_candidates,
+)
+from app import calibration_model
+from app.data_io import DataImportError, read_xy
+
+
+DATA_SEPARATORS = [";", "   ", "\t", ","]
+
+
+class PipelineError(Exception):
+    """A pipeline stage cannot continue; the message is meant for the user."""
+
+
+class PipelineParameters:
+    """Every setting a calibration run depends on (the G_* values of the tabs).
+
+    Keyword arguments override the defaults, which are the GUI defaults.
+    """
+
+    def __init__(self, **overrides):
+        # Calibration sample
+        self.step_distance = 0.3
+        self.number_of_steps = 7
+        self.cal_setting = 1  # 1: charge carriers, 2: resistivity
+        self.dopant_type = "B"
+
+        # Trimming ([left, right] in µm, None keeps the whole profile)
+        self.borders_cal = None
+        self.cal_is_flipped = False
+        self.borders_data = None
+        self.data_is_flipped = False
+
+        # Rough alignment
+        self.stretch_window = [-5, 5]  # Allowed stretch in %
+        self.resolution_t = 1000
+        self.resolution_m = 1000
+        self.filterwidth = 7
+        self.filterorder = 1
+        self.increase_searcharea = False
+        self.search_mode = "dense"  # "dense", "pyramid" or "fft"
+        self.pyramid_levels = 3
+        self.pyramid_keep = 8
+        self.memory_budget_mb = 256
+        self.workers = None  # Threads of the FFT search (None: all cores)
+
+        # Fine alignment
+        self.fine_iterations = 50
+        self.nms_radius_m = 2
+        self.nms_radius_t = 2
+        self.refine = False
+        self.refine_max_evals = 60
+
+        # Fitpoints
+        self.fit_includeleft = False
+        self.fit_includeright = False
+        self.fitpoints = [0, 0, 0, 0]  # Intermediate points per step
+
+        # Conversion
+        self.electron_const = calibration_model.G_ELECTRON_CONST
+        self.max_N = list(calibration_model.G_MAX_N)
+
+        for name, value in overrides.items():
+            if not hasattr(self, name):
+                raise TypeError("Unknown pipeline parameter '%s'" % name)
+            setattr(self, name, value)
+
+    def copy(self, **changes):
+        values = dict(vars(self))
+        values.update(changes)
+        return PipelineParameters(**values)
+
+    def as_dict(self):
+        return dict(vars(self))
+
+
+class PipelineResult:
+    """Outputs of run(), one attribute per stage."""
+
+    def __init__(self):
+        self.X_cal = self.Y_cal = self.X_dat = self.Y_dat = None
+        self.quality = self.t_arr = self.m_arr = None
+        self.best_m = self.best_t = self.fine_quality = self.quals = None
+        self.X_plateaus_cal = self.Y_plateaus_cal = None
+        self.X_plateaus_dat = self.Y_plateaus_dat = None
+        self.initialguess = self.popt = self.fitpoints_dat_opt = None
+        self.Y_plateaus_cal_conv = None
+
+
+# =============================================================================
+# Import & trimming
+# =============================================================================
+
+def load_profile(path, separators=DATA_SEPARATORS, cache=None):
+    """Read a two-column depth profile; X is converted to µm and starts at 0.
+
+    cache is passed to read_xy (e.g. data_io.xy_cache()).
+    """
+    try:
+        data = read_xy(path, separators, exact_columns=True, cache=cache)
+    except (DataImportError, OSError) as e:
+        raise PipelineError("Measurement data cannot be read: %s (%s)" % (path, e))
+    if not np.all(np.isfinite(data)):
+        raise PipelineError("Data contains non-numeric or invalid values")
+
+    X = data[:, 0] * 1e6
+    X = X - X[0]
+    Y = data[:, 1]
+    if X.size < 2:
+        raise PipelineError("Data has too few points")
+    return X, Y
+
+
+def trim_and_flip(X, Y, borders, is_flipped):
+    """Cut a profile to its borders (None: keep everything) and optionally reverse it."""
+    if borders is None:
+        borders = [X[0], X[-1]]
+    return apply_parameters_to_data(X, Y, borders, is_flipped)
+
+
+# =============================================================================
+# Alignment
+# =============================================================================
+
+def rough_alignment(X_cal, Y_cal, X_dat, Y_dat, params):
+    """Rough alignment quality surface: (quality, t_arr, m_arr)."""
+    steps_c = find_step_pos(X_cal, Y_cal, params.step_distance, params.number_of_steps, fixed_filterwidth=0)
+    if steps_c is None:
+        raise PipelineError("No calibration steps found, adjust the step settings.")
+    print("PyQt - Calibration steps: %d, positions=%s..." % (len(steps_c), steps_c[:min(len(steps_c), 5)]))
+
+    window = np.array(params.stretch_window) / 100 + 1
+    if params.increase_searcharea:
+        t_min = np.min((np.min(X_dat) - np.max(X_cal)) / window)
+        t_max = np.max((np.max(X_dat) - np.min(X_cal)) / window)
+    else:
+        t_min = np.min((np.min(X_dat) - np.min(steps_c)) / window)
+        t_max = np.max((np.max(X_dat) - np.max(steps_c)) / window)
+        if t_max < t_min:
+            t_max, t_min = min(t_min, t_max), max(t_min, t_max)
+    print("PyQt - Shift range: t_min=%.3f, t_max=%.3f" % (t_min, t_max))
+
+    t_arr = np.linspace(t_min, t_max, params.resolution_t)
+    m_arr = np.linspace(*params.stretch_window, params.resolution_m) / 100 + 1
+    print("PyQt - t_arr range: %.3f to %.3f, length=%d" % (t_arr[0], t_arr[-1], len(t_arr)))
+    print("PyQt - m_arr range: %.3f to %.3f, length=%d" % (m_arr[0], m_arr[-1], len(m_arr)))
+
+    try:
+        Y_input = np.abs(savgol_filter(np.diff(Y_dat), params.filterwidth, params.filterorder))
+    except Exception as e:
+        print("PyQt - Error in savgol_filter: %s" % e)
+        raise PipelineError("Filtering failed. Adjust filter parameters.")
+
+    search_min, search_max = rough_search_range(steps_c, t_arr, m_arr)
+    X_search, Y_search = build_search_profile(X_dat, Y_input, search_min, search_max)
+
+    if params.search_mode == "pyramid":
+        quality, evaluated = rough_quality_pyramid(
+            steps_c, t_arr, m_arr, X_search, Y_search,
+            levels=params.pyramid_levels,
+            keep=params.pyramid_keep,
+            memory_budget_mb=params.memory_budget_mb,
+        )
+        print("PyQt - Pyramid search: evaluated %d of %d grid nodes" % (np.count_nonzero(evaluated), evaluated.size))
+    elif params.search_mode == "fft":
+        quality = rough_quality_fft(
+            steps_c, t_arr, m_arr, X_search, Y_search,
+            memory_budget_mb=params.memory_budget_mb,
+            workers=params.workers,
+        )
+    else:
+        quality = rough_quality_chunked(steps_c, t_arr, m_arr, X_search, Y_search, params.memory_budget_mb)
+    print("PyQt - Quality matrix shape: %s, min=%.7f, max=%.3f, mean=%.3f" % (quality.shape, np.min(quality), np.max(quality), np.mean(quality)))
+    return quality, t_arr, m_arr
+
+
+def fine_alignment_problem(X_cal, Y_cal, X_dat, Y_dat, X_ref, Y_ref, params):
+    """FineAlignmentProblem of the trimmed profiles; X_ref / Y_ref is the untrimmed measurement."""
+    return FineAlignmentProblem(
+        X_cal, Y_cal, X_dat, Y_dat, X_ref, Y_ref,
+        params.step_distance, params.number_of_steps, params.cal_setting == 1,
+    )
+
+
+def fine_alignment(problem, quality, t_arr, m_arr, params, evaluate=None):
+    """Best (m, t) of the rough surface according to spline matching.
+
+    evaluate(problem, candidates) returns the quality of every (m, t) candidate
+    (serial by default; the GUI passes its process-pool version) or None to
+    cancel. Returns (best_m, best_t, best_quality, quals), or None if cancelled.
+    """
+    best_fits = select_candidates(quality, params.fine_iterations, params.nms_radius_m, params.nms_radius_t)
+    print("PyQt - Fine alignment: %d candidates after non-maximum suppression" % best_fits.shape[1])
+    candidates = [(m_arr[int(best_fits[0, i])], t_arr[int(best_fits[1, i])]) for i in range(best_fits.shape[1])]
+
+    if evaluate is None:
+        quals = np.array(fine_quality_batch(problem, candidates))
+    else:
+        quals = evaluate(problem, candidates)
+    if quals is None:
+        return None
+
+    i = np.argmin(quals)
+    best_m, best_t = candidates[i]
+    best_quality = quals[i]
+    print("Fine alignment results: quality=%.7f, stretch=%.1f%%, shift=%.0fnm" % (quals[i], (best_m - 1) * 100, best_t * 1000))
+
+    if params.refine:
+        dm = m_arr[1] - m_arr[0] if m_arr.size > 1 else 0
+        dt = t_arr[1] - t_arr[0] if t_arr.size > 1 else 0
+        best_m, best_t, best_quality, evaluations = refine_alignment(
+            problem, best_m, best_t, dm, dt, params.refine_max_evals, quals[i]
+        )
+        print("Refined alignment results (%d evaluations): quality=%.7f, stretch=%.3f%%, shift=%.1fnm"
+              % (evaluations, best_quality, (best_m - 1) * 100, best_t * 1000))
+    return best_m, best_t, best_quality, quals
+
+
+# =============================================================================
+# Fitpoints & calibration curve
+# =============================================================================
+
+def find_fitpoints(X_cal, Y_cal, X_dat, Y_dat, params, manual_Y_plateaus_cal=None):
+    """Anchor points of the aligned profiles: (X_plateaus_cal, Y_plateaus_cal, X_plateaus_dat, Y_plateaus_dat).
+
+    Without manual_Y_plateaus_cal the plateaus are detected automatically, the
+    profile edges are added on request and params.fitpoints intermediate points
+    are inserted into every step.
+    """
+    if manual_Y_plateaus_cal is None:
+        if params.number_of_steps < 1:
+            raise PipelineError("The number of steps must be at least 1.")
+        X_plateaus_cal, step_pos = estimate_plateaus(X_cal, Y_cal, params.step_distance, params.number_of_steps)
+        if X_plateaus_cal is None:
+            raise PipelineError("Could not find all required steps!")
+        Y_plateaus_cal = list(Y_cal[closest_pxls(X_cal, X_plateaus_cal)])
+
+        if params.fit_includeleft:
+            Y_plateaus_cal.insert(0, Y_cal[0])
+            X_plateaus_cal.insert(0, X_cal[0])
+        if params.fit_includeright:
+            Y_plateaus_cal.append(Y_cal[-1])
+            X_plateaus_cal.append(X_cal[-1])
+
+        # Insert intermediate fitpoints
+        k = 0
+        for i in range(len(X_plateaus_cal) - 1):
+            if i < len(params.fitpoints) and params.fitpoints[i] != 0:
+                inbetween_fitpoints = params.fitpoints[i]
+                sign_of_step = np.sign(Y_plateaus_cal[i + 1 + k] - Y_plateaus_cal[i + k])
+                start_of_step = Y_plateaus_cal[i + k]
+                height_of_step = np.abs(Y_plateaus_cal[i + 1 + k] - Y_plateaus_cal[i + k])
+                for j in range(inbetween_fitpoints):
+                    Y_plateaus_cal.insert(i + 1 + k, start_of_step + (j + 1) * sign_of_step * height_of_step / (inbetween_fitpoints + 1))
+                    X_plateaus_cal.insert(i + 1 + k, X_cal[get_closest_pxl_to_value(Y_cal, Y_plateaus_cal[i + 1 + k])[0]])
+                    k += 1
+    else:
+        Y_plateaus_cal = list(manual_Y_plateaus_cal)
+
+    # Map calibration plateaus to measurement data
+    dat_index = NearestIndex(X_dat)
+    X_plateaus_cal = list(X_cal[closest_pxls(Y_cal, Y_plateaus_cal)])
+    X_plateaus_dat = list(X_dat[dat_index.query(X_plateaus_cal)])
+    Y_plateaus_dat = list(Y_dat[dat_index.query(X_plateaus_dat)])
+    return X_plateaus_cal, Y_plateaus_cal, X_plateaus_dat, Y_plateaus_dat
+
+
+def order_fitpoints(X_plateaus_cal, Y_plateaus_cal, X_plateaus_dat, Y_plateaus_dat, cal_setting):
+    """Sort the anchor points by calibration value (descending for charge carriers)."""
+    plateau_order = sorted(range(len(Y_plateaus_cal)), key=lambda k: Y_plateaus_cal[k])
+    if cal_setting == 1:
+        plateau_order = plateau_order[::-1]
+    return (
+        [X_plateaus_cal[i] for i in plateau_order],
+        [Y_plateaus_cal[i] for i in plateau_order],
+        [X_plateaus_dat[i] for i in plateau_order],
+        [Y_plateaus_dat[i] for i in plateau_order],
+    )
+
+
+def fit_calibration_curve(Y_plateaus_cal, ref, X_cal, Y_cal, initialguess):
+    """Fit the calibration curve; returns (popt, fitted knot positions in measurement units)."""
+    popt, pcov = calibration_model.CalibrationFitSession(Y_plateaus_cal, ref, X_cal).fit(Y_cal, initialguess)
+    return popt, calibration_model.knots_from_params(popt)
+
+
+def convert_to_charge_carriers(Y_log_rho, params):
+    """log10 resistivity -> log10 charge carrier concentration (Masetti mobility)."""
+    N = calibration_model.convert_rho_to_N(np.power(10., np.asarray(Y_log_rho)), params.dopant_type,
+                                           params.max_N, params.electron_const)
+    if N is None:
+        raise PipelineError("Unknown dopant type '%s'" % params.dopant_type)
+    return np.log10(N)
+
+
+# =============================================================================
+# Whole run
+# =============================================================================
+
+def run(X_cal_raw, Y_cal_raw, X_dat_raw, Y_dat_raw, params, evaluate=None):
+    """Run every stage on raw calibration and measurement profiles; returns a PipelineResult."""
+    result = PipelineResult()
+    X_cal, Y_cal = trim_and_flip(X_cal_raw, Y_cal_raw, params.borders_cal, params.cal_is_flipped)
+    X_dat, Y_dat = trim_and_flip(X_dat_raw, Y_dat_raw, params.borders_data, params.data_is_flipped)
+
+    result.quality, result.t_arr, result.m_arr = rough_alignment(X_cal, Y_cal, X_dat, Y_dat, params)
+
+    problem = fine_alignment_problem(X_cal, Y_cal, X_dat, Y_dat, X_dat_raw, Y_dat_raw, params)
+    fine = fine_alignment(problem, result.quality, result.t_arr, result.m_arr, params, evaluate)
+    if fine is None:
+        raise PipelineError("Fine alignment cancelled")
+    result.best_m, result.best_t, result.fine_quality, result.quals = fine
+
+    X_cal, Y_cal, X_dat, Y_dat = apply_lin_offset(X_cal, Y_cal, X_dat, Y_dat, result.best_m, result.best_t)
+    result.X_cal, result.Y_cal, result.X_dat, result.Y_dat = X_cal, Y_cal, X_dat, Y_dat
+
+    fitpoints = find_fitpoints(X_cal, Y_cal, X_dat, Y_dat, params)
+    (result.X_plateaus_cal, result.Y_plateaus_cal,
+     result.X_plateaus_dat, result.Y_plateaus_dat) = order_fitpoints(*fitpoints, params.cal_setting)
+
+    ref_index = NearestIndex(X_dat_raw)
+
+    def ref(X):
+        return nearest_reference(X, X_dat_raw, Y_dat_raw, ref_index)
+
+    result.initialguess = calibration_model.initial_guess(result.Y_plateaus_dat)
+    result.popt, result.fitpoints_dat_opt = fit_calibration_curve(
+        result.Y_plateaus_cal, ref, X_cal, Y_cal, result.initialguess)
+
+    if params.cal_setting == 2:
+        result.Y_plateaus_cal_conv = convert_to_charge_carriers(result.Y_plateaus_cal, params)
+    return result
@@ -0,0 +1,299 @@
+"""Reference calibration samples: measured profiles (data_lib) and their presets (preset_lib).
+
+The profiles live in app/data/reference_profiles.npz and are read on first
+access per sample, so importing this module costs no array parsing. More
+samples can be added without code changes by dropping <name>.npz files
+(arrays data_cc and optionally data_res, columns depth and value) into
+USER_REFERENCE_DIR, optionally with a <name>.json holding its presets in the
+preset_lib format.
+"""
+
+from collections.abc import Mapping
+import copy
+import json
+import os
+
+import numpy as np
+
+from app.disk_cache import DEFAULT_CACHE_ROOT
+
+
+REFERENCE_ARCHIVE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "reference_profiles.npz")
+USER_REFERENCE_DIR = os.path.join(DEFAULT_CACHE_ROOT, "reference_samples")
+OWN_SAMPLE = "Own Sample"
+PROFILE_KINDS = ("data_cc", "data_res")
+
+
+preset_lib = {
+    "pcal":{
+        "Charge carriers -- default":{
+            "-flip_cal_data-":False,
+            "-cal_setting-":1,
+            "-dopant_type-":"B",
+            "-num_steps-":5,
+            "-step_distance-":1,
+            "-stretch-":[-5,5],
+            "-fitpoints-":[0,0,0,0],
+            '-scale_cal-':False
+        },
+        "Resistivity -- default":{
+            "-flip_cal_data-":False,
+            "-cal_setting-":2,
+            "-dopant_type-":"B",
+            "-num_steps-":5,
+            "-step_distance-":1,
+            "-stretch-":[-5,5],
+            "-fitpoints-":[0,0,0,0],
+            '-scale_cal-':False
+        },
+    },
+    "pcs1":{
+        "Charge carriers -- default":{
+            "-flip_cal_data-":False,
+            "-cal_setting-":1,
+            "-dopant_type-":"B",
+            "-num_steps-":7,
+            "-step_distance-":0.3,
+            "-stretch-":[0,8],
+            "-fitpoints-":[0,0,0,0,0,0],
+            '-scale_cal-':False
+        },
+        "Resistivity -- default":{
+            "-flip_cal_data-":False,
+            "-cal_setting-":2,
+            "-dopant_type-":"B",
+            "-num_steps-":7,
+            "-step_distance-":0.3,
+            "-stretch-":[0,8],
+            "-fitpoints-":[0,0,0,0,0,0],
+            '-scale_cal-':False
+        },
+     },
+    "npsc2":{
+        "Charge carriers -- default":{
+            "-flip_cal_data-":False,
+            "-cal_setting-":1,
+            "-dopant_type-":"As",
+            "-num_steps-":5,
+            "-step_distance-":0.3,
+            "-stretch-":[0,8],
+            "-fitpoints-":[0,0,0,0,0,0],
+            '-scale_cal-':False
+        },
+
+        "Resistivity -- default":{
+            "-flip_cal_data-":False,
+            "-cal_setting-":2,
+            "-dopant_type-":"As",
+            "-num_steps-":5,
+            "-step_distance-":0.3,
+            "-stretch-":[0,8],
+            "-fitpoints-":[0,0,0,0,0,0],
+            '-scale_cal-':False
+        },
+    
+    },
+    "npsc1":{
+        "Charge carriers -- default":{
+            "-flip_cal_data-":False,
+            "-cal_setting-":1,
+            "-dopant_type-":"As",
+            "-num_steps-":7,
+            "-step_distance-":0.3,
+            "-stretch-":[0,8],
+            "-fitpoints-":[0,0,0,0,0,0],
+            '-scale_cal-':False
+        },
+
+        "Resistivity -- default":{
+            "-flip_cal_data-":False,
+            "-cal_setting-":2,
+            "-dopant_type-":"As",
+            "-num_steps-":7,
+            "-step_distance-":0.3,
+            "-stretch-":[0,8],
+            "-fitpoints-":[0,0,0,0,0,0],
+            '-scale_cal-':False
+        },
+    
+    },
+    "ppsc2":{
+        "Charge carriers -- default":{
+            "-flip_cal_data-":False,
+            "-cal_setting-":1,
+            "-dopant_type-":"B",
+            "-num_steps-":5,
+            "-step_distance-":0.6,
+            "-stretch-":[-5,5],
+            "-fitpoints-":[0,0,0,0,0,0],
+            '-scale_cal-':False
+        },
+        "Resistivity -- default":{
+            "-flip_cal_data-":False,
+            "-cal_setting-":2,
+            "-dopant_type-":"B",
+            "-num_steps-":5,
+            "-step_distance-":0.6,
+            "-stretch-":[-5,5],
+            "-fitpoints-":[0,0,0,0,0,0],
+            '-scale_cal-':False
+        },
+    },
+    "ncal":{
+        "Charge carriers -- default":{
+            "-flip_cal_data-":False,
+            "-cal_setting-":1,
+            "-dopant_type-":"As",
+            "-num_steps-":5,
+            "-step_distance-":1,
+            "-stretch-":[5,12],
+            "-fitpoints-":[0,1,2,2],
+            '-scale_cal-':False
+        },
+        "Resistivity -- default":{
+            "-flip_cal_data-":False,
+            "-cal_setting-":2,
+            "-dopant_type-":"As",
+            "-num_steps-":5,
+            "-step_distance-":1,
+            "-stretch-":[5,12],
+            "-fitpoints-":[0,1,2,2],
+            '-scale_cal-':False
+        },
+
+    },
+    "CS01":{
+        "Charge carriers -- default":{
+            "-flip_cal_data-":False,
+            "-cal_setting-":1,
+            "-dopant_type-":"As",
+            "-num_steps-":5,
+            "-step_distance-":0.2,
+            "-stretch-":[-5,5],
+            "-fitpoints-":[0,0,0,0],
+            '-scale_cal-':False
+        },
+    },
+    "GS":{
+        "Charge carriers -- default":{
+            "-flip_cal_data-":False,
+            "-cal_setting-":1,
+            "-dopant_type-":"As",
+            "-num_steps-":10,
+            "-step_distance-":3.5,
+            "-stretch-":[-5,5],
+            "-fitpoints-":[0,0,0,0],
+            '-scale_cal-':False
+        },
+    },
+    "Own Sample":{
+        "Charge carriers -- default":{
+            "-flip_cal_data-":False,
+            "-cal_setting-":1,
+            "-dopant_type-":"As",
+            "-num_steps-":5,
+            "-step_distance-":1,
+            "-stretch-":[-5,5],
+            "-fitpoints-":[0,0,0,0],
+            '-scale_cal-':False
+         }
+    },
+    
+
+}
+
+
+def _archive_samples(path):
+    """Sample names stored in a reference archive, in archive order."""
+    with np.load(path, allow_pickle=False) as data:
+        names = []
+        for key in data.files:
+            name = key.rsplit("__", 1)[0]
+            if name not in names:
+                names.append(name)
+    return names
+
+
+def _user_samples(directory):
+    """{name: .npz path} of the user reference samples, sorted by name."""
+    if not os.path.isdir(directory):
+        return {}
+    return {
+        os.path.splitext(file_name)[0]: os.path.join(directory, file_name)
+        for file_name in sorted(os.listdir(directory))
+        if file_name.lower().endswith(".npz")
+    }
+
+
+class ReferenceLibrary(Mapping):
+    """data_lib: sample name -> {"resistivity_allowed", "data_cc", "data_res"}, loaded on first access."""
+
+    def __init__(self, archive=REFERENCE_ARCHIVE, user_dir=USER_REFERENCE_DIR):
+        self.sources = {}
+        for name in _archive_samples(archive):
+            self.sources[name] = (archive, name + "__")
+        for name, path in _user_samples(user_dir).items():
+            if name in self.sources or name == OWN_SAMPLE:
+                print(f"Warning: user reference sample '{name}' ignored, the name is already in use")
+                continue
+            self.sources[name] = (path, "")
+        self.entries = {OWN_SAMPLE: {"resistivity_allowed": True, "data_cc": None, "data_res": None}}
+
+    def __iter__(self):
+        yield from self.sources
+        yield OWN_SAMPLE
+
+    def __len__(self):
+        return len(self.sources) + 1
+
+    def __contains__(self, sample):
+        return sample == OWN_SAMPLE or sample in self.sources
+
+    def __getitem__(self, sample):
+        if sample not in self.entries:
+            if sample not in self.sources:
+                raise KeyError(sample)
+            path, prefix = self.sources[sample]
+            with np.load(path, allow_pickle=False) as data:
+                entry = {kind: np.array(data[prefix + kind], dtype=float) if prefix + kind in data.files else None
+                         for kind in PROFILE_KINDS}
+            if entry["data_cc"] is None:
+                raise KeyError(f"{sample}: data_cc missing in {path}")
+            entry["resistivity_allowed"] = entry["data_res"] is not None
+            self.entries[sample] = entry
+        return self.entries[sample]
+
+    def is_user_sample(self, sample):
+        return sample in self.sources and self.sources[sample][0] != REFERENCE_ARCHIVE
+
+
+def _default_presets(has_resistivity):
+    presets = {"Charge carriers -- default": copy.deepcopy(preset_lib[OWN_SAMPLE]["Charge carriers -- default"])}
+    if has_resistivity:
+        presets["Resistivity -- default"] = dict(presets["Charge carriers -- default"], **{"-cal_setting-": 2})
+    return presets
+
+
+def _with_user_presets(presets, user_dir=USER_REFERENCE_DIR):
+    """preset_lib with entries for the user reference samples, inserted before "Own Sample"."""
+    merged = {name: value for name, value in presets.items() if name != OWN_SAMPLE}
+    for name, path in _user_samples(user_dir).items():
+        if name in presets:
+            continue
+        preset_path = os.path.splitext(path)[0] + ".json"
+        try:
+            with open(preset_path, "r", encoding="utf-8") as f:
+                merged[name] = json.load(f)
+        except FileNotFoundError:
+            with np.load(path, allow_pickle=False) as data:
+                merged[name] = _default_presets("data_res" in data.files)
+        except Exception as e:
+            print(f"Warning: presets of reference sample '{name}' cannot be read ({e}), using defaults")
+            with np.load(path, allow_pickle=False) as data:
+                merged[name] = _default_presets("data_res" in data.files)
+    merged[OWN_SAMPLE] = presets[OWN_SAMPLE]
+    return merged
+
+
+preset_lib = _with_user_presets(preset_lib)
+data_lib = ReferenceLibrary()
@@ -6,5115 +6,9 @@ from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 from scipy.signal import find_peaks, savgol_filter
 from PyQt5.QtWidgets import QSpacerItem, QVBoxLayout
-from matplotlib.patches import Rectangle
-import matplotlib.pyplot as plt
-from scipy.signal import savgol_filter, find_peaks
 
-
-# ============================== Calibration Data ============================== #
-
-data_c_GS = np.array([[0.0000000e+00, 1.0260800e+19],
-       [1.8658000e-02, 1.0201400e+19],
-       [3.7316000e-02, 1.0280800e+19],
-       [5.5974000e-02, 1.0236200e+19],
-       [7.4632000e-02, 1.0247100e+19],
-       [9.3290000e-02, 1.0200600e+19],
-       [1.1194800e-01, 1.0282500e+19],
-       [1.3060600e-01, 1.0274500e+19],
-       [1.4926400e-01, 1.0258700e+19],
-       [1.6792200e-01, 1.0245400e+19],
-       [1.8658000e-01, 1.0220600e+19],
-       [2.0523800e-01, 1.0221100e+19],
-       [2.2389600e-01, 1.0251900e+19],
-       [2.4255400e-01, 1.0256400e+19],
-       [2.6121200e-01, 1.0237700e+19],
-       [2.7987000e-01, 1.0238500e+19],
-       [2.9852800e-01, 1.0235600e+19],
-       [3.1718600e-01, 1.0229000e+19],
-       [3.3584400e-01, 1.0201300e+19],
-       [3.5450200e-01, 1.0263000e+19],
-       [3.7316000e-01, 1.0292100e+19],
-       [3.9181800e-01, 1.0206400e+19],
-       [4.1047600e-01, 1.0270200e+19],
-       [4.2913400e-01, 1.0282800e+19],
-       [4.4779200e-01, 1.0231400e+19],
-       [4.6645000e-01, 1.0241900e+19],
-       [4.8510800e-01, 1.0252200e+19],
-       [5.0376600e-01, 1.0253400e+19],
-       [5.2242400e-01, 1.0200900e+19],
-       [5.4108200e-01, 1.0229400e+19],
-       [5.5974000e-01, 1.0260100e+19],
-       [5.7839800e-01, 1.0241700e+19],
-       [5.9705600e-01, 1.0259400e+19],
-       [6.1571400e-01, 1.0228700e+19],
-       [6.3437200e-01, 1.0263700e+19],
-       [6.5303000e-01, 1.0262300e+19],
-       [6.7168800e-01, 1.0204400e+19],
-       [6.9034600e-01, 1.0255100e+19],
-       [7.0900400e-01, 1.0218100e+19],
-       [7.2766200e-01, 1.0275700e+19],
-       [7.4632000e-01, 1.0274700e+19],
-       [7.6497800e-01, 1.0250500e+19],
-       [7.8363600e-01, 1.0281700e+19],
-       [8.0229400e-01, 1.0237200e+19],
-       [8.2095200e-01, 1.0233400e+19],
-       [8.3961000e-01, 1.0207000e+19],
-       [8.5826800e-01, 1.0268600e+19],
-       [8.7692600e-01, 1.0208100e+19],
-       [8.9558400e-01, 1.0292900e+19],
-       [9.1424200e-01, 1.0212900e+19],
-       [9.3290000e-01, 1.0238200e+19],
-       [9.5155800e-01, 1.0224000e+19],
-       [9.7021600e-01, 1.0238800e+19],
-       [9.8887400e-01, 1.0210500e+19],
-       [1.0075320e+00, 1.0275100e+19],
-       [1.0261900e+00, 1.0250300e+19],
-       [1.0448480e+00, 1.0215800e+19],
-       [1.0635060e+00, 1.0224500e+19],
-       [1.0821640e+00, 1.0253500e+19],
-       [1.1008220e+00, 1.0215300e+19],
-       [1.1194800e+00, 1.0287200e+19],
-       [1.1381380e+00, 1.0286300e+19],
-       [1.1567960e+00, 1.0284100e+19],
-       [1.1754540e+00, 1.0209300e+19],
-       [1.1941120e+00, 1.0244600e+19],
-       [1.2127700e+00, 1.0294400e+19],
-       [1.2314280e+00, 1.0221900e+19],
-       [1.2500860e+00, 1.0271300e+19],
-       [1.2687440e+00, 1.0288500e+19],
-       [1.2874020e+00, 1.0224700e+19],
-       [1.3060600e+00, 1.0228200e+19],
-       [1.3247180e+00, 1.0281200e+19],
-       [1.3433760e+00, 1.0268500e+19],
-       [1.3620340e+00, 1.0276300e+19],
-       [1.3806920e+00, 1.0247500e+19],
-       [1.3993500e+00, 1.0261700e+19],
-       [1.4180080e+00, 1.0254900e+19],
-       [1.4366660e+00, 1.0247800e+19],
-       [1.4553240e+00, 1.0213600e+19],
-       [1.4739820e+00, 1.0251200e+19],
-       [1.4926400e+00, 1.0205100e+19],
-       [1.5112980e+00, 1.0218900e+19],
-       [1.5299560e+00, 1.0235000e+19],
-       [1.5486140e+00, 1.0236200e+19],
-       [1.5672720e+00, 1.0262800e+19],
-       [1.5859300e+00, 1.0283900e+19],
-       [1.6045880e+00, 1.0290500e+19],
-       [1.6232460e+00, 1.0215000e+19],
-       [1.6419040e+00, 1.0274300e+19],
-       [1.6605620e+00, 1.0203100e+19],
-       [1.6792200e+00, 1.0278900e+19],
-       [1.6978780e+00, 1.0267700e+19],
-       [1.7165360e+00, 1.0240400e+19],
-       [1.7351940e+00, 1.0297500e+19],
-       [1.7538520e+00, 1.0229300e+19],
-       [1.7725100e+00, 1.0260200e+19],
-       [1.7911680e+00, 1.0225900e+19],
-       [1.8098260e+00, 1.0210200e+19],
-       [1.8284840e+00, 1.0247800e+19],
-       [1.8471420e+00, 1.0269500e+19],
-       [1.8658000e+00, 1.0218500e+19],
-       [1.8844580e+00, 1.0295300e+19],
-       [1.9031160e+00, 1.0281600e+19],
-       [1.9217740e+00, 1.0296200e+19],
-       [1.9404320e+00, 1.0291900e+19],
-       [1.9590900e+00, 1.0214200e+19],
-       [1.9777480e+00, 1.0228800e+19],
-       [1.9964060e+00, 1.0280500e+19],
-       [2.0150640e+00, 1.0238100e+19],
-       [2.0337220e+00, 1.0244900e+19],
-       [2.0523800e+00, 1.0228200e+19],
-       [2.0710380e+00, 1.0293400e+19],
-       [2.0896960e+00, 1.0206200e+19],
-       [2.1083540e+00, 1.0209800e+19],
-       [2.1270120e+00, 1.0223300e+19],
-       [2.1456700e+00, 1.0211100e+19],
-       [2.1643280e+00, 1.0215600e+19],
-       [2.1829860e+00, 1.0238200e+19],
-       [2.2016440e+00, 1.0206600e+19],
-       [2.2203020e+00, 1.0280800e+19],
-       [2.2389600e+00, 1.0253100e+19],
-       [2.2576180e+00, 1.0239000e+19],
-       [2.2762760e+00, 1.0272300e+19],
-       [2.2949340e+00, 1.0282600e+19],
-       [2.3135920e+00, 1.0299800e+19],
-       [2.3322500e+00, 1.0263000e+19],
-       [2.3509080e+00, 1.0225600e+19],
-       [2.3695660e+00, 1.0206000e+19],
-       [2.3882240e+00, 1.0258800e+19],
-       [2.4068820e+00, 1.0203800e+19],
-       [2.4255400e+00, 1.0296700e+19],
-       [2.4441980e+00, 1.0245600e+19],
-       [2.4628560e+00, 1.0252900e+19],
-       [2.4815140e+00, 1.0236200e+19],
-       [2.5001720e+00, 1.0238300e+19],
-       [2.5188300e+00, 1.0218500e+19],
-       [2.5374880e+00, 1.0216200e+19],
-       [2.5561460e+00, 1.0286800e+19],
-       [2.5748040e+00, 1.0204400e+19],
-       [2.5934620e+00, 1.0261900e+19],
-       [2.6121200e+00, 1.0221300e+19],
-       [2.6307780e+00, 1.0249900e+19],
-       [2.6494360e+00, 1.0278900e+19],
-       [2.6680940e+00, 1.0222000e+19],
-       [2.6867520e+00, 1.0253500e+19],
-       [2.7054100e+00, 1.0215900e+19],
-       [2.7240680e+00, 1.0218600e+19],
-       [2.7427260e+00, 1.0251500e+19],
-       [2.7613840e+00, 1.0253800e+19],
-       [2.7800420e+00, 1.0283600e+19],
-       [2.7987000e+00, 1.0213400e+19],
-       [2.8173580e+00, 1.0237400e+19],
-       [2.8360160e+00, 1.0201700e+19],
-       [2.8546740e+00, 1.0285800e+19],
-       [2.8733320e+00, 1.0276700e+19],
-       [2.8919900e+00, 1.0243200e+19],
-       [2.9106480e+00, 1.0203500e+19],
-       [2.9293060e+00, 1.0274400e+19],
-       [2.9479640e+00, 1.0278200e+19],
-       [2.9666220e+00, 1.0245200e+19],
-       [2.9852800e+00, 1.0262800e+19],
-       [3.0039380e+00, 1.0265000e+19],
-       [3.0225960e+00, 1.0208600e+19],
-       [3.0412540e+00, 1.0222900e+19],
-       [3.0599120e+00, 1.0229500e+19],
-       [3.0785700e+00, 1.0203200e+19],
-       [3.0972280e+00, 1.0289800e+19],
-       [3.1158860e+00, 1.0223100e+19],
-       [3.1345440e+00, 1.0252700e+19],
-       [3.1532020e+00, 1.0243100e+19],
-       [3.1718600e+00, 1.0279800e+19],
-       [3.1905180e+00, 1.0288500e+19],
-       [3.2091760e+00, 1.0227800e+19],
-       [3.2278340e+00, 1.0259800e+19],
-       [3.2464920e+00, 1.0214700e+19],
-       [3.2651500e+00, 1.0252000e+19],
-       [3.2838080e+00, 1.0204400e+19],
-       [3.3024660e+00, 1.0255000e+19],
-       [3.3211240e+00, 1.0285100e+19],
-       [3.3397820e+00, 1.0240600e+19],
-       [3.3584400e+00, 1.0211600e+19],
-       [3.3770980e+00, 1.0256600e+19],
-       [3.3957560e+00, 1.0271600e+19],
-       [3.4144140e+00, 1.0299700e+19],
-       [3.4330720e+00, 1.0216200e+19],
-       [3.4517300e+00, 1.0295300e+19],
-       [3.4703880e+00, 1.0241800e+19],
-       [3.4890460e+00, 1.0206800e+19],
-       [3.5077040e+00, 1.0245900e+19],
-       [3.5263620e+00, 1.0247400e+19],
-       [3.5450200e+00, 1.0239900e+19],
-       [3.5636780e+00, 1.0280700e+19],
-       [3.5823360e+00, 1.0262200e+19],
-       [3.6009940e+00, 1.0206900e+19],
-       [3.6196520e+00, 1.0230400e+19],
-       [3.6383100e+00, 1.0231900e+19],
-       [3.6569680e+00, 1.0260000e+19],
-       [3.6756260e+00, 1.0268500e+19],
-       [3.6942840e+00, 1.0238300e+19],
-       [3.7129420e+00, 1.0213200e+19],
-       [3.7316000e+00, 1.0234500e+19],
-       [3.7502580e+00, 1.0256500e+19],
-       [3.7689160e+00, 1.0256600e+19],
-       [3.7875740e+00, 1.0269800e+19],
-       [3.8062320e+00, 1.0289000e+19],
-       [3.8248900e+00, 1.0296900e+19],
-       [3.8435480e+00, 1.0232200e+19],
-       [3.8622060e+00, 1.0204000e+19],
-       [3.8808640e+00, 1.0273500e+19],
-       [3.8995220e+00, 1.0236500e+19],
-       [3.9181800e+00, 1.0219200e+19],
-       [3.9368380e+00, 1.0286100e+19],
-       [3.9554960e+00, 1.0288300e+19],
-       [3.9741540e+00, 1.0258100e+19],
-       [3.9928120e+00, 1.0278800e+19],
-       [4.0114700e+00, 1.0284000e+19],
-       [4.0301280e+00, 1.0299200e+19],
-       [4.0487860e+00, 1.0209100e+19],
-       [4.0674440e+00, 1.0271800e+19],
-       [4.0861020e+00, 1.0239300e+19],
-       [4.1047600e+00, 1.0203200e+19],
-       [4.1234180e+00, 1.0281100e+19],
-       [4.1420760e+00, 1.0226100e+19],
-       [4.1607340e+00, 1.0212100e+19],
-       [4.1793920e+00, 1.0216200e+19],
-       [4.1980500e+00, 1.0256400e+19],
-       [4.2167080e+00, 1.0288600e+19],
-       [4.2353660e+00, 1.0272300e+19],
-       [4.2540240e+00, 1.0280000e+19],
-       [4.2726820e+00, 1.0251900e+19],
-       [4.2913400e+00, 1.0258200e+19],
-       [4.3099980e+00, 1.0253100e+19],
-       [4.3286560e+00, 1.0214100e+19],
-       [4.3473140e+00, 1.0234000e+19],
-       [4.3659720e+00, 1.0235400e+19],
-       [4.3846300e+00, 1.0296300e+19],
-       [4.4032880e+00, 1.0246300e+19],
-       [4.4219460e+00, 1.0230700e+19],
-       [4.4406040e+00, 1.0253700e+19],
-       [4.4592620e+00, 1.0218900e+19],
-       [4.4779200e+00, 1.0276900e+19],
-       [4.4965780e+00, 1.0213500e+19],
-       [4.5152360e+00, 1.0274000e+19],
-       [4.5338940e+00, 1.0232600e+19],
-       [4.5525520e+00, 1.0210600e+19],
-       [4.5712100e+00, 1.0227800e+19],
-       [4.5898680e+00, 1.0209200e+19],
-       [4.6085260e+00, 1.0248600e+19],
-       [4.6271840e+00, 1.0252000e+19],
-       [4.6458420e+00, 1.0268000e+19],
-       [4.6645000e+00, 1.0218800e+19],
-       [4.6831580e+00, 1.0211900e+19],
-       [4.7018160e+00, 1.0245100e+19],
-       [4.7204740e+00, 1.0203700e+19],
-       [4.7391320e+00, 1.0298000e+19],
-       [4.7577900e+00, 1.0283000e+19],
-       [4.7764480e+00, 1.0252700e+19],
-       [4.7951060e+00, 1.0213400e+19],
-       [4.8137640e+00, 1.0266400e+19],
-       [4.8324220e+00, 1.0299700e+19],
-       [4.8510800e+00, 1.0210500e+19],
-       [4.8697380e+00, 1.0258400e+19],
-       [4.8883960e+00, 1.0233900e+19],
-       [4.9070540e+00, 1.0236100e+19],
-       [4.9257120e+00, 1.0242700e+19],
-       [4.9443700e+00, 1.0232200e+19],
-       [4.9630280e+00, 1.0256900e+19],
-       [4.9816860e+00, 1.0256600e+19],
-       [5.0003440e+00, 1.0240400e+19],
-       [5.0190020e+00, 1.0732900e+18],
-       [5.0376600e+00, 1.0691300e+18],
-       [5.0563180e+00, 1.0731200e+18],
-       [5.0749760e+00, 1.0706800e+18],
-       [5.0936340e+00, 1.0661800e+18],
-       [5.1122920e+00, 1.0740700e+18],
-       [5.1309500e+00, 1.0682500e+18],
-       [5.1496080e+00, 1.0744100e+18],
-       [5.1682660e+00, 1.0733200e+18],
-       [5.1869240e+00, 1.0743600e+18],
-       [5.2055820e+00, 1.0653200e+18],
-       [5.2242400e+00, 1.0732700e+18],
-       [5.2428980e+00, 1.0655800e+18],
-       [5.2615560e+00, 1.0705900e+18],
-       [5.2802140e+00, 1.0733900e+18],
-       [5.2988720e+00, 1.0685600e+18],
-       [5.3175300e+00, 1.0701700e+18],
-       [5.3361880e+00, 1.0657400e+18],
-       [5.3548460e+00, 1.0727700e+18],
-       [5.3735040e+00, 1.0703100e+18],
-       [5.3921620e+00, 1.0705500e+18],
-       [5.4108200e+00, 1.0740100e+18],
-       [5.4294780e+00, 1.0714400e+18],
-       [5.4481360e+00, 1.0669300e+18],
-       [5.4667940e+00, 1.0654500e+18],
-       [5.4854520e+00, 1.0697900e+18],
-       [5.5041100e+00, 1.0720700e+18],
-       [5.5227680e+00, 1.0705600e+18],
-       [5.5414260e+00, 1.0673900e+18],
-       [5.5600840e+00, 1.0668000e+18],
-       [5.5787420e+00, 1.0668100e+18],
-       [5.5974000e+00, 1.0655100e+18],
-       [5.6160580e+00, 1.0662300e+18],
-       [5.6347160e+00, 1.0749000e+18],
-       [5.6533740e+00, 1.0695300e+18],
-       [5.6720320e+00, 1.0680700e+18],
-       [5.6906900e+00, 1.0705300e+18],
-       [5.7093480e+00, 1.0747500e+18],
-       [5.7280060e+00, 1.0696800e+18],
-       [5.7466640e+00, 1.0734400e+18],
-       [5.7653220e+00, 1.0666600e+18],
-       [5.7839800e+00, 1.0725100e+18],
-       [5.8026380e+00, 1.0742800e+18],
-       [5.8212960e+00, 1.0724800e+18],
-       [5.8399540e+00, 1.0719200e+18],
-       [5.8586120e+00, 1.0724900e+18],
-       [5.8772700e+00, 1.0703000e+18],
-       [5.8959280e+00, 1.0684300e+18],
-       [5.9145860e+00, 1.0730500e+18],
-       [5.9332440e+00, 1.0732800e+18],
-       [5.9519020e+00, 1.0684900e+18],
-       [5.9705600e+00, 1.0739400e+18],
-       [5.9892180e+00, 1.0674300e+18],
-       [6.0078760e+00, 1.0731700e+18],
-       [6.0265340e+00, 1.0713300e+18],
-       [6.0451920e+00, 1.0707400e+18],
-       [6.0638500e+00, 1.0666800e+18],
-       [6.0825080e+00, 1.0666900e+18],
-       [6.1011660e+00, 1.0671200e+18],
-       [6.1198240e+00, 1.0668400e+18],
-       [6.1384820e+00, 1.0743800e+18],
-       [6.1571400e+00, 1.0700000e+18],
-       [6.1757980e+00, 1.0710600e+18],
-       [6.1944560e+00, 1.0663200e+18],
-       [6.2131140e+00, 1.0710700e+18],
-       [6.2317720e+00, 1.0706900e+18],
-       [6.2504300e+00, 1.0732600e+18],
-       [6.2690880e+00, 1.0673800e+18],
-       [6.2877460e+00, 1.0707600e+18],
-       [6.3064040e+00, 1.0690100e+18],
-       [6.3250620e+00, 1.0684800e+18],
-       [6.3437200e+00, 1.0712600e+18],
-       [6.3623780e+00, 1.0713900e+18],
-       [6.3810360e+00, 1.0728700e+18],
-       [6.3996940e+00, 1.0681500e+18],
-       [6.4183520e+00, 1.0683000e+18],
-       [6.4370100e+00, 1.0683700e+18],
-       [6.4556680e+00, 1.0747900e+18],
-       [6.4743260e+00, 1.0714700e+18],
-       [6.4929840e+00, 1.0708500e+18],
-       [6.5116420e+00, 1.0741400e+18],
-       [6.5303000e+00, 1.0657300e+18],
-       [6.5489580e+00, 1.0701800e+18],
-       [6.5676160e+00, 1.0687800e+18],
-       [6.5862740e+00, 1.0655300e+18],
-       [6.6049320e+00, 1.0706100e+18],
-       [6.6235900e+00, 1.0724800e+18],
-       [6.6422480e+00, 1.0665400e+18],
-       [6.6609060e+00, 1.0703800e+18],
-       [6.6795640e+00, 1.0651800e+18],
-       [6.6982220e+00, 1.0678900e+18],
-       [6.7168800e+00, 1.0746300e+18],
-       [6.7355380e+00, 1.0686700e+18],
-       [6.7541960e+00, 1.0675900e+18],
-       [6.7728540e+00, 1.0746200e+18],
-       [6.7915120e+00, 1.0666700e+18],
-       [6.8101700e+00, 1.0727300e+18],
-       [6.8288280e+00, 1.0721600e+18],
-       [6.8474860e+00, 1.0697200e+18],
-       [6.8661440e+00, 1.0694800e+18],
-       [6.8848020e+00, 1.0683600e+18],
-       [6.9034600e+00, 1.0717200e+18],
-       [6.9221180e+00, 1.0722400e+18],
-       [6.9407760e+00, 1.0731900e+18],
-       [6.9594340e+00, 1.0662600e+18],
-       [6.9780920e+00, 1.0710900e+18],
-       [6.9967500e+00, 1.0675500e+18],
-       [7.0154080e+00, 1.0744200e+18],
-       [7.0340660e+00, 1.0700400e+18],
-       [7.0527240e+00, 1.0716100e+18],
-       [7.0713820e+00, 1.0734600e+18],
-       [7.0900400e+00, 1.0746100e+18],
-       [7.1086980e+00, 1.0666800e+18],
-       [7.1273560e+00, 1.0697200e+18],
-       [7.1460140e+00, 1.0711500e+18],
-       [7.1646720e+00, 1.0720100e+18],
-       [7.1833300e+00, 1.0709800e+18],
-       [7.2019880e+00, 1.0716400e+18],
-       [7.2206460e+00, 1.0670600e+18],
-       [7.2393040e+00, 1.0712400e+18],
-       [7.2579620e+00, 1.0727500e+18],
-       [7.2766200e+00, 1.0740400e+18],
-       [7.2952780e+00, 1.0692100e+18],
-       [7.3139360e+00, 1.0722100e+18],
-       [7.3325940e+00, 1.0722000e+18],
-       [7.3512520e+00, 1.0702900e+18],
-       [7.3699100e+00, 1.0691700e+18],
-       [7.3885680e+00, 1.0658000e+18],
-       [7.4072260e+00, 1.0693200e+18],
-       [7.4258840e+00, 1.0654100e+18],
-       [7.4445420e+00, 1.0713800e+18],
-       [7.4632000e+00, 1.0713800e+18],
-       [7.4818580e+00, 1.0667500e+18],
-       [7.5005160e+00, 1.0724300e+18],
-       [7.5191740e+00, 1.0692000e+18],
-       [7.5378320e+00, 1.0749500e+18],
-       [7.5564900e+00, 1.0743500e+18],
-       [7.5751480e+00, 1.0664300e+18],
-       [7.5938060e+00, 1.0728500e+18],
-       [7.6124640e+00, 1.0708300e+18],
-       [7.6311220e+00, 1.0700000e+18],
-       [7.6497800e+00, 1.0723300e+18],
-       [7.6684380e+00, 1.0688300e+18],
-       [7.6870960e+00, 1.0672600e+18],
-       [7.7057540e+00, 1.0698500e+18],
-       [7.7244120e+00, 1.0734500e+18],
-       [7.7430700e+00, 1.0667700e+18],
-       [7.7617280e+00, 1.0709300e+18],
-       [7.7803860e+00, 1.0666000e+18],
-       [7.7990440e+00, 1.0709500e+18],
-       [7.8177020e+00, 1.0657200e+18],
-       [7.8363600e+00, 1.0683100e+18],
-       [7.8550180e+00, 1.0694500e+18],
-       [7.8736760e+00, 1.0704200e+18],
-       [7.8923340e+00, 1.0722700e+18],
-       [7.9109920e+00, 1.0727900e+18],
-       [7.9296500e+00, 1.0708500e+18],
-       [7.9483080e+00, 1.0658800e+18],
-       [7.9669660e+00, 1.0706400e+18],
-       [7.9856240e+00, 1.0697000e+18],
-       [8.0042820e+00, 1.0720900e+18],
-       [8.0229400e+00, 1.0714100e+18],
-       [8.0415980e+00, 1.0743700e+18],
-       [8.0602560e+00, 1.0650200e+18],
-       [8.0789140e+00, 1.0667500e+18],
-       [8.0975720e+00, 1.0703600e+18],
-       [8.1162300e+00, 1.0740100e+18],
-       [8.1348880e+00, 1.0701000e+18],
-       [8.1535460e+00, 1.0726400e+18],
-       [8.1722040e+00, 1.0681500e+18],
-       [8.1908620e+00, 1.0669800e+18],
-       [8.2095200e+00, 1.0686200e+18],
-       [8.2281780e+00, 1.0700100e+18],
-       [8.2468360e+00, 1.0733400e+18],
-       [8.2654940e+00, 1.0684900e+18],
-       [8.2841520e+00, 1.0740800e+18],
-       [8.3028100e+00, 1.0677000e+18],
-       [8.3214680e+00, 1.0727400e+18],
-       [8.3401260e+00, 1.0699900e+18],
-       [8.3587840e+00, 1.0673200e+18],
-       [8.3774420e+00, 1.0665200e+18],
-       [8.3961000e+00, 1.0673400e+18],
-       [8.4147580e+00, 1.0667400e+18],
-       [8.4334160e+00, 1.0731100e+18],
-       [8.4520740e+00, 1.0716700e+18],
-       [8.4707320e+00, 1.0738600e+18],
-       [8.4893900e+00, 1.0680200e+18],
-       [8.5080480e+00, 1.0671900e+18],
-       [8.5267060e+00, 1.0714000e+18],
-       [8.5453640e+00, 1.0698600e+18],
-       [8.5640220e+00, 1.0723700e+18],
-       [8.5826800e+00, 1.0745400e+18],
-       [8.6013380e+00, 1.0690600e+18],
-       [8.6199960e+00, 1.0684900e+18],
-       [8.6386540e+00, 1.0683000e+18],
-       [8.6573120e+00, 1.0714200e+18],
-       [8.6759700e+00, 1.0653400e+18],
-       [8.6946280e+00, 1.0659400e+18],
-       [8.7132860e+00, 1.0716100e+18],
-       [8.7319440e+00, 1.0685200e+18],
-       [8.7506020e+00, 1.0725600e+18],
-       [8.7692600e+00, 1.0743700e+18],
-       [8.7879180e+00, 1.0738000e+18],
-       [8.8065760e+00, 1.0699500e+18],
-       [8.8252340e+00, 1.0741900e+18],
-       [8.8438920e+00, 1.0706600e+18],
-       [8.8625500e+00, 1.0679300e+18],
-       [8.8812080e+00, 1.0674100e+18],
-       [8.8998660e+00, 1.0721800e+18],
-       [8.9185240e+00, 1.0692800e+18],
-       [8.9371820e+00, 1.0674900e+18],
-       [8.9558400e+00, 1.0748800e+18],
-       [8.9744980e+00, 1.0661000e+18],
-       [8.9931560e+00, 1.0657100e+18],
-       [9.0118140e+00, 1.0694700e+18],
-       [9.0304720e+00, 1.0736000e+18],
-       [9.0491300e+00, 1.0668000e+18],
-       [9.0677880e+00, 1.0652900e+18],
-       [9.0864460e+00, 1.0714600e+18],
-       [9.1051040e+00, 1.0737600e+18],
-       [9.1237620e+00, 1.0674200e+18],
-       [9.1424200e+00, 1.0739600e+18],
-       [9.1610780e+00, 1.0698800e+18],
-       [9.1797360e+00, 1.0659300e+18],
-       [9.1983940e+00, 1.0698500e+18],
-       [9.2170520e+00, 1.0654200e+18],
-       [9.2357100e+00, 1.0746100e+18],
-       [9.2543680e+00, 1.0699700e+18],
-       [9.2730260e+00, 1.0684900e+18],
-       [9.2916840e+00, 1.0736600e+18],
-       [9.3103420e+00, 1.0655700e+18],
-       [9.3290000e+00, 1.0729900e+18],
-       [9.3476580e+00, 1.0689100e+18],
-       [9.3663160e+00, 1.0665600e+18],
-       [9.3849740e+00, 1.0711800e+18],
-       [9.4036320e+00, 1.0721600e+18],
-       [9.4222900e+00, 1.0665800e+18],
-       [9.4409480e+00, 1.0654800e+18],
-       [9.4596060e+00, 1.0733700e+18],
-       [9.4782640e+00, 1.0750000e+18],
-       [9.4969220e+00, 1.0652400e+18],
-       [9.5155800e+00, 1.0692900e+18],
-       [9.5342380e+00, 1.0745100e+18],
-       [9.5528960e+00, 1.0727800e+18],
-       [9.5715540e+00, 1.0691600e+18],
-       [9.5902120e+00, 1.0668600e+18],
-       [9.6088700e+00, 1.0737300e+18],
-       [9.6275280e+00, 1.0744100e+18],
-       [9.6461860e+00, 1.0695900e+18],
-       [9.6648440e+00, 1.0734200e+18],
-       [9.6835020e+00, 1.0692800e+18],
-       [9.7021600e+00, 1.0745100e+18],
-       [9.7208180e+00, 1.0708500e+18],
-       [9.7394760e+00, 1.0721900e+18],
-       [9.7581340e+00, 1.0749900e+18],
-       [9.7767920e+00, 1.0653600e+18],
-       [9.7954500e+00, 1.0691200e+18],
-       [9.8141080e+00, 1.0715800e+18],
-       [9.8327660e+00, 1.0700300e+18],
-       [9.8514240e+00, 1.0675500e+18],
-       [9.8700820e+00, 1.0745100e+18],
-       [9.8887400e+00, 1.0666300e+18],
-       [9.9073980e+00, 1.0728400e+18],
-       [9.9260560e+00, 1.0697800e+18],
-       [9.9447140e+00, 1.0686100e+18],
-       [9.9633720e+00, 1.0693900e+18],
-       [9.9820300e+00, 1.0747400e+18],
-       [1.0000688e+01, 1.0655000e+18],
-       [1.0019346e+01, 1.0812600e+17],
-       [1.0038004e+01, 1.0871200e+17],
-       [1.0056662e+01, 1.0868600e+17],
-       [1.0075320e+01, 1.0839400e+17],
-       [1.0093978e+01, 1.0888000e+17],
-       [1.0112636e+01, 1.0971600e+17],
-       [1.0131294e+01, 1.0828700e+17],
-       [1.0149952e+01, 1.0946800e+17],
-       [1.0168610e+01, 1.0934100e+17],
-       [1.0187268e+01, 1.0800300e+17],
-       [1.0205926e+01, 1.0928100e+17],
-       [1.0224584e+01, 1.0855600e+17],
-       [1.0243242e+01, 1.0831100e+17],
-       [1.0261900e+01, 1.0903000e+17],
-       [1.0280558e+01, 1.0869100e+17],
-       [1.0299216e+01, 1.0801300e+17],
-       [1.0317874e+01, 1.0999900e+17],
-       [1.0336532e+01, 1.0844700e+17],
-       [1.0355190e+01, 1.0856900e+17],
-       [1.0373848e+01, 1.0980100e+17],
-       [1.0392506e+01, 1.0941000e+17],
-       [1.0411164e+01, 1.0985000e+17],
-       [1.0429822e+01, 1.0842200e+17],
-       [1.0448480e+01, 1.0883600e+17],
-       [1.0467138e+01, 1.0863700e+17],
-       [1.0485796e+01, 1.0863000e+17],
-       [1.0504454e+01, 1.0814600e+17],
-       [1.0523112e+01, 1.0862900e+17],
-       [1.0541770e+01, 1.0997100e+17],
-       [1.0560428e+01, 1.0929400e+17],
-       [1.0579086e+01, 1.0957800e+17],
-       [1.0597744e+01, 1.0903000e+17],
-       [1.0616402e+01, 1.0907900e+17],
-       [1.0635060e+01, 1.0955200e+17],
-       [1.0653718e+01, 1.0964400e+17],
-       [1.0672376e+01, 1.0932000e+17],
-       [1.0691034e+01, 1.0829100e+17],
-       [1.0709692e+01, 1.0808900e+17],
-       [1.0728350e+01, 1.0942000e+17],
-       [1.0747008e+01, 1.0822000e+17],
-       [1.0765666e+01, 1.0812100e+17],
-       [1.0784324e+01, 1.0942600e+17],
-       [1.0802982e+01, 1.0909700e+17],
-       [1.0821640e+01, 1.0910200e+17],
-       [1.0840298e+01, 1.0815800e+17],
-       [1.0858956e+01, 1.0814600e+17],
-       [1.0877614e+01, 1.0931000e+17],
-       [1.0896272e+01, 1.0830700e+17],
-       [1.0914930e+01, 1.0807900e+17],
-       [1.0933588e+01, 1.0917200e+17],
-       [1.0952246e+01, 1.0859600e+17],
-       [1.0970904e+01, 1.0923100e+17],
-       [1.0989562e+01, 1.0866000e+17],
-       [1.1008220e+01, 1.0879400e+17],
-       [1.1026878e+01, 1.0945100e+17],
-       [1.1045536e+01, 1.0837200e+17],
-       [1.1064194e+01, 1.0910900e+17],
-       [1.1082852e+01, 1.0979500e+17],
-       [1.1101510e+01, 1.0810900e+17],
-       [1.1120168e+01, 1.0842300e+17],
-       [1.1138826e+01, 1.0816800e+17],
-       [1.1157484e+01, 1.0869100e+17],
-       [1.1176142e+01, 1.0935400e+17],
-       [1.1194800e+01, 1.0851100e+17],
-       [1.1213458e+01, 1.0850800e+17],
-       [1.1232116e+01, 1.0969800e+17],
-       [1.1250774e+01, 1.0991000e+17],
-       [1.1269432e+01, 1.0930800e+17],
-       [1.1288090e+01, 1.0875300e+17],
-       [1.1306748e+01, 1.0813900e+17],
-       [1.1325406e+01, 1.0911000e+17],
-       [1.1344064e+01, 1.0918400e+17],
-       [1.1362722e+01, 1.0804300e+17],
-       [1.1381380e+01, 1.0935600e+17],
-       [1.1400038e+01, 1.0916300e+17],
-       [1.1418696e+01, 1.0848900e+17],
-       [1.1437354e+01, 1.0958500e+17],
-       [1.1456012e+01, 1.0921200e+17],
-       [1.1474670e+01, 1.0874400e+17],
-       [1.1493328e+01, 1.0991300e+17],
-       [1.1511986e+01, 1.0867100e+17],
-       [1.1530644e+01, 1.0881400e+17],
-       [1.1549302e+01, 1.0958700e+17],
-       [1.1567960e+01, 1.0801400e+17],
-       [1.1586618e+01, 1.0969000e+17],
-       [1.1605276e+01, 1.0923200e+17],
-       [1.1623934e+01, 1.0803100e+17],
-       [1.1642592e+01, 1.0815900e+17],
-       [1.1661250e+01, 1.0872200e+17],
-       [1.1679908e+01, 1.0861600e+17],
-       [1.1698566e+01, 1.0996600e+17],
-       [1.1717224e+01, 1.0844100e+17],
-       [1.1735882e+01, 1.0866500e+17],
-       [1.1754540e+01, 1.0942900e+17],
-       [1.1773198e+01, 1.0880700e+17],
-       [1.1791856e+01, 1.0863900e+17],
-       [1.1810514e+01, 1.0830400e+17],
-       [1.1829172e+01, 1.0886700e+17],
-       [1.1847830e+01, 1.0808500e+17],
-       [1.1866488e+01, 1.0969000e+17],
-       [1.1885146e+01, 1.0897500e+17],
-       [1.1903804e+01, 1.0976800e+17],
-       [1.1922462e+01, 1.0885500e+17],
-       [1.1941120e+01, 1.0809900e+17],
-       [1.1959778e+01, 1.0974700e+17],
-       [1.1978436e+01, 1.0812300e+17],
-       [1.1997094e+01, 1.0807100e+17],
-       [1.2015752e+01, 1.0814900e+17],
-       [1.2034410e+01, 1.0838800e+17],
-       [1.2053068e+01, 1.0886600e+17],
-       [1.2071726e+01, 1.0918900e+17],
-       [1.2090384e+01, 1.0933600e+17],
-       [1.2109042e+01, 1.0891200e+17],
-       [1.2127700e+01, 1.0927100e+17],
-       [1.2146358e+01, 1.0875300e+17],
-       [1.2165016e+01, 1.0860500e+17],
-       [1.2183674e+01, 1.0930700e+17],
-       [1.2202332e+01, 1.0887600e+17],
-       [1.2220990e+01, 1.0850900e+17],
-       [1.2239648e+01, 1.0878700e+17],
-       [1.2258306e+01, 1.0937200e+17],
-       [1.2276964e+01, 1.0853800e+17],
-       [1.2295622e+01, 1.0841900e+17],
-       [1.2314280e+01, 1.0985900e+17],
-       [1.2332938e+01, 1.0889800e+17],
-       [1.2351596e+01, 1.0890200e+17],
-       [1.2370254e+01, 1.0815000e+17],
-       [1.2388912e+01, 1.0882200e+17],
-       [1.2407570e+01, 1.0870800e+17],
-       [1.2426228e+01, 1.0923200e+17],
-       [1.2444886e+01, 1.0902300e+17],
-       [1.2463544e+01, 1.0947800e+17],
-       [1.2482202e+01, 1.0986800e+17],
-       [1.2500860e+01, 1.0950000e+17],
-       [1.2519518e+01, 1.0825900e+17],
-       [1.2538176e+01, 1.0802500e+17],
-       [1.2556834e+01, 1.0825500e+17],
-       [1.2575492e+01, 1.0870400e+17],
-       [1.2594150e+01, 1.0802900e+17],
-       [1.2612808e+01, 1.0987000e+17],
-       [1.2631466e+01, 1.0991200e+17],
-       [1.2650124e+01, 1.0847900e+17],
-       [1.2668782e+01, 1.0825900e+17],
-       [1.2687440e+01, 1.0868800e+17],
-       [1.2706098e+01, 1.0986000e+17],
-       [1.2724756e+01, 1.0814300e+17],
-       [1.2743414e+01, 1.0947900e+17],
-       [1.2762072e+01, 1.0851200e+17],
-       [1.2780730e+01, 1.0897400e+17],
-       [1.2799388e+01, 1.0942500e+17],
-       [1.2818046e+01, 1.0800100e+17],
-       [1.2836704e+01, 1.0997500e+17],
-       [1.2855362e+01, 1.0900600e+17],
-       [1.2874020e+01, 1.0959100e+17],
-       [1.2892678e+01, 1.0801600e+17],
-       [1.2911336e+01, 1.0892100e+17],
-       [1.2929994e+01, 1.0976100e+17],
-       [1.2948652e+01, 1.0952100e+17],
-       [1.2967310e+01, 1.0924300e+17],
-       [1.2985968e+01, 1.0802600e+17],
-       [1.3004626e+01, 1.0938500e+17],
-       [1.3023284e+01, 1.0992700e+17],
-       [1.3041942e+01, 1.0847300e+17],
-       [1.3060600e+01, 1.0980200e+17],
-       [1.3079258e+01, 1.0963700e+17],
-       [1.3097916e+01, 1.0981600e+17],
-       [1.3116574e+01, 1.0974100e+17],
-       [1.3135232e+01, 1.0876200e+17],
-       [1.3153890e+01, 1.0976400e+17],
-       [1.3172548e+01, 1.0969700e+17],
-       [1.3191206e+01, 1.0843100e+17],
-       [1.3209864e+01, 1.0915400e+17],
-       [1.3228522e+01, 1.0888300e+17],
-       [1.3247180e+01, 1.0898900e+17],
-       [1.3265838e+01, 1.0915000e+17],
-       [1.3284496e+01, 1.0992700e+17],
-       [1.3303154e+01, 1.0902600e+17],
-       [1.3321812e+01, 1.0867600e+17],
-       [1.3340470e+01, 1.0818800e+17],
-       [1.3359128e+01, 1.0840000e+17],
-       [1.3377786e+01, 1.0875000e+17],
-       [1.3396444e+01, 1.0846400e+17],
-       [1.3415102e+01, 1.0957700e+17],
-       [1.3433760e+01, 1.0899400e+17],
-       [1.3452418e+01, 1.0866900e+17],
-       [1.3471076e+01, 1.0992800e+17],
-       [1.3489734e+01, 1.0835000e+17],
-       [1.3508392e+01, 1.0876700e+17],
-       [1.3527050e+01, 1.0985100e+17],
-       [1.3545708e+01, 1.0949000e+17],
-       [1.3564366e+01, 1.0881300e+17],
-       [1.3583024e+01, 1.0948600e+17],
-       [1.3601682e+01, 1.0839700e+17],
-       [1.3620340e+01, 1.0845000e+17],
-       [1.3638998e+01, 1.0939200e+17],
-       [1.3657656e+01, 1.0974900e+17],
-       [1.3676314e+01, 1.0924000e+17],
-       [1.3694972e+01, 1.0848200e+17],
-       [1.3713630e+01, 1.0983100e+17],
-       [1.3732288e+01, 1.0836800e+17],
-       [1.3750946e+01, 1.0912300e+17],
-       [1.3769604e+01, 1.0864000e+17],
-       [1.3788262e+01, 1.0846600e+17],
-       [1.3806920e+01, 1.0937400e+17],
-       [1.3825578e+01, 1.0970200e+17],
-       [1.3844236e+01, 1.0883100e+17],
-       [1.3862894e+01, 1.0878500e+17],
-       [1.3881552e+01, 1.0839500e+17],
-       [1.3900210e+01, 1.0923400e+17],
-       [1.3918868e+01, 1.0975600e+17],
-       [1.3937526e+01, 1.0856100e+17],
-       [1.3956184e+01, 1.0967000e+17],
-       [1.3974842e+01, 1.0824500e+17],
-       [1.3993500e+01, 1.0862200e+17],
-       [1.4012158e+01, 1.0947800e+17],
-       [1.4030816e+01, 1.0825000e+17],
-       [1.4049474e+01, 1.0927400e+17],
-       [1.4068132e+01, 1.0839100e+17],
-       [1.4086790e+01, 1.0967700e+17],
-       [1.4105448e+01, 1.0920800e+17],
-       [1.4124106e+01, 1.0962000e+17],
-       [1.4142764e+01, 1.0945900e+17],
-       [1.4161422e+01, 1.0969800e+17],
-       [1.4180080e+01, 1.0836100e+17],
-       [1.4198738e+01, 1.0971200e+17],
-       [1.4217396e+01, 1.0997500e+17],
-       [1.4236054e+01, 1.0966300e+17],
-       [1.4254712e+01, 1.0952600e+17],
-       [1.4273370e+01, 1.0933500e+17],
-       [1.4292028e+01, 1.0865700e+17],
-       [1.4310686e+01, 1.0843500e+17],
-       [1.4329344e+01, 1.0881800e+17],
-       [1.4348002e+01, 1.0938300e+17],
-       [1.4366660e+01, 1.0940100e+17],
-       [1.4385318e+01, 1.0893800e+17],
-       [1.4403976e+01, 1.0802100e+17],
-       [1.4422634e+01, 1.0878500e+17],
-       [1.4441292e+01, 1.0861600e+17],
-       [1.4459950e+01, 1.0921500e+17],
-       [1.4478608e+01, 1.0833900e+17],
-       [1.4497266e+01, 1.0903000e+17],
-       [1.4515924e+01, 1.0825100e+17],
-       [1.4534582e+01, 1.0882600e+17],
-       [1.4553240e+01, 1.0841600e+17],
-       [1.4571898e+01, 1.0914200e+17],
-       [1.4590556e+01, 1.0982200e+17],
-       [1.4609214e+01, 1.0865500e+17],
-       [1.4627872e+01, 1.0969500e+17],
-       [1.4646530e+01, 1.0888200e+17],
-       [1.4665188e+01, 1.0891400e+17],
-       [1.4683846e+01, 1.0806300e+17],
-       [1.4702504e+01, 1.0837900e+17],
-       [1.4721162e+01, 1.0967700e+17],
-       [1.4739820e+01, 1.0825000e+17],
-       [1.4758478e+01, 1.0887900e+17],
-       [1.4777136e+01, 1.0869200e+17],
-       [1.4795794e+01, 1.0958800e+17],
-       [1.4814452e+01, 1.0855600e+17],
-       [1.4833110e+01, 1.0892800e+17],
-       [1.4851768e+01, 1.0958800e+17],
-       [1.4870426e+01, 1.0816300e+17],
-       [1.4889084e+01, 1.0811200e+17],
-       [1.4907742e+01, 1.0922800e+17],
-       [1.4926400e+01, 1.0997400e+17],
-       [1.4945058e+01, 1.0869100e+17],
-       [1.4963716e+01, 1.0985800e+17],
-       [1.4982374e+01, 1.0990400e+17],
-       [1.5001032e+01, 1.0979100e+17],
-       [1.5019690e+01, 9.9301000e+15],
-       [1.5038348e+01, 9.4197100e+15],
-       [1.5057006e+01, 9.5989900e+15],
-       [1.5075664e+01, 9.6577600e+15],
-       [1.5094322e+01, 9.9843700e+15],
-       [1.5112980e+01, 9.3100400e+15],
-       [1.5131638e+01, 9.9504600e+15],
-       [1.5150296e+01, 9.6769400e+15],
-       [1.5168954e+01, 9.3815600e+15],
-       [1.5187612e+01, 9.4109300e+15],
-       [1.5206270e+01, 9.3537100e+15],
-       [1.5224928e+01, 9.8995400e+15],
-       [1.5243586e+01, 9.3576300e+15],
-       [1.5262244e+01, 9.3319000e+15],
-       [1.5280902e+01, 9.3621500e+15],
-       [1.5299560e+01, 9.4732300e+15],
-       [1.5318218e+01, 9.4239900e+15],
-       [1.5336876e+01, 9.8610600e+15],
-       [1.5355534e+01, 9.9247800e+15],
-       [1.5374192e+01, 9.4489300e+15],
-       [1.5392850e+01, 9.5006800e+15],
-       [1.5411508e+01, 9.4995800e+15],
-       [1.5430166e+01, 9.4571400e+15],
-       [1.5448824e+01, 9.3729000e+15],
-       [1.5467482e+01, 9.8451400e+15],
-       [1.5486140e+01, 9.9485500e+15],
-       [1.5504798e+01, 9.5466800e+15],
-       [1.5523456e+01, 9.5366800e+15],
-       [1.5542114e+01, 9.9181300e+15],
-       [1.5560772e+01, 9.8630600e+15],
-       [1.5579430e+01, 9.3135400e+15],
-       [1.5598088e+01, 9.9162300e+15],
-       [1.5616746e+01, 9.9968100e+15],
-       [1.5635404e+01, 9.8380600e+15],
-       [1.5654062e+01, 9.5354300e+15],
-       [1.5672720e+01, 9.9984400e+15],
-       [1.5691378e+01, 9.4293800e+15],
-       [1.5710036e+01, 9.4711800e+15],
-       [1.5728694e+01, 9.3301300e+15],
-       [1.5747352e+01, 9.6783200e+15],
-       [1.5766010e+01, 9.7888000e+15],
-       [1.5784668e+01, 9.7088900e+15],
-       [1.5803326e+01, 9.4641800e+15],
-       [1.5821984e+01, 9.9792800e+15],
-       [1.5840642e+01, 9.9684000e+15],
-       [1.5859300e+01, 9.5399100e+15],
-       [1.5877958e+01, 9.6411100e+15],
-       [1.5896616e+01, 9.3987600e+15],
-       [1.5915274e+01, 9.8981800e+15],
-       [1.5933932e+01, 9.4582600e+15],
-       [1.5952590e+01, 9.6880700e+15],
-       [1.5971248e+01, 9.5563200e+15],
-       [1.5989906e+01, 9.6037900e+15],
-       [1.6008564e+01, 9.4401600e+15],
-       [1.6027222e+01, 9.4447800e+15],
-       [1.6045880e+01, 9.4487300e+15],
-       [1.6064538e+01, 9.8957300e+15],
-       [1.6083196e+01, 9.3654100e+15],
-       [1.6101854e+01, 9.8221100e+15],
-       [1.6120512e+01, 9.7116000e+15],
-       [1.6139170e+01, 9.5709200e+15],
-       [1.6157828e+01, 9.7491000e+15],
-       [1.6176486e+01, 9.4934600e+15],
-       [1.6195144e+01, 9.9005700e+15],
-       [1.6213802e+01, 9.6526400e+15],
-       [1.6232460e+01, 9.8658300e+15],
-       [1.6251118e+01, 9.8331600e+15],
-       [1.6269776e+01, 9.3601900e+15],
-       [1.6288434e+01, 9.9392600e+15],
-       [1.6307092e+01, 9.4041800e+15],
-       [1.6325750e+01, 9.9519900e+15],
-       [1.6344408e+01, 9.6293400e+15],
-       [1.6363066e+01, 9.6775300e+15],
-       [1.6381724e+01, 9.8222100e+15],
-       [1.6400382e+01, 9.6950500e+15],
-       [1.6419040e+01, 9.4018200e+15],
-       [1.6437698e+01, 9.7624700e+15],
-       [1.6456356e+01, 9.8300500e+15],
-       [1.6475014e+01, 9.8989200e+15],
-       [1.6493672e+01, 9.3874100e+15],
-       [1.6512330e+01, 9.6835000e+15],
-       [1.6530988e+01, 9.6083800e+15],
-       [1.6549646e+01, 9.4978300e+15],
-       [1.6568304e+01, 9.7548100e+15],
-       [1.6586962e+01, 9.4001100e+15],
-       [1.6605620e+01, 9.5575900e+15],
-       [1.6624278e+01, 9.4635300e+15],
-       [1.6642936e+01, 9.9222000e+15],
-       [1.6661594e+01, 9.6113600e+15],
-       [1.6680252e+01, 9.7036000e+15],
-       [1.6698910e+01, 9.4768600e+15],
-       [1.6717568e+01, 9.7356300e+15],
-       [1.6736226e+01, 9.6484900e+15],
-       [1.6754884e+01, 9.7565200e+15],
-       [1.6773542e+01, 9.7615600e+15],
-       [1.6792200e+01, 9.4885300e+15],
-       [1.6810858e+01, 9.5693700e+15],
-       [1.6829516e+01, 9.6801300e+15],
-       [1.6848174e+01, 9.6483800e+15],
-       [1.6866832e+01, 9.5248300e+15],
-       [1.6885490e+01, 9.3561200e+15],
-       [1.6904148e+01, 9.3578600e+15],
-       [1.6922806e+01, 9.3180100e+15],
-       [1.6941464e+01, 9.4572400e+15],
-       [1.6960122e+01, 9.5891200e+15],
-       [1.6978780e+01, 9.6879600e+15],
-       [1.6997438e+01, 9.5372500e+15],
-       [1.7016096e+01, 9.5406500e+15],
-       [1.7034754e+01, 9.5123400e+15],
-       [1.7053412e+01, 9.9541900e+15],
-       [1.7072070e+01, 9.8370000e+15],
-       [1.7090728e+01, 9.4497900e+15],
-       [1.7109386e+01, 9.9946800e+15],
-       [1.7128044e+01, 9.9587500e+15],
-       [1.7146702e+01, 9.8679600e+15],
-       [1.7165360e+01, 9.4921400e+15],
-       [1.7184018e+01, 9.4416200e+15],
-       [1.7202676e+01, 9.8218200e+15],
-       [1.7221334e+01, 9.6022800e+15],
-       [1.7239992e+01, 9.4697100e+15],
-       [1.7258650e+01, 9.3665300e+15],
-       [1.7277308e+01, 9.8964300e+15],
-       [1.7295966e+01, 9.4491500e+15],
-       [1.7314624e+01, 9.9810000e+15],
-       [1.7333282e+01, 9.3352100e+15],
-       [1.7351940e+01, 9.3371900e+15],
-       [1.7370598e+01, 9.3043700e+15],
-       [1.7389256e+01, 9.3584400e+15],
-       [1.7407914e+01, 9.3379100e+15],
-       [1.7426572e+01, 9.7292800e+15],
-       [1.7445230e+01, 9.6259000e+15],
-       [1.7463888e+01, 9.4719600e+15],
-       [1.7482546e+01, 9.8626900e+15],
-       [1.7501204e+01, 9.5703100e+15],
-       [1.7519862e+01, 9.8060700e+15],
-       [1.7538520e+01, 9.9051100e+15],
-       [1.7557178e+01, 9.7747300e+15],
-       [1.7575836e+01, 9.4566800e+15],
-       [1.7594494e+01, 9.8857300e+15],
-       [1.7613152e+01, 9.9840600e+15],
-       [1.7631810e+01, 9.5576600e+15],
-       [1.7650468e+01, 9.8976200e+15],
-       [1.7669126e+01, 9.5096100e+15],
-       [1.7687784e+01, 9.4885800e+15],
-       [1.7706442e+01, 9.5915900e+15],
-       [1.7725100e+01, 9.6712900e+15],
-       [1.7743758e+01, 9.6183200e+15],
-       [1.7762416e+01, 9.7563400e+15],
-       [1.7781074e+01, 9.7224600e+15],
-       [1.7799732e+01, 9.4354600e+15],
-       [1.7818390e+01, 9.7830100e+15],
-       [1.7837048e+01, 9.3147400e+15],
-       [1.7855706e+01, 9.3464200e+15],
-       [1.7874364e+01, 9.4334800e+15],
-       [1.7893022e+01, 9.9861000e+15],
-       [1.7911680e+01, 9.5411200e+15],
-       [1.7930338e+01, 9.9979100e+15],
-       [1.7948996e+01, 9.6358600e+15],
-       [1.7967654e+01, 9.8145900e+15],
-       [1.7986312e+01, 9.7315000e+15],
-       [1.8004970e+01, 9.7130500e+15],
-       [1.8023628e+01, 9.3321200e+15],
-       [1.8042286e+01, 9.3074800e+15],
-       [1.8060944e+01, 9.6466100e+15],
-       [1.8079602e+01, 9.3219600e+15],
-       [1.8098260e+01, 9.3821100e+15],
-       [1.8116918e+01, 9.8969400e+15],
-       [1.8135576e+01, 9.5684200e+15],
-       [1.8154234e+01, 9.7673200e+15],
-       [1.8172892e+01, 9.4288300e+15],
-       [1.8191550e+01, 9.6500000e+15],
-       [1.8210208e+01, 9.7151100e+15],
-       [1.8228866e+01, 9.4836100e+15],
-       [1.8247524e+01, 9.8237100e+15],
-       [1.8266182e+01, 9.3417700e+15],
-       [1.8284840e+01, 9.7106900e+15],
-       [1.8303498e+01, 9.4385600e+15],
-       [1.8322156e+01, 9.6636100e+15],
-       [1.8340814e+01, 9.7875600e+15],
-       [1.8359472e+01, 9.7729500e+15],
-       [1.8378130e+01, 9.9689100e+15],
-       [1.8396788e+01, 9.3129500e+15],
-       [1.8415446e+01, 9.7836300e+15],
-       [1.8434104e+01, 9.4103500e+15],
-       [1.8452762e+01, 9.8530300e+15],
-       [1.8471420e+01, 9.3836700e+15],
-       [1.8490078e+01, 9.4751800e+15],
-       [1.8508736e+01, 9.4010400e+15],
-       [1.8527394e+01, 9.4974700e+15],
-       [1.8546052e+01, 9.6004100e+15],
-       [1.8564710e+01, 9.6596100e+15],
-       [1.8583368e+01, 9.3913500e+15],
-       [1.8602026e+01, 9.3149800e+15],
-       [1.8620684e+01, 9.8932200e+15],
-       [1.8639342e+01, 9.6819200e+15],
-       [1.8658000e+01, 9.3399700e+15],
-       [1.8676658e+01, 9.7848100e+15],
-       [1.8695316e+01, 9.4795600e+15],
-       [1.8713974e+01, 9.9040800e+15],
-       [1.8732632e+01, 9.8882800e+15],
-       [1.8751290e+01, 9.5011900e+15],
-       [1.8769948e+01, 9.8217300e+15],
-       [1.8788606e+01, 9.4120600e+15],
-       [1.8807264e+01, 9.4543900e+15],
-       [1.8825922e+01, 9.6946600e+15],
-       [1.8844580e+01, 9.7765600e+15],
-       [1.8863238e+01, 9.9050400e+15],
-       [1.8881896e+01, 9.4260400e+15],
-       [1.8900554e+01, 9.5576900e+15],
-       [1.8919212e+01, 9.6161400e+15],
-       [1.8937870e+01, 9.4094400e+15],
-       [1.8956528e+01, 9.3440500e+15],
-       [1.8975186e+01, 9.3840500e+15],
-       [1.8993844e+01, 9.7909500e+15],
-       [1.9012502e+01, 9.3068600e+15],
-       [1.9031160e+01, 9.9392100e+15],
-       [1.9049818e+01, 9.5813800e+15],
-       [1.9068476e+01, 9.8028200e+15],
-       [1.9087134e+01, 9.6972100e+15],
-       [1.9105792e+01, 9.6638800e+15],
-       [1.9124450e+01, 9.4843400e+15],
-       [1.9143108e+01, 9.8740600e+15],
-       [1.9161766e+01, 9.8544500e+15],
-       [1.9180424e+01, 9.4700200e+15],
-       [1.9199082e+01, 9.6169000e+15],
-       [1.9217740e+01, 9.8456000e+15],
-       [1.9236398e+01, 9.4264600e+15],
-       [1.9255056e+01, 9.7688300e+15],
-       [1.9273714e+01, 9.4239000e+15],
-       [1.9292372e+01, 9.7867500e+15],
-       [1.9311030e+01, 9.3719500e+15],
-       [1.9329688e+01, 9.8240900e+15],
-       [1.9348346e+01, 9.7683100e+15],
-       [1.9367004e+01, 9.9030000e+15],
-       [1.9385662e+01, 9.7120700e+15],
-       [1.9404320e+01, 9.4661900e+15],
-       [1.9422978e+01, 9.5500500e+15],
-       [1.9441636e+01, 9.3652900e+15],
-       [1.9460294e+01, 9.5476000e+15],
-       [1.9478952e+01, 9.5553100e+15],
-       [1.9497610e+01, 9.9894800e+15],
-       [1.9516268e+01, 9.3665700e+15],
-       [1.9534926e+01, 9.3052300e+15],
-       [1.9553584e+01, 9.8435100e+15],
-       [1.9572242e+01, 9.5362400e+15],
-       [1.9590900e+01, 9.8185700e+15],
-       [1.9609558e+01, 9.8181800e+15],
-       [1.9628216e+01, 9.6341400e+15],
-       [1.9646874e+01, 9.9911800e+15],
-       [1.9665532e+01, 9.9247200e+15],
-       [1.9684190e+01, 9.9625500e+15],
-       [1.9702848e+01, 9.5157100e+15],
-       [1.9721506e+01, 9.7185300e+15],
-       [1.9740164e+01, 9.8350800e+15],
-       [1.9758822e+01, 9.8730000e+15],
-       [1.9777480e+01, 9.6183500e+15],
-       [1.9796138e+01, 9.9375200e+15],
-       [1.9814796e+01, 9.9836900e+15],
-       [1.9833454e+01, 9.6603200e+15],
-       [1.9852112e+01, 9.6069600e+15],
-       [1.9870770e+01, 9.9473300e+15],
-       [1.9889428e+01, 9.9601800e+15],
-       [1.9908086e+01, 9.3625300e+15],
-       [1.9926744e+01, 9.3589100e+15],
-       [1.9945402e+01, 9.6021700e+15],
-       [1.9964060e+01, 9.3528400e+15],
-       [1.9982718e+01, 9.4536800e+15],
-       [2.0001376e+01, 9.6223100e+15],
-       [2.0020034e+01, 1.1808600e+15],
-       [2.0038692e+01, 1.3516900e+15],
-       [2.0057350e+01, 9.0060300e+14],
-       [2.0076008e+01, 1.0919600e+15],
-       [2.0094666e+01, 1.2253700e+15],
-       [2.0113324e+01, 1.0448200e+15],
-       [2.0131982e+01, 1.3524600e+15],
-       [2.0150640e+01, 8.7378600e+14],
-       [2.0169298e+01, 8.6766000e+14],
-       [2.0187956e+01, 1.0250000e+15],
-       [2.0206614e+01, 9.4186900e+14],
-       [2.0225272e+01, 1.1687300e+15],
-       [2.0243930e+01, 9.5863200e+14],
-       [2.0262588e+01, 1.1021600e+15],
-       [2.0281246e+01, 1.1677000e+15],
-       [2.0299904e+01, 1.1616500e+15],
-       [2.0318562e+01, 9.1912400e+14],
-       [2.0337220e+01, 1.2937400e+15],
-       [2.0355878e+01, 1.1540900e+15],
-       [2.0374536e+01, 1.2021800e+15],
-       [2.0393194e+01, 1.0107700e+15],
-       [2.0411852e+01, 9.4325700e+14],
-       [2.0430510e+01, 9.1822300e+14],
-       [2.0449168e+01, 1.3542600e+15],
-       [2.0467826e+01, 1.2140400e+15],
-       [2.0486484e+01, 9.5633100e+14],
-       [2.0505142e+01, 1.1879700e+15],
-       [2.0523800e+01, 1.0050800e+15],
-       [2.0542458e+01, 1.0836300e+15],
-       [2.0561116e+01, 1.0473600e+15],
-       [2.0579774e+01, 1.1288700e+15],
-       [2.0598432e+01, 1.0671600e+15],
-       [2.0617090e+01, 1.1183400e+15],
-       [2.0635748e+01, 9.3994900e+14],
-       [2.0654406e+01, 1.0645600e+15],
-       [2.0673064e+01, 1.3376100e+15],
-       [2.0691722e+01, 9.9052300e+14],
-       [2.0710380e+01, 1.1641800e+15],
-       [2.0729038e+01, 9.5615700e+14],
-       [2.0747696e+01, 1.3298500e+15],
-       [2.0766354e+01, 8.5828300e+14],
-       [2.0785012e+01, 1.0764500e+15],
-       [2.0803670e+01, 1.0769900e+15],
-       [2.0822328e+01, 1.3328700e+15],
-       [2.0840986e+01, 1.2912700e+15],
-       [2.0859644e+01, 9.4002300e+14],
-       [2.0878302e+01, 1.0461400e+15],
-       [2.0896960e+01, 9.0256800e+14],
-       [2.0915618e+01, 1.2472500e+15],
-       [2.0934276e+01, 1.2246000e+15],
-       [2.0952934e+01, 9.5717100e+14],
-       [2.0971592e+01, 1.1806200e+15],
-       [2.0990250e+01, 1.2221600e+15],
-       [2.1008908e+01, 9.6433800e+14],
-       [2.1027566e+01, 1.0203100e+15],
-       [2.1046224e+01, 1.0952600e+15],
-       [2.1064882e+01, 1.0245700e+15],
-       [2.1083540e+01, 1.1601800e+15],
-       [2.1102198e+01, 1.2390700e+15],
-       [2.1120856e+01, 1.2699500e+15],
-       [2.1139514e+01, 8.7912800e+14],
-       [2.1158172e+01, 9.1583600e+14],
-       [2.1176830e+01, 1.3386900e+15],
-       [2.1195488e+01, 1.0258900e+15],
-       [2.1214146e+01, 1.1412700e+15],
-       [2.1232804e+01, 1.2352200e+15],
-       [2.1251462e+01, 1.0599300e+15],
-       [2.1270120e+01, 1.0332400e+15],
-       [2.1288778e+01, 1.3804200e+15],
-       [2.1307436e+01, 1.3282700e+15],
-       [2.1326094e+01, 9.9131100e+14],
-       [2.1344752e+01, 1.1385600e+15],
-       [2.1363410e+01, 1.3693200e+15],
-       [2.1382068e+01, 9.9675400e+14],
-       [2.1400726e+01, 9.3329600e+14],
-       [2.1419384e+01, 1.0618000e+15],
-       [2.1438042e+01, 8.9745700e+14],
-       [2.1456700e+01, 1.3228000e+15],
-       [2.1475358e+01, 1.0497000e+15],
-       [2.1494016e+01, 1.3209400e+15],
-       [2.1512674e+01, 1.1392900e+15],
-       [2.1531332e+01, 9.1452900e+14],
-       [2.1549990e+01, 9.1746600e+14],
-       [2.1568648e+01, 9.8734900e+14],
-       [2.1587306e+01, 9.9350400e+14],
-       [2.1605964e+01, 1.2166600e+15],
-       [2.1624622e+01, 1.3858600e+15],
-       [2.1643280e+01, 1.3435600e+15],
-       [2.1661938e+01, 1.1317200e+15],
-       [2.1680596e+01, 1.2259400e+15],
-       [2.1699254e+01, 1.2266700e+15],
-       [2.1717912e+01, 1.2380700e+15],
-       [2.1736570e+01, 1.0459000e+15],
-       [2.1755228e+01, 9.1935200e+14],
-       [2.1773886e+01, 1.1791700e+15],
-       [2.1792544e+01, 9.0375900e+14],
-       [2.1811202e+01, 1.2711400e+15],
-       [2.1829860e+01, 1.3293600e+15],
-       [2.1848518e+01, 9.2447800e+14],
-       [2.1867176e+01, 1.0394000e+15],
-       [2.1885834e+01, 1.3423400e+15],
-       [2.1904492e+01, 1.3302700e+15],
-       [2.1923150e+01, 1.3332900e+15],
-       [2.1941808e+01, 1.3671900e+15],
-       [2.1960466e+01, 1.2490900e+15],
-       [2.1979124e+01, 1.0195400e+15],
-       [2.1997782e+01, 8.6304400e+14],
-       [2.2016440e+01, 1.1974400e+15],
-       [2.2035098e+01, 8.8387800e+14],
-       [2.2053756e+01, 1.0466700e+15],
-       [2.2072414e+01, 1.0782500e+15],
-       [2.2091072e+01, 1.0198500e+15],
-       [2.2109730e+01, 1.0265800e+15],
-       [2.2128388e+01, 1.0395100e+15],
-       [2.2147046e+01, 1.3663800e+15],
-       [2.2165704e+01, 9.0390100e+14],
-       [2.2184362e+01, 9.8143500e+14],
-       [2.2203020e+01, 8.7529200e+14],
-       [2.2221678e+01, 1.0562200e+15],
-       [2.2240336e+01, 9.4202400e+14],
-       [2.2258994e+01, 1.1381200e+15],
-       [2.2277652e+01, 8.8715300e+14],
-       [2.2296310e+01, 9.7714400e+14],
-       [2.2314968e+01, 1.0344700e+15],
-       [2.2333626e+01, 8.9236900e+14],
-       [2.2352284e+01, 9.6541200e+14],
-       [2.2370942e+01, 1.2304200e+15],
-       [2.2389600e+01, 1.1560300e+15],
-       [2.2408258e+01, 1.2809500e+15],
-       [2.2426916e+01, 1.1246500e+15],
-       [2.2445574e+01, 9.8707900e+14],
-       [2.2464232e+01, 1.2207200e+15],
-       [2.2482890e+01, 1.1212000e+15],
-       [2.2501548e+01, 1.3130400e+15],
-       [2.2520206e+01, 1.0515700e+15],
-       [2.2538864e+01, 1.0248300e+15],
-       [2.2557522e+01, 8.7999400e+14],
-       [2.2576180e+01, 1.1477700e+15],
-       [2.2594838e+01, 9.6638900e+14],
-       [2.2613496e+01, 1.3305100e+15],
-       [2.2632154e+01, 1.0334300e+15],
-       [2.2650812e+01, 1.3849300e+15],
-       [2.2669470e+01, 1.0738900e+15],
-       [2.2688128e+01, 1.2708900e+15],
-       [2.2706786e+01, 8.5320000e+14],
-       [2.2725444e+01, 1.3044600e+15],
-       [2.2744102e+01, 9.7547200e+14],
-       [2.2762760e+01, 1.3725700e+15],
-       [2.2781418e+01, 1.2739700e+15],
-       [2.2800076e+01, 1.1265800e+15],
-       [2.2818734e+01, 1.1468000e+15],
-       [2.2837392e+01, 1.1805300e+15],
-       [2.2856050e+01, 1.2071800e+15],
-       [2.2874708e+01, 1.1350500e+15],
-       [2.2893366e+01, 1.2673800e+15],
-       [2.2912024e+01, 1.2219100e+15],
-       [2.2930682e+01, 1.2330000e+15],
-       [2.2949340e+01, 9.8528200e+14],
-       [2.2967998e+01, 8.5567600e+14],
-       [2.2986656e+01, 1.1851900e+15],
-       [2.3005314e+01, 9.0537300e+14],
-       [2.3023972e+01, 1.0919700e+15],
-       [2.3042630e+01, 1.3564100e+15],
-       [2.3061288e+01, 1.2246400e+15],
-       [2.3079946e+01, 1.1628700e+15],
-       [2.3098604e+01, 1.2480800e+15],
-       [2.3117262e+01, 9.2160700e+14],
-       [2.3135920e+01, 1.1201800e+15],
-       [2.3154578e+01, 9.6430900e+14],
-       [2.3173236e+01, 9.3172800e+14],
-       [2.3191894e+01, 1.1123800e+15],
-       [2.3210552e+01, 8.6824000e+14],
-       [2.3229210e+01, 1.3284600e+15],
-       [2.3247868e+01, 1.2227600e+15],
-       [2.3266526e+01, 9.5149400e+14],
-       [2.3285184e+01, 1.1270100e+15],
-       [2.3303842e+01, 1.2177900e+15],
-       [2.3322500e+01, 1.0498200e+15],
-       [2.3341158e+01, 1.2161400e+15],
-       [2.3359816e+01, 1.2686500e+15],
-       [2.3378474e+01, 1.2081000e+15],
-       [2.3397132e+01, 1.2333700e+15],
-       [2.3415790e+01, 1.2206700e+15],
-       [2.3434448e+01, 1.3612000e+15],
-       [2.3453106e+01, 1.3574200e+15],
-       [2.3471764e+01, 8.5533000e+14],
-       [2.3490422e+01, 1.0766700e+15],
-       [2.3509080e+01, 1.2367700e+15],
-       [2.3527738e+01, 9.6204600e+14],
-       [2.3546396e+01, 1.3656900e+15],
-       [2.3565054e+01, 1.1872700e+15],
-       [2.3583712e+01, 1.0057900e+15],
-       [2.3602370e+01, 1.2596700e+15],
-       [2.3621028e+01, 1.3239300e+15],
-       [2.3639686e+01, 1.3556200e+15],
-       [2.3658344e+01, 1.0582900e+15],
-       [2.3677002e+01, 1.3145700e+15],
-       [2.3695660e+01, 1.3830200e+15],
-       [2.3714318e+01, 1.2794000e+15],
-       [2.3732976e+01, 9.1042900e+14],
-       [2.3751634e+01, 1.2789800e+15],
-       [2.3770292e+01, 1.2766600e+15],
-       [2.3788950e+01, 1.1855300e+15],
-       [2.3807608e+01, 1.2325700e+15],
-       [2.3826266e+01, 1.3681000e+15],
-       [2.3844924e+01, 1.0183800e+15],
-       [2.3863582e+01, 8.7396600e+14],
-       [2.3882240e+01, 1.2338800e+15],
-       [2.3900898e+01, 1.3401000e+15],
-       [2.3919556e+01, 1.2080700e+15],
-       [2.3938214e+01, 1.1621500e+15],
-       [2.3956872e+01, 1.1403100e+15],
-       [2.3975530e+01, 1.0507200e+15],
-       [2.3994188e+01, 1.0113700e+15],
-       [2.4012846e+01, 9.4861000e+14],
-       [2.4031504e+01, 1.2071800e+15],
-       [2.4050162e+01, 1.3185000e+15],
-       [2.4068820e+01, 8.7878000e+14],
-       [2.4087478e+01, 1.3789800e+15],
-       [2.4106136e+01, 9.6648600e+14],
-       [2.4124794e+01, 1.1224700e+15],
-       [2.4143452e+01, 1.1011800e+15],
-       [2.4162110e+01, 1.2923900e+15],
-       [2.4180768e+01, 1.2961400e+15],
-       [2.4199426e+01, 1.3138400e+15],
-       [2.4218084e+01, 1.0303900e+15],
-       [2.4236742e+01, 1.0766100e+15],
-       [2.4255400e+01, 9.2688400e+14],
-       [2.4274058e+01, 1.2991000e+15],
-       [2.4292716e+01, 1.0751700e+15],
-       [2.4311374e+01, 1.2317800e+15],
-       [2.4330032e+01, 1.1625900e+15],
-       [2.4348690e+01, 1.3785200e+15],
-       [2.4367348e+01, 1.0748600e+15],
-       [2.4386006e+01, 1.3838300e+15],
-       [2.4404664e+01, 8.8401400e+14],
-       [2.4423322e+01, 1.0620600e+15],
-       [2.4441980e+01, 1.1364000e+15],
-       [2.4460638e+01, 9.9010300e+14],
-       [2.4479296e+01, 1.0237700e+15],
-       [2.4497954e+01, 1.0839200e+15],
-       [2.4516612e+01, 1.1629900e+15],
-       [2.4535270e+01, 1.1963800e+15],
-       [2.4553928e+01, 1.3213200e+15],
-       [2.4572586e+01, 1.0781300e+15],
-       [2.4591244e+01, 1.0380600e+15],
-       [2.4609902e+01, 1.2649600e+15],
-       [2.4628560e+01, 1.1014800e+15],
-       [2.4647218e+01, 8.9747600e+14],
-       [2.4665876e+01, 9.3081500e+14],
-       [2.4684534e+01, 1.3205600e+15],
-       [2.4703192e+01, 1.1319900e+15],
-       [2.4721850e+01, 1.3356600e+15],
-       [2.4740508e+01, 1.0792900e+15],
-       [2.4759166e+01, 1.2108100e+15],
-       [2.4777824e+01, 8.9585900e+14],
-       [2.4796482e+01, 1.0189200e+15],
-       [2.4815140e+01, 1.2956100e+15],
-       [2.4833798e+01, 1.2610700e+15],
-       [2.4852456e+01, 1.1143400e+15],
-       [2.4871114e+01, 1.2791400e+15],
-       [2.4889772e+01, 8.6476500e+14],
-       [2.4908430e+01, 1.2645500e+15],
-       [2.4927088e+01, 8.6320700e+14],
-       [2.4945746e+01, 1.3804300e+15],
-       [2.4964404e+01, 1.3823500e+15],
-       [2.4983062e+01, 1.2901400e+15],
-       [2.5001720e+01, 9.2709100e+14],
-       [2.5020378e+01, 9.7614900e+14],
-       [2.5039036e+01, 1.2414700e+15],
-       [2.5057694e+01, 1.2671000e+15],
-       [2.5076352e+01, 1.1328100e+15],
-       [2.5095010e+01, 1.3489600e+15],
-       [2.5113668e+01, 1.3314300e+15],
-       [2.5132326e+01, 9.3443800e+14],
-       [2.5150984e+01, 1.3606900e+15],
-       [2.5169642e+01, 1.2010100e+15],
-       [2.5188300e+01, 1.2994300e+15],
-       [2.5206958e+01, 8.5862300e+14],
-       [2.5225616e+01, 8.7821000e+14],
-       [2.5244274e+01, 1.2809900e+15],
-       [2.5262932e+01, 8.6033300e+14],
-       [2.5281590e+01, 1.0299600e+15],
-       [2.5300248e+01, 1.2011100e+15],
-       [2.5318906e+01, 1.3579100e+15],
-       [2.5337564e+01, 8.5294000e+14],
-       [2.5356222e+01, 1.3142800e+15],
-       [2.5374880e+01, 8.6210600e+14],
-       [2.5393538e+01, 9.7263300e+14],
-       [2.5412196e+01, 8.6023900e+14],
-       [2.5430854e+01, 9.4734500e+14],
-       [2.5449512e+01, 1.3145000e+15],
-       [2.5468170e+01, 1.2045700e+15],
-       [2.5486828e+01, 1.1682300e+15],
-       [2.5505486e+01, 1.2294600e+15],
-       [2.5524144e+01, 9.2209200e+14],
-       [2.5542802e+01, 1.3792600e+15],
-       [2.5561460e+01, 9.7590000e+14],
-       [2.5580118e+01, 1.2807100e+15],
-       [2.5598776e+01, 1.1322400e+15],
-       [2.5617434e+01, 9.6757900e+14],
-       [2.5636092e+01, 1.2681400e+15],
-       [2.5654750e+01, 1.1450000e+15],
-       [2.5673408e+01, 1.2113200e+15],
-       [2.5692066e+01, 1.0787400e+15],
-       [2.5710724e+01, 9.2688400e+14],
-       [2.5729382e+01, 1.1956300e+15],
-       [2.5748040e+01, 1.1249600e+15],
-       [2.5766698e+01, 1.0323600e+15],
-       [2.5785356e+01, 8.7578100e+14],
-       [2.5804014e+01, 1.1056900e+15],
-       [2.5822672e+01, 9.9558800e+14],
-       [2.5841330e+01, 1.1333000e+15],
-       [2.5859988e+01, 1.1679700e+15],
-       [2.5878646e+01, 1.1974000e+15],
-       [2.5897304e+01, 1.1731000e+15],
-       [2.5915962e+01, 1.3187700e+15],
-       [2.5934620e+01, 1.1516800e+15],
-       [2.5953278e+01, 1.0754400e+15],
-       [2.5971936e+01, 9.3803400e+14],
-       [2.5990594e+01, 1.1628700e+15],
-       [2.6009252e+01, 1.1549800e+15],
-       [2.6027910e+01, 1.0685300e+15],
-       [2.6046568e+01, 1.3666800e+15],
-       [2.6065226e+01, 1.3303700e+15],
-       [2.6083884e+01, 1.0860700e+15],
-       [2.6102542e+01, 8.7089400e+14],
-       [2.6121200e+01, 1.2621000e+15],
-       [2.6139858e+01, 1.0884500e+15],
-       [2.6158516e+01, 1.0924500e+15],
-       [2.6177174e+01, 1.2597800e+15],
-       [2.6195832e+01, 1.2524200e+15],
-       [2.6214490e+01, 1.1521200e+15],
-       [2.6233148e+01, 9.9505100e+14],
-       [2.6251806e+01, 1.0445700e+15],
-       [2.6270464e+01, 1.3584500e+15],
-       [2.6289122e+01, 1.2622400e+15],
-       [2.6307780e+01, 1.3350900e+15],
-       [2.6326438e+01, 1.2051400e+15],
-       [2.6345096e+01, 9.3879300e+14],
-       [2.6363754e+01, 1.1052900e+15],
-       [2.6382412e+01, 8.9945400e+14],
-       [2.6401070e+01, 1.1032600e+15],
-       [2.6419728e+01, 1.2010200e+15],
-       [2.6438386e+01, 9.4871800e+14],
-       [2.6457044e+01, 9.1172300e+14],
-       [2.6475702e+01, 1.1823800e+15],
-       [2.6494360e+01, 1.2307300e+15],
-       [2.6513018e+01, 9.6664300e+14],
-       [2.6531676e+01, 8.9351000e+14],
-       [2.6550334e+01, 1.2442900e+15],
-       [2.6568992e+01, 1.0262800e+15],
-       [2.6587650e+01, 1.0000500e+15],
-       [2.6606308e+01, 1.1243900e+15],
-       [2.6624966e+01, 1.3808900e+15],
-       [2.6643624e+01, 1.2319100e+15],
-       [2.6662282e+01, 9.7201600e+14],
-       [2.6680940e+01, 1.2430300e+15],
-       [2.6699598e+01, 1.0280900e+15],
-       [2.6718256e+01, 1.0689000e+15],
-       [2.6736914e+01, 1.3658000e+15],
-       [2.6755572e+01, 1.2191500e+15],
-       [2.6774230e+01, 8.8921100e+14],
-       [2.6792888e+01, 1.0558200e+15],
-       [2.6811546e+01, 9.2520400e+14],
-       [2.6830204e+01, 9.0592400e+14],
-       [2.6848862e+01, 1.1147400e+15],
-       [2.6867520e+01, 9.9752700e+14],
-       [2.6886178e+01, 1.1257500e+15],
-       [2.6904836e+01, 1.0132100e+15],
-       [2.6923494e+01, 1.2894500e+15],
-       [2.6942152e+01, 1.0207000e+15],
-       [2.6960810e+01, 1.1611900e+15],
-       [2.6979468e+01, 1.0575000e+15],
-       [2.6998126e+01, 9.0685700e+14],
-       [2.7016784e+01, 9.2079900e+14],
-       [2.7035442e+01, 1.1437000e+15],
-       [2.7054100e+01, 1.3728100e+15],
-       [2.7072758e+01, 9.6605600e+14],
-       [2.7091416e+01, 1.0895700e+15],
-       [2.7110074e+01, 9.4521800e+14],
-       [2.7128732e+01, 9.6236200e+14],
-       [2.7147390e+01, 1.2180800e+15],
-       [2.7166048e+01, 1.3426600e+15],
-       [2.7184706e+01, 1.0265200e+15],
-       [2.7203364e+01, 8.9791400e+14],
-       [2.7222022e+01, 8.8196300e+14],
-       [2.7240680e+01, 1.3063200e+15],
-       [2.7259338e+01, 8.5182100e+14],
-       [2.7277996e+01, 8.8494400e+14],
-       [2.7296654e+01, 9.3707200e+14],
-       [2.7315312e+01, 8.7461700e+14],
-       [2.7333970e+01, 9.1795300e+14],
-       [2.7352628e+01, 1.0243700e+15],
-       [2.7371286e+01, 1.1256400e+15],
-       [2.7389944e+01, 1.3221600e+15],
-       [2.7408602e+01, 9.9732700e+14],
-       [2.7427260e+01, 1.3644400e+15],
-       [2.7445918e+01, 1.3019100e+15],
-       [2.7464576e+01, 1.3727100e+15],
-       [2.7483234e+01, 8.8291600e+14],
-       [2.7501892e+01, 1.3322900e+15],
-       [2.7520550e+01, 9.3009900e+14],
-       [2.7539208e+01, 1.2253600e+15],
-       [2.7557866e+01, 1.0197500e+15],
-       [2.7576524e+01, 1.0056400e+15],
-       [2.7595182e+01, 1.1319000e+15],
-       [2.7613840e+01, 1.2455400e+15],
-       [2.7632498e+01, 9.3790600e+14],
-       [2.7651156e+01, 1.3424300e+15],
-       [2.7669814e+01, 1.1769800e+15],
-       [2.7688472e+01, 8.7156100e+14],
-       [2.7707130e+01, 1.3383100e+15],
-       [2.7725788e+01, 1.3037100e+15],
-       [2.7744446e+01, 1.0139200e+15],
-       [2.7763104e+01, 1.0558400e+15],
-       [2.7781762e+01, 1.3035600e+15],
-       [2.7800420e+01, 1.1170500e+15],
-       [2.7819078e+01, 1.3139400e+15],
-       [2.7837736e+01, 1.1097300e+15],
-       [2.7856394e+01, 1.3794300e+15],
-       [2.7875052e+01, 1.3162700e+15],
-       [2.7893710e+01, 1.1174100e+15],
-       [2.7912368e+01, 1.0938700e+15],
-       [2.7931026e+01, 1.2093200e+15],
-       [2.7949684e+01, 1.1816600e+15],
-       [2.7968342e+01, 9.4220600e+14],
-       [2.7987000e+01, 1.2887800e+15],
-       [2.8005658e+01, 1.0835400e+15],
-       [2.8024316e+01, 9.8897000e+14],
-       [2.8042974e+01, 1.1032000e+15],
-       [2.8061632e+01, 1.3505200e+15],
-       [2.8080290e+01, 1.0670400e+15],
-       [2.8098948e+01, 1.0588100e+15],
-       [2.8117606e+01, 1.2461300e+15],
-       [2.8136264e+01, 9.3462700e+14],
-       [2.8154922e+01, 9.0282400e+14],
-       [2.8173580e+01, 1.0546100e+15],
-       [2.8192238e+01, 1.0999200e+15],
-       [2.8210896e+01, 8.7256000e+14],
-       [2.8229554e+01, 1.2710500e+15],
-       [2.8248212e+01, 1.1241600e+15],
-       [2.8266870e+01, 1.3493900e+15],
-       [2.8285528e+01, 1.2462300e+15],
-       [2.8304186e+01, 8.5552400e+14],
-       [2.8322844e+01, 9.6994500e+14],
-       [2.8341502e+01, 8.7888600e+14],
-       [2.8360160e+01, 9.4504800e+14],
-       [2.8378818e+01, 1.0744500e+15],
-       [2.8397476e+01, 1.3281600e+15],
-       [2.8416134e+01, 8.8405000e+14],
-       [2.8434792e+01, 1.1998000e+15],
-       [2.8453450e+01, 1.2974900e+15],
-       [2.8472108e+01, 1.1129000e+15],
-       [2.8490766e+01, 1.1404500e+15],
-       [2.8509424e+01, 1.2247000e+15],
-       [2.8528082e+01, 1.3558800e+15],
-       [2.8546740e+01, 9.7336500e+14],
-       [2.8565398e+01, 1.0928800e+15],
-       [2.8584056e+01, 1.0871200e+15],
-       [2.8602714e+01, 1.1158800e+15],
-       [2.8621372e+01, 1.2507000e+15],
-       [2.8640030e+01, 9.0475100e+14],
-       [2.8658688e+01, 9.1266900e+14],
-       [2.8677346e+01, 1.3277700e+15],
-       [2.8696004e+01, 8.7449600e+14],
-       [2.8714662e+01, 1.1348800e+15],
-       [2.8733320e+01, 1.3078400e+15],
-       [2.8751978e+01, 1.1300800e+15],
-       [2.8770636e+01, 1.1806000e+15],
-       [2.8789294e+01, 1.1541500e+15],
-       [2.8807952e+01, 1.0171900e+15],
-       [2.8826610e+01, 9.2137500e+14],
-       [2.8845268e+01, 1.1587700e+15],
-       [2.8863926e+01, 1.0000100e+15],
-       [2.8882584e+01, 1.1607100e+15],
-       [2.8901242e+01, 9.2259500e+14],
-       [2.8919900e+01, 9.8360400e+14],
-       [2.8938558e+01, 1.0133300e+15],
-       [2.8957216e+01, 1.1171100e+15],
-       [2.8975874e+01, 1.2761300e+15],
-       [2.8994532e+01, 1.0580200e+15],
-       [2.9013190e+01, 1.1784100e+15],
-       [2.9031848e+01, 8.5950200e+14],
-       [2.9050506e+01, 1.0595200e+15],
-       [2.9069164e+01, 1.2488400e+15],
-       [2.9087822e+01, 1.1166100e+15],
-       [2.9106480e+01, 8.8694700e+14],
-       [2.9125138e+01, 1.2851100e+15],
-       [2.9143796e+01, 1.0040700e+15],
-       [2.9162454e+01, 1.1392000e+15],
-       [2.9181112e+01, 9.5128900e+14],
-       [2.9199770e+01, 8.9625000e+14],
-       [2.9218428e+01, 8.8986200e+14],
-       [2.9237086e+01, 1.0985600e+15],
-       [2.9255744e+01, 1.0727400e+15],
-       [2.9274402e+01, 1.0920600e+15],
-       [2.9293060e+01, 1.2354600e+15],
-       [2.9311718e+01, 1.0498900e+15],
-       [2.9330376e+01, 9.8374900e+14],
-       [2.9349034e+01, 8.9328500e+14],
-       [2.9367692e+01, 1.0744500e+15],
-       [2.9386350e+01, 9.3777600e+14],
-       [2.9405008e+01, 1.3197600e+15],
-       [2.9423666e+01, 1.3537100e+15],
-       [2.9442324e+01, 1.0786400e+15],
-       [2.9460982e+01, 1.2177200e+15],
-       [2.9479640e+01, 1.0998700e+15],
-       [2.9498298e+01, 1.1317000e+15],
-       [2.9516956e+01, 1.0757900e+15],
-       [2.9535614e+01, 1.0535800e+15],
-       [2.9554272e+01, 1.0764500e+15],
-       [2.9572930e+01, 1.0851700e+15],
-       [2.9591588e+01, 1.0980800e+15],
-       [2.9610246e+01, 1.1397900e+15],
-       [2.9628904e+01, 1.3484500e+15],
-       [2.9647562e+01, 9.3883800e+14],
-       [2.9666220e+01, 1.2019800e+15],
-       [2.9684878e+01, 1.3081200e+15],
-       [2.9703536e+01, 1.0586600e+15],
-       [2.9722194e+01, 1.2381900e+15],
-       [2.9740852e+01, 9.4415900e+14],
-       [2.9759510e+01, 8.8104300e+14],
-       [2.9778168e+01, 9.2685300e+14],
-       [2.9796826e+01, 9.5882900e+14],
-       [2.9815484e+01, 1.1270000e+15],
-       [2.9834142e+01, 1.3618700e+15],
-       [2.9852800e+01, 9.3994900e+14],
-       [2.9871458e+01, 1.3284800e+15],
-       [2.9890116e+01, 9.2538500e+14],
-       [2.9908774e+01, 1.0300400e+15],
-       [2.9927432e+01, 8.7840700e+14],
-       [2.9946090e+01, 1.2378000e+15],
-       [2.9964748e+01, 1.3383300e+15],
-       [2.9983406e+01, 1.1292400e+15],
-       [3.0002064e+01, 1.1291500e+15],
-       [3.0020722e+01, 1.4149600e+15],
-       [3.0039380e+01, 1.1645500e+15],
-       [3.0058038e+01, 6.8258000e+14],
-       [3.0076696e+01, 1.2309700e+15],
-       [3.0095354e+01, 6.0791500e+14],
-       [3.0114012e+01, 9.8214000e+14],
-       [3.0132670e+01, 1.3855300e+15],
-       [3.0151328e+01, 7.0706100e+14],
-       [3.0169986e+01, 7.2773500e+14],
-       [3.0188644e+01, 1.0909900e+15],
-       [3.0207302e+01, 9.3946900e+14],
-       [3.0225960e+01, 1.2121200e+15],
-       [3.0244618e+01, 1.2909300e+15],
-       [3.0263276e+01, 1.3275500e+15],
-       [3.0281934e+01, 1.1164200e+15],
-       [3.0300592e+01, 8.5720100e+14],
-       [3.0319250e+01, 6.5104200e+14],
-       [3.0337908e+01, 1.3554100e+15],
-       [3.0356566e+01, 8.1697400e+14],
-       [3.0375224e+01, 1.0483700e+15],
-       [3.0393882e+01, 6.2243400e+14],
-       [3.0412540e+01, 1.1740300e+15],
-       [3.0431198e+01, 1.1297500e+15],
-       [3.0449856e+01, 1.0402000e+15],
-       [3.0468514e+01, 1.2425400e+15],
-       [3.0487172e+01, 1.1886100e+15],
-       [3.0505830e+01, 7.2735300e+14],
-       [3.0524488e+01, 8.6653100e+14],
-       [3.0543146e+01, 8.4374400e+14],
-       [3.0561804e+01, 1.1242200e+15],
-       [3.0580462e+01, 8.2634400e+14],
-       [3.0599120e+01, 9.0992700e+14],
-       [3.0617778e+01, 1.2132500e+15],
-       [3.0636436e+01, 9.8817400e+14],
-       [3.0655094e+01, 1.2343600e+15],
-       [3.0673752e+01, 9.5255000e+14],
-       [3.0692410e+01, 6.1376700e+14],
-       [3.0711068e+01, 9.5059100e+14],
-       [3.0729726e+01, 1.0319300e+15],
-       [3.0748384e+01, 8.4578900e+14],
-       [3.0767042e+01, 8.3615500e+14],
-       [3.0785700e+01, 1.2269000e+15],
-       [3.0804358e+01, 1.0235700e+15],
-       [3.0823016e+01, 1.3261400e+15],
-       [3.0841674e+01, 1.3617000e+15],
-       [3.0860332e+01, 1.3529600e+15],
-       [3.0878990e+01, 1.2233000e+15],
-       [3.0897648e+01, 1.2026500e+15],
-       [3.0916306e+01, 1.2636500e+15],
-       [3.0934964e+01, 9.6142400e+14],
-       [3.0953622e+01, 1.0559200e+15],
-       [3.0972280e+01, 1.2699600e+15],
-       [3.0990938e+01, 6.2281600e+14],
-       [3.1009596e+01, 1.2282800e+15],
-       [3.1028254e+01, 1.2052100e+15],
-       [3.1046912e+01, 1.3292100e+15],
-       [3.1065570e+01, 8.8300300e+14],
-       [3.1084228e+01, 1.3797500e+15],
-       [3.1102886e+01, 8.8957500e+14],
-       [3.1121544e+01, 1.0383300e+15],
-       [3.1140202e+01, 1.1295200e+15],
-       [3.1158860e+01, 1.2070300e+15],
-       [3.1177518e+01, 1.0599000e+15],
-       [3.1196176e+01, 1.3974600e+15],
-       [3.1214834e+01, 6.5649900e+14],
-       [3.1233492e+01, 1.0703000e+15],
-       [3.1252150e+01, 9.3409800e+14],
-       [3.1270808e+01, 6.2820200e+14],
-       [3.1289466e+01, 1.0881600e+15],
-       [3.1308124e+01, 1.0518000e+15],
-       [3.1326782e+01, 1.0783600e+15],
-       [3.1345440e+01, 1.2375700e+15],
-       [3.1364098e+01, 1.2375000e+15],
-       [3.1382756e+01, 9.6787200e+14],
-       [3.1401414e+01, 7.2216200e+14],
-       [3.1420072e+01, 1.0472900e+15],
-       [3.1438730e+01, 9.2596600e+14],
-       [3.1457388e+01, 6.9887500e+14],
-       [3.1476046e+01, 8.8478100e+14],
-       [3.1494704e+01, 7.5750700e+14],
-       [3.1513362e+01, 7.2808500e+14],
-       [3.1532020e+01, 6.5913800e+14],
-       [3.1550678e+01, 1.1629000e+15],
-       [3.1569336e+01, 9.1245800e+14],
-       [3.1587994e+01, 7.5973900e+14],
-       [3.1606652e+01, 9.5063500e+14],
-       [3.1625310e+01, 1.0642900e+15],
-       [3.1643968e+01, 7.0387100e+14],
-       [3.1662626e+01, 8.9194100e+14],
-       [3.1681284e+01, 1.2483400e+15],
-       [3.1699942e+01, 6.6602400e+14],
-       [3.1718600e+01, 1.0874500e+15],
-       [3.1737258e+01, 1.3232300e+15],
-       [3.1755916e+01, 7.9408200e+14],
-       [3.1774574e+01, 9.4136600e+14],
-       [3.1793232e+01, 1.2877300e+15],
-       [3.1811890e+01, 9.5292600e+14],
-       [3.1830548e+01, 1.3094000e+15],
-       [3.1849206e+01, 1.3071900e+15],
-       [3.1867864e+01, 1.2876200e+15],
-       [3.1886522e+01, 9.1765900e+14],
-       [3.1905180e+01, 1.0888800e+15],
-       [3.1923838e+01, 1.2185000e+15],
-       [3.1942496e+01, 1.2894100e+15],
-       [3.1961154e+01, 7.4449100e+14],
-       [3.1979812e+01, 9.0756800e+14],
-       [3.1998470e+01, 1.0715400e+15],
-       [3.2017128e+01, 9.5486300e+14],
-       [3.2035786e+01, 6.2784700e+14],
-       [3.2054444e+01, 1.2912900e+15],
-       [3.2073102e+01, 9.3726000e+14],
-       [3.2091760e+01, 1.1990000e+15],
-       [3.2110418e+01, 9.6225900e+14],
-       [3.2129076e+01, 6.9071500e+14],
-       [3.2147734e+01, 6.8437000e+14],
-       [3.2166392e+01, 9.7340800e+14],
-       [3.2185050e+01, 1.3615400e+15],
-       [3.2203708e+01, 1.1776000e+15],
-       [3.2222366e+01, 1.0115900e+15],
-       [3.2241024e+01, 1.0551400e+15],
-       [3.2259682e+01, 8.3860700e+14],
-       [3.2278340e+01, 1.1445200e+15],
-       [3.2296998e+01, 1.2126600e+15],
-       [3.2315656e+01, 9.0188500e+14],
-       [3.2334314e+01, 1.2988300e+15],
-       [3.2352972e+01, 9.5958800e+14],
-       [3.2371630e+01, 1.2084600e+15],
-       [3.2390288e+01, 1.3830200e+15],
-       [3.2408946e+01, 6.5011900e+14],
-       [3.2427604e+01, 7.0779100e+14],
-       [3.2446262e+01, 1.2374700e+15],
-       [3.2464920e+01, 6.3937700e+14],
-       [3.2483578e+01, 1.3871000e+15],
-       [3.2502236e+01, 1.0148600e+15],
-       [3.2520894e+01, 1.3183800e+15],
-       [3.2539552e+01, 8.4065500e+14],
-       [3.2558210e+01, 8.4375800e+14],
-       [3.2576868e+01, 9.0614000e+14],
-       [3.2595526e+01, 1.0939900e+15],
-       [3.2614184e+01, 9.3905700e+14],
-       [3.2632842e+01, 1.1208600e+15],
-       [3.2651500e+01, 7.7857000e+14],
-       [3.2670158e+01, 7.0886700e+14],
-       [3.2688816e+01, 7.5616200e+14],
-       [3.2707474e+01, 1.0046600e+15],
-       [3.2726132e+01, 1.0283500e+15],
-       [3.2744790e+01, 1.1135600e+15],
-       [3.2763448e+01, 9.1598600e+14],
-       [3.2782106e+01, 9.9054500e+14],
-       [3.2800764e+01, 9.3175200e+14],
-       [3.2819422e+01, 1.0594700e+15],
-       [3.2838080e+01, 1.3410300e+15],
-       [3.2856738e+01, 1.3872200e+15],
-       [3.2875396e+01, 1.1302800e+15],
-       [3.2894054e+01, 1.1655100e+15],
-       [3.2912712e+01, 6.1565000e+14],
-       [3.2931370e+01, 1.0078600e+15],
-       [3.2950028e+01, 6.8192100e+14],
-       [3.2968686e+01, 1.1638000e+15],
-       [3.2987344e+01, 6.7737400e+14],
-       [3.3006002e+01, 8.0112500e+14],
-       [3.3024660e+01, 1.0527200e+15],
-       [3.3043318e+01, 1.3433300e+15],
-       [3.3061976e+01, 9.3233400e+14],
-       [3.3080634e+01, 7.8808400e+14],
-       [3.3099292e+01, 6.4192100e+14],
-       [3.3117950e+01, 1.3216400e+15],
-       [3.3136608e+01, 1.0666300e+15],
-       [3.3155266e+01, 8.0863500e+14],
-       [3.3173924e+01, 8.6850400e+14],
-       [3.3192582e+01, 7.4620500e+14],
-       [3.3211240e+01, 1.1379500e+15],
-       [3.3229898e+01, 1.0735700e+15],
-       [3.3248556e+01, 9.1360800e+14],
-       [3.3267214e+01, 9.5518300e+14],
-       [3.3285872e+01, 1.3688400e+15],
-       [3.3304530e+01, 1.0304900e+15],
-       [3.3323188e+01, 9.7658500e+14],
-       [3.3341846e+01, 8.1466900e+14],
-       [3.3360504e+01, 1.3084500e+15],
-       [3.3379162e+01, 1.3470200e+15],
-       [3.3397820e+01, 1.0424400e+15],
-       [3.3416478e+01, 7.3143400e+14],
-       [3.3435136e+01, 9.0743400e+14],
-       [3.3453794e+01, 1.2701000e+15],
-       [3.3472452e+01, 8.7399300e+14],
-       [3.3491110e+01, 8.8357500e+14],
-       [3.3509768e+01, 1.3077700e+15],
-       [3.3528426e+01, 1.0319700e+15],
-       [3.3547084e+01, 1.1774900e+15],
-       [3.3565742e+01, 8.5033900e+14],
-       [3.3584400e+01, 7.4975600e+14],
-       [3.3603058e+01, 9.9726700e+14],
-       [3.3621716e+01, 1.0407300e+15],
-       [3.3640374e+01, 1.1766300e+15],
-       [3.3659032e+01, 1.0377800e+15],
-       [3.3677690e+01, 9.8932900e+14],
-       [3.3696348e+01, 7.2831600e+14],
-       [3.3715006e+01, 9.7182500e+14],
-       [3.3733664e+01, 6.0009100e+14],
-       [3.3752322e+01, 8.4645500e+14],
-       [3.3770980e+01, 1.1903400e+15],
-       [3.3789638e+01, 1.0788200e+15],
-       [3.3808296e+01, 1.1544300e+15],
-       [3.3826954e+01, 1.0299100e+15],
-       [3.3845612e+01, 8.8454900e+14],
-       [3.3864270e+01, 9.1919200e+14],
-       [3.3882928e+01, 8.7356400e+14],
-       [3.3901586e+01, 1.3378100e+15],
-       [3.3920244e+01, 1.0196500e+15],
-       [3.3938902e+01, 6.8845600e+14],
-       [3.3957560e+01, 9.5506900e+14],
-       [3.3976218e+01, 8.9654800e+14],
-       [3.3994876e+01, 1.3519500e+15],
-       [3.4013534e+01, 8.8407100e+14],
-       [3.4032192e+01, 9.4226400e+14],
-       [3.4050850e+01, 1.2265000e+15],
-       [3.4069508e+01, 1.1774000e+15],
-       [3.4088166e+01, 7.8884200e+14],
-       [3.4106824e+01, 1.2908600e+15],
-       [3.4125482e+01, 9.1068700e+14],
-       [3.4144140e+01, 1.0987400e+15],
-       [3.4162798e+01, 1.0272700e+15],
-       [3.4181456e+01, 8.0849700e+14],
-       [3.4200114e+01, 1.1720600e+15],
-       [3.4218772e+01, 1.0200700e+15],
-       [3.4237430e+01, 1.3231500e+15],
-       [3.4256088e+01, 1.1102500e+15],
-       [3.4274746e+01, 6.0671300e+14],
-       [3.4293404e+01, 9.4125500e+14],
-       [3.4312062e+01, 1.3732400e+15],
-       [3.4330720e+01, 1.1813500e+15],
-       [3.4349378e+01, 7.1318800e+14],
-       [3.4368036e+01, 9.2902500e+14],
-       [3.4386694e+01, 1.2694000e+15],
-       [3.4405352e+01, 1.2562200e+15],
-       [3.4424010e+01, 6.9569300e+14],
-       [3.4442668e+01, 1.1560500e+15],
-       [3.4461326e+01, 7.5579600e+14],
-       [3.4479984e+01, 6.0188000e+14],
-       [3.4498642e+01, 1.3180600e+15],
-       [3.4517300e+01, 1.0270000e+15],
-       [3.4535958e+01, 1.2859000e+15],
-       [3.4554616e+01, 1.2515500e+15],
-       [3.4573274e+01, 6.3445200e+14],
-       [3.4591932e+01, 1.1491200e+15],
-       [3.4610590e+01, 1.0965200e+15],
-       [3.4629248e+01, 6.8920800e+14],
-       [3.4647906e+01, 1.0299700e+15],
-       [3.4666564e+01, 1.0138100e+15],
-       [3.4685222e+01, 8.6311100e+14],
-       [3.4703880e+01, 6.1942700e+14],
-       [3.4722538e+01, 8.8143500e+14],
-       [3.4741196e+01, 1.2699600e+15],
-       [3.4759854e+01, 1.3332500e+15],
-       [3.4778512e+01, 1.0188000e+15],
-       [3.4797170e+01, 9.4250400e+14],
-       [3.4815828e+01, 6.5914100e+14],
-       [3.4834486e+01, 7.7573600e+14],
-       [3.4853144e+01, 1.2019600e+15],
-       [3.4871802e+01, 7.8416900e+14],
-       [3.4890460e+01, 6.4544000e+14],
-       [3.4909118e+01, 1.3745700e+15],
-       [3.4927776e+01, 8.4671100e+14],
-       [3.4946434e+01, 9.4944500e+14],
-       [3.4965092e+01, 8.8435700e+14],
-       [3.4983750e+01, 9.6707300e+14],
-       [3.5002408e+01, 1.2697900e+15],
-       [3.5021066e+01, 1.0858700e+15],
-       [3.5039724e+01, 7.1870000e+14],
-       [3.5058382e+01, 8.6626600e+14],
-       [3.5077040e+01, 9.0159000e+14],
-       [3.5095698e+01, 1.0101700e+15],
-       [3.5114356e+01, 1.3030000e+15],
-       [3.5133014e+01, 7.0359800e+14],
-       [3.5151672e+01, 9.5741000e+14],
-       [3.5170330e+01, 1.0934400e+15],
-       [3.5188988e+01, 7.6256400e+14],
-       [3.5207646e+01, 1.1267000e+15],
-       [3.5226304e+01, 1.3622500e+15],
-       [3.5244962e+01, 9.2395900e+14],
-       [3.5263620e+01, 1.2830200e+15],
-       [3.5282278e+01, 1.1859600e+15],
-       [3.5300936e+01, 1.0102100e+15],
-       [3.5319594e+01, 1.1040700e+15],
-       [3.5338252e+01, 1.1636600e+15],
-       [3.5356910e+01, 1.2610000e+15],
-       [3.5375568e+01, 1.1327100e+15],
-       [3.5394226e+01, 6.4466200e+14],
-       [3.5412884e+01, 1.0274600e+15],
-       [3.5431542e+01, 8.4937000e+14],
-       [3.5450200e+01, 7.0326800e+14],
-       [3.5468858e+01, 1.2807600e+15],
-       [3.5487516e+01, 1.0719400e+15],
-       [3.5506174e+01, 1.1501800e+15],
-       [3.5524832e+01, 7.1717600e+14],
-       [3.5543490e+01, 6.9963400e+14],
-       [3.5562148e+01, 1.0605200e+15],
-       [3.5580806e+01, 1.0522400e+15],
-       [3.5599464e+01, 1.0657200e+15],
-       [3.5618122e+01, 1.1205800e+15],
-       [3.5636780e+01, 1.3172600e+15],
-       [3.5655438e+01, 1.0178700e+15],
-       [3.5674096e+01, 9.6062200e+14],
-       [3.5692754e+01, 1.3504300e+15],
-       [3.5711412e+01, 6.8484700e+14],
-       [3.5730070e+01, 1.2311800e+15],
-       [3.5748728e+01, 9.1654400e+14],
-       [3.5767386e+01, 7.4616000e+14],
-       [3.5786044e+01, 9.7812300e+14],
-       [3.5804702e+01, 1.0069000e+15],
-       [3.5823360e+01, 1.0087100e+15],
-       [3.5842018e+01, 6.6812900e+14],
-       [3.5860676e+01, 1.3050500e+15],
-       [3.5879334e+01, 1.3429400e+15],
-       [3.5897992e+01, 1.1514200e+15],
-       [3.5916650e+01, 1.3419100e+15],
-       [3.5935308e+01, 1.2890700e+15],
-       [3.5953966e+01, 1.2327000e+15],
-       [3.5972624e+01, 1.0699000e+15],
-       [3.5991282e+01, 1.2551000e+15],
-       [3.6009940e+01, 1.2059000e+15],
-       [3.6028598e+01, 1.0764700e+15],
-       [3.6047256e+01, 1.3749300e+15],
-       [3.6065914e+01, 1.0416000e+15],
-       [3.6084572e+01, 1.0083800e+15],
-       [3.6103230e+01, 9.3704700e+14],
-       [3.6121888e+01, 1.2448600e+15],
-       [3.6140546e+01, 1.1685000e+15],
-       [3.6159204e+01, 1.0066400e+15],
-       [3.6177862e+01, 1.2096000e+15],
-       [3.6196520e+01, 1.1422000e+15],
-       [3.6215178e+01, 1.2389600e+15],
-       [3.6233836e+01, 1.0940200e+15],
-       [3.6252494e+01, 1.0818500e+15],
-       [3.6271152e+01, 1.1182300e+15],
-       [3.6289810e+01, 1.2578000e+15],
-       [3.6308468e+01, 1.2496700e+15],
-       [3.6327126e+01, 1.2164000e+15],
-       [3.6345784e+01, 9.5009400e+14],
-       [3.6364442e+01, 1.2038000e+15],
-       [3.6383100e+01, 1.1496700e+15],
-       [3.6401758e+01, 1.3007900e+15],
-       [3.6420416e+01, 1.2937200e+15],
-       [3.6439074e+01, 1.0847500e+15],
-       [3.6457732e+01, 7.2262800e+14],
-       [3.6476390e+01, 9.2993300e+14],
-       [3.6495048e+01, 7.9809800e+14],
-       [3.6513706e+01, 1.3791300e+15],
-       [3.6532364e+01, 1.2381700e+15],
-       [3.6551022e+01, 9.3960100e+14],
-       [3.6569680e+01, 8.0033400e+14],
-       [3.6588338e+01, 1.0467400e+15],
-       [3.6606996e+01, 1.3317800e+15],
-       [3.6625654e+01, 1.3463000e+15],
-       [3.6644312e+01, 1.1483600e+15],
-       [3.6662970e+01, 1.3138300e+15],
-       [3.6681628e+01, 1.3984300e+15],
-       [3.6700286e+01, 1.0714100e+15],
-       [3.6718944e+01, 1.3934200e+15],
-       [3.6737602e+01, 7.7132400e+14],
-       [3.6756260e+01, 7.7234600e+14],
-       [3.6774918e+01, 9.0853400e+14],
-       [3.6793576e+01, 6.4399000e+14],
-       [3.6812234e+01, 1.0591200e+15],
-       [3.6830892e+01, 7.4145900e+14],
-       [3.6849550e+01, 8.6743200e+14],
-       [3.6868208e+01, 1.0173100e+15],
-       [3.6886866e+01, 1.3639300e+15],
-       [3.6905524e+01, 1.1819600e+15],
-       [3.6924182e+01, 6.7529100e+14],
-       [3.6942840e+01, 1.1682000e+15],
-       [3.6961498e+01, 9.1975100e+14],
-       [3.6980156e+01, 9.8903700e+14],
-       [3.6998814e+01, 1.1044700e+15],
-       [3.7017472e+01, 1.1044300e+15],
-       [3.7036130e+01, 8.6859400e+14],
-       [3.7054788e+01, 1.3520600e+15],
-       [3.7073446e+01, 6.4438900e+14],
-       [3.7092104e+01, 1.0130100e+15],
-       [3.7110762e+01, 7.7744700e+14],
-       [3.7129420e+01, 8.1617500e+14],
-       [3.7148078e+01, 1.0019100e+15],
-       [3.7166736e+01, 1.0799500e+15],
-       [3.7185394e+01, 6.9031800e+14],
-       [3.7204052e+01, 1.1933000e+15],
-       [3.7222710e+01, 1.2849100e+15],
-       [3.7241368e+01, 8.7545200e+14],
-       [3.7260026e+01, 1.0082600e+15],
-       [3.7278684e+01, 9.4695400e+14],
-       [3.7297342e+01, 9.9057800e+14],
-       [3.7316000e+01, 9.0090700e+14],
-       [3.7334658e+01, 6.9504100e+14],
-       [3.7353316e+01, 9.0897700e+14],
-       [3.7371974e+01, 9.8322200e+14],
-       [3.7390632e+01, 1.1668900e+15],
-       [3.7409290e+01, 7.2533500e+14],
-       [3.7427948e+01, 1.0985100e+15],
-       [3.7446606e+01, 9.1147300e+14],
-       [3.7465264e+01, 1.3570800e+15],
-       [3.7483922e+01, 9.4385900e+14],
-       [3.7502580e+01, 6.1344700e+14],
-       [3.7521238e+01, 1.2590500e+15],
-       [3.7539896e+01, 1.0010000e+15],
-       [3.7558554e+01, 1.0560700e+15],
-       [3.7577212e+01, 6.1279200e+14],
-       [3.7595870e+01, 9.9504500e+14],
-       [3.7614528e+01, 6.5302700e+14],
-       [3.7633186e+01, 1.0702100e+15],
-       [3.7651844e+01, 1.1782900e+15],
-       [3.7670502e+01, 1.2373100e+15],
-       [3.7689160e+01, 7.6651000e+14],
-       [3.7707818e+01, 6.2424800e+14],
-       [3.7726476e+01, 8.1212600e+14],
-       [3.7745134e+01, 1.0850200e+15],
-       [3.7763792e+01, 1.3578300e+15],
-       [3.7782450e+01, 9.8279000e+14],
-       [3.7801108e+01, 1.2768500e+15],
-       [3.7819766e+01, 1.2341400e+15],
-       [3.7838424e+01, 7.7714200e+14],
-       [3.7857082e+01, 1.2352700e+15],
-       [3.7875740e+01, 1.2542800e+15],
-       [3.7894398e+01, 7.3980100e+14],
-       [3.7913056e+01, 7.9895900e+14],
-       [3.7931714e+01, 1.3165000e+15],
-       [3.7950372e+01, 1.0963100e+15],
-       [3.7969030e+01, 7.6007800e+14],
-       [3.7987688e+01, 1.2331800e+15],
-       [3.8006346e+01, 1.2355300e+15],
-       [3.8025004e+01, 1.0819200e+15],
-       [3.8043662e+01, 1.3363800e+15],
-       [3.8062320e+01, 1.0027700e+15],
-       [3.8080978e+01, 1.2563300e+15],
-       [3.8099636e+01, 6.3498500e+14],
-       [3.8118294e+01, 7.7442700e+14],
-       [3.8136952e+01, 9.1616700e+14],
-       [3.8155610e+01, 7.8593900e+14],
-       [3.8174268e+01, 1.2979300e+15],
-       [3.8192926e+01, 8.3262400e+14],
-       [3.8211584e+01, 6.3333200e+14],
-       [3.8230242e+01, 9.5473000e+14],
-       [3.8248900e+01, 1.1204900e+15],
-       [3.8267558e+01, 8.7983500e+14],
-       [3.8286216e+01, 1.0253200e+15],
-       [3.8304874e+01, 1.0822300e+15],
-       [3.8323532e+01, 1.0755600e+15],
-       [3.8342190e+01, 1.2011200e+15],
-       [3.8360848e+01, 1.3344300e+15],
-       [3.8379506e+01, 1.2476500e+15],
-       [3.8398164e+01, 8.7974400e+14],
-       [3.8416822e+01, 8.6481800e+14],
-       [3.8435480e+01, 1.1926900e+15],
-       [3.8454138e+01, 1.0442900e+15],
-       [3.8472796e+01, 6.3625300e+14],
-       [3.8491454e+01, 1.1612200e+15],
-       [3.8510112e+01, 7.1732200e+14],
-       [3.8528770e+01, 1.0610800e+15],
-       [3.8547428e+01, 1.0294100e+15],
-       [3.8566086e+01, 7.4424000e+14],
-       [3.8584744e+01, 6.3514100e+14],
-       [3.8603402e+01, 1.2756000e+15],
-       [3.8622060e+01, 9.7243100e+14],
-       [3.8640718e+01, 1.2398000e+15],
-       [3.8659376e+01, 7.3189800e+14],
-       [3.8678034e+01, 8.4810000e+14],
-       [3.8696692e+01, 1.0949400e+15],
-       [3.8715350e+01, 1.2557900e+15],
-       [3.8734008e+01, 9.6427700e+14],
-       [3.8752666e+01, 1.3658500e+15],
-       [3.8771324e+01, 1.1653200e+15],
-       [3.8789982e+01, 6.9579700e+14],
-       [3.8808640e+01, 7.8966400e+14],
-       [3.8827298e+01, 6.6595100e+14],
-       [3.8845956e+01, 9.2487900e+14],
-       [3.8864614e+01, 1.2799200e+15],
-       [3.8883272e+01, 8.5990600e+14],
-       [3.8901930e+01, 9.9466900e+14],
-       [3.8920588e+01, 7.4708900e+14],
-       [3.8939246e+01, 9.0372600e+14],
-       [3.8957904e+01, 8.2028200e+14],
-       [3.8976562e+01, 1.3487300e+15],
-       [3.8995220e+01, 9.3152600e+14],
-       [3.9013878e+01, 7.3049500e+14],
-       [3.9032536e+01, 8.9474700e+14],
-       [3.9051194e+01, 6.8289300e+14],
-       [3.9069852e+01, 1.2468100e+15],
-       [3.9088510e+01, 1.0842800e+15],
-       [3.9107168e+01, 1.1347900e+15],
-       [3.9125826e+01, 9.6369900e+14],
-       [3.9144484e+01, 1.0835900e+15],
-       [3.9163142e+01, 1.3854500e+15],
-       [3.9181800e+01, 7.4129700e+14],
-       [3.9200458e+01, 7.7486900e+14],
-       [3.9219116e+01, 1.0785600e+15],
-       [3.9237774e+01, 7.6550700e+14],
-       [3.9256432e+01, 8.8551700e+14],
-       [3.9275090e+01, 1.0651800e+15],
-       [3.9293748e+01, 1.0846900e+15],
-       [3.9312406e+01, 1.3630100e+15],
-       [3.9331064e+01, 1.0547100e+15],
-       [3.9349722e+01, 1.2670600e+15],
-       [3.9368380e+01, 1.0662100e+15],
-       [3.9387038e+01, 1.3118600e+15],
-       [3.9405696e+01, 1.3406400e+15],
-       [3.9424354e+01, 6.8279700e+14],
-       [3.9443012e+01, 1.3653000e+15],
-       [3.9461670e+01, 9.8050400e+14],
-       [3.9480328e+01, 7.7143200e+14],
-       [3.9498986e+01, 1.2014900e+15],
-       [3.9517644e+01, 1.1388900e+15],
-       [3.9536302e+01, 1.1336900e+15],
-       [3.9554960e+01, 1.1881700e+15],
-       [3.9573618e+01, 1.3852600e+15],
-       [3.9592276e+01, 9.4393300e+14],
-       [3.9610934e+01, 9.1894300e+14],
-       [3.9629592e+01, 8.2895800e+14],
-       [3.9648250e+01, 1.3023600e+15],
-       [3.9666908e+01, 1.2209900e+15],
-       [3.9685566e+01, 7.3126600e+14],
-       [3.9704224e+01, 1.1567700e+15],
-       [3.9722882e+01, 7.1555800e+14],
-       [3.9741540e+01, 1.1971700e+15],
-       [3.9760198e+01, 9.3954800e+14],
-       [3.9778856e+01, 7.0182800e+14],
-       [3.9797514e+01, 7.4507200e+14],
-       [3.9816172e+01, 8.3475800e+14],
-       [3.9834830e+01, 7.3745700e+14],
-       [3.9853488e+01, 8.4526900e+14],
-       [3.9872146e+01, 1.1375100e+15],
-       [3.9890804e+01, 7.8206000e+14],
-       [3.9909462e+01, 1.0619200e+15],
-       [3.9928120e+01, 1.2412000e+15],
-       [3.9946778e+01, 1.2214300e+15],
-       [3.9965436e+01, 1.3313500e+15],
-       [3.9984094e+01, 6.2265200e+14],
-       [4.0002752e+01, 1.3636000e+15],
-       [4.0021410e+01, 9.6922100e+15],
-       [4.0040068e+01, 9.7375000e+15],
-       [4.0058726e+01, 1.0108600e+16],
-       [4.0077384e+01, 9.9310800e+15],
-       [4.0096042e+01, 1.0681900e+16],
-       [4.0114700e+01, 1.0407600e+16],
-       [4.0133358e+01, 9.8167000e+15],
-       [4.0152016e+01, 1.0081100e+16],
-       [4.0170674e+01, 1.0649800e+16],
-       [4.0189332e+01, 1.0620800e+16],
-       [4.0207990e+01, 9.8176100e+15],
-       [4.0226648e+01, 9.7277800e+15],
-       [4.0245306e+01, 1.0262300e+16],
-       [4.0263964e+01, 1.0028800e+16],
-       [4.0282622e+01, 1.0657800e+16],
-       [4.0301280e+01, 1.0470400e+16],
-       [4.0319938e+01, 1.0112300e+16],
-       [4.0338596e+01, 9.5238700e+15],
-       [4.0357254e+01, 9.6666000e+15],
-       [4.0375912e+01, 1.0559700e+16],
-       [4.0394570e+01, 1.0467500e+16],
-       [4.0413228e+01, 1.0028400e+16],
-       [4.0431886e+01, 1.0659900e+16],
-       [4.0450544e+01, 9.9544900e+15],
-       [4.0469202e+01, 9.6021700e+15],
-       [4.0487860e+01, 1.0228100e+16],
-       [4.0506518e+01, 9.5219700e+15],
-       [4.0525176e+01, 1.0167000e+16],
-       [4.0543834e+01, 1.0588500e+16],
-       [4.0562492e+01, 9.9685500e+15],
-       [4.0581150e+01, 1.0611500e+16],
-       [4.0599808e+01, 9.7752100e+15],
-       [4.0618466e+01, 9.9688700e+15],
-       [4.0637124e+01, 1.0305500e+16],
-       [4.0655782e+01, 1.0004300e+16],
-       [4.0674440e+01, 1.0546300e+16],
-       [4.0693098e+01, 9.8096600e+15],
-       [4.0711756e+01, 9.5882100e+15],
-       [4.0730414e+01, 1.0213200e+16],
-       [4.0749072e+01, 1.0018900e+16],
-       [4.0767730e+01, 9.9522400e+15],
-       [4.0786388e+01, 9.7023000e+15],
-       [4.0805046e+01, 1.0539400e+16],
-       [4.0823704e+01, 9.5144200e+15],
-       [4.0842362e+01, 9.6506900e+15],
-       [4.0861020e+01, 9.7653700e+15],
-       [4.0879678e+01, 9.5941500e+15],
-       [4.0898336e+01, 9.8830800e+15],
-       [4.0916994e+01, 1.0500200e+16],
-       [4.0935652e+01, 1.0245600e+16],
-       [4.0954310e+01, 1.0253000e+16],
-       [4.0972968e+01, 1.0195300e+16],
-       [4.0991626e+01, 1.0250500e+16],
-       [4.1010284e+01, 1.0639400e+16],
-       [4.1028942e+01, 1.0294600e+16],
-       [4.1047600e+01, 9.8745600e+15],
-       [4.1066258e+01, 1.0011900e+16],
-       [4.1084916e+01, 1.0497000e+16],
-       [4.1103574e+01, 1.0296800e+16],
-       [4.1122232e+01, 9.7829700e+15],
-       [4.1140890e+01, 9.8253400e+15],
-       [4.1159548e+01, 9.9127000e+15],
-       [4.1178206e+01, 9.5207100e+15],
-       [4.1196864e+01, 1.0473100e+16],
-       [4.1215522e+01, 9.6885300e+15],
-       [4.1234180e+01, 1.0532900e+16],
-       [4.1252838e+01, 9.7089700e+15],
-       [4.1271496e+01, 1.0673500e+16],
-       [4.1290154e+01, 9.5461800e+15],
-       [4.1308812e+01, 1.0072700e+16],
-       [4.1327470e+01, 1.0385000e+16],
-       [4.1346128e+01, 1.0203300e+16],
-       [4.1364786e+01, 1.0587500e+16],
-       [4.1383444e+01, 1.0405700e+16],
-       [4.1402102e+01, 1.0376100e+16],
-       [4.1420760e+01, 9.5206400e+15],
-       [4.1439418e+01, 1.0047200e+16],
-       [4.1458076e+01, 9.9645300e+15],
-       [4.1476734e+01, 1.0130800e+16],
-       [4.1495392e+01, 1.0041900e+16],
-       [4.1514050e+01, 1.0602300e+16],
-       [4.1532708e+01, 9.8884300e+15],
-       [4.1551366e+01, 1.0377400e+16],
-       [4.1570024e+01, 9.8002700e+15],
-       [4.1588682e+01, 9.5380300e+15],
-       [4.1607340e+01, 9.5959300e+15],
-       [4.1625998e+01, 1.0376400e+16],
-       [4.1644656e+01, 1.0148400e+16],
-       [4.1663314e+01, 9.8574900e+15],
-       [4.1681972e+01, 9.9242900e+15],
-       [4.1700630e+01, 1.0339800e+16],
-       [4.1719288e+01, 9.7462500e+15],
-       [4.1737946e+01, 9.9799100e+15],
-       [4.1756604e+01, 1.0572200e+16],
-       [4.1775262e+01, 1.0634400e+16],
-       [4.1793920e+01, 9.5781600e+15],
-       [4.1812578e+01, 1.0647800e+16],
-       [4.1831236e+01, 1.0242100e+16],
-       [4.1849894e+01, 9.8660900e+15],
-       [4.1868552e+01, 1.0644800e+16],
-       [4.1887210e+01, 1.0549900e+16],
-       [4.1905868e+01, 9.9193300e+15],
-       [4.1924526e+01, 9.9141400e+15],
-       [4.1943184e+01, 1.0528500e+16],
-       [4.1961842e+01, 9.9184900e+15],
-       [4.1980500e+01, 1.0649700e+16],
-       [4.1999158e+01, 9.5521800e+15],
-       [4.2017816e+01, 1.0431600e+16],
-       [4.2036474e+01, 9.7858000e+15],
-       [4.2055132e+01, 1.0241100e+16],
-       [4.2073790e+01, 1.0227800e+16],
-       [4.2092448e+01, 1.0019200e+16],
-       [4.2111106e+01, 9.5552600e+15],
-       [4.2129764e+01, 9.5255300e+15],
-       [4.2148422e+01, 9.9826200e+15],
-       [4.2167080e+01, 1.0496600e+16],
-       [4.2185738e+01, 9.6607500e+15],
-       [4.2204396e+01, 9.7362300e+15],
-       [4.2223054e+01, 1.0068800e+16],
-       [4.2241712e+01, 9.8782500e+15],
-       [4.2260370e+01, 9.7558900e+15],
-       [4.2279028e+01, 1.0647300e+16],
-       [4.2297686e+01, 1.0464200e+16],
-       [4.2316344e+01, 1.0307200e+16],
-       [4.2335002e+01, 1.0268800e+16],
-       [4.2353660e+01, 9.6478900e+15],
-       [4.2372318e+01, 9.7994600e+15],
-       [4.2390976e+01, 1.0655800e+16],
-       [4.2409634e+01, 9.6735500e+15],
-       [4.2428292e+01, 1.0293900e+16],
-       [4.2446950e+01, 1.0285300e+16],
-       [4.2465608e+01, 1.0604100e+16],
-       [4.2484266e+01, 1.0102900e+16],
-       [4.2502924e+01, 1.0265200e+16],
-       [4.2521582e+01, 1.0699900e+16],
-       [4.2540240e+01, 1.0096700e+16],
-       [4.2558898e+01, 9.9642400e+15],
-       [4.2577556e+01, 1.0520400e+16],
-       [4.2596214e+01, 9.5224600e+15],
-       [4.2614872e+01, 9.6906600e+15],
-       [4.2633530e+01, 1.0240400e+16],
-       [4.2652188e+01, 9.6294400e+15],
-       [4.2670846e+01, 1.0085800e+16],
-       [4.2689504e+01, 9.7296500e+15],
-       [4.2708162e+01, 9.5371700e+15],
-       [4.2726820e+01, 9.7962500e+15],
-       [4.2745478e+01, 9.6101200e+15],
-       [4.2764136e+01, 9.6732700e+15],
-       [4.2782794e+01, 9.7449500e+15],
-       [4.2801452e+01, 1.0358500e+16],
-       [4.2820110e+01, 1.0500100e+16],
-       [4.2838768e+01, 1.0097900e+16],
-       [4.2857426e+01, 9.8301200e+15],
-       [4.2876084e+01, 1.0382300e+16],
-       [4.2894742e+01, 9.8641700e+15],
-       [4.2913400e+01, 1.0022500e+16],
-       [4.2932058e+01, 9.5146900e+15],
-       [4.2950716e+01, 1.0605100e+16],
-       [4.2969374e+01, 9.8901600e+15],
-       [4.2988032e+01, 9.5194600e+15],
-       [4.3006690e+01, 1.0506400e+16],
-       [4.3025348e+01, 1.0555500e+16],
-       [4.3044006e+01, 9.5487700e+15],
-       [4.3062664e+01, 9.5854300e+15],
-       [4.3081322e+01, 9.8528000e+15],
-       [4.3099980e+01, 9.9819300e+15],
-       [4.3118638e+01, 1.0091100e+16],
-       [4.3137296e+01, 1.0496400e+16],
-       [4.3155954e+01, 1.0216700e+16],
-       [4.3174612e+01, 9.5412600e+15],
-       [4.3193270e+01, 9.6820500e+15],
-       [4.3211928e+01, 1.0202900e+16],
-       [4.3230586e+01, 9.5787400e+15],
-       [4.3249244e+01, 9.8275500e+15],
-       [4.3267902e+01, 9.8281400e+15],
-       [4.3286560e+01, 1.0161500e+16],
-       [4.3305218e+01, 1.0298500e+16],
-       [4.3323876e+01, 9.8599000e+15],
-       [4.3342534e+01, 1.0085100e+16],
-       [4.3361192e+01, 1.0567800e+16],
-       [4.3379850e+01, 9.8956700e+15],
-       [4.3398508e+01, 1.0194900e+16],
-       [4.3417166e+01, 9.5719200e+15],
-       [4.3435824e+01, 1.0157700e+16],
-       [4.3454482e+01, 9.5006600e+15],
-       [4.3473140e+01, 9.9534900e+15],
-       [4.3491798e+01, 9.6488100e+15],
-       [4.3510456e+01, 1.0123500e+16],
-       [4.3529114e+01, 9.8846600e+15],
-       [4.3547772e+01, 1.0019500e+16],
-       [4.3566430e+01, 1.0106800e+16],
-       [4.3585088e+01, 1.0239300e+16],
-       [4.3603746e+01, 9.7425200e+15],
-       [4.3622404e+01, 1.0094600e+16],
-       [4.3641062e+01, 9.6261800e+15],
-       [4.3659720e+01, 1.0066500e+16],
-       [4.3678378e+01, 9.8566000e+15],
-       [4.3697036e+01, 1.0020600e+16],
-       [4.3715694e+01, 1.0104700e+16],
-       [4.3734352e+01, 1.0260500e+16],
-       [4.3753010e+01, 1.0279400e+16],
-       [4.3771668e+01, 1.0099100e+16],
-       [4.3790326e+01, 1.0297700e+16],
-       [4.3808984e+01, 1.0207500e+16],
-       [4.3827642e+01, 1.0537900e+16],
-       [4.3846300e+01, 9.6418700e+15],
-       [4.3864958e+01, 1.0286400e+16],
-       [4.3883616e+01, 9.6742300e+15],
-       [4.3902274e+01, 1.0144600e+16],
-       [4.3920932e+01, 1.0474800e+16],
-       [4.3939590e+01, 1.0531800e+16],
-       [4.3958248e+01, 1.0637100e+16],
-       [4.3976906e+01, 1.0445400e+16],
-       [4.3995564e+01, 1.0498000e+16],
-       [4.4014222e+01, 9.5206500e+15],
-       [4.4032880e+01, 1.0070300e+16],
-       [4.4051538e+01, 9.7312400e+15],
-       [4.4070196e+01, 1.0326200e+16],
-       [4.4088854e+01, 1.0462600e+16],
-       [4.4107512e+01, 1.0020200e+16],
-       [4.4126170e+01, 1.0232700e+16],
-       [4.4144828e+01, 9.7129200e+15],
-       [4.4163486e+01, 1.0035300e+16],
-       [4.4182144e+01, 1.0522600e+16],
-       [4.4200802e+01, 9.8143100e+15],
-       [4.4219460e+01, 1.0602900e+16],
-       [4.4238118e+01, 9.5539500e+15],
-       [4.4256776e+01, 9.7939200e+15],
-       [4.4275434e+01, 1.0256300e+16],
-       [4.4294092e+01, 9.8378800e+15],
-       [4.4312750e+01, 1.0457000e+16],
-       [4.4331408e+01, 1.0232700e+16],
-       [4.4350066e+01, 9.5306100e+15],
-       [4.4368724e+01, 1.0184600e+16],
-       [4.4387382e+01, 9.9789600e+15],
-       [4.4406040e+01, 1.0279700e+16],
-       [4.4424698e+01, 1.0194700e+16],
-       [4.4443356e+01, 1.0223600e+16],
-       [4.4462014e+01, 1.0276100e+16],
-       [4.4480672e+01, 1.0628400e+16],
-       [4.4499330e+01, 1.0281500e+16],
-       [4.4517988e+01, 9.6963400e+15],
-       [4.4536646e+01, 9.6855900e+15],
-       [4.4555304e+01, 9.9883200e+15],
-       [4.4573962e+01, 9.8421400e+15],
-       [4.4592620e+01, 9.7597100e+15],
-       [4.4611278e+01, 9.7195700e+15],
-       [4.4629936e+01, 9.6207200e+15],
-       [4.4648594e+01, 1.0046400e+16],
-       [4.4667252e+01, 1.0353800e+16],
-       [4.4685910e+01, 1.0270700e+16],
-       [4.4704568e+01, 1.0075200e+16],
-       [4.4723226e+01, 1.0453400e+16],
-       [4.4741884e+01, 1.0392600e+16],
-       [4.4760542e+01, 9.6882500e+15],
-       [4.4779200e+01, 1.0599800e+16],
-       [4.4797858e+01, 1.0681000e+16],
-       [4.4816516e+01, 1.0181800e+16],
-       [4.4835174e+01, 9.6057200e+15],
-       [4.4853832e+01, 1.0020000e+16],
-       [4.4872490e+01, 9.7335800e+15],
-       [4.4891148e+01, 1.0623700e+16],
-       [4.4909806e+01, 9.5431200e+15],
-       [4.4928464e+01, 1.0081600e+16],
-       [4.4947122e+01, 1.0414200e+16],
-       [4.4965780e+01, 1.0171600e+16],
-       [4.4984438e+01, 9.8372100e+15],
-       [4.5003096e+01, 9.6908500e+15],
-       [4.5021754e+01, 1.0741500e+17],
-       [4.5040412e+01, 1.0493400e+17],
-       [4.5059070e+01, 1.0449300e+17],
-       [4.5077728e+01, 1.0585600e+17],
-       [4.5096386e+01, 1.0577800e+17],
-       [4.5115044e+01, 1.0226000e+17],
-       [4.5133702e+01, 1.0247300e+17],
-       [4.5152360e+01, 1.0168200e+17],
-       [4.5171018e+01, 1.0236700e+17],
-       [4.5189676e+01, 1.0693900e+17],
-       [4.5208334e+01, 1.0212000e+17],
-       [4.5226992e+01, 1.0578400e+17],
-       [4.5245650e+01, 1.0719800e+17],
-       [4.5264308e+01, 1.0713800e+17],
-       [4.5282966e+01, 1.0686400e+17],
-       [4.5301624e+01, 1.0770900e+17],
-       [4.5320282e+01, 1.0320300e+17],
-       [4.5338940e+01, 1.0437700e+17],
-       [4.5357598e+01, 1.0895900e+17],
-       [4.5376256e+01, 1.0703100e+17],
-       [4.5394914e+01, 1.0188000e+17],
-       [4.5413572e+01, 1.0860800e+17],
-       [4.5432230e+01, 1.0573100e+17],
-       [4.5450888e+01, 1.0698200e+17],
-       [4.5469546e+01, 1.0156700e+17],
-       [4.5488204e+01, 1.0187700e+17],
-       [4.5506862e+01, 1.0592500e+17],
-       [4.5525520e+01, 1.0761100e+17],
-       [4.5544178e+01, 1.0321200e+17],
-       [4.5562836e+01, 1.0773900e+17],
-       [4.5581494e+01, 1.0676900e+17],
-       [4.5600152e+01, 1.0100800e+17],
-       [4.5618810e+01, 1.0778000e+17],
-       [4.5637468e+01, 1.0406800e+17],
-       [4.5656126e+01, 1.0732900e+17],
-       [4.5674784e+01, 1.0468300e+17],
-       [4.5693442e+01, 1.0348600e+17],
-       [4.5712100e+01, 1.0565700e+17],
-       [4.5730758e+01, 1.0244800e+17],
-       [4.5749416e+01, 1.0445900e+17],
-       [4.5768074e+01, 1.0680200e+17],
-       [4.5786732e+01, 1.0877000e+17],
-       [4.5805390e+01, 1.0148900e+17],
-       [4.5824048e+01, 1.0741400e+17],
-       [4.5842706e+01, 1.0803700e+17],
-       [4.5861364e+01, 1.0122600e+17],
-       [4.5880022e+01, 1.0825600e+17],
-       [4.5898680e+01, 1.0124400e+17],
-       [4.5917338e+01, 1.0871000e+17],
-       [4.5935996e+01, 1.0794500e+17],
-       [4.5954654e+01, 1.0583200e+17],
-       [4.5973312e+01, 1.0853200e+17],
-       [4.5991970e+01, 1.0348800e+17],
-       [4.6010628e+01, 1.0272500e+17],
-       [4.6029286e+01, 1.0558300e+17],
-       [4.6047944e+01, 1.0673400e+17],
-       [4.6066602e+01, 1.0642600e+17],
-       [4.6085260e+01, 1.0869500e+17],
-       [4.6103918e+01, 1.0194600e+17],
-       [4.6122576e+01, 1.0426500e+17],
-       [4.6141234e+01, 1.0602300e+17],
-       [4.6159892e+01, 1.0704600e+17],
-       [4.6178550e+01, 1.0152200e+17],
-       [4.6197208e+01, 1.0838100e+17],
-       [4.6215866e+01, 1.0632900e+17],
-       [4.6234524e+01, 1.0116500e+17],
-       [4.6253182e+01, 1.0554800e+17],
-       [4.6271840e+01, 1.0692100e+17],
-       [4.6290498e+01, 1.0483500e+17],
-       [4.6309156e+01, 1.0129700e+17],
-       [4.6327814e+01, 1.0101000e+17],
-       [4.6346472e+01, 1.0643000e+17],
-       [4.6365130e+01, 1.0789000e+17],
-       [4.6383788e+01, 1.0273600e+17],
-       [4.6402446e+01, 1.0460800e+17],
-       [4.6421104e+01, 1.0668900e+17],
-       [4.6439762e+01, 1.0646600e+17],
-       [4.6458420e+01, 1.0891100e+17],
-       [4.6477078e+01, 1.0136200e+17],
-       [4.6495736e+01, 1.0899800e+17],
-       [4.6514394e+01, 1.0882000e+17],
-       [4.6533052e+01, 1.0781500e+17],
-       [4.6551710e+01, 1.0879300e+17],
-       [4.6570368e+01, 1.0622200e+17],
-       [4.6589026e+01, 1.0312800e+17],
-       [4.6607684e+01, 1.0638200e+17],
-       [4.6626342e+01, 1.0597500e+17],
-       [4.6645000e+01, 1.0659500e+17],
-       [4.6663658e+01, 1.0337500e+17],
-       [4.6682316e+01, 1.0500700e+17],
-       [4.6700974e+01, 1.0153500e+17],
-       [4.6719632e+01, 1.0884800e+17],
-       [4.6738290e+01, 1.0199500e+17],
-       [4.6756948e+01, 1.0889800e+17],
-       [4.6775606e+01, 1.0874200e+17],
-       [4.6794264e+01, 1.0487200e+17],
-       [4.6812922e+01, 1.0319400e+17],
-       [4.6831580e+01, 1.0140000e+17],
-       [4.6850238e+01, 1.0131200e+17],
-       [4.6868896e+01, 1.0241500e+17],
-       [4.6887554e+01, 1.0250400e+17],
-       [4.6906212e+01, 1.0854200e+17],
-       [4.6924870e+01, 1.0764200e+17],
-       [4.6943528e+01, 1.0326000e+17],
-       [4.6962186e+01, 1.0338900e+17],
-       [4.6980844e+01, 1.0827200e+17],
-       [4.6999502e+01, 1.0887400e+17],
-       [4.7018160e+01, 1.0628900e+17],
-       [4.7036818e+01, 1.0678200e+17],
-       [4.7055476e+01, 1.0761100e+17],
-       [4.7074134e+01, 1.0868000e+17],
-       [4.7092792e+01, 1.0694000e+17],
-       [4.7111450e+01, 1.0196200e+17],
-       [4.7130108e+01, 1.0763000e+17],
-       [4.7148766e+01, 1.0347600e+17],
-       [4.7167424e+01, 1.0436300e+17],
-       [4.7186082e+01, 1.0399800e+17],
-       [4.7204740e+01, 1.0240900e+17],
-       [4.7223398e+01, 1.0723600e+17],
-       [4.7242056e+01, 1.0526900e+17],
-       [4.7260714e+01, 1.0501400e+17],
-       [4.7279372e+01, 1.0543200e+17],
-       [4.7298030e+01, 1.0735000e+17],
-       [4.7316688e+01, 1.0373800e+17],
-       [4.7335346e+01, 1.0277100e+17],
-       [4.7354004e+01, 1.0385900e+17],
-       [4.7372662e+01, 1.0497000e+17],
-       [4.7391320e+01, 1.0835100e+17],
-       [4.7409978e+01, 1.0870000e+17],
-       [4.7428636e+01, 1.0672500e+17],
-       [4.7447294e+01, 1.0178200e+17],
-       [4.7465952e+01, 1.0813900e+17],
-       [4.7484610e+01, 1.0174100e+17],
-       [4.7503268e+01, 1.0337200e+17],
-       [4.7521926e+01, 1.0648500e+17],
-       [4.7540584e+01, 1.0782900e+17],
-       [4.7559242e+01, 1.0184900e+17],
-       [4.7577900e+01, 1.0777900e+17],
-       [4.7596558e+01, 1.0541100e+17],
-       [4.7615216e+01, 1.0605700e+17],
-       [4.7633874e+01, 1.0212500e+17],
-       [4.7652532e+01, 1.0326700e+17],
-       [4.7671190e+01, 1.0627100e+17],
-       [4.7689848e+01, 1.0650800e+17],
-       [4.7708506e+01, 1.0304600e+17],
-       [4.7727164e+01, 1.0568200e+17],
-       [4.7745822e+01, 1.0198300e+17],
-       [4.7764480e+01, 1.0332400e+17],
-       [4.7783138e+01, 1.0621500e+17],
-       [4.7801796e+01, 1.0420700e+17],
-       [4.7820454e+01, 1.0126300e+17],
-       [4.7839112e+01, 1.0537800e+17],
-       [4.7857770e+01, 1.0142900e+17],
-       [4.7876428e+01, 1.0662100e+17],
-       [4.7895086e+01, 1.0383900e+17],
-       [4.7913744e+01, 1.0293800e+17],
-       [4.7932402e+01, 1.0153900e+17],
-       [4.7951060e+01, 1.0490200e+17],
-       [4.7969718e+01, 1.0891700e+17],
-       [4.7988376e+01, 1.0186700e+17],
-       [4.8007034e+01, 1.0859700e+17],
-       [4.8025692e+01, 1.0450000e+17],
-       [4.8044350e+01, 1.0877200e+17],
-       [4.8063008e+01, 1.0693800e+17],
-       [4.8081666e+01, 1.0266100e+17],
-       [4.8100324e+01, 1.0433400e+17],
-       [4.8118982e+01, 1.0302200e+17],
-       [4.8137640e+01, 1.0499400e+17],
-       [4.8156298e+01, 1.0455500e+17],
-       [4.8174956e+01, 1.0839600e+17],
-       [4.8193614e+01, 1.0587500e+17],
-       [4.8212272e+01, 1.0340200e+17],
-       [4.8230930e+01, 1.0198100e+17],
-       [4.8249588e+01, 1.0329700e+17],
-       [4.8268246e+01, 1.0837200e+17],
-       [4.8286904e+01, 1.0686500e+17],
-       [4.8305562e+01, 1.0216500e+17],
-       [4.8324220e+01, 1.0668800e+17],
-       [4.8342878e+01, 1.0192000e+17],
-       [4.8361536e+01, 1.0412800e+17],
-       [4.8380194e+01, 1.0507500e+17],
-       [4.8398852e+01, 1.0270400e+17],
-       [4.8417510e+01, 1.0855700e+17],
-       [4.8436168e+01, 1.0843000e+17],
-       [4.8454826e+01, 1.0133200e+17],
-       [4.8473484e+01, 1.0116300e+17],
-       [4.8492142e+01, 1.0250500e+17],
-       [4.8510800e+01, 1.0543000e+17],
-       [4.8529458e+01, 1.0816400e+17],
-       [4.8548116e+01, 1.0714700e+17],
-       [4.8566774e+01, 1.0861300e+17],
-       [4.8585432e+01, 1.0142800e+17],
-       [4.8604090e+01, 1.0294500e+17],
-       [4.8622748e+01, 1.0377700e+17],
-       [4.8641406e+01, 1.0749900e+17],
-       [4.8660064e+01, 1.0163500e+17],
-       [4.8678722e+01, 1.0399900e+17],
-       [4.8697380e+01, 1.0485200e+17],
-       [4.8716038e+01, 1.0326800e+17],
-       [4.8734696e+01, 1.0893500e+17],
-       [4.8753354e+01, 1.0531100e+17],
-       [4.8772012e+01, 1.0646300e+17],
-       [4.8790670e+01, 1.0264700e+17],
-       [4.8809328e+01, 1.0201200e+17],
-       [4.8827986e+01, 1.0700700e+17],
-       [4.8846644e+01, 1.0248300e+17],
-       [4.8865302e+01, 1.0258400e+17],
-       [4.8883960e+01, 1.0263100e+17],
-       [4.8902618e+01, 1.0853600e+17],
-       [4.8921276e+01, 1.0526100e+17],
-       [4.8939934e+01, 1.0461300e+17],
-       [4.8958592e+01, 1.0447000e+17],
-       [4.8977250e+01, 1.0762000e+17],
-       [4.8995908e+01, 1.0422700e+17],
-       [4.9014566e+01, 1.0148700e+17],
-       [4.9033224e+01, 1.0673800e+17],
-       [4.9051882e+01, 1.0331200e+17],
-       [4.9070540e+01, 1.0379300e+17],
-       [4.9089198e+01, 1.0573900e+17],
-       [4.9107856e+01, 1.0894000e+17],
-       [4.9126514e+01, 1.0623100e+17],
-       [4.9145172e+01, 1.0123100e+17],
-       [4.9163830e+01, 1.0333800e+17],
-       [4.9182488e+01, 1.0557500e+17],
-       [4.9201146e+01, 1.0423100e+17],
-       [4.9219804e+01, 1.0857800e+17],
-       [4.9238462e+01, 1.0546400e+17],
-       [4.9257120e+01, 1.0348400e+17],
-       [4.9275778e+01, 1.0843000e+17],
-       [4.9294436e+01, 1.0787600e+17],
-       [4.9313094e+01, 1.0450000e+17],
-       [4.9331752e+01, 1.0157300e+17],
-       [4.9350410e+01, 1.0717000e+17],
-       [4.9369068e+01, 1.0148200e+17],
-       [4.9387726e+01, 1.0873700e+17],
-       [4.9406384e+01, 1.0379800e+17],
-       [4.9425042e+01, 1.0277200e+17],
-       [4.9443700e+01, 1.0795600e+17],
-       [4.9462358e+01, 1.0832900e+17],
-       [4.9481016e+01, 1.0169100e+17],
-       [4.9499674e+01, 1.0430200e+17],
-       [4.9518332e+01, 1.0707200e+17],
-       [4.9536990e+01, 1.0878900e+17],
-       [4.9555648e+01, 1.0861900e+17],
-       [4.9574306e+01, 1.0463200e+17],
-       [4.9592964e+01, 1.0576500e+17],
-       [4.9611622e+01, 1.0735900e+17],
-       [4.9630280e+01, 1.0356300e+17],
-       [4.9648938e+01, 1.0860800e+17],
-       [4.9667596e+01, 1.0882600e+17],
-       [4.9686254e+01, 1.0272300e+17],
-       [4.9704912e+01, 1.0515500e+17],
-       [4.9723570e+01, 1.0838600e+17],
-       [4.9742228e+01, 1.0682400e+17],
-       [4.9760886e+01, 1.0588500e+17],
-       [4.9779544e+01, 1.0688300e+17],
-       [4.9798202e+01, 1.0756300e+17],
-       [4.9816860e+01, 1.0532300e+17],
-       [4.9835518e+01, 1.0863100e+17],
-       [4.9854176e+01, 1.0187400e+17],
-       [4.9872834e+01, 1.0237100e+17],
-       [4.9891492e+01, 1.0763800e+17],
-       [4.9910150e+01, 1.0223900e+17],
-       [4.9928808e+01, 1.0446600e+17],
-       [4.9947466e+01, 1.0871300e+17],
-       [4.9966124e+01, 1.0155300e+17],
-       [4.9984782e+01, 1.0135900e+17],
-       [5.0003440e+01, 1.0285500e+17],
-       [5.0022098e+01, 1.0745300e+18],
-       [5.0040756e+01, 1.0900500e+18],
-       [5.0059414e+01, 1.0652300e+18],
-       [5.0078072e+01, 1.0605600e+18],
-       [5.0096730e+01, 1.0569900e+18],
-       [5.0115388e+01, 1.0633500e+18],
-       [5.0134046e+01, 1.0551000e+18],
-       [5.0152704e+01, 1.0699200e+18],
-       [5.0171362e+01, 1.0615300e+18],
-       [5.0190020e+01, 1.0909500e+18],
-       [5.0208678e+01, 1.0535600e+18],
-       [5.0227336e+01, 1.0711300e+18],
-       [5.0245994e+01, 1.0611000e+18],
-       [5.0264652e+01, 1.0991500e+18],
-       [5.0283310e+01, 1.0773100e+18],
-       [5.0301968e+01, 1.0515100e+18],
-       [5.0320626e+01, 1.0841000e+18],
-       [5.0339284e+01, 1.0664900e+18],
-       [5.0357942e+01, 1.0739800e+18],
-       [5.0376600e+01, 1.0815300e+18],
-       [5.0395258e+01, 1.0694100e+18],
-       [5.0413916e+01, 1.0541500e+18],
-       [5.0432574e+01, 1.0949700e+18],
-       [5.0451232e+01, 1.0835500e+18],
-       [5.0469890e+01, 1.0717700e+18],
-       [5.0488548e+01, 1.0630300e+18],
-       [5.0507206e+01, 1.0981000e+18],
-       [5.0525864e+01, 1.0819500e+18],
-       [5.0544522e+01, 1.0776400e+18],
-       [5.0563180e+01, 1.0898200e+18],
-       [5.0581838e+01, 1.0872600e+18],
-       [5.0600496e+01, 1.0632400e+18],
-       [5.0619154e+01, 1.0922400e+18],
-       [5.0637812e+01, 1.0541300e+18],
-       [5.0656470e+01, 1.0613200e+18],
-       [5.0675128e+01, 1.0878100e+18],
-       [5.0693786e+01, 1.0957300e+18],
-       [5.0712444e+01, 1.0752000e+18],
-       [5.0731102e+01, 1.0951600e+18],
-       [5.0749760e+01, 1.0877300e+18],
-       [5.0768418e+01, 1.0759800e+18],
-       [5.0787076e+01, 1.0927100e+18],
-       [5.0805734e+01, 1.0664400e+18],
-       [5.0824392e+01, 1.0875400e+18],
-       [5.0843050e+01, 1.0586400e+18],
-       [5.0861708e+01, 1.0580200e+18],
-       [5.0880366e+01, 1.0731500e+18],
-       [5.0899024e+01, 1.0558500e+18],
-       [5.0917682e+01, 1.0538700e+18],
-       [5.0936340e+01, 1.0775700e+18],
-       [5.0954998e+01, 1.0614900e+18],
-       [5.0973656e+01, 1.0742400e+18],
-       [5.0992314e+01, 1.0848300e+18],
-       [5.1010972e+01, 1.0562300e+18],
-       [5.1029630e+01, 1.0595800e+18],
-       [5.1048288e+01, 1.0737700e+18],
-       [5.1066946e+01, 1.0540900e+18],
-       [5.1085604e+01, 1.0813800e+18],
-       [5.1104262e+01, 1.0744200e+18],
-       [5.1122920e+01, 1.0556500e+18],
-       [5.1141578e+01, 1.0594500e+18],
-       [5.1160236e+01, 1.0823500e+18],
-       [5.1178894e+01, 1.0841900e+18],
-       [5.1197552e+01, 1.0934900e+18],
-       [5.1216210e+01, 1.0829900e+18],
-       [5.1234868e+01, 1.0806800e+18],
-       [5.1253526e+01, 1.0837800e+18],
-       [5.1272184e+01, 1.0564800e+18],
-       [5.1290842e+01, 1.0502200e+18],
-       [5.1309500e+01, 1.0678800e+18],
-       [5.1328158e+01, 1.0828300e+18],
-       [5.1346816e+01, 1.0856100e+18],
-       [5.1365474e+01, 1.0552500e+18],
-       [5.1384132e+01, 1.0774900e+18],
-       [5.1402790e+01, 1.0637800e+18],
-       [5.1421448e+01, 1.0788400e+18],
-       [5.1440106e+01, 1.0946500e+18],
-       [5.1458764e+01, 1.0720600e+18],
-       [5.1477422e+01, 1.0652400e+18],
-       [5.1496080e+01, 1.0786500e+18],
-       [5.1514738e+01, 1.0908400e+18],
-       [5.1533396e+01, 1.0781300e+18],
-       [5.1552054e+01, 1.0887300e+18],
-       [5.1570712e+01, 1.0796600e+18],
-       [5.1589370e+01, 1.0641400e+18],
-       [5.1608028e+01, 1.0543800e+18],
-       [5.1626686e+01, 1.0861900e+18],
-       [5.1645344e+01, 1.0608200e+18],
-       [5.1664002e+01, 1.0876700e+18],
-       [5.1682660e+01, 1.0867800e+18],
-       [5.1701318e+01, 1.0803700e+18],
-       [5.1719976e+01, 1.0922100e+18],
-       [5.1738634e+01, 1.0786900e+18],
-       [5.1757292e+01, 1.0755600e+18],
-       [5.1775950e+01, 1.0857700e+18],
-       [5.1794608e+01, 1.0821100e+18],
-       [5.1813266e+01, 1.0801800e+18],
-       [5.1831924e+01, 1.0911500e+18],
-       [5.1850582e+01, 1.0971200e+18],
-       [5.1869240e+01, 1.0794000e+18],
-       [5.1887898e+01, 1.0963600e+18],
-       [5.1906556e+01, 1.0676600e+18],
-       [5.1925214e+01, 1.0767400e+18],
-       [5.1943872e+01, 1.0576200e+18],
-       [5.1962530e+01, 1.0628500e+18],
-       [5.1981188e+01, 1.0962100e+18],
-       [5.1999846e+01, 1.0836400e+18],
-       [5.2018504e+01, 1.0888900e+18],
-       [5.2037162e+01, 1.0612900e+18],
-       [5.2055820e+01, 1.0957500e+18],
-       [5.2074478e+01, 1.0940600e+18],
-       [5.2093136e+01, 1.0655400e+18],
-       [5.2111794e+01, 1.0804700e+18],
-       [5.2130452e+01, 1.0838300e+18],
-       [5.2149110e+01, 1.0824100e+18],
-       [5.2167768e+01, 1.0503600e+18],
-       [5.2186426e+01, 1.0579300e+18],
-       [5.2205084e+01, 1.0981200e+18],
-       [5.2223742e+01, 1.0830000e+18],
-       [5.2242400e+01, 1.0882500e+18],
-       [5.2261058e+01, 1.0898800e+18],
-       [5.2279716e+01, 1.0798500e+18],
-       [5.2298374e+01, 1.0698100e+18],
-       [5.2317032e+01, 1.0651100e+18],
-       [5.2335690e+01, 1.0746700e+18],
-       [5.2354348e+01, 1.0537300e+18],
-       [5.2373006e+01, 1.0617600e+18],
-       [5.2391664e+01, 1.0650400e+18],
-       [5.2410322e+01, 1.0890400e+18],
-       [5.2428980e+01, 1.0767300e+18],
-       [5.2447638e+01, 1.0545200e+18],
-       [5.2466296e+01, 1.0500200e+18],
-       [5.2484954e+01, 1.0986200e+18],
-       [5.2503612e+01, 1.0556900e+18],
-       [5.2522270e+01, 1.0655900e+18],
-       [5.2540928e+01, 1.0535900e+18],
-       [5.2559586e+01, 1.0627000e+18],
-       [5.2578244e+01, 1.0794000e+18],
-       [5.2596902e+01, 1.0539100e+18],
-       [5.2615560e+01, 1.0581500e+18],
-       [5.2634218e+01, 1.0583600e+18],
-       [5.2652876e+01, 1.0860400e+18],
-       [5.2671534e+01, 1.0682700e+18],
-       [5.2690192e+01, 1.0687400e+18],
-       [5.2708850e+01, 1.0574300e+18],
-       [5.2727508e+01, 1.0976200e+18],
-       [5.2746166e+01, 1.0856900e+18],
-       [5.2764824e+01, 1.0767100e+18],
-       [5.2783482e+01, 1.0778100e+18],
-       [5.2802140e+01, 1.0558800e+18],
-       [5.2820798e+01, 1.0974200e+18],
-       [5.2839456e+01, 1.0977700e+18],
-       [5.2858114e+01, 1.0571200e+18],
-       [5.2876772e+01, 1.0973500e+18],
-       [5.2895430e+01, 1.0650600e+18],
-       [5.2914088e+01, 1.0534500e+18],
-       [5.2932746e+01, 1.0881600e+18],
-       [5.2951404e+01, 1.0900100e+18],
-       [5.2970062e+01, 1.0740500e+18],
-       [5.2988720e+01, 1.0575700e+18],
-       [5.3007378e+01, 1.0853700e+18],
-       [5.3026036e+01, 1.0963600e+18],
-       [5.3044694e+01, 1.0998900e+18],
-       [5.3063352e+01, 1.0823600e+18],
-       [5.3082010e+01, 1.0961300e+18],
-       [5.3100668e+01, 1.0578300e+18],
-       [5.3119326e+01, 1.0881200e+18],
-       [5.3137984e+01, 1.0613500e+18],
-       [5.3156642e+01, 1.0948000e+18],
-       [5.3175300e+01, 1.0599800e+18],
-       [5.3193958e+01, 1.0532400e+18],
-       [5.3212616e+01, 1.0602100e+18],
-       [5.3231274e+01, 1.0754600e+18],
-       [5.3249932e+01, 1.0939200e+18],
-       [5.3268590e+01, 1.0953100e+18],
-       [5.3287248e+01, 1.0783100e+18],
-       [5.3305906e+01, 1.0703900e+18],
-       [5.3324564e+01, 1.0547100e+18],
-       [5.3343222e+01, 1.0895300e+18],
-       [5.3361880e+01, 1.0926100e+18],
-       [5.3380538e+01, 1.0996200e+18],
-       [5.3399196e+01, 1.0762900e+18],
-       [5.3417854e+01, 1.0922200e+18],
-       [5.3436512e+01, 1.0842900e+18],
-       [5.3455170e+01, 1.0733500e+18],
-       [5.3473828e+01, 1.0850300e+18],
-       [5.3492486e+01, 1.0985200e+18],
-       [5.3511144e+01, 1.0508900e+18],
-       [5.3529802e+01, 1.0500600e+18],
-       [5.3548460e+01, 1.0633500e+18],
-       [5.3567118e+01, 1.0743600e+18],
-       [5.3585776e+01, 1.0929700e+18],
-       [5.3604434e+01, 1.0902700e+18],
-       [5.3623092e+01, 1.0569900e+18],
-       [5.3641750e+01, 1.0990800e+18],
-       [5.3660408e+01, 1.0605100e+18],
-       [5.3679066e+01, 1.0533600e+18],
-       [5.3697724e+01, 1.0807000e+18],
-       [5.3716382e+01, 1.0929900e+18],
-       [5.3735040e+01, 1.0737700e+18],
-       [5.3753698e+01, 1.0889000e+18],
-       [5.3772356e+01, 1.0585800e+18],
-       [5.3791014e+01, 1.0502900e+18],
-       [5.3809672e+01, 1.0835200e+18],
-       [5.3828330e+01, 1.0793000e+18],
-       [5.3846988e+01, 1.0644800e+18],
-       [5.3865646e+01, 1.0674200e+18],
-       [5.3884304e+01, 1.0959900e+18],
-       [5.3902962e+01, 1.0715400e+18],
-       [5.3921620e+01, 1.0728300e+18],
-       [5.3940278e+01, 1.0771500e+18],
-       [5.3958936e+01, 1.0958500e+18],
-       [5.3977594e+01, 1.0660200e+18],
-       [5.3996252e+01, 1.0902300e+18],
-       [5.4014910e+01, 1.0638300e+18],
-       [5.4033568e+01, 1.0716800e+18],
-       [5.4052226e+01, 1.0879200e+18],
-       [5.4070884e+01, 1.0730800e+18],
-       [5.4089542e+01, 1.0509500e+18],
-       [5.4108200e+01, 1.0621200e+18],
-       [5.4126858e+01, 1.0691500e+18],
-       [5.4145516e+01, 1.0548200e+18],
-       [5.4164174e+01, 1.0645700e+18],
-       [5.4182832e+01, 1.0911500e+18],
-       [5.4201490e+01, 1.0646500e+18],
-       [5.4220148e+01, 1.0563600e+18],
-       [5.4238806e+01, 1.0987700e+18],
-       [5.4257464e+01, 1.0988700e+18],
-       [5.4276122e+01, 1.0885500e+18],
-       [5.4294780e+01, 1.0709400e+18],
-       [5.4313438e+01, 1.0520800e+18],
-       [5.4332096e+01, 1.0918800e+18],
-       [5.4350754e+01, 1.0537800e+18],
-       [5.4369412e+01, 1.0751700e+18],
-       [5.4388070e+01, 1.0956600e+18],
-       [5.4406728e+01, 1.0644800e+18],
-       [5.4425386e+01, 1.0533300e+18],
-       [5.4444044e+01, 1.0644700e+18],
-       [5.4462702e+01, 1.0584700e+18],
-       [5.4481360e+01, 1.0762100e+18],
-       [5.4500018e+01, 1.0511400e+18],
-       [5.4518676e+01, 1.0576300e+18],
-       [5.4537334e+01, 1.0556700e+18],
-       [5.4555992e+01, 1.0634100e+18],
-       [5.4574650e+01, 1.0568000e+18],
-       [5.4593308e+01, 1.0914200e+18],
-       [5.4611966e+01, 1.0562400e+18],
-       [5.4630624e+01, 1.0724700e+18],
-       [5.4649282e+01, 1.0735800e+18],
-       [5.4667940e+01, 1.0839100e+18],
-       [5.4686598e+01, 1.0603600e+18],
-       [5.4705256e+01, 1.0909600e+18],
-       [5.4723914e+01, 1.0562500e+18],
-       [5.4742572e+01, 1.0813800e+18],
-       [5.4761230e+01, 1.0645700e+18],
-       [5.4779888e+01, 1.0815400e+18],
-       [5.4798546e+01, 1.0548900e+18],
-       [5.4817204e+01, 1.0663600e+18],
-       [5.4835862e+01, 1.0862100e+18],
-       [5.4854520e+01, 1.0663000e+18],
-       [5.4873178e+01, 1.0987800e+18],
-       [5.4891836e+01, 1.0808100e+18],
-       [5.4910494e+01, 1.0633400e+18],
-       [5.4929152e+01, 1.0886100e+18],
-       [5.4947810e+01, 1.0619600e+18],
-       [5.4966468e+01, 1.0793800e+18],
-       [5.4985126e+01, 1.0868500e+18],
-       [5.5003784e+01, 1.0927000e+18],
-       [5.5022442e+01, 1.0995300e+19],
-       [5.5041100e+01, 1.0907300e+19],
-       [5.5059758e+01, 1.0902800e+19],
-       [5.5078416e+01, 1.0927800e+19],
-       [5.5097074e+01, 1.0925600e+19],
-       [5.5115732e+01, 1.0960900e+19],
-       [5.5134390e+01, 1.1165300e+19],
-       [5.5153048e+01, 1.1139900e+19],
-       [5.5171706e+01, 1.1120500e+19],
-       [5.5190364e+01, 1.1000200e+19],
-       [5.5209022e+01, 1.0943900e+19],
-       [5.5227680e+01, 1.1022600e+19],
-       [5.5246338e+01, 1.1058900e+19],
-       [5.5264996e+01, 1.1188600e+19],
-       [5.5283654e+01, 1.1137300e+19],
-       [5.5302312e+01, 1.0932700e+19],
-       [5.5320970e+01, 1.1003400e+19],
-       [5.5339628e+01, 1.1177700e+19],
-       [5.5358286e+01, 1.1018500e+19],
-       [5.5376944e+01, 1.1144800e+19],
-       [5.5395602e+01, 1.1150600e+19],
-       [5.5414260e+01, 1.1180000e+19],
-       [5.5432918e+01, 1.1043200e+19],
-       [5.5451576e+01, 1.1155800e+19],
-       [5.5470234e+01, 1.1149600e+19],
-       [5.5488892e+01, 1.1062300e+19],
-       [5.5507550e+01, 1.1071600e+19],
-       [5.5526208e+01, 1.0986100e+19],
-       [5.5544866e+01, 1.1166400e+19],
-       [5.5563524e+01, 1.1004300e+19],
-       [5.5582182e+01, 1.0982100e+19],
-       [5.5600840e+01, 1.0978700e+19],
-       [5.5619498e+01, 1.1058900e+19],
-       [5.5638156e+01, 1.1006000e+19],
-       [5.5656814e+01, 1.1167400e+19],
-       [5.5675472e+01, 1.1069100e+19],
-       [5.5694130e+01, 1.0975900e+19],
-       [5.5712788e+01, 1.1054300e+19],
-       [5.5731446e+01, 1.1105200e+19],
-       [5.5750104e+01, 1.1134900e+19],
-       [5.5768762e+01, 1.1103600e+19],
-       [5.5787420e+01, 1.0937200e+19],
-       [5.5806078e+01, 1.1042100e+19],
-       [5.5824736e+01, 1.1041600e+19],
-       [5.5843394e+01, 1.1097800e+19],
-       [5.5862052e+01, 1.0974800e+19],
-       [5.5880710e+01, 1.1122000e+19],
-       [5.5899368e+01, 1.1036100e+19],
-       [5.5918026e+01, 1.1192400e+19],
-       [5.5936684e+01, 1.1005300e+19],
-       [5.5955342e+01, 1.1154500e+19],
-       [5.5974000e+01, 1.1140000e+19],
-       [5.5992658e+01, 1.0936400e+19],
-       [5.6011316e+01, 1.0924300e+19],
-       [5.6029974e+01, 1.0976300e+19],
-       [5.6048632e+01, 1.1065400e+19],
-       [5.6067290e+01, 1.1080500e+19],
-       [5.6085948e+01, 1.1053300e+19],
-       [5.6104606e+01, 1.1161100e+19],
-       [5.6123264e+01, 1.1087300e+19],
-       [5.6141922e+01, 1.1007200e+19],
-       [5.6160580e+01, 1.0992500e+19],
-       [5.6179238e+01, 1.1124300e+19],
-       [5.6197896e+01, 1.1181700e+19],
-       [5.6216554e+01, 1.0914900e+19],
-       [5.6235212e+01, 1.0907600e+19],
-       [5.6253870e+01, 1.0912000e+19],
-       [5.6272528e+01, 1.0962200e+19],
-       [5.6291186e+01, 1.0996000e+19],
-       [5.6309844e+01, 1.0969600e+19],
-       [5.6328502e+01, 1.1114500e+19],
-       [5.6347160e+01, 1.1152900e+19],
-       [5.6365818e+01, 1.0916600e+19],
-       [5.6384476e+01, 1.1085100e+19],
-       [5.6403134e+01, 1.1193000e+19],
-       [5.6421792e+01, 1.1016000e+19],
-       [5.6440450e+01, 1.1017600e+19],
-       [5.6459108e+01, 1.0962100e+19],
-       [5.6477766e+01, 1.1112600e+19],
-       [5.6496424e+01, 1.1139100e+19],
-       [5.6515082e+01, 1.1196100e+19],
-       [5.6533740e+01, 1.0978500e+19],
-       [5.6552398e+01, 1.0926500e+19],
-       [5.6571056e+01, 1.1022200e+19],
-       [5.6589714e+01, 1.1165300e+19],
-       [5.6608372e+01, 1.1154900e+19],
-       [5.6627030e+01, 1.1144600e+19],
-       [5.6645688e+01, 1.1085300e+19],
-       [5.6664346e+01, 1.1161100e+19],
-       [5.6683004e+01, 1.1099600e+19],
-       [5.6701662e+01, 1.0933600e+19],
-       [5.6720320e+01, 1.1098700e+19],
-       [5.6738978e+01, 1.0900500e+19],
-       [5.6757636e+01, 1.0937800e+19],
-       [5.6776294e+01, 1.1099900e+19],
-       [5.6794952e+01, 1.1047400e+19],
-       [5.6813610e+01, 1.1061500e+19],
-       [5.6832268e+01, 1.1067200e+19],
-       [5.6850926e+01, 1.1040700e+19],
-       [5.6869584e+01, 1.1091600e+19],
-       [5.6888242e+01, 1.0946600e+19],
-       [5.6906900e+01, 1.1062100e+19],
-       [5.6925558e+01, 1.1199100e+19],
-       [5.6944216e+01, 1.0989300e+19],
-       [5.6962874e+01, 1.0975000e+19],
-       [5.6981532e+01, 1.1023600e+19],
-       [5.7000190e+01, 1.1147100e+19],
-       [5.7018848e+01, 1.1070700e+19],
-       [5.7037506e+01, 1.1136700e+19],
-       [5.7056164e+01, 1.1191700e+19],
-       [5.7074822e+01, 1.1181700e+19],
-       [5.7093480e+01, 1.1122500e+19],
-       [5.7112138e+01, 1.1012300e+19],
-       [5.7130796e+01, 1.1058700e+19],
-       [5.7149454e+01, 1.0978600e+19],
-       [5.7168112e+01, 1.0914600e+19],
-       [5.7186770e+01, 1.1174200e+19],
-       [5.7205428e+01, 1.1046900e+19],
-       [5.7224086e+01, 1.0974000e+19],
-       [5.7242744e+01, 1.1039500e+19],
-       [5.7261402e+01, 1.0972900e+19],
-       [5.7280060e+01, 1.0921900e+19],
-       [5.7298718e+01, 1.1099500e+19],
-       [5.7317376e+01, 1.0901900e+19],
-       [5.7336034e+01, 1.1157700e+19],
-       [5.7354692e+01, 1.1096500e+19],
-       [5.7373350e+01, 1.1086800e+19],
-       [5.7392008e+01, 1.0983700e+19],
-       [5.7410666e+01, 1.1028900e+19],
-       [5.7429324e+01, 1.0935100e+19],
-       [5.7447982e+01, 1.1105200e+19],
-       [5.7466640e+01, 1.1044500e+19],
-       [5.7485298e+01, 1.0946200e+19],
-       [5.7503956e+01, 1.0933800e+19],
-       [5.7522614e+01, 1.1111300e+19],
-       [5.7541272e+01, 1.1030400e+19],
-       [5.7559930e+01, 1.1039300e+19],
-       [5.7578588e+01, 1.1022400e+19],
-       [5.7597246e+01, 1.1140300e+19],
-       [5.7615904e+01, 1.1117100e+19],
-       [5.7634562e+01, 1.1016900e+19],
-       [5.7653220e+01, 1.1171400e+19],
-       [5.7671878e+01, 1.1004200e+19],
-       [5.7690536e+01, 1.0973000e+19],
-       [5.7709194e+01, 1.0931600e+19],
-       [5.7727852e+01, 1.1100600e+19],
-       [5.7746510e+01, 1.0937200e+19],
-       [5.7765168e+01, 1.1031900e+19],
-       [5.7783826e+01, 1.0991700e+19],
-       [5.7802484e+01, 1.0971400e+19],
-       [5.7821142e+01, 1.0978900e+19],
-       [5.7839800e+01, 1.1123200e+19],
-       [5.7858458e+01, 1.1080700e+19],
-       [5.7877116e+01, 1.0956700e+19],
-       [5.7895774e+01, 1.1064500e+19],
-       [5.7914432e+01, 1.0976800e+19],
-       [5.7933090e+01, 1.0949100e+19],
-       [5.7951748e+01, 1.1170600e+19],
-       [5.7970406e+01, 1.1077100e+19],
-       [5.7989064e+01, 1.0942600e+19],
-       [5.8007722e+01, 1.1150500e+19],
-       [5.8026380e+01, 1.1089200e+19],
-       [5.8045038e+01, 1.1198700e+19],
-       [5.8063696e+01, 1.1139500e+19],
-       [5.8082354e+01, 1.1014800e+19],
-       [5.8101012e+01, 1.0987900e+19],
-       [5.8119670e+01, 1.0972800e+19],
-       [5.8138328e+01, 1.1109600e+19],
-       [5.8156986e+01, 1.0953700e+19],
-       [5.8175644e+01, 1.1194800e+19],
-       [5.8194302e+01, 1.1018900e+19],
-       [5.8212960e+01, 1.1099100e+19],
-       [5.8231618e+01, 1.1013600e+19],
-       [5.8250276e+01, 1.0950500e+19],
-       [5.8268934e+01, 1.1104900e+19],
-       [5.8287592e+01, 1.1156700e+19],
-       [5.8306250e+01, 1.0995300e+19],
-       [5.8324908e+01, 1.0947500e+19],
-       [5.8343566e+01, 1.1192000e+19],
-       [5.8362224e+01, 1.0928200e+19],
-       [5.8380882e+01, 1.0998100e+19],
-       [5.8399540e+01, 1.0906500e+19],
-       [5.8418198e+01, 1.0997500e+19],
-       [5.8436856e+01, 1.1015000e+19],
-       [5.8455514e+01, 1.1087100e+19],
-       [5.8474172e+01, 1.1159400e+19],
-       [5.8492830e+01, 1.0901300e+19],
-       [5.8511488e+01, 1.0994500e+19],
-       [5.8530146e+01, 1.1194300e+19],
-       [5.8548804e+01, 1.1118400e+19],
-       [5.8567462e+01, 1.1146900e+19],
-       [5.8586120e+01, 1.1031400e+19],
-       [5.8604778e+01, 1.1138100e+19],
-       [5.8623436e+01, 1.1144100e+19],
-       [5.8642094e+01, 1.1139200e+19],
-       [5.8660752e+01, 1.0971500e+19],
-       [5.8679410e+01, 1.1151600e+19],
-       [5.8698068e+01, 1.1043900e+19],
-       [5.8716726e+01, 1.0992700e+19],
-       [5.8735384e+01, 1.1060100e+19],
-       [5.8754042e+01, 1.1195800e+19],
-       [5.8772700e+01, 1.1109300e+19],
-       [5.8791358e+01, 1.0986300e+19],
-       [5.8810016e+01, 1.1175000e+19],
-       [5.8828674e+01, 1.1085800e+19],
-       [5.8847332e+01, 1.1146400e+19],
-       [5.8865990e+01, 1.1115300e+19],
-       [5.8884648e+01, 1.0969800e+19],
-       [5.8903306e+01, 1.1060700e+19],
-       [5.8921964e+01, 1.0902500e+19],
-       [5.8940622e+01, 1.1185400e+19],
-       [5.8959280e+01, 1.1139400e+19],
-       [5.8977938e+01, 1.0984800e+19],
-       [5.8996596e+01, 1.1027500e+19],
-       [5.9015254e+01, 1.1199700e+19],
-       [5.9033912e+01, 1.1141500e+19],
-       [5.9052570e+01, 1.1191000e+19],
-       [5.9071228e+01, 1.0938500e+19],
-       [5.9089886e+01, 1.0952000e+19],
-       [5.9108544e+01, 1.1038100e+19],
-       [5.9127202e+01, 1.1027400e+19],
-       [5.9145860e+01, 1.0934800e+19],
-       [5.9164518e+01, 1.1084200e+19],
-       [5.9183176e+01, 1.0950900e+19],
-       [5.9201834e+01, 1.1192400e+19],
-       [5.9220492e+01, 1.1041100e+19],
-       [5.9239150e+01, 1.1167000e+19],
-       [5.9257808e+01, 1.1106800e+19],
-       [5.9276466e+01, 1.0970400e+19],
-       [5.9295124e+01, 1.0913000e+19],
-       [5.9313782e+01, 1.0922400e+19],
-       [5.9332440e+01, 1.1042900e+19],
-       [5.9351098e+01, 1.1180300e+19],
-       [5.9369756e+01, 1.1099300e+19],
-       [5.9388414e+01, 1.0996400e+19],
-       [5.9407072e+01, 1.1039300e+19],
-       [5.9425730e+01, 1.0923200e+19],
-       [5.9444388e+01, 1.1075400e+19],
-       [5.9463046e+01, 1.0994600e+19],
-       [5.9481704e+01, 1.1103100e+19],
-       [5.9500362e+01, 1.1051200e+19],
-       [5.9519020e+01, 1.0915200e+19],
-       [5.9537678e+01, 1.1130400e+19],
-       [5.9556336e+01, 1.0906800e+19],
-       [5.9574994e+01, 1.1161800e+19],
-       [5.9593652e+01, 1.1132300e+19],
-       [5.9612310e+01, 1.1086900e+19],
-       [5.9630968e+01, 1.1084400e+19],
-       [5.9649626e+01, 1.0953900e+19],
-       [5.9668284e+01, 1.0906300e+19],
-       [5.9686942e+01, 1.1154000e+19],
-       [5.9705600e+01, 1.1105400e+19],
-       [5.9724258e+01, 1.1120000e+19],
-       [5.9742916e+01, 1.1155400e+19],
-       [5.9761574e+01, 1.1079400e+19],
-       [5.9780232e+01, 1.1010400e+19],
-       [5.9798890e+01, 1.0930800e+19],
-       [5.9817548e+01, 1.1079600e+19],
-       [5.9836206e+01, 1.1191200e+19],
-       [5.9854864e+01, 1.1180900e+19],
-       [5.9873522e+01, 1.1033500e+19],
-       [5.9892180e+01, 1.0918000e+19],
-       [5.9910838e+01, 1.0993300e+19],
-       [5.9929496e+01, 1.1103100e+19],
-       [5.9948154e+01, 1.1029100e+19],
-       [5.9966812e+01, 1.1133500e+19],
-       [5.9985470e+01, 1.1140500e+19],
-       [6.0004128e+01, 1.0934100e+19],
-       [6.0022786e+01, 1.0144600e+19],
-       [6.0041444e+01, 1.0109700e+19],
-       [6.0060102e+01, 1.0148300e+19],
-       [6.0078760e+01, 1.0108800e+19],
-       [6.0097418e+01, 1.0188000e+19],
-       [6.0116076e+01, 1.0143700e+19],
-       [6.0134734e+01, 1.0199400e+19],
-       [6.0153392e+01, 1.0132800e+19],
-       [6.0172050e+01, 1.0188400e+19],
-       [6.0190708e+01, 1.0180500e+19],
-       [6.0209366e+01, 1.0106800e+19],
-       [6.0228024e+01, 1.0176100e+19],
-       [6.0246682e+01, 1.0146900e+19],
-       [6.0265340e+01, 1.0150900e+19],
-       [6.0283998e+01, 1.0163900e+19],
-       [6.0302656e+01, 1.0112400e+19],
-       [6.0321314e+01, 1.0164200e+19],
-       [6.0339972e+01, 1.0121100e+19],
-       [6.0358630e+01, 1.0141600e+19],
-       [6.0377288e+01, 1.0154100e+19],
-       [6.0395946e+01, 1.0186100e+19],
-       [6.0414604e+01, 1.0162500e+19],
-       [6.0433262e+01, 1.0170500e+19],
-       [6.0451920e+01, 1.0174900e+19],
-       [6.0470578e+01, 1.0113800e+19],
-       [6.0489236e+01, 1.0170800e+19],
-       [6.0507894e+01, 1.0175200e+19],
-       [6.0526552e+01, 1.0148500e+19],
-       [6.0545210e+01, 1.0106700e+19],
-       [6.0563868e+01, 1.0168300e+19],
-       [6.0582526e+01, 1.0148600e+19],
-       [6.0601184e+01, 1.0171500e+19],
-       [6.0619842e+01, 1.0181700e+19],
-       [6.0638500e+01, 1.0142800e+19],
-       [6.0657158e+01, 1.0193100e+19],
-       [6.0675816e+01, 1.0145700e+19],
-       [6.0694474e+01, 1.0168000e+19],
-       [6.0713132e+01, 1.0138100e+19],
-       [6.0731790e+01, 1.0194000e+19],
-       [6.0750448e+01, 1.0155600e+19],
-       [6.0769106e+01, 1.0110200e+19],
-       [6.0787764e+01, 1.0196900e+19],
-       [6.0806422e+01, 1.0158700e+19],
-       [6.0825080e+01, 1.0118300e+19],
-       [6.0843738e+01, 1.0128800e+19],
-       [6.0862396e+01, 1.0116900e+19],
-       [6.0881054e+01, 1.0121000e+19],
-       [6.0899712e+01, 1.0115100e+19],
-       [6.0918370e+01, 1.0184600e+19],
-       [6.0937028e+01, 1.0174200e+19],
-       [6.0955686e+01, 1.0177200e+19],
-       [6.0974344e+01, 1.0168900e+19],
-       [6.0993002e+01, 1.0152100e+19],
-       [6.1011660e+01, 1.0178200e+19],
-       [6.1030318e+01, 1.0128000e+19],
-       [6.1048976e+01, 1.0108500e+19],
-       [6.1067634e+01, 1.0122200e+19],
-       [6.1086292e+01, 1.0133800e+19],
-       [6.1104950e+01, 1.0185400e+19],
-       [6.1123608e+01, 1.0196200e+19],
-       [6.1142266e+01, 1.0139200e+19],
-       [6.1160924e+01, 1.0101400e+19],
-       [6.1179582e+01, 1.0186500e+19],
-       [6.1198240e+01, 1.0135600e+19],
-       [6.1216898e+01, 1.0192400e+19],
-       [6.1235556e+01, 1.0186300e+19],
-       [6.1254214e+01, 1.0170800e+19],
-       [6.1272872e+01, 1.0105500e+19],
-       [6.1291530e+01, 1.0135500e+19],
-       [6.1310188e+01, 1.0131900e+19],
-       [6.1328846e+01, 1.0192000e+19],
-       [6.1347504e+01, 1.0139000e+19],
-       [6.1366162e+01, 1.0192800e+19],
-       [6.1384820e+01, 1.0183500e+19],
-       [6.1403478e+01, 1.0129700e+19],
-       [6.1422136e+01, 1.0100500e+19],
-       [6.1440794e+01, 1.0133400e+19],
-       [6.1459452e+01, 1.0141900e+19],
-       [6.1478110e+01, 1.0126800e+19],
-       [6.1496768e+01, 1.0167200e+19],
-       [6.1515426e+01, 1.0186300e+19],
-       [6.1534084e+01, 1.0183300e+19],
-       [6.1552742e+01, 1.0140400e+19],
-       [6.1571400e+01, 1.0147700e+19],
-       [6.1590058e+01, 1.0164000e+19],
-       [6.1608716e+01, 1.0179400e+19],
-       [6.1627374e+01, 1.0125700e+19],
-       [6.1646032e+01, 1.0131600e+19],
-       [6.1664690e+01, 1.0184800e+19],
-       [6.1683348e+01, 1.0188300e+19],
-       [6.1702006e+01, 1.0166300e+19],
-       [6.1720664e+01, 1.0102700e+19],
-       [6.1739322e+01, 1.0174500e+19],
-       [6.1757980e+01, 1.0124500e+19],
-       [6.1776638e+01, 1.0149400e+19],
-       [6.1795296e+01, 1.0157100e+19],
-       [6.1813954e+01, 1.0118300e+19],
-       [6.1832612e+01, 1.0162100e+19],
-       [6.1851270e+01, 1.0151300e+19],
-       [6.1869928e+01, 1.0115500e+19],
-       [6.1888586e+01, 1.0125200e+19],
-       [6.1907244e+01, 1.0144400e+19],
-       [6.1925902e+01, 1.0156000e+19],
-       [6.1944560e+01, 1.0177800e+19],
-       [6.1963218e+01, 1.0128100e+19],
-       [6.1981876e+01, 1.0116300e+19],
-       [6.2000534e+01, 1.0198100e+19],
-       [6.2019192e+01, 1.0188400e+19],
-       [6.2037850e+01, 1.0181000e+19],
-       [6.2056508e+01, 1.0109000e+19],
-       [6.2075166e+01, 1.0142600e+19],
-       [6.2093824e+01, 1.0144900e+19],
-       [6.2112482e+01, 1.0107400e+19],
-       [6.2131140e+01, 1.0127200e+19],
-       [6.2149798e+01, 1.0106200e+19],
-       [6.2168456e+01, 1.0117300e+19],
-       [6.2187114e+01, 1.0113900e+19],
-       [6.2205772e+01, 1.0197700e+19],
-       [6.2224430e+01, 1.0117600e+19],
-       [6.2243088e+01, 1.0127400e+19],
-       [6.2261746e+01, 1.0116300e+19],
-       [6.2280404e+01, 1.0158200e+19],
-       [6.2299062e+01, 1.0198400e+19],
-       [6.2317720e+01, 1.0119800e+19],
-       [6.2336378e+01, 1.0157200e+19],
-       [6.2355036e+01, 1.0104600e+19],
-       [6.2373694e+01, 1.0178500e+19],
-       [6.2392352e+01, 1.0135200e+19],
-       [6.2411010e+01, 1.0171400e+19],
-       [6.2429668e+01, 1.0126800e+19],
-       [6.2448326e+01, 1.0133300e+19],
-       [6.2466984e+01, 1.0110700e+19],
-       [6.2485642e+01, 1.0186800e+19],
-       [6.2504300e+01, 1.0137700e+19]])
-
-
-
-
-
-
-
-data_c_npsc1 = np.array([[0.00000000e+00, 7.00971000e+19, 1.04712900e-03],
-       [4.71000000e-02, 7.21107000e+19, 1.02070400e-03],
-       [9.43000000e-02, 7.26942000e+19, 1.01321100e-03],
-       [1.41400000e-01, 7.05180000e+19, 1.04135800e-03],
-       [1.88500000e-01, 6.98072000e+19, 1.05123500e-03],
-       [2.35700000e-01, 7.00487000e+19, 1.04785200e-03],
-       [2.82800000e-01, 6.93107000e+19, 1.05803500e-03],
-       [3.30000000e-01, 6.52079000e+19, 1.11815000e-03],
-       [3.77100000e-01, 5.81300000e+19, 1.24193800e-03],
-       [4.24200000e-01, 5.04429000e+19, 1.41579400e-03],
-       [4.71400000e-01, 4.31420000e+19, 1.63681700e-03],
-       [5.18500000e-01, 3.23594000e+19, 2.13943900e-03],
-       [5.65600000e-01, 2.10378000e+19, 3.16737900e-03],
-       [6.12800000e-01, 1.61362000e+19, 3.98749400e-03],
-       [6.59900000e-01, 1.34741000e+19, 4.63020300e-03],
-       [7.07000000e-01, 1.15691000e+19, 5.22757200e-03],
-       [7.54200000e-01, 1.01321000e+19, 5.78628700e-03],
-       [8.01300000e-01, 8.88996000e+18, 6.37529100e-03],
-       [8.48400000e-01, 7.71792000e+18, 7.05342400e-03],
-       [8.95600000e-01, 6.60693000e+18, 7.84693400e-03],
-       [9.42700000e-01, 5.55904000e+18, 8.79427400e-03],
-       [9.89900000e-01, 4.57299000e+18, 9.94718100e-03],
-       [1.03700000e+00, 3.66522000e+18, 1.13658000e-02],
-       [1.08410000e+00, 2.86286000e+18, 1.31099190e-02],
-       [1.13130000e+00, 2.18424000e+18, 1.52335110e-02],
-       [1.17840000e+00, 1.74502000e+18, 1.71988730e-02],
-       [1.22550000e+00, 1.50938000e+18, 1.85780450e-02],
-       [1.27270000e+00, 1.37626000e+18, 1.95074270e-02],
-       [1.31980000e+00, 1.29033000e+18, 2.01790170e-02],
-       [1.36690000e+00, 1.24968000e+18, 2.05210700e-02],
-       [1.41410000e+00, 1.22574000e+18, 2.07252610e-02],
-       [1.46120000e+00, 1.18331000e+18, 2.11154330e-02],
-       [1.50840000e+00, 1.12254000e+18, 2.17020120e-02],
-       [1.55550000e+00, 1.06660000e+18, 2.22894830e-02],
-       [1.60260000e+00, 1.01181000e+18, 2.29139520e-02],
-       [1.64980000e+00, 9.55873000e+17, 2.36047820e-02],
-       [1.69690000e+00, 9.01779000e+17, 2.43276410e-02],
-       [1.74400000e+00, 8.50550000e+17, 2.50841850e-02],
-       [1.79120000e+00, 8.01678000e+17, 2.58702130e-02],
-       [1.83830000e+00, 7.52142000e+17, 2.67485350e-02],
-       [1.88540000e+00, 6.98715000e+17, 2.77971330e-02],
-       [1.93260000e+00, 6.41357000e+17, 2.90736800e-02],
-       [1.97970000e+00, 5.83176000e+17, 3.05703210e-02],
-       [2.02690000e+00, 5.26866000e+17, 3.22552190e-02],
-       [2.07400000e+00, 4.76650000e+17, 3.40251460e-02],
-       [2.12110000e+00, 4.30626000e+17, 3.59252670e-02],
-       [2.16830000e+00, 3.86990000e+17, 3.80627360e-02],
-       [2.21540000e+00, 3.45621000e+17, 4.04948690e-02],
-       [2.26250000e+00, 3.08248000e+17, 4.31419730e-02],
-       [2.30970000e+00, 2.75233000e+17, 4.59621140e-02],
-       [2.35680000e+00, 2.46831000e+17, 4.88990030e-02],
-       [2.40390000e+00, 2.22229000e+17, 5.19517280e-02],
-       [2.45110000e+00, 2.00632000e+17, 5.51442200e-02],
-       [2.49820000e+00, 1.82390000e+17, 5.83445100e-02],
-       [2.54530000e+00, 1.68229000e+17, 6.12491410e-02],
-       [2.59250000e+00, 1.55561000e+17, 6.42243920e-02],
-       [2.63960000e+00, 1.42692000e+17, 6.77329510e-02],
-       [2.68680000e+00, 1.31129000e+17, 7.14002940e-02],
-       [2.73390000e+00, 1.22744000e+17, 7.44217710e-02],
-       [2.78100000e+00, 1.15425000e+17, 7.74105230e-02],
-       [2.82820000e+00, 1.06611000e+17, 8.14704280e-02],
-       [2.87530000e+00, 9.68947000e+16, 8.67361220e-02],
-       [2.92240000e+00, 8.65765000e+16, 9.34759740e-02],
-       [2.96960000e+00, 7.38244000e+16, 1.04207745e-01],
-       [3.01670000e+00, 6.03532000e+16, 1.20060459e-01],
-       [3.06380000e+00, 4.64836000e+16, 1.45244602e-01],
-       [3.11100000e+00, 3.08106000e+16, 1.99296651e-01],
-       [3.15810000e+00, 1.98838000e+16, 2.84839359e-01],
-       [3.20530000e+00, 1.38420000e+16, 3.88150366e-01],
-       [3.25240000e+00, 1.09270000e+16, 4.77859253e-01],
-       [3.29950000e+00, 9.89008000e+15, 5.22275917e-01],
-       [3.34670000e+00, 9.34329000e+15, 5.49540874e-01],
-       [3.39380000e+00, 9.02610000e+15, 5.67022118e-01],
-       [3.44090000e+00, 8.88792000e+15, 5.74910182e-01],
-       [3.48810000e+00, 8.92278000e+15, 5.72796031e-01],
-       [3.53520000e+00, 9.04690000e+15, 5.65718003e-01],
-       [3.58230000e+00, 9.13903000e+15, 5.60660552e-01],
-       [3.62950000e+00, 9.09076000e+15, 5.63378151e-01],
-       [3.67660000e+00, 8.95571000e+15, 5.70952528e-01],
-       [3.72380000e+00, 8.78011000e+15, 5.81299568e-01],
-       [3.77090000e+00, 8.40040000e+15, 6.05062169e-01],
-       [3.81800000e+00, 7.84874000e+15, 6.43428065e-01],
-       [3.86520000e+00, 7.20941000e+15, 6.95184371e-01],
-       [3.91230000e+00, 6.39146000e+15, 7.76425875e-01],
-       [3.95940000e+00, 5.34934000e+15, 9.15377008e-01],
-       [4.00660000e+00, 4.24522000e+15, 1.13579512e+00],
-       [4.05370000e+00, 3.03319000e+15, 1.56027087e+00],
-       [4.10080000e+00, 2.17871000e+15, 2.13894688e+00],
-       [4.14800000e+00, 1.75631000e+15, 2.63087370e+00],
-       [4.19510000e+00, 1.49005000e+15, 3.08247810e+00],
-       [4.24220000e+00, 1.32160000e+15, 3.46178427e+00],
-       [4.28940000e+00, 1.20893000e+15, 3.77398352e+00],
-       [4.33650000e+00, 1.12798000e+15, 4.03552461e+00],
-       [4.38370000e+00, 1.07870000e+15, 4.21405306e+00],
-       [4.43080000e+00, 1.05999000e+15, 4.28647209e+00],
-       [4.47790000e+00, 1.05051000e+15, 4.32414253e+00],
-       [4.52510000e+00, 1.04112000e+15, 4.36113971e+00],
-       [4.57220000e+00, 1.02683000e+15, 4.41977336e+00],
-       [4.61930000e+00, 1.01251000e+15, 4.48125853e+00],
-       [4.66650000e+00, 9.98619000e+14, 4.54150713e+00],
-       [4.71360000e+00, 9.85372000e+14, 4.60150608e+00],
-       [4.76070000e+00, 9.71852000e+14, 4.66337135e+00],
-       [4.80790000e+00, 9.58297000e+14, 4.72715671e+00],
-       [4.85500000e+00, 9.42975000e+14, 4.80175503e+00],
-       [4.90220000e+00, 9.18121000e+14, 4.92719783e+00],
-       [4.94930000e+00, 8.88792000e+14, 5.08627690e+00],
-       [4.99640000e+00, 8.59211000e+14, 5.25654032e+00],
-       [5.04360000e+00, 8.24518000e+14, 5.47141933e+00],
-       [5.09070000e+00, 7.86321000e+14, 5.73059874e+00],
-       [5.13780000e+00, 7.45075000e+14, 6.03948629e+00],
-       [5.18500000e+00, 6.93905000e+14, 6.47291643e+00],
-       [5.23210000e+00, 6.37236000e+14, 7.03396171e+00],
-       [5.27920000e+00, 5.80230000e+14, 7.70725982e+00],
-       [5.32640000e+00, 5.22035000e+14, 8.54673031e+00],
-       [5.37350000e+00, 4.60681000e+14, 9.65606098e+00],
-       [5.42070000e+00, 3.99393000e+14, 1.11045253e+01],
-       [5.46780000e+00, 3.40957000e+14, 1.29658203e+01],
-       [5.51490000e+00, 2.85825000e+14, 1.54134550e+01],
-       [5.56210000e+00, 2.33668000e+14, 1.87845156e+01],
-       [5.60920000e+00, 1.88712000e+14, 2.31686111e+01],
-       [5.65630000e+00, 1.53709000e+14, 2.83530641e+01],
-       [5.70350000e+00, 1.26125000e+14, 3.44349931e+01],
-       [5.75060000e+00, 1.04112000e+14, 4.15910611e+01],
-       [5.79770000e+00, 8.70563000e+13, 4.96020927e+01],
-       [5.84490000e+00, 7.39605000e+13, 5.82371348e+01],
-       [5.89200000e+00, 6.47739000e+13, 6.63743070e+01],
-       [5.93910000e+00, 5.92107000e+13, 7.25103498e+01],
-       [5.98630000e+00, 5.58856000e+13, 7.67714954e+01],
-       [6.03340000e+00, 5.38146000e+13, 7.96892978e+01],
-       [6.08060000e+00, 5.27716000e+13, 8.12269227e+01],
-       [6.12770000e+00, 5.26623000e+13, 8.13954259e+01],
-       [6.17480000e+00, 5.31007000e+13, 8.07420924e+01],
-       [6.22200000e+00, 5.39386000e+13, 7.95060175e+01],
-       [6.26910000e+00, 5.55520000e+13, 7.72324835e+01],
-       [6.31620000e+00, 5.82371000e+13, 7.37224908e+01],
-       [6.36340000e+00, 6.14611000e+13, 6.99036737e+01],
-       [6.41050000e+00, 6.52229000e+13, 6.59325693e+01],
-       [6.45760000e+00, 6.96947000e+13, 6.17589637e+01],
-       [6.50480000e+00, 7.47825000e+13, 5.76235486e+01],
-       [6.55190000e+00, 8.03526000e+13, 5.36784541e+01],
-       [6.59910000e+00, 8.66762000e+13, 4.98195729e+01],
-       [6.64620000e+00, 9.40373000e+13, 4.59726989e+01],
-       [6.69330000e+00, 1.02259000e+14, 4.23350425e+01],
-       [6.74050000e+00, 1.11429000e+14, 3.89045145e+01],
-       [6.78760000e+00, 1.21703000e+14, 3.56615323e+01],
-       [6.83470000e+00, 1.33260000e+14, 3.26212050e+01],
-       [6.88190000e+00, 1.46016000e+14, 2.98194755e+01],
-       [6.92900000e+00, 1.59882000e+14, 2.72709332e+01],
-       [6.97610000e+00, 1.74824000e+14, 2.49804352e+01],
-       [7.02330000e+00, 1.90941000e+14, 2.29034022e+01],
-       [7.07040000e+00, 2.08593000e+14, 2.09990670e+01],
-       [7.11760000e+00, 2.27091000e+14, 1.93196832e+01],
-       [7.16470000e+00, 2.45471000e+14, 1.78978144e+01],
-       [7.21180000e+00, 2.63451000e+14, 1.66993666e+01],
-       [7.25900000e+00, 2.80543000e+14, 1.57000126e+01],
-       [7.30610000e+00, 2.95393000e+14, 1.49245072e+01],
-       [7.35320000e+00, 3.07539000e+14, 1.43449818e+01],
-       [7.40040000e+00, 3.17468000e+14, 1.39059287e+01],
-       [7.44750000e+00, 3.26588000e+14, 1.35269536e+01],
-       [7.49460000e+00, 3.34349000e+14, 1.32159991e+01],
-       [7.54180000e+00, 3.39938000e+14, 1.30046899e+01],
-       [7.58890000e+00, 3.43954000e+14, 1.28558264e+01],
-       [7.63600000e+00, 3.47536000e+14, 1.27262368e+01],
-       [7.68320000e+00, 3.50106000e+14, 1.26328110e+01],
-       [7.73030000e+00, 3.51318000e+14, 1.25921532e+01],
-       [7.77750000e+00, 3.51641000e+14, 1.25805608e+01],
-       [7.82460000e+00, 3.51803000e+14, 1.25747685e+01],
-       [7.87170000e+00, 3.51641000e+14, 1.25776643e+01],
-       [7.91890000e+00, 3.51318000e+14, 1.25921532e+01],
-       [7.96600000e+00, 3.50429000e+14, 1.26211811e+01],
-       [8.01310000e+00, 3.49462000e+14, 1.26561030e+01],
-       [8.06030000e+00, 3.48739000e+14, 1.26823578e+01],
-       [8.10740000e+00, 3.48739000e+14, 1.26823578e+01],
-       [8.15450000e+00, 3.49623000e+14, 1.26531891e+01],
-       [8.20170000e+00, 3.51803000e+14, 1.25747685e+01],
-       [8.24880000e+00, 3.54324000e+14, 1.24853293e+01]])
-
-
-
-data_c_pcs1 = np.array([[0.00000000e+00, 1.35863000e+20, 8.67761000e-04],
-       [1.06000000e-01, 1.29897000e+20, 9.06358000e-04],
-       [2.12000000e-01, 1.27732000e+20, 9.21086000e-04],
-       [3.18000000e-01, 1.28499000e+20, 9.15799000e-04],
-       [4.24000000e-01, 1.27262000e+20, 9.24485000e-04],
-       [5.29900000e-01, 1.18359000e+20, 9.91517000e-04],
-       [6.35900000e-01, 9.84918000e+19, 1.18276900e-03],
-       [7.41900000e-01, 7.98362000e+19, 1.44477400e-03],
-       [8.47900000e-01, 6.73442000e+19, 1.69629000e-03],
-       [9.53900000e-01, 5.68853000e+19, 1.98563800e-03],
-       [1.05990000e+00, 4.82725000e+19, 2.31046800e-03],
-       [1.16590000e+00, 4.16582000e+19, 2.64301700e-03],
-       [1.27190000e+00, 3.83796000e+19, 2.84642700e-03],
-       [1.37780000e+00, 3.47856000e+19, 3.10885200e-03],
-       [1.48380000e+00, 2.92079000e+19, 3.62994500e-03],
-       [1.58980000e+00, 2.37028000e+19, 4.35211100e-03],
-       [1.69580000e+00, 1.92486000e+19, 5.19517300e-03],
-       [1.80180000e+00, 1.45345000e+19, 6.55088500e-03],
-       [1.90780000e+00, 1.03777000e+19, 8.56446000e-03],
-       [2.01380000e+00, 6.77954000e+18, 1.18331400e-02],
-       [2.11980000e+00, 4.01698000e+18, 1.72385210e-02],
-       [2.22570000e+00, 2.65583000e+18, 2.28875870e-02],
-       [2.33170000e+00, 2.10281000e+18, 2.67546950e-02],
-       [2.43770000e+00, 1.76076000e+18, 3.00746100e-02],
-       [2.54370000e+00, 1.56099000e+18, 3.25386850e-02],
-       [2.64970000e+00, 1.39091000e+18, 3.50751870e-02],
-       [2.75570000e+00, 1.15027000e+18, 3.96643190e-02],
-       [2.86170000e+00, 9.31108000e+17, 4.54569190e-02],
-       [2.96770000e+00, 7.50240000e+17, 5.22275920e-02],
-       [3.07370000e+00, 5.83848000e+17, 6.13762010e-02],
-       [3.17960000e+00, 4.25207000e+17, 7.53876140e-02],
-       [3.28560000e+00, 2.89668000e+17, 9.70286520e-02],
-       [3.39160000e+00, 1.88191000e+17, 1.29927176e-01],
-       [3.49760000e+00, 1.40314000e+17, 1.59477713e-01],
-       [3.60360000e+00, 1.21339000e+17, 1.76929398e-01],
-       [3.70960000e+00, 1.12720000e+17, 1.86594999e-01],
-       [3.81560000e+00, 1.06316000e+17, 1.94760105e-01],
-       [3.92160000e+00, 1.02235000e+17, 2.00401053e-01],
-       [4.02750000e+00, 1.01251000e+17, 2.01836636e-01],
-       [4.13350000e+00, 1.04208000e+17, 1.97605942e-01],
-       [4.23950000e+00, 1.07994000e+17, 1.92486378e-01],
-       [4.34550000e+00, 1.09270000e+17, 1.90897394e-01],
-       [4.45150000e+00, 1.07746000e+17, 1.92841278e-01],
-       [4.55750000e+00, 9.57414000e+16, 2.10329408e-01],
-       [4.66350000e+00, 7.92501000e+16, 2.42270201e-01],
-       [4.76950000e+00, 6.09958000e+16, 2.96346635e-01],
-       [4.87550000e+00, 3.70169000e+16, 4.43302316e-01],
-       [4.98140000e+00, 2.29298000e+16, 6.67267542e-01],
-       [5.08740000e+00, 1.69317000e+16, 8.73775775e-01],
-       [5.19340000e+00, 1.39380000e+16, 1.04255746e+00],
-       [5.29940000e+00, 1.27057000e+16, 1.13501082e+00],
-       [5.40540000e+00, 1.23055000e+16, 1.16896094e+00],
-       [5.51140000e+00, 1.21199000e+16, 1.18549575e+00],
-       [5.61740000e+00, 1.20393000e+16, 1.19288891e+00],
-       [5.72340000e+00, 1.19207000e+16, 1.20392657e+00],
-       [5.82930000e+00, 1.17733000e+16, 1.21786738e+00],
-       [5.93530000e+00, 1.17355000e+16, 1.22151836e+00],
-       [6.04130000e+00, 1.18932000e+16, 1.20670191e+00],
-       [6.14730000e+00, 1.22603000e+16, 1.17300537e+00],
-       [6.25330000e+00, 1.21535000e+16, 1.18276918e+00],
-       [6.35930000e+00, 1.18905000e+16, 1.20670191e+00],
-       [6.46530000e+00, 1.24022000e+16, 1.16064659e+00],
-       [6.57130000e+00, 1.36930000e+16, 1.05974164e+00],
-       [6.67720000e+00, 1.16681000e+16, 1.22800462e+00],
-       [6.78320000e+00, 7.08925000e+15, 1.96290825e+00],
-       [6.88920000e+00, 3.62577000e+15, 3.75145724e+00],
-       [6.99520000e+00, 1.55561000e+15, 8.62779863e+00],
-       [7.10120000e+00, 1.06733000e+15, 1.25371840e+01],
-       [7.20720000e+00, 9.54113000e+14, 1.40152226e+01],
-       [7.31320000e+00, 9.41456000e+14, 1.42003811e+01],
-       [7.41920000e+00, 9.32610000e+14, 1.43350760e+01],
-       [7.52520000e+00, 9.24911000e+14, 1.44510698e+01],
-       [7.63110000e+00, 9.21722000e+14, 1.45044077e+01],
-       [7.73710000e+00, 9.26403000e+14, 1.44311187e+01],
-       [7.84310000e+00, 9.39723000e+14, 1.42265633e+01],
-       [7.94910000e+00, 9.56753000e+14, 1.39765506e+01],
-       [8.05510000e+00, 9.72747000e+14, 1.37467489e+01],
-       [8.16110000e+00, 9.82200000e+14, 1.36144468e+01],
-       [8.26710000e+00, 9.81974000e+14, 1.36175820e+01],
-       [8.37310000e+00, 9.76338000e+14, 1.36961972e+01],
-       [8.47900000e+00, 9.69840000e+14, 1.37879595e+01],
-       [8.58500000e+00, 9.67386000e+14, 1.38229265e+01],
-       [8.69100000e+00, 9.69617000e+14, 1.37911347e+01],
-       [8.79700000e+00, 9.73419000e+14, 1.37372563e+01],
-       [8.90300000e+00, 9.77462000e+14, 1.36804379e+01],
-       [9.00900000e+00, 9.80393000e+14, 1.36395487e+01],
-       [9.11500000e+00, 9.81070000e+14, 1.36301301e+01],
-       [9.22100000e+00, 9.79039000e+14, 1.36615508e+01],
-       [9.32690000e+00, 9.74990000e+14, 1.37151323e+01],
-       [9.43290000e+00, 9.70510000e+14, 1.37784384e+01],
-       [9.53890000e+00, 9.53894000e+14, 1.40152226e+01],
-       [9.64490000e+00, 9.18544000e+14, 1.45545908e+01],
-       [9.75090000e+00, 8.71565000e+14, 1.53320420e+01],
-       [9.85690000e+00, 8.20540000e+14, 1.62817094e+01],
-       [9.96290000e+00, 7.47137000e+14, 1.78731047e+01],
-       [1.00689000e+01, 6.53883000e+14, 2.04126787e+01],
-       [1.01749000e+01, 5.67153000e+14, 2.35233949e+01],
-       [1.02808000e+01, 5.00150000e+14, 2.66624467e+01],
-       [1.03868000e+01, 4.70760000e+14, 2.83269620e+01],
-       [1.04928000e+01, 4.60999000e+14, 2.89201140e+01],
-       [1.05988000e+01, 4.58670000e+14, 2.90669859e+01],
-       [1.07048000e+01, 4.65801000e+14, 2.86220015e+01],
-       [1.08108000e+01, 5.23842000e+14, 2.54624389e+01],
-       [1.09168000e+01, 6.74683000e+14, 1.97833575e+01],
-       [1.10228000e+01, 9.86279000e+14, 1.35581364e+01],
-       [1.11287000e+01, 1.56315000e+15, 8.58618022e+00],
-       [1.12347000e+01, 3.20922000e+15, 4.22668614e+00],
-       [1.13407000e+01, 6.78110000e+15, 2.04785876e+00],
-       [1.14467000e+01, 1.67842000e+16, 8.80643228e-01],
-       [1.15527000e+01, 5.28810000e+16, 3.31665272e-01],
-       [1.16587000e+01, 2.41991000e+17, 1.09446027e-01],
-       [1.17647000e+01, 8.67761000e+17, 4.75663690e-02],
-       [1.18707000e+01, 1.69434000e+18, 3.08460810e-02],
-       [1.19767000e+01, 2.64606000e+18, 2.29456310e-02],
-       [1.20826000e+01, 3.46418000e+18, 1.90985330e-02],
-       [1.21886000e+01, 4.15336000e+18, 1.68383680e-02],
-       [1.22946000e+01, 4.30824000e+18, 1.64096760e-02],
-       [1.24006000e+01, 4.35412000e+18, 1.62892090e-02],
-       [1.25066000e+01, 4.39238000e+18, 1.61882540e-02],
-       [1.26126000e+01, 4.41774000e+18, 1.61212980e-02],
-       [1.27186000e+01, 4.43404000e+18, 1.60805170e-02],
-       [1.28246000e+01, 4.45143000e+18, 1.60361460e-02],
-       [1.29305000e+01, 4.46786000e+18, 1.59955800e-02],
-       [1.30365000e+01, 4.48436000e+18, 1.59551170e-02],
-       [1.31425000e+01, 4.49987000e+18, 1.59147570e-02],
-       [1.32485000e+01, 4.51544000e+18, 1.58744980e-02],
-       [1.33545000e+01, 4.53106000e+18, 1.58379880e-02],
-       [1.34605000e+01, 4.53211000e+18, 1.58343410e-02],
-       [1.35665000e+01, 4.51440000e+18, 1.58781540e-02],
-       [1.36725000e+01, 4.50091000e+18, 1.59110920e-02],
-       [1.37784000e+01, 4.51440000e+18, 1.58781540e-02],
-       [1.38844000e+01, 4.57826000e+18, 1.57217180e-02],
-       [1.39904000e+01, 4.65586000e+18, 1.55345970e-02],
-       [1.40964000e+01, 4.69894000e+18, 1.54347640e-02],
-       [1.42024000e+01, 4.70219000e+18, 1.54276580e-02],
-       [1.43084000e+01, 4.70002000e+18, 1.54312110e-02],
-       [1.44144000e+01, 4.70002000e+18, 1.54312110e-02],
-       [1.45204000e+01, 4.70327000e+18, 1.54241060e-02],
-       [1.46264000e+01, 4.70327000e+18, 1.54241060e-02],
-       [1.47323000e+01, 4.70977000e+18, 1.54099060e-02],
-       [1.48383000e+01, 4.74133000e+18, 1.53355730e-02],
-       [1.49443000e+01, 4.79402000e+18, 1.52159820e-02],
-       [1.50503000e+01, 4.85289000e+18, 1.50834260e-02]])
-
-data_c_pcal = np.array([[0.00000000e+00, 2.30250000e+19, 4.46169600e-03],
-       [5.07000000e-02, 2.30675000e+19, 4.45451100e-03],
-       [1.01500000e-01, 2.43108000e+19, 4.25794500e-03],
-       [1.52200000e-01, 2.58821000e+19, 4.03366700e-03],
-       [2.02900000e-01, 2.66686000e+19, 3.93006700e-03],
-       [2.53700000e-01, 2.70085000e+19, 3.88687000e-03],
-       [3.04400000e-01, 2.77396000e+19, 3.79751900e-03],
-       [3.55200000e-01, 2.90001000e+19, 3.65258200e-03],
-       [4.05900000e-01, 2.99847000e+19, 3.54650000e-03],
-       [4.56600000e-01, 3.00469000e+19, 3.54078900e-03],
-       [5.07400000e-01, 2.90402000e+19, 3.64837900e-03],
-       [5.58100000e-01, 2.80027000e+19, 3.76617100e-03],
-       [6.08800000e-01, 2.84446000e+19, 3.71535200e-03],
-       [6.59600000e-01, 2.88868000e+19, 3.66522000e-03],
-       [7.10300000e-01, 2.72898000e+19, 3.85212200e-03],
-       [7.61000000e-01, 2.60495000e+19, 4.01051400e-03],
-       [8.11800000e-01, 2.70707000e+19, 3.87882300e-03],
-       [8.62500000e-01, 2.74726000e+19, 3.83001100e-03],
-       [9.13200000e-01, 2.76312000e+19, 3.81065800e-03],
-       [9.64000000e-01, 1.56315000e+19, 6.17305300e-03],
-       [1.01470000e+00, 6.15460000e+18, 1.27057410e-02],
-       [1.06550000e+00, 3.27718000e+18, 1.98426650e-02],
-       [1.11620000e+00, 2.16272000e+18, 2.62603190e-02],
-       [1.16690000e+00, 1.83612000e+18, 2.92549930e-02],
-       [1.21770000e+00, 1.78855000e+18, 2.97645970e-02],
-       [1.26840000e+00, 1.74783000e+18, 3.02203850e-02],
-       [1.31910000e+00, 1.71593000e+18, 3.05914460e-02],
-       [1.36990000e+00, 1.69473000e+18, 3.08389800e-02],
-       [1.42060000e+00, 1.68384000e+18, 3.09670620e-02],
-       [1.47130000e+00, 1.67919000e+18, 3.10241580e-02],
-       [1.52210000e+00, 1.67996000e+18, 3.10170150e-02],
-       [1.57280000e+00, 1.68267000e+18, 3.09813260e-02],
-       [1.62360000e+00, 1.68850000e+18, 3.09171890e-02],
-       [1.67430000e+00, 1.69981000e+18, 3.07751370e-02],
-       [1.72500000e+00, 1.70883000e+18, 3.06690270e-02],
-       [1.77580000e+00, 1.71475000e+18, 3.06055370e-02],
-       [1.82650000e+00, 1.71830000e+18, 3.05562460e-02],
-       [1.87720000e+00, 1.71633000e+18, 3.05844020e-02],
-       [1.92800000e+00, 1.70294000e+18, 3.07397270e-02],
-       [1.97870000e+00, 1.67880000e+18, 3.10313020e-02],
-       [2.02940000e+00, 1.64892000e+18, 3.13978560e-02],
-       [2.08020000e+00, 1.62256000e+18, 3.17321870e-02],
-       [2.13090000e+00, 1.60620000e+18, 3.19374330e-02],
-       [2.18170000e+00, 1.60103000e+18, 3.20036860e-02],
-       [2.23240000e+00, 1.60842000e+18, 3.19080310e-02],
-       [2.28310000e+00, 1.62293000e+18, 3.17248810e-02],
-       [2.33390000e+00, 1.60731000e+18, 3.19227280e-02],
-       [2.38460000e+00, 1.57979000e+18, 3.22849410e-02],
-       [2.43530000e+00, 1.57870000e+18, 3.22998120e-02],
-       [2.48610000e+00, 1.60325000e+18, 3.19742230e-02],
-       [2.53680000e+00, 1.64551000e+18, 3.14412640e-02],
-       [2.58750000e+00, 1.76644000e+18, 3.00123500e-02],
-       [2.63830000e+00, 1.88452000e+18, 2.87607360e-02],
-       [2.68900000e+00, 1.88191000e+18, 2.87872380e-02],
-       [2.73970000e+00, 1.68655000e+18, 3.09385530e-02],
-       [2.79050000e+00, 1.04568000e+18, 4.21793610e-02],
-       [2.84120000e+00, 5.80898000e+17, 6.15743730e-02],
-       [2.89200000e+00, 3.04439000e+17, 9.38858190e-02],
-       [2.94270000e+00, 1.88408000e+17, 1.29807564e-01],
-       [2.99340000e+00, 1.68694000e+17, 1.40119958e-01],
-       [3.04420000e+00, 1.63042000e+17, 1.43482852e-01],
-       [3.09490000e+00, 1.59809000e+17, 1.45512399e-01],
-       [3.14560000e+00, 1.58380000e+17, 1.46419864e-01],
-       [3.19640000e+00, 1.58198000e+17, 1.46554784e-01],
-       [3.24710000e+00, 1.58672000e+17, 1.46251389e-01],
-       [3.29780000e+00, 1.59148000e+17, 1.45915020e-01],
-       [3.34860000e+00, 1.59588000e+17, 1.45646482e-01],
-       [3.39930000e+00, 1.59993000e+17, 1.45378439e-01],
-       [3.45010000e+00, 1.60435000e+17, 1.45110888e-01],
-       [3.50080000e+00, 1.60509000e+17, 1.45077479e-01],
-       [3.55150000e+00, 1.60029000e+17, 1.45378439e-01],
-       [3.60230000e+00, 1.59478000e+17, 1.45713570e-01],
-       [3.65300000e+00, 1.59551000e+17, 1.45680023e-01],
-       [3.70370000e+00, 1.60177000e+17, 1.45278049e-01],
-       [3.75450000e+00, 1.61027000e+17, 1.44743810e-01],
-       [3.80520000e+00, 1.62592000e+17, 1.43780503e-01],
-       [3.85590000e+00, 1.63908000e+17, 1.42988134e-01],
-       [3.90670000e+00, 1.64172000e+17, 1.42823608e-01],
-       [3.95740000e+00, 1.64437000e+17, 1.42659271e-01],
-       [4.00810000e+00, 1.63983000e+17, 1.42922301e-01],
-       [4.05890000e+00, 1.63042000e+17, 1.43482852e-01],
-       [4.10960000e+00, 1.61771000e+17, 1.44277962e-01],
-       [4.16040000e+00, 1.59221000e+17, 1.45881426e-01],
-       [4.21110000e+00, 1.56603000e+17, 1.47604637e-01],
-       [4.26180000e+00, 1.55668000e+17, 1.48217676e-01],
-       [4.31260000e+00, 1.55096000e+17, 1.48593564e-01],
-       [4.36330000e+00, 1.54739000e+17, 1.48833262e-01],
-       [4.41400000e+00, 1.50591000e+17, 1.51705037e-01],
-       [4.46480000e+00, 1.42955000e+17, 1.57398286e-01],
-       [4.51550000e+00, 1.42626000e+17, 1.57652187e-01],
-       [4.56620000e+00, 1.60140000e+17, 1.45311505e-01],
-       [4.61700000e+00, 1.66418000e+17, 1.41481612e-01],
-       [4.66770000e+00, 1.44911000e+17, 1.55883447e-01],
-       [4.71850000e+00, 1.20754000e+17, 1.77541547e-01],
-       [4.76920000e+00, 9.44496000e+16, 2.12422248e-01],
-       [4.81990000e+00, 6.24741000e+16, 2.90870716e-01],
-       [4.87070000e+00, 3.25387000e+16, 4.93855620e-01],
-       [4.92140000e+00, 2.00956000e+16, 7.49548950e-01],
-       [4.97210000e+00, 1.57652000e+16, 9.31751284e-01],
-       [5.02290000e+00, 1.48252000e+16, 9.85371507e-01],
-       [5.07360000e+00, 1.53922000e+16, 9.52357486e-01],
-       [5.12430000e+00, 1.63606000e+16, 9.01156044e-01],
-       [5.17510000e+00, 1.62592000e+16, 9.06149802e-01],
-       [5.22580000e+00, 1.59845000e+16, 9.20237655e-01],
-       [5.27660000e+00, 1.57398000e+16, 9.33254301e-01],
-       [5.32730000e+00, 1.54632000e+16, 9.48418463e-01],
-       [5.37800000e+00, 1.52335000e+16, 9.61390884e-01],
-       [5.42880000e+00, 1.50904000e+16, 9.69616506e-01],
-       [5.47950000e+00, 1.50730000e+16, 9.70509967e-01],
-       [5.53020000e+00, 1.50765000e+16, 9.70509967e-01],
-       [5.58100000e+00, 1.51252000e+16, 9.67609225e-01],
-       [5.63170000e+00, 1.53356000e+16, 9.55432478e-01],
-       [5.68240000e+00, 1.55274000e+16, 9.44713236e-01],
-       [5.73320000e+00, 1.54989000e+16, 9.46237161e-01],
-       [5.78390000e+00, 1.53780000e+16, 9.53235044e-01],
-       [5.83460000e+00, 1.51950000e+16, 9.63607119e-01],
-       [5.88540000e+00, 1.49589000e+16, 9.77462264e-01],
-       [5.93610000e+00, 1.47979000e+16, 9.86961019e-01],
-       [5.98690000e+00, 1.45881000e+16, 1.00000000e+00],
-       [6.03760000e+00, 1.44777000e+16, 1.00693167e+00],
-       [6.08830000e+00, 1.47299000e+16, 9.91288345e-01],
-       [6.13910000e+00, 1.47809000e+16, 9.88097954e-01],
-       [6.18980000e+00, 1.47197000e+16, 9.91744955e-01],
-       [6.24050000e+00, 1.48491000e+16, 9.84011106e-01],
-       [6.29130000e+00, 1.45982000e+16, 9.99309463e-01],
-       [6.34200000e+00, 1.40314000e+16, 1.03609601e+00],
-       [6.39270000e+00, 1.36553000e+16, 1.06218460e+00],
-       [6.44350000e+00, 1.31735000e+16, 1.09774129e+00],
-       [6.49420000e+00, 1.22518000e+16, 1.17381593e+00],
-       [6.54500000e+00, 1.22405000e+16, 1.17489756e+00],
-       [6.59570000e+00, 1.41710000e+16, 1.02683343e+00],
-       [6.64640000e+00, 1.24652000e+16, 1.15504791e+00],
-       [6.69720000e+00, 5.60531000e+15, 2.45810256e+00],
-       [6.74790000e+00, 2.05069000e+15, 6.56447502e+00],
-       [6.79860000e+00, 1.19840000e+15, 1.11737770e+01],
-       [6.84940000e+00, 9.49074000e+14, 1.40863995e+01],
-       [6.90010000e+00, 8.37915000e+14, 1.59477713e+01],
-       [6.95080000e+00, 7.88315000e+14, 1.69433780e+01],
-       [7.00160000e+00, 7.75354000e+14, 1.72266171e+01],
-       [7.05230000e+00, 7.78574000e+14, 1.71553665e+01],
-       [7.10300000e+00, 7.84513000e+14, 1.70255049e+01],
-       [7.15380000e+00, 7.88678000e+14, 1.69355771e+01],
-       [7.20450000e+00, 7.86683000e+14, 1.69785266e+01],
-       [7.25530000e+00, 7.82168000e+14, 1.70765447e+01],
-       [7.30600000e+00, 7.77857000e+14, 1.71711744e+01],
-       [7.35670000e+00, 7.76068000e+14, 1.72107581e+01],
-       [7.40750000e+00, 7.76426000e+14, 1.72028341e+01],
-       [7.45820000e+00, 7.77141000e+14, 1.71869970e+01],
-       [7.50890000e+00, 7.78216000e+14, 1.71632686e+01],
-       [7.55970000e+00, 7.79651000e+14, 1.71316818e+01],
-       [7.61040000e+00, 7.81628000e+14, 1.70883449e+01],
-       [7.66110000e+00, 7.84152000e+14, 1.70333472e+01],
-       [7.71190000e+00, 7.86865000e+14, 1.69746176e+01],
-       [7.76260000e+00, 7.89223000e+14, 1.69277798e+01],
-       [7.81340000e+00, 7.90861000e+14, 1.68888470e+01],
-       [7.86410000e+00, 7.91589000e+14, 1.68732989e+01],
-       [7.91480000e+00, 7.91043000e+14, 1.68888470e+01],
-       [7.96560000e+00, 7.88678000e+14, 1.69355771e+01],
-       [8.01630000e+00, 7.85055000e+14, 1.70137482e+01],
-       [8.06700000e+00, 7.80369000e+14, 1.71119696e+01],
-       [8.11780000e+00, 7.75532000e+14, 1.72226510e+01],
-       [8.16850000e+00, 7.70903000e+14, 1.73260674e+01],
-       [8.21920000e+00, 7.66479000e+14, 1.74260919e+01],
-       [8.27000000e+00, 7.61904000e+14, 1.75266938e+01],
-       [8.32070000e+00, 7.57879000e+14, 1.76238180e+01],
-       [8.37150000e+00, 7.54050000e+14, 1.77092431e+01],
-       [8.42220000e+00, 7.52315000e+14, 1.77541547e+01],
-       [8.47290000e+00, 7.53009000e+14, 1.77337263e+01],
-       [8.52370000e+00, 7.55788000e+14, 1.76685130e+01],
-       [8.57440000e+00, 7.59801000e+14, 1.75792361e+01],
-       [8.62510000e+00, 7.64892000e+14, 1.74582215e+01],
-       [8.67590000e+00, 7.71259000e+14, 1.73141031e+01],
-       [8.72660000e+00, 7.78037000e+14, 1.71672211e+01],
-       [8.77730000e+00, 7.84332000e+14, 1.70294256e+01],
-       [8.82810000e+00, 7.90679000e+14, 1.68927362e+01],
-       [8.87880000e+00, 7.97076000e+14, 1.67571439e+01],
-       [8.92950000e+00, 8.01863000e+14, 1.66571233e+01],
-       [8.98030000e+00, 8.02971000e+14, 1.66341265e+01],
-       [9.03100000e+00, 8.01309000e+14, 1.66686336e+01],
-       [9.08180000e+00, 7.99466000e+14, 1.67070588e+01],
-       [9.13250000e+00, 7.97444000e+14, 1.67494288e+01],
-       [9.18320000e+00, 7.95426000e+14, 1.67919062e+01],
-       [9.23400000e+00, 7.93597000e+14, 1.68306156e+01],
-       [9.28470000e+00, 7.91589000e+14, 1.68732989e+01],
-       [9.33540000e+00, 7.89587000e+14, 1.69160905e+01],
-       [9.38620000e+00, 7.87590000e+14, 1.69589906e+01],
-       [9.43690000e+00, 7.86140000e+14, 1.69902590e+01],
-       [9.48760000e+00, 7.85597000e+14, 1.70019995e+01],
-       [9.53840000e+00, 7.85236000e+14, 1.70098310e+01],
-       [9.58910000e+00, 7.85055000e+14, 1.70137482e+01],
-       [9.63990000e+00, 7.85055000e+14, 1.70137482e+01],
-       [9.69060000e+00, 7.85597000e+14, 1.70019995e+01],
-       [9.74130000e+00, 7.86865000e+14, 1.69746176e+01],
-       [9.79210000e+00, 7.88860000e+14, 1.69316780e+01],
-       [9.84280000e+00, 7.93597000e+14, 1.68344914e+01],
-       [9.89350000e+00, 8.01124000e+14, 1.66763116e+01],
-       [9.94430000e+00, 8.09841000e+14, 1.64968110e+01],
-       [9.99500000e+00, 8.17900000e+14, 1.63342802e+01],
-       [1.00457000e+01, 8.26228000e+14, 1.61696269e+01],
-       [1.00965000e+01, 8.35218000e+14, 1.59992638e+01],
-       [1.01472000e+01, 8.41008000e+14, 1.58891257e+01],
-       [1.01979000e+01, 8.39653000e+14, 1.59110925e+01],
-       [1.02487000e+01, 8.33681000e+14, 1.60287627e+01],
-       [1.02994000e+01, 8.27942000e+14, 1.61361529e+01]])
-
-data_c_ncal = np.array([[0.00000000e+00, 1.51845000e+19, 4.19662300e-03],
-       [4.24000000e-02, 1.52440000e+19, 4.18311700e-03],
-       [8.48000000e-02, 1.53250000e+19, 4.16389700e-03],
-       [1.27200000e-01, 1.54241000e+19, 4.14190400e-03],
-       [1.69600000e-01, 1.55203000e+19, 4.12002600e-03],
-       [2.12000000e-01, 1.56171000e+19, 4.09920800e-03],
-       [2.54400000e-01, 1.57145000e+19, 4.07755700e-03],
-       [2.96800000e-01, 1.57725000e+19, 4.06536900e-03],
-       [3.39200000e-01, 1.57652000e+19, 4.06724200e-03],
-       [3.81600000e-01, 1.57072000e+19, 4.07943500e-03],
-       [4.24000000e-01, 1.56171000e+19, 4.09920800e-03],
-       [4.66400000e-01, 1.55239000e+19, 4.11907800e-03],
-       [5.08800000e-01, 1.54383000e+19, 4.13904400e-03],
-       [5.51200000e-01, 1.53462000e+19, 4.16006400e-03],
-       [5.93600000e-01, 1.52511000e+19, 4.18119100e-03],
-       [6.36000000e-01, 1.51845000e+19, 4.19662300e-03],
-       [6.78400000e-01, 1.51530000e+19, 4.20436100e-03],
-       [7.20800000e-01, 1.51461000e+19, 4.20532900e-03],
-       [7.63200000e-01, 1.51635000e+19, 4.20145800e-03],
-       [8.05600000e-01, 1.51391000e+19, 4.20726600e-03],
-       [8.48000000e-01, 1.50453000e+19, 4.22863300e-03],
-       [8.90400000e-01, 1.49279000e+19, 4.25598400e-03],
-       [9.32800000e-01, 1.48081000e+19, 4.28548500e-03],
-       [9.75200000e-01, 1.47163000e+19, 4.30724900e-03],
-       [1.01760000e+00, 1.46656000e+19, 4.31916700e-03],
-       [1.06000000e+00, 1.46352000e+19, 4.32713100e-03],
-       [1.10240000e+00, 1.45881000e+19, 4.33810400e-03],
-       [1.14480000e+00, 1.44344000e+19, 4.37723600e-03],
-       [1.18720000e+00, 1.43021000e+19, 4.40960800e-03],
-       [1.22960000e+00, 1.44644000e+19, 4.36918100e-03],
-       [1.27200000e+00, 1.51321000e+19, 4.20823500e-03],
-       [1.31440000e+00, 1.55597000e+19, 4.11149700e-03],
-       [1.35680000e+00, 1.46251000e+19, 4.33012100e-03],
-       [1.39920000e+00, 1.26009000e+19, 4.88652400e-03],
-       [1.44160000e+00, 1.01485000e+19, 5.77963000e-03],
-       [1.48400000e+00, 7.84152000e+18, 6.97429000e-03],
-       [1.52640000e+00, 5.75572000e+18, 8.59805100e-03],
-       [1.56880000e+00, 3.97832000e+18, 1.08243040e-02],
-       [1.61120000e+00, 2.70520000e+18, 1.35331840e-02],
-       [1.65360000e+00, 1.99710000e+18, 1.59955800e-02],
-       [1.69600000e+00, 1.79184000e+18, 1.69550860e-02],
-       [1.73840000e+00, 1.76238000e+18, 1.71080300e-02],
-       [1.78080000e+00, 1.75995000e+18, 1.71198520e-02],
-       [1.82320000e+00, 1.77092000e+18, 1.70647530e-02],
-       [1.86560000e+00, 1.78033000e+18, 1.70176660e-02],
-       [1.90800000e+00, 1.76848000e+18, 1.70765450e-02],
-       [1.95040000e+00, 1.75590000e+18, 1.71435200e-02],
-       [1.99280000e+00, 1.74462000e+18, 1.72028340e-02],
-       [2.03520000e+00, 1.73420000e+18, 1.72583790e-02],
-       [2.07760000e+00, 1.72584000e+18, 1.73021470e-02],
-       [2.12000000e+00, 1.71870000e+18, 1.73380400e-02],
-       [2.16240000e+00, 1.71080000e+18, 1.73820100e-02],
-       [2.20480000e+00, 1.69473000e+18, 1.74702850e-02],
-       [2.24720000e+00, 1.67109000e+18, 1.76035400e-02],
-       [2.28960000e+00, 1.64172000e+18, 1.77664230e-02],
-       [2.33200000e+00, 1.61027000e+18, 1.79514690e-02],
-       [2.37440000e+00, 1.57870000e+18, 1.81426200e-02],
-       [2.41680000e+00, 1.54953000e+18, 1.83231440e-02],
-       [2.45920000e+00, 1.52125000e+18, 1.85012040e-02],
-       [2.50160000e+00, 1.49451000e+18, 1.86766940e-02],
-       [2.54400000e+00, 1.46825000e+18, 1.88538480e-02],
-       [2.58640000e+00, 1.43483000e+18, 1.90809500e-02],
-       [2.62880000e+00, 1.39508000e+18, 1.93686790e-02],
-       [2.67120000e+00, 1.35176000e+18, 1.96924610e-02],
-       [2.71360000e+00, 1.30497000e+18, 2.00585710e-02],
-       [2.75600000e+00, 1.25285000e+18, 2.04927390e-02],
-       [2.79840000e+00, 1.19564000e+18, 2.09990670e-02],
-       [2.84080000e+00, 1.13240000e+18, 2.16023000e-02],
-       [2.88320000e+00, 1.06611000e+18, 2.22946160e-02],
-       [2.92560000e+00, 9.98619000e+17, 2.30674720e-02],
-       [2.96800000e+00, 9.29180000e+17, 2.39496960e-02],
-       [3.01040000e+00, 8.58223000e+17, 2.49689340e-02],
-       [3.05280000e+00, 7.88134000e+17, 2.61035760e-02],
-       [3.09520000e+00, 7.20775000e+17, 2.73463900e-02],
-       [3.13760000e+00, 6.57052000e+17, 2.87078060e-02],
-       [3.18000000e+00, 5.97448000e+17, 3.01786630e-02],
-       [3.22240000e+00, 5.38022000e+17, 3.18933400e-02],
-       [3.26480000e+00, 4.75007000e+17, 3.40878810e-02],
-       [3.30720000e+00, 4.04203000e+17, 3.71791970e-02],
-       [3.34960000e+00, 3.36744000e+17, 4.10771210e-02],
-       [3.39200000e+00, 2.83204000e+17, 4.52376460e-02],
-       [3.43440000e+00, 2.40104000e+17, 4.96821060e-02],
-       [3.47680000e+00, 2.06063000e+17, 5.42875200e-02],
-       [3.51920000e+00, 1.83696000e+17, 5.80898160e-02],
-       [3.56160000e+00, 1.71435000e+17, 6.05480280e-02],
-       [3.60400000e+00, 1.64248000e+17, 6.21441140e-02],
-       [3.64640000e+00, 1.58635000e+17, 6.34599900e-02],
-       [3.68880000e+00, 1.54775000e+17, 6.44169270e-02],
-       [3.73120000e+00, 1.53038000e+17, 6.48783800e-02],
-       [3.77360000e+00, 1.52686000e+17, 6.49531170e-02],
-       [3.81600000e+00, 1.52651000e+17, 6.49680750e-02],
-       [3.85840000e+00, 1.51985000e+17, 6.51478370e-02],
-       [3.90080000e+00, 1.51112000e+17, 6.53732390e-02],
-       [3.94320000e+00, 1.49417000e+17, 6.58263840e-02],
-       [3.98560000e+00, 1.46859000e+17, 6.65426360e-02],
-       [4.02800000e+00, 1.44145000e+17, 6.72976660e-02],
-       [4.07040000e+00, 1.41579000e+17, 6.80612620e-02],
-       [4.11280000e+00, 1.39284000e+17, 6.87543210e-02],
-       [4.15520000e+00, 1.37246000e+17, 6.93745210e-02],
-       [4.19760000e+00, 1.35457000e+17, 6.99519780e-02],
-       [4.24000000e+00, 1.33444000e+17, 7.06154940e-02],
-       [4.28240000e+00, 1.31280000e+17, 7.13345620e-02],
-       [4.32480000e+00, 1.29181000e+17, 7.20609530e-02],
-       [4.36720000e+00, 1.26707000e+17, 7.29457510e-02],
-       [4.40960000e+00, 1.23424000e+17, 7.41651710e-02],
-       [4.45200000e+00, 1.19179000e+17, 7.58402930e-02],
-       [4.49440000e+00, 1.14657000e+17, 7.77320280e-02],
-       [4.53680000e+00, 1.10255000e+17, 7.97260050e-02],
-       [4.57920000e+00, 1.06194000e+17, 8.16770420e-02],
-       [4.62160000e+00, 1.02612000e+17, 8.35218300e-02],
-       [4.66400000e+00, 9.94260000e+16, 8.52707340e-02],
-       [4.70640000e+00, 9.65162000e+16, 8.69560890e-02],
-       [4.74880000e+00, 9.36268000e+16, 8.87156010e-02],
-       [4.79120000e+00, 8.99083000e+16, 9.11590940e-02],
-       [4.83360000e+00, 8.55855000e+16, 9.42106500e-02],
-       [4.87600000e+00, 8.11335000e+16, 9.76787290e-02],
-       [4.91840000e+00, 7.66655000e+16, 1.01531312e-01],
-       [4.96080000e+00, 7.21107000e+16, 1.05925373e-01],
-       [5.00320000e+00, 6.74217000e+16, 1.10994127e-01],
-       [5.04560000e+00, 6.25605000e+16, 1.17030753e-01],
-       [5.08800000e+00, 5.75307000e+16, 1.24251031e-01],
-       [5.13040000e+00, 5.22878000e+16, 1.33168038e-01],
-       [5.17280000e+00, 4.68490000e+16, 1.44410908e-01],
-       [5.21520000e+00, 4.15145000e+16, 1.58124804e-01],
-       [5.25760000e+00, 3.60413000e+16, 1.76238180e-01],
-       [5.30000000e+00, 3.08745000e+16, 1.98975681e-01],
-       [5.34240000e+00, 2.67609000e+16, 2.23048856e-01],
-       [5.38480000e+00, 2.36157000e+16, 2.46944865e-01],
-       [5.42720000e+00, 2.12178000e+16, 2.69836068e-01],
-       [5.46960000e+00, 1.94267000e+16, 2.90469141e-01],
-       [5.51200000e+00, 1.81635000e+16, 3.07397266e-01],
-       [5.55440000e+00, 1.73540000e+16, 3.19521436e-01],
-       [5.59680000e+00, 1.69044000e+16, 3.26738266e-01],
-       [5.63920000e+00, 1.68112000e+16, 3.28322012e-01],
-       [5.68160000e+00, 1.68267000e+16, 3.28019755e-01],
-       [5.72400000e+00, 1.65882000e+16, 3.32047336e-01],
-       [5.76640000e+00, 1.62967000e+16, 3.37132018e-01],
-       [5.80880000e+00, 1.60103000e+16, 3.42294562e-01],
-       [5.85120000e+00, 1.57181000e+16, 3.47776314e-01],
-       [5.89360000e+00, 1.54454000e+16, 3.53101856e-01],
-       [5.93600000e+00, 1.51845000e+16, 3.58261385e-01],
-       [5.97840000e+00, 1.49073000e+16, 3.63998840e-01],
-       [6.02080000e+00, 1.45781000e+16, 3.71107729e-01],
-       [6.06320000e+00, 1.42102000e+16, 3.79402336e-01],
-       [6.10560000e+00, 1.38516000e+16, 3.87882334e-01],
-       [6.14800000e+00, 1.35114000e+16, 3.96460569e-01],
-       [6.19040000e+00, 1.31826000e+16, 4.05041945e-01],
-       [6.23280000e+00, 1.28499000e+16, 4.14285754e-01],
-       [6.27520000e+00, 1.24796000e+16, 4.24912982e-01],
-       [6.31760000e+00, 1.21116000e+16, 4.36314856e-01],
-       [6.36000000e+00, 1.17842000e+16, 4.46992257e-01],
-       [6.40240000e+00, 1.14736000e+16, 4.57614735e-01],
-       [6.44480000e+00, 1.11455000e+16, 4.69461519e-01],
-       [6.48720000e+00, 1.08268000e+16, 4.81836838e-01],
-       [6.52960000e+00, 1.04064000e+16, 4.99114285e-01],
-       [6.57200000e+00, 9.85372000e+15, 5.23962252e-01],
-       [6.61440000e+00, 9.27897000e+15, 5.53095341e-01],
-       [6.65680000e+00, 8.62383000e+15, 5.90744926e-01],
-       [6.69920000e+00, 7.93232000e+15, 6.37235556e-01],
-       [6.74160000e+00, 7.26942000e+15, 6.89922010e-01],
-       [6.78400000e+00, 6.53281000e+15, 7.60851673e-01],
-       [6.82640000e+00, 5.68068000e+15, 8.65764951e-01],
-       [6.86880000e+00, 4.82281000e+15, 1.00809161e+00],
-       [6.91120000e+00, 4.00498000e+15, 1.19977553e+00],
-       [6.95360000e+00, 3.10456000e+15, 1.52580840e+00],
-       [6.99600000e+00, 2.24802000e+15, 2.07586927e+00],
-       [7.03840000e+00, 1.64399000e+15, 2.80349638e+00],
-       [7.08080000e+00, 1.22067000e+15, 3.73766178e+00],
-       [7.12320000e+00, 9.04690000e+14, 4.99919411e+00],
-       [7.16560000e+00, 6.90558000e+14, 6.50429155e+00],
-       [7.20800000e+00, 5.65588000e+14, 7.90132635e+00],
-       [7.25040000e+00, 4.97164000e+14, 8.96189807e+00],
-       [7.29280000e+00, 4.69137000e+14, 9.48636870e+00],
-       [7.33520000e+00, 4.55512000e+14, 9.76337567e+00],
-       [7.37760000e+00, 4.51232000e+14, 9.85371507e+00],
-       [7.42000000e+00, 4.55512000e+14, 9.76337567e+00],
-       [7.46240000e+00, 4.66015000e+14, 9.54772716e+00],
-       [7.50480000e+00, 4.78961000e+14, 9.29608316e+00],
-       [7.54720000e+00, 4.91473000e+14, 9.06358475e+00],
-       [7.58960000e+00, 5.00265000e+14, 8.90840596e+00],
-       [7.63200000e+00, 5.06058000e+14, 8.80846027e+00],
-       [7.67440000e+00, 5.11564000e+14, 8.71565438e+00],
-       [7.71680000e+00, 5.15466000e+14, 8.65167108e+00],
-       [7.75920000e+00, 5.16654000e+14, 8.63177279e+00],
-       [7.80160000e+00, 5.15585000e+14, 8.64967919e+00],
-       [7.84400000e+00, 5.13925000e+14, 8.67760745e+00],
-       [7.88640000e+00, 5.12389000e+14, 8.70362157e+00],
-       [7.92880000e+00, 5.11564000e+14, 8.71565438e+00],
-       [7.97120000e+00, 5.11564000e+14, 8.71766147e+00],
-       [8.01360000e+00, 5.11446000e+14, 8.71766147e+00],
-       [8.05600000e+00, 5.11446000e+14, 8.71966901e+00],
-       [8.09840000e+00, 5.11329000e+14, 8.72167702e+00],
-       [8.14080000e+00, 5.11093000e+14, 8.72368549e+00],
-       [8.18320000e+00, 5.10975000e+14, 8.72770382e+00],
-       [8.22560000e+00, 5.10740000e+14, 8.72971368e+00],
-       [8.26800000e+00, 5.10623000e+14, 8.73373479e+00],
-       [8.31040000e+00, 5.10387000e+14, 8.73775775e+00],
-       [8.35280000e+00, 5.10035000e+14, 8.74178256e+00],
-       [8.39520000e+00, 5.09683000e+14, 8.74782326e+00],
-       [8.43760000e+00, 5.09331000e+14, 8.75185271e+00],
-       [8.48000000e+00, 5.08745000e+14, 8.76395220e+00],
-       [8.52240000e+00, 5.07925000e+14, 8.77808941e+00],
-       [8.56480000e+00, 5.07107000e+14, 8.79022517e+00],
-       [8.60720000e+00, 5.06874000e+14, 8.79629934e+00],
-       [8.64960000e+00, 5.06874000e+14, 8.79427415e+00],
-       [8.69200000e+00, 5.07107000e+14, 8.79224942e+00],
-       [8.73440000e+00, 5.07107000e+14, 8.79022517e+00],
-       [8.77680000e+00, 5.06874000e+14, 8.79427415e+00],
-       [8.81920000e+00, 5.06641000e+14, 8.79832499e+00],
-       [8.86160000e+00, 5.06407000e+14, 8.80237771e+00],
-       [8.90400000e+00, 5.06291000e+14, 8.80440476e+00],
-       [8.94640000e+00, 5.06407000e+14, 8.80237771e+00],
-       [8.98880000e+00, 5.06524000e+14, 8.80035112e+00],
-       [9.03120000e+00, 5.06757000e+14, 8.79629934e+00],
-       [9.07360000e+00, 5.07107000e+14, 8.79224942e+00],
-       [9.11600000e+00, 5.07341000e+14, 8.78617805e+00],
-       [9.15840000e+00, 5.07809000e+14, 8.77808941e+00],
-       [9.20080000e+00, 5.08276000e+14, 8.77000821e+00],
-       [9.24320000e+00, 5.08745000e+14, 8.76395220e+00],
-       [9.28560000e+00, 5.08276000e+14, 8.77000821e+00],
-       [9.32800000e+00, 5.07107000e+14, 8.79224942e+00],
-       [9.37040000e+00, 5.06058000e+14, 8.80846027e+00],
-       [9.41280000e+00, 5.06058000e+14, 8.80846027e+00],
-       [9.45520000e+00, 5.07107000e+14, 8.79224942e+00],
-       [9.49760000e+00, 5.08276000e+14, 8.77000821e+00],
-       [9.54000000e+00, 5.09565000e+14, 8.74983775e+00],
-       [9.58240000e+00, 5.10740000e+14, 8.72971368e+00],
-       [9.62480000e+00, 5.12153000e+14, 8.70562589e+00],
-       [9.66720000e+00, 5.13689000e+14, 8.68160456e+00],
-       [9.70960000e+00, 5.14873000e+14, 8.66163742e+00],
-       [9.75200000e+00, 5.15229000e+14, 8.65565624e+00],
-       [9.79440000e+00, 5.14991000e+14, 8.65964323e+00],
-       [9.83680000e+00, 5.14754000e+14, 8.66163742e+00]])
-
-
-data_c_CS01 = np.array([[1.39200000e-01, 2.56975506e+20],
-       [1.45300000e-01, 2.62261825e+20],
-       [1.51500000e-01, 2.67306554e+20],
-       [1.57600000e-01, 2.71656483e+20],
-       [1.63700000e-01, 2.72991426e+20],
-       [1.69800000e-01, 2.74666262e+20],
-       [1.76000000e-01, 2.73328037e+20],
-       [1.82100000e-01, 2.72326827e+20],
-       [1.88200000e-01, 2.71996332e+20],
-       [1.94400000e-01, 2.71325562e+20],
-       [2.00500000e-01, 2.70991417e+20],
-       [2.06600000e-01, 2.69998765e+20],
-       [2.12800000e-01, 2.68991298e+20],
-       [2.18900000e-01, 2.67991321e+20],
-       [2.25100000e-01, 2.66998752e+20],
-       [2.31200000e-01, 2.67998756e+20],
-       [2.37300000e-01, 2.68332920e+20],
-       [2.43500000e-01, 2.67663757e+20],
-       [2.49600000e-01, 2.66998752e+20],
-       [2.55700000e-01, 2.66998752e+20],
-       [2.61900000e-01, 2.67332918e+20],
-       [2.68000000e-01, 2.66663746e+20],
-       [2.74100000e-01, 2.72186970e+20],
-       [2.80200000e-01, 2.79143642e+20],
-       [2.86400000e-01, 2.85996512e+20],
-       [2.92500000e-01, 2.80193064e+20],
-       [2.98600000e-01, 2.73550901e+20],
-       [3.04800000e-01, 2.68000000e+20],
-       [3.10900000e-01, 2.74189295e+20],
-       [3.17000000e-01, 2.81495569e+20],
-       [3.23200000e-01, 2.88663969e+20],
-       [3.29300000e-01, 2.90330657e+20],
-       [3.35500000e-01, 2.89661690e+20],
-       [3.41600000e-01, 2.90328348e+20],
-       [3.47700000e-01, 2.89663979e+20],
-       [3.53900000e-01, 2.83499034e+20],
-       [3.60000000e-01, 2.76849462e+20],
-       [3.66100000e-01, 2.70998770e+20],
-       [3.72300000e-01, 2.71666257e+20],
-       [3.78400000e-01, 2.72000000e+20],
-       [3.84500000e-01, 2.72332926e+20],
-       [3.90600000e-01, 2.72666259e+20],
-       [3.96800000e-01, 2.72666259e+20],
-       [4.02900000e-01, 2.72666259e+20],
-       [4.09000000e-01, 2.71998775e+20],
-       [4.15200000e-01, 2.71665033e+20],
-       [4.21300000e-01, 2.68306654e+20],
-       [4.27400000e-01, 2.63945897e+20],
-       [4.33600000e-01, 2.45851685e+20],
-       [4.39700000e-01, 2.04336958e+20],
-       [4.45900000e-01, 1.48984248e+20],
-       [4.52000000e-01, 1.02347781e+20],
-       [4.58100000e-01, 7.17847222e+19],
-       [4.64300000e-01, 5.40556776e+19],
-       [4.70400000e-01, 4.34999850e+19],
-       [4.76500000e-01, 3.85282595e+19],
-       [4.82700000e-01, 3.56754942e+19],
-       [4.88800000e-01, 3.44787552e+19],
-       [4.94900000e-01, 3.31932336e+19],
-       [5.01000000e-01, 3.22875081e+19],
-       [5.07200000e-01, 3.17301501e+19],
-       [5.13300000e-01, 3.07854347e+19],
-       [5.19400000e-01, 2.99749124e+19],
-       [5.25600000e-01, 2.90650304e+19],
-       [5.31700000e-01, 2.90978352e+19],
-       [5.37800000e-01, 2.91314744e+19],
-       [5.44000000e-01, 2.94964853e+19],
-       [5.50100000e-01, 2.93964964e+19],
-       [5.56300000e-01, 2.94641526e+19],
-       [5.62400000e-01, 2.91330667e+19],
-       [5.68500000e-01, 2.90332951e+19],
-       [5.74700000e-01, 2.90000000e+19],
-       [5.80800000e-01, 2.92314807e+19],
-       [5.86900000e-01, 3.01118822e+19],
-       [5.93100000e-01, 3.09861485e+19],
-       [5.99200000e-01, 3.16998948e+19],
-       [6.05300000e-01, 3.15659972e+19],
-       [6.11400000e-01, 3.16324521e+19],
-       [6.17600000e-01, 3.13986240e+19],
-       [6.23700000e-01, 3.14320268e+19],
-       [6.29800000e-01, 3.13328715e+19],
-       [6.36000000e-01, 3.12992525e+19],
-       [6.42100000e-01, 3.06547718e+19],
-       [6.48200000e-01, 3.00256078e+19],
-       [6.54400000e-01, 2.96330711e+19],
-       [6.60500000e-01, 2.96998878e+19],
-       [6.66700000e-01, 2.95654973e+19],
-       [6.72800000e-01, 2.95654973e+19],
-       [6.78900000e-01, 2.98286079e+19],
-       [6.85100000e-01, 3.01653023e+19],
-       [6.91200000e-01, 3.03664103e+19],
-       [6.97300000e-01, 3.02665200e+19],
-       [7.03500000e-01, 3.01659661e+19],
-       [7.09600000e-01, 3.03957483e+19],
-       [7.15700000e-01, 3.06618078e+19],
-       [7.21900000e-01, 3.09328655e+19],
-       [7.28000000e-01, 3.09990322e+19],
-       [7.34100000e-01, 3.10987083e+19],
-       [7.40200000e-01, 3.14327694e+19],
-       [7.46400000e-01, 3.24065332e+19],
-       [7.52500000e-01, 3.33779630e+19],
-       [7.58600000e-01, 3.45309967e+19],
-       [7.64800000e-01, 3.38812489e+19],
-       [7.70900000e-01, 3.31730742e+19],
-       [7.77100000e-01, 3.26936272e+19],
-       [7.83200000e-01, 3.29935855e+19],
-       [7.89300000e-01, 3.35660371e+19],
-       [7.95500000e-01, 3.40905912e+19],
-       [8.01600000e-01, 3.48580526e+19],
-       [8.07700000e-01, 3.55324562e+19],
-       [8.13900000e-01, 3.71101291e+19],
-       [8.20000000e-01, 3.82230789e+19],
-       [8.26100000e-01, 3.87496337e+19],
-       [8.32300000e-01, 3.47818072e+19],
-       [8.38400000e-01, 2.71981851e+19],
-       [8.44500000e-01, 1.91893713e+19],
-       [8.50600000e-01, 1.31300582e+19],
-       [8.56800000e-01, 9.43435108e+18],
-       [8.62900000e-01, 7.20707792e+18],
-       [8.69000000e-01, 5.79921353e+18],
-       [8.75200000e-01, 5.01040394e+18],
-       [8.81300000e-01, 4.60702330e+18],
-       [8.87500000e-01, 4.54593204e+18],
-       [8.93600000e-01, 4.56289463e+18],
-       [8.99700000e-01, 4.45306778e+18],
-       [9.05900000e-01, 4.41442750e+18],
-       [9.12000000e-01, 4.41115513e+18],
-       [9.18100000e-01, 4.34393378e+18],
-       [9.24300000e-01, 4.23914066e+18],
-       [9.30400000e-01, 4.10932178e+18],
-       [9.36500000e-01, 4.12961506e+18],
-       [9.42700000e-01, 4.04619927e+18],
-       [9.48800000e-01, 4.07241020e+18],
-       [9.54900000e-01, 4.14415672e+18],
-       [9.61000000e-01, 4.07678891e+18],
-       [9.67200000e-01, 4.02396626e+18],
-       [9.73300000e-01, 3.83127113e+18],
-       [9.79400000e-01, 3.94314770e+18],
-       [9.85600000e-01, 3.90675752e+18],
-       [9.91700000e-01, 4.07126628e+18],
-       [9.97900000e-01, 4.13945803e+18],
-       [1.00400000e+00, 4.15004492e+18],
-       [1.01010000e+00, 4.04211470e+18],
-       [1.01630000e+00, 3.95933937e+18],
-       [1.02240000e+00, 3.99264068e+18],
-       [1.02850000e+00, 4.04664743e+18],
-       [1.03470000e+00, 4.09588155e+18],
-       [1.04080000e+00, 4.10601991e+18],
-       [1.04690000e+00, 4.16597026e+18],
-       [1.05310000e+00, 4.20518170e+18],
-       [1.05920000e+00, 4.29971164e+18],
-       [1.06530000e+00, 4.19911675e+18],
-       [1.07140000e+00, 4.12005569e+18],
-       [1.07760000e+00, 3.99611740e+18],
-       [1.08370000e+00, 4.01630015e+18],
-       [1.08980000e+00, 3.99986666e+18],
-       [1.09600000e+00, 3.96591030e+18],
-       [1.10210000e+00, 3.91231035e+18],
-       [1.10830000e+00, 3.90260234e+18],
-       [1.11440000e+00, 3.84444797e+18],
-       [1.12050000e+00, 3.86436775e+18],
-       [1.12670000e+00, 3.68953924e+18],
-       [1.13280000e+00, 3.33287976e+18],
-       [1.13890000e+00, 2.91526662e+18],
-       [1.14510000e+00, 2.56603232e+18],
-       [1.15120000e+00, 2.46459087e+18],
-       [1.15730000e+00, 2.36287426e+18],
-       [1.16350000e+00, 2.33270661e+18],
-       [1.16960000e+00, 2.29332849e+18],
-       [1.17570000e+00, 2.25959817e+18],
-       [1.18180000e+00, 2.21941900e+18],
-       [1.18800000e+00, 2.12500272e+18],
-       [1.19410000e+00, 2.07218561e+18],
-       [1.20020000e+00, 2.06259202e+18],
-       [1.20640000e+00, 2.12563589e+18],
-       [1.21250000e+00, 2.16986174e+18],
-       [1.21870000e+00, 2.16647662e+18],
-       [1.22480000e+00, 2.13652148e+18],
-       [1.23090000e+00, 2.12663004e+18],
-       [1.23710000e+00, 2.12995290e+18],
-       [1.24320000e+00, 2.18568446e+18],
-       [1.24930000e+00, 2.16506357e+18],
-       [1.25550000e+00, 2.21128308e+18],
-       [1.26160000e+00, 2.12731306e+18],
-       [1.26770000e+00, 2.16746048e+18],
-       [1.27390000e+00, 2.09197999e+18],
-       [1.28000000e+00, 2.13900644e+18],
-       [1.28610000e+00, 2.12923915e+18],
-       [1.29230000e+00, 2.21889023e+18],
-       [1.29840000e+00, 2.28184728e+18],
-       [1.30450000e+00, 2.30612407e+18],
-       [1.31060000e+00, 2.25877084e+18],
-       [1.31680000e+00, 2.21319236e+18],
-       [1.32290000e+00, 2.20326760e+18],
-       [1.32900000e+00, 2.23317986e+18],
-       [1.33520000e+00, 2.24982115e+18],
-       [1.34130000e+00, 2.30285550e+18],
-       [1.34750000e+00, 2.21500745e+18],
-       [1.35360000e+00, 2.15827280e+18],
-       [1.35970000e+00, 2.01198141e+18],
-       [1.36590000e+00, 2.07941798e+18],
-       [1.37200000e+00, 2.10870941e+18],
-       [1.37810000e+00, 2.15876515e+18],
-       [1.38430000e+00, 2.04654663e+18],
-       [1.39040000e+00, 1.99544128e+18],
-       [1.39650000e+00, 1.99220718e+18],
-       [1.40270000e+00, 2.05979057e+18],
-       [1.40880000e+00, 2.09307241e+18],
-       [1.41490000e+00, 2.10323312e+18],
-       [1.42100000e+00, 2.10988896e+18],
-       [1.42720000e+00, 2.08651801e+18],
-       [1.43330000e+00, 2.03861369e+18],
-       [1.43940000e+00, 1.96205082e+18],
-       [1.44560000e+00, 1.87576609e+18],
-       [1.45170000e+00, 1.87898353e+18],
-       [1.45790000e+00, 1.90512926e+18],
-       [1.46400000e+00, 1.89804693e+18],
-       [1.47010000e+00, 1.81674558e+18],
-       [1.47630000e+00, 1.77587058e+18],
-       [1.48240000e+00, 1.81491314e+18],
-       [1.48850000e+00, 1.79704866e+18],
-       [1.49470000e+00, 1.77061764e+18],
-       [1.50080000e+00, 1.77061764e+18],
-       [1.50690000e+00, 1.80548123e+18],
-       [1.51310000e+00, 1.75628002e+18],
-       [1.51920000e+00, 1.61958837e+18],
-       [1.52530000e+00, 1.54572028e+18],
-       [1.53140000e+00, 1.54572028e+18],
-       [1.53760000e+00, 1.49939175e+18],
-       [1.54370000e+00, 1.46256134e+18],
-       [1.54980000e+00, 1.37632291e+18],
-       [1.55600000e+00, 1.32008264e+18],
-       [1.56210000e+00, 1.23402607e+18],
-       [1.56830000e+00, 1.19307118e+18],
-       [1.57440000e+00, 1.19307118e+18],
-       [1.58050000e+00, 1.16138163e+18],
-       [1.58670000e+00, 1.12537173e+18],
-       [1.59280000e+00, 1.08987766e+18],
-       [1.59890000e+00, 1.03598865e+18],
-       [1.60510000e+00, 9.89781022e+17],
-       [1.61120000e+00, 9.07811378e+17],
-       [1.61730000e+00, 9.09454776e+17],
-       [1.62350000e+00, 9.34442154e+17],
-       [1.62960000e+00, 9.08546002e+17],
-       [1.63570000e+00, 8.45241041e+17],
-       [1.64180000e+00, 7.79007100e+17],
-       [1.64800000e+00, 7.77323846e+17],
-       [1.65410000e+00, 7.18682033e+17],
-       [1.66020000e+00, 6.78274564e+17],
-       [1.66640000e+00, 6.51629637e+17],
-       [1.67250000e+00, 6.27472679e+17],
-       [1.67870000e+00, 5.46689675e+17],
-       [1.68480000e+00, 4.73688757e+17],
-       [1.69090000e+00, 4.40778191e+17],
-       [1.69710000e+00, 4.07082280e+17],
-       [1.70320000e+00, 3.86450636e+17],
-       [1.70930000e+00, 3.72557783e+17],
-       [1.71550000e+00, 3.62272586e+17],
-       [1.72160000e+00, 3.28275726e+17],
-       [1.72770000e+00, 2.67035555e+17],
-       [1.73390000e+00, 2.39231710e+17],
-       [1.74000000e+00, 2.21556781e+17],
-       [1.74610000e+00, 2.08492914e+17],
-       [1.75220000e+00, 1.70866168e+17],
-       [1.75840000e+00, 1.33567664e+17],
-       [1.76450000e+00, 1.16222719e+17],
-       [1.77060000e+00, 9.55967460e+16],
-       [1.77680000e+00, 8.02085890e+16],
-       [1.78290000e+00, 5.12400037e+16],
-       [1.78910000e+00, 4.75887458e+16],
-       [1.79520000e+00, 3.07817046e+16],
-       [1.80130000e+00, 3.07817046e+16],
-       [1.80750000e+00, 3.07817046e+16],
-       [1.81360000e+00, 3.07817046e+16],
-       [1.81970000e+00, 3.07817046e+16],
-       [1.82590000e+00, 3.07817046e+16],
-       [1.83200000e+00, 3.07817046e+16],
-       [1.83810000e+00, 3.06916554e+16],
-       [1.84430000e+00, 3.05715258e+16],
-       [1.85040000e+00, 3.03617355e+16],
-       [1.85650000e+00, 2.99879013e+16],
-       [1.86270000e+00, 2.95582297e+16],
-       [1.86880000e+00, 2.91453213e+16],
-       [1.87490000e+00, 2.87504925e+16],
-       [1.88100000e+00, 2.83417580e+16],
-       [1.88720000e+00, 2.79351730e+16],
-       [1.89330000e+00, 2.76075779e+16],
-       [1.89950000e+00, 2.74123399e+16],
-       [1.90560000e+00, 2.73837019e+16],
-       [1.91170000e+00, 2.75007357e+16],
-       [1.91790000e+00, 2.76642179e+16],
-       [1.92400000e+00, 2.78718269e+16],
-       [1.93010000e+00, 2.81158546e+16],
-       [1.93630000e+00, 2.85660509e+16],
-       [1.94240000e+00, 2.91098878e+16],
-       [1.94850000e+00, 2.96556825e+16],
-       [1.95470000e+00, 3.00150800e+16],
-       [1.96080000e+00, 3.02910847e+16],
-       [1.96690000e+00, 3.05109582e+16],
-       [1.97310000e+00, 3.06260044e+16],
-       [1.97920000e+00, 3.04914719e+16],
-       [1.98530000e+00, 3.02115161e+16],
-       [1.99140000e+00, 2.98416617e+16],
-       [1.99760000e+00, 2.95839997e+16],
-       [2.00370000e+00, 2.94502228e+16],
-       [2.00990000e+00, 2.94260573e+16],
-       [2.01600000e+00, 2.94112217e+16],
-       [2.02210000e+00, 2.93672452e+16],
-       [2.02830000e+00, 2.92881044e+16],
-       [2.03440000e+00, 2.92101836e+16],
-       [2.04050000e+00, 2.89733697e+16],
-       [2.04670000e+00, 2.85239655e+16],
-       [2.05280000e+00, 2.78788552e+16],
-       [2.05890000e+00, 2.70814597e+16],
-       [2.06510000e+00, 2.62008416e+16],
-       [2.07120000e+00, 2.52564671e+16],
-       [2.07730000e+00, 2.43420160e+16],
-       [2.08350000e+00, 2.34073975e+16],
-       [2.08960000e+00, 2.24583819e+16],
-       [2.09570000e+00, 2.14650932e+16],
-       [2.10180000e+00, 2.06100517e+16],
-       [2.10800000e+00, 1.98347261e+16],
-       [2.11410000e+00, 1.92226861e+16],
-       [2.12030000e+00, 1.87150593e+16],
-       [2.12640000e+00, 1.84444348e+16],
-       [2.13250000e+00, 1.82679165e+16],
-       [2.13870000e+00, 1.82732734e+16],
-       [2.14480000e+00, 1.82935440e+16],
-       [2.15090000e+00, 1.84348347e+16],
-       [2.15710000e+00, 1.83839090e+16],
-       [2.16320000e+00, 1.82152267e+16],
-       [2.16930000e+00, 1.79442828e+16],
-       [2.17550000e+00, 1.77916737e+16],
-       [2.18160000e+00, 1.76097814e+16],
-       [2.18770000e+00, 1.74642496e+16],
-       [2.19390000e+00, 1.72545156e+16],
-       [2.20000000e+00, 1.72704990e+16],
-       [2.20610000e+00, 1.72844377e+16],
-       [2.21220000e+00, 1.74221351e+16],
-       [2.21840000e+00, 1.74763533e+16],
-       [2.22450000e+00, 1.76275693e+16],
-       [2.23070000e+00, 1.77685643e+16],
-       [2.23680000e+00, 1.80775078e+16],
-       [2.24290000e+00, 1.84535178e+16],
-       [2.24910000e+00, 1.89864574e+16],
-       [2.25520000e+00, 1.94216535e+16],
-       [2.26130000e+00, 1.99703877e+16],
-       [2.26750000e+00, 2.05180470e+16],
-       [2.27360000e+00, 2.10441462e+16],
-       [2.27970000e+00, 2.12336123e+16],
-       [2.28590000e+00, 2.11765007e+16],
-       [2.29200000e+00, 2.09982249e+16],
-       [2.29810000e+00, 2.09170928e+16],
-       [2.30430000e+00, 2.07890875e+16],
-       [2.31040000e+00, 2.06508290e+16],
-       [2.31650000e+00, 2.04911833e+16],
-       [2.32260000e+00, 2.04337670e+16],
-       [2.32880000e+00, 2.04119041e+16],
-       [2.33490000e+00, 2.04619535e+16],
-       [2.34110000e+00, 2.04107502e+16],
-       [2.34720000e+00, 2.02863348e+16],
-       [2.35330000e+00, 2.01727376e+16],
-       [2.35950000e+00, 2.02484418e+16],
-       [2.36560000e+00, 2.05872233e+16],
-       [2.37170000e+00, 2.10383926e+16],
-       [2.37790000e+00, 2.14928098e+16],
-       [2.38400000e+00, 2.18738796e+16],
-       [2.39010000e+00, 2.21626387e+16],
-       [2.39630000e+00, 2.21921675e+16],
-       [2.40240000e+00, 2.19970281e+16],
-       [2.40850000e+00, 2.15253653e+16],
-       [2.41470000e+00, 2.10128273e+16],
-       [2.42080000e+00, 2.04691604e+16],
-       [2.42690000e+00, 2.00176780e+16],
-       [2.43300000e+00, 1.95772287e+16],
-       [2.43920000e+00, 1.91748806e+16],
-       [2.44530000e+00, 1.86829744e+16],
-       [2.45140000e+00, 1.82036191e+16],
-       [2.45760000e+00, 1.76751589e+16],
-       [2.46370000e+00, 1.71760091e+16],
-       [2.46990000e+00, 1.66063509e+16],
-       [2.47600000e+00, 1.61785052e+16],
-       [2.48210000e+00, 1.58507923e+16],
-       [2.48830000e+00, 1.57626164e+16],
-       [2.49440000e+00, 1.57235775e+16],
-       [2.50050000e+00, 1.57011865e+16],
-       [2.50670000e+00, 1.56070190e+16],
-       [2.51280000e+00, 1.55732803e+16],
-       [2.51890000e+00, 1.55686406e+16],
-       [2.52510000e+00, 1.56560877e+16],
-       [2.53120000e+00, 1.56621348e+16],
-       [2.53730000e+00, 1.56263712e+16],
-       [2.54350000e+00, 1.55576368e+16],
-       [2.54960000e+00, 1.55602956e+16],
-       [2.55570000e+00, 1.55926613e+16],
-       [2.56180000e+00, 1.55312388e+16],
-       [2.56800000e+00, 1.53189311e+16],
-       [2.57410000e+00, 1.50964460e+16],
-       [2.58030000e+00, 1.49744459e+16],
-       [2.58640000e+00, 1.49692215e+16],
-       [2.59250000e+00, 1.49361563e+16],
-       [2.59870000e+00, 1.48155628e+16],
-       [2.60480000e+00, 1.46467557e+16],
-       [2.61090000e+00, 1.44702139e+16],
-       [2.61710000e+00, 1.42445753e+16],
-       [2.62320000e+00, 1.39515082e+16],
-       [2.62930000e+00, 1.36390459e+16],
-       [2.63550000e+00, 1.34265950e+16],
-       [2.64160000e+00, 1.33543036e+16],
-       [2.64770000e+00, 1.33180676e+16],
-       [2.65390000e+00, 1.32204159e+16],
-       [2.66610000e+00, 1.30189791e+16],
-       [2.67220000e+00, 1.28347613e+16],
-       [2.67840000e+00, 1.26852697e+16],
-       [2.68450000e+00, 1.25375193e+16],
-       [2.69070000e+00, 1.23548446e+16],
-       [2.69680000e+00, 1.22498600e+16],
-       [2.70910000e+00, 1.23240336e+16],
-       [2.72130000e+00, 1.25672578e+16],
-       [2.72750000e+00, 1.27875433e+16],
-       [2.73360000e+00, 1.28745755e+16],
-       [2.73970000e+00, 1.27930358e+16],
-       [2.74590000e+00, 1.26851859e+16],
-       [2.75200000e+00, 1.25516063e+16],
-       [2.75810000e+00, 1.24479384e+16],
-       [2.76430000e+00, 1.23368691e+16],
-       [2.77040000e+00, 1.22861932e+16],
-       [2.77650000e+00, 1.23086484e+16],
-       [2.78260000e+00, 1.24361249e+16],
-       [2.78880000e+00, 1.25936657e+16],
-       [2.79490000e+00, 1.27256456e+16],
-       [2.80110000e+00, 1.27747762e+16],
-       [2.80720000e+00, 1.28327283e+16],
-       [2.81330000e+00, 1.28668126e+16],
-       [2.81950000e+00, 1.29145733e+16],
-       [2.82560000e+00, 1.29239829e+16],
-       [2.83170000e+00, 1.29173714e+16],
-       [2.83790000e+00, 1.29226864e+16],
-       [2.84400000e+00, 1.28879577e+16],
-       [2.85010000e+00, 1.28478426e+16],
-       [2.85630000e+00, 1.28072534e+16],
-       [2.86240000e+00, 1.27851861e+16],
-       [2.86850000e+00, 1.27853415e+16],
-       [2.87470000e+00, 1.28458540e+16],
-       [2.88080000e+00, 1.29258525e+16],
-       [2.88690000e+00, 1.30638686e+16],
-       [2.89300000e+00, 1.32033584e+16],
-       [2.89920000e+00, 1.34414678e+16],
-       [2.90530000e+00, 1.36787285e+16],
-       [2.91150000e+00, 1.39109186e+16],
-       [2.92380000e+00, 1.39736823e+16],
-       [2.92990000e+00, 1.39916122e+16],
-       [2.93600000e+00, 1.38417840e+16],
-       [2.94210000e+00, 1.36333196e+16],
-       [2.94830000e+00, 1.33010569e+16],
-       [2.95440000e+00, 1.28782286e+16],
-       [2.96050000e+00, 1.28782286e+16],
-       [2.96670000e+00, 1.28782286e+16]])
-
-data_c_ppsc2 = np.array([[0.00000000e+00, 6.35769955e-04, 1.87068214e+20],
-       [1.03400000e-01, 6.85172620e-04, 1.73220784e+20],
-       [2.06900000e-01, 7.24102422e-04, 1.63719346e+20],
-       [3.10300000e-01, 7.55440041e-04, 1.56711187e+20],
-       [4.13800000e-01, 7.98730006e-04, 1.48013047e+20],
-       [5.17200000e-01, 8.76193445e-04, 1.34493099e+20],
-       [6.20600000e-01, 1.05511549e-03, 1.10968573e+20],
-       [7.24100000e-01, 1.30226689e-03, 8.90430444e+19],
-       [8.27500000e-01, 1.53603107e-03, 7.48169501e+19],
-       [9.30900000e-01, 1.80717413e-03, 6.29361250e+19],
-       [1.03440000e+00, 2.10959943e-03, 5.32843902e+19],
-       [1.13780000e+00, 2.40436280e-03, 4.62168136e+19],
-       [1.24130000e+00, 2.63815313e-03, 4.17541839e+19],
-       [1.34470000e+00, 2.96346635e-03, 3.67028678e+19],
-       [1.44810000e+00, 3.46577209e-03, 3.07751374e+19],
-       [1.55160000e+00, 4.04296517e-03, 2.58107129e+19],
-       [1.65500000e+00, 4.76979814e-03, 2.12911932e+19],
-       [1.75850000e+00, 5.70689655e-03, 1.71949137e+19],
-       [1.86190000e+00, 7.00970918e-03, 1.33690331e+19],
-       [1.96530000e+00, 9.22146665e-03, 9.43626220e+18],
-       [2.06880000e+00, 1.31401402e-02, 5.87759964e+18],
-       [2.17220000e+00, 1.84629035e-02, 3.63915036e+18],
-       [2.27560000e+00, 2.39552110e-02, 2.48198984e+18],
-       [2.37910000e+00, 2.87276433e-02, 1.88755667e+18],
-       [2.48250000e+00, 3.35042577e-02, 1.49279441e+18],
-       [2.58600000e+00, 3.79664508e-02, 1.23083546e+18],
-       [2.68940000e+00, 4.21308285e-02, 1.04761088e+18],
-       [2.79280000e+00, 4.63340219e-02, 9.03649474e+17],
-       [2.89630000e+00, 5.12625257e-02, 7.72324834e+17],
-       [2.99970000e+00, 5.72664155e-02, 6.49980010e+17],
-       [3.10320000e+00, 6.49381632e-02, 5.34933751e+17],
-       [3.20660000e+00, 7.57181510e-02, 4.22279501e+17],
-       [3.31000000e+00, 9.97929819e-02, 2.77779377e+17],
-       [3.41350000e+00, 1.37784384e-01, 1.72862186e+17],
-       [3.51690000e+00, 1.84714079e-01, 1.14287833e+17],
-       [3.62030000e+00, 2.25372021e-01, 8.72368549e+16],
-       [3.72380000e+00, 2.39662453e-01, 8.03896245e+16],
-       [3.82720000e+00, 2.40879588e-01, 7.98730006e+16],
-       [3.93070000e+00, 2.46660723e-01, 7.73927003e+16],
-       [4.03410000e+00, 2.49344619e-01, 7.63132589e+16],
-       [4.13750000e+00, 2.51825671e-01, 7.53182117e+16],
-       [4.24100000e+00, 2.70707320e-01, 6.85488226e+16],
-       [4.34440000e+00, 3.48979567e-01, 4.96249406e+16],
-       [4.44790000e+00, 4.70652099e-01, 3.44587881e+16],
-       [4.55130000e+00, 6.31684179e-01, 2.44174327e+16],
-       [4.65470000e+00, 8.58420341e-01, 1.72663285e+16],
-       [4.75820000e+00, 1.04712855e+00, 1.38707518e+16],
-       [4.86160000e+00, 1.14182619e+00, 1.26211811e+16],
-       [4.96500000e+00, 1.20976217e+00, 1.18576875e+16],
-       [5.06850000e+00, 1.26095620e+00, 1.13396591e+16],
-       [5.17190000e+00, 1.30707347e+00, 1.09093783e+16],
-       [5.27540000e+00, 1.32617245e+00, 1.07423674e+16],
-       [5.37880000e+00, 1.31129378e+00, 1.08717636e+16],
-       [5.48220000e+00, 1.25458474e+00, 1.14024979e+16],
-       [5.58570000e+00, 1.12434605e+00, 1.28351220e+16],
-       [5.68910000e+00, 1.05462971e+00, 1.37625845e+16],
-       [5.79260000e+00, 1.37372563e+00, 1.03442736e+16],
-       [5.89600000e+00, 2.85495982e+00, 4.80064951e+15],
-       [5.99940000e+00, 7.17133483e+00, 1.87499451e+15],
-       [6.10290000e+00, 1.17057704e+01, 1.14366808e+15],
-       [6.20630000e+00, 1.45512399e+01, 9.18544075e+14],
-       [6.30970000e+00, 1.52124793e+01, 8.78415519e+14],
-       [6.41320000e+00, 1.51914770e+01, 8.79832499e+14],
-       [6.51660000e+00, 1.51495593e+01, 8.82266928e+14],
-       [6.62010000e+00, 1.51251608e+01, 8.83690121e+14],
-       [6.72350000e+00, 1.51600279e+01, 8.81454704e+14],
-       [6.82690000e+00, 1.52580839e+01, 8.75790036e+14],
-       [6.93040000e+00, 1.53886315e+01, 8.68360380e+14],
-       [7.03380000e+00, 1.55453319e+01, 8.59607112e+14],
-       [7.13730000e+00, 1.57072444e+01, 8.50746165e+14],
-       [7.24070000e+00, 1.57979233e+01, 8.45668200e+14],
-       [7.34410000e+00, 1.58452830e+01, 8.43140595e+14],
-       [7.44760000e+00, 1.58927847e+01, 8.40814127e+14],
-       [7.55100000e+00, 1.56855590e+01, 8.51726187e+14],
-       [7.65440000e+00, 1.51077573e+01, 8.84708093e+14],
-       [7.75790000e+00, 1.43582001e+01, 9.31107875e+14],
-       [7.86130000e+00, 1.36144468e+01, 9.82200159e+14],
-       [7.96480000e+00, 1.28233058e+01, 1.04327788e+15],
-       [8.06820000e+00, 1.14208914e+01, 1.17246530e+15],
-       [8.17160000e+00, 9.18121167e+00, 1.46083108e+15],
-       [8.27510000e+00, 6.08135001e+00, 2.21615433e+15],
-       [8.37850000e+00, 3.20036859e+00, 4.26776011e+15],
-       [8.48200000e+00, 1.37720947e+00, 1.03181064e+16],
-       [8.58540000e+00, 5.19397674e-01, 3.06549068e+16],
-       [8.68880000e+00, 1.92530705e-01, 1.07969229e+17],
-       [8.79230000e+00, 7.45761570e-02, 4.32314697e+17],
-       [8.89570000e+00, 3.64837944e-02, 1.30918192e+18],
-       [8.99910000e+00, 2.35504928e-02, 2.54565766e+18],
-       [9.10260000e+00, 1.84799163e-02, 3.63412616e+18],
-       [9.20600000e+00, 1.62742132e-02, 4.35913180e+18],
-       [9.30950000e+00, 1.48867536e-02, 4.94310687e+18],
-       [9.41290000e+00, 1.46419864e-02, 5.05941146e+18],
-       [9.51630000e+00, 1.45915020e-02, 5.08393513e+18],
-       [9.61980000e+00, 1.45478897e-02, 5.10505000e+18],
-       [9.72320000e+00, 1.45244602e-02, 5.11681836e+18],
-       [9.82670000e+00, 1.45077479e-02, 5.12507234e+18],
-       [9.93010000e+00, 1.44943919e-02, 5.13215778e+18],
-       [1.00335000e+01, 1.44777142e-02, 5.14043652e+18],
-       [1.01370000e+01, 1.44577263e-02, 5.14872860e+18],
-       [1.02404000e+01, 1.44344420e-02, 5.16059765e+18],
-       [1.03438000e+01, 1.44111952e-02, 5.17368520e+18],
-       [1.04473000e+01, 1.43879858e-02, 5.18441788e+18],
-       [1.05507000e+01, 1.43912991e-02, 5.18203092e+18],
-       [1.06542000e+01, 1.44311187e-02, 5.16297474e+18],
-       [1.07576000e+01, 1.44843830e-02, 5.13688685e+18],
-       [1.08610000e+01, 1.45445403e-02, 5.10622562e+18],
-       [1.09645000e+01, 1.46521042e-02, 5.05475371e+18],
-       [1.10679000e+01, 1.47604637e-02, 5.00264862e+18],
-       [1.11714000e+01, 1.48149435e-02, 4.97737085e+18],
-       [1.12748000e+01, 1.48047132e-02, 4.98195729e+18],
-       [1.13782000e+01, 1.47672627e-02, 4.99919411e+18],
-       [1.14817000e+01, 1.47163463e-02, 5.02458271e+18],
-       [1.15851000e+01, 1.46588533e-02, 5.05126322e+18],
-       [1.16885000e+01, 1.45948622e-02, 5.08276464e+18],
-       [1.17920000e+01, 1.45211162e-02, 5.11799668e+18],
-       [1.18954000e+01, 1.44477427e-02, 5.15347294e+18],
-       [1.19989000e+01, 1.43879858e-02, 5.18322426e+18],
-       [1.21023000e+01, 1.43681218e-02, 5.19397674e+18],
-       [1.22057000e+01, 1.43846732e-02, 5.18561178e+18],
-       [1.23092000e+01, 1.43979281e-02, 5.17964506e+18],
-       [1.24126000e+01, 1.43714305e-02, 5.19278092e+18],
-       [1.25161000e+01, 1.42988134e-02, 5.22877555e+18],
-       [1.26195000e+01, 1.42167393e-02, 5.27108476e+18],
-       [1.27229000e+01, 1.41709837e-02, 5.29419581e+18],
-       [1.28264000e+01, 1.41873081e-02, 5.28688666e+18],
-       [1.29298000e+01, 1.42331164e-02, 5.26259562e+18],
-       [1.30332000e+01, 1.42724983e-02, 5.24203601e+18],
-       [1.31367000e+01, 1.42724983e-02, 5.24324317e+18],
-       [1.32401000e+01, 1.42527937e-02, 5.25291048e+18],
-       [1.33436000e+01, 1.42265633e-02, 5.26623215e+18],
-       [1.34470000e+01, 1.42101938e-02, 5.27472716e+18],
-       [1.35504000e+01, 1.42036512e-02, 5.27837207e+18],
-       [1.36539000e+01, 1.42036512e-02, 5.27715682e+18],
-       [1.37573000e+01, 1.42134662e-02, 5.27229861e+18],
-       [1.38608000e+01, 1.42396725e-02, 5.25896160e+18],
-       [1.39642000e+01, 1.43086941e-02, 5.22396189e+18],
-       [1.40676000e+01, 1.43946132e-02, 5.18083785e+18],
-       [1.41711000e+01, 1.44577263e-02, 5.14991428e+18],
-       [1.42745000e+01, 1.44843830e-02, 5.13570418e+18],
-       [1.43779000e+01, 1.44977298e-02, 5.12979488e+18],
-       [1.44814000e+01, 1.44943919e-02, 5.13097620e+18],
-       [1.45848000e+01, 1.44743810e-02, 5.14162028e+18],
-       [1.46883000e+01, 1.44444164e-02, 5.15584675e+18],
-       [1.47917000e+01, 1.44012437e-02, 5.17845254e+18],
-       [1.48951000e+01, 1.43284760e-02, 5.21434785e+18],
-       [1.49986000e+01, 1.42101938e-02, 5.27472716e+18],
-       [1.51020000e+01, 1.40604752e-02, 5.35303398e+18],
-       [1.52055000e+01, 1.39027272e-02, 5.43750914e+18]])
-
-
-data_c_npsc2 = np.array([[0.00000000e+00, 1.05754779e-03, 6.93266157e+19],
-       [1.04400000e-01, 1.04279754e-03, 7.04206452e+19],
-       [2.08900000e-01, 9.61612278e-04, 7.70371132e+19],
-       [3.13300000e-01, 9.90603824e-04, 7.45246594e+19],
-       [4.17800000e-01, 1.46960290e-03, 4.84506938e+19],
-       [5.22200000e-01, 2.58642566e-03, 2.63390435e+19],
-       [6.26600000e-01, 4.21696503e-03, 1.50973249e+19],
-       [7.31100000e-01, 5.42875197e-03, 1.10204670e+19],
-       [8.35500000e-01, 6.76705958e-03, 8.18464788e+18],
-       [9.40000000e-01, 8.43140595e-03, 5.92925325e+18],
-       [1.04440000e+00, 1.18494993e-02, 3.41350073e+18],
-       [1.14880000e+00, 1.77133213e-02, 1.65120122e+18],
-       [1.25330000e+00, 2.00631906e-02, 1.30436759e+18],
-       [1.35770000e+00, 2.13550209e-02, 1.15797718e+18],
-       [1.46220000e+00, 2.26777519e-02, 1.03204825e+18],
-       [1.56660000e+00, 2.38231947e-02, 9.38858192e+17],
-       [1.67100000e+00, 2.51941668e-02, 8.43334758e+17],
-       [1.77550000e+00, 2.69215462e-02, 7.42848071e+17],
-       [1.87990000e+00, 2.89134556e-02, 6.48186527e+17],
-       [1.98440000e+00, 3.14485047e-02, 5.52713408e+17],
-       [2.08880000e+00, 3.45939378e-02, 4.61955349e+17],
-       [2.19320000e+00, 3.85034815e-02, 3.78965784e+17],
-       [2.29770000e+00, 4.32513831e-02, 3.06831540e+17],
-       [2.40210000e+00, 4.86855410e-02, 2.48713867e+17],
-       [2.50660000e+00, 5.48403225e-02, 2.02534961e+17],
-       [2.61100000e+00, 6.16736994e-02, 1.66264680e+17],
-       [2.71540000e+00, 7.01132341e-02, 1.34958425e+17],
-       [2.81990000e+00, 7.95426398e-02, 1.10636900e+17],
-       [2.92430000e+00, 8.87769049e-02, 9.35405674e+16],
-       [3.02880000e+00, 1.03347506e-01, 7.47308634e+16],
-       [3.13320000e+00, 1.42200132e-01, 4.78299581e+16],
-       [3.23760000e+00, 2.31046822e-01, 2.56271317e+16],
-       [3.34210000e+00, 3.92012576e-01, 1.36867395e+16],
-       [3.44650000e+00, 4.87640761e-01, 1.06807070e+16],
-       [3.55090000e+00, 5.29297692e-01, 9.74316371e+15],
-       [3.65540000e+00, 5.60402417e-01, 9.14323748e+15],
-       [3.75980000e+00, 5.98136080e-01, 8.50746165e+15],
-       [3.86430000e+00, 6.20297456e-01, 8.17146641e+15],
-       [3.96870000e+00, 6.67882401e-01, 7.53355564e+15],
-       [4.07310000e+00, 8.36372992e-01, 5.89657735e+15],
-       [4.17760000e+00, 1.34338347e+00, 3.55140335e+15],
-       [4.28200000e+00, 2.43444518e+00, 1.90414493e+15],
-       [4.38650000e+00, 3.74110588e+00, 1.21983194e+15],
-       [4.49090000e+00, 4.30625754e+00, 1.05487257e+15],
-       [4.59530000e+00, 4.65478901e+00, 9.73643570e+14],
-       [4.69980000e+00, 4.89215265e+00, 9.25124111e+14],
-       [4.80420000e+00, 5.05475371e+00, 8.94540484e+14],
-       [4.90870000e+00, 5.25170110e+00, 8.60003067e+14],
-       [5.01310000e+00, 5.46764111e+00, 8.25087485e+14],
-       [5.11750000e+00, 5.85463736e+00, 7.69130440e+14],
-       [5.22200000e+00, 6.46100385e+00, 6.95184371e+14],
-       [5.32640000e+00, 7.40286790e+00, 6.04644351e+14],
-       [5.43090000e+00, 9.26616437e+00, 4.80507311e+14],
-       [5.53530000e+00, 1.33721118e+01, 3.30445620e+14],
-       [5.63970000e+00, 2.27876741e+01, 1.91955252e+14],
-       [5.74420000e+00, 4.54988060e+01, 9.50167125e+13],
-       [5.84860000e+00, 8.65565624e+01, 4.94766174e+13],
-       [5.95310000e+00, 1.41026264e+02, 3.01647687e+13],
-       [6.05750000e+00, 2.05731125e+02, 2.05731125e+13],
-       [6.16190000e+00, 2.54741675e+02, 1.65691412e+13],
-       [6.26640000e+00, 2.77332010e+02, 1.52019745e+13],
-       [6.37080000e+00, 2.86351854e+02, 1.47163463e+13],
-       [6.47530000e+00, 2.86220015e+02, 1.47265155e+13],
-       [6.57970000e+00, 2.77715424e+02, 1.51844827e+13],
-       [6.68410000e+00, 2.66931606e+02, 1.58015613e+13],
-       [6.78860000e+00, 2.53804899e+02, 1.66302968e+13],
-       [6.89300000e+00, 2.43108420e+02, 1.73740073e+13],
-       [6.99750000e+00, 2.33776041e+02, 1.80759029e+13],
-       [7.10190000e+00, 2.24439866e+02, 1.88364909e+13],
-       [7.20630000e+00, 2.13402744e+02, 1.98243976e+13],
-       [7.31080000e+00, 2.01697261e+02, 2.09893988e+13],
-       [7.41520000e+00, 1.90589952e+02, 2.22330989e+13],
-       [7.51970000e+00, 1.79928517e+02, 2.35667666e+13],
-       [7.62410000e+00, 1.69785266e+02, 2.49919418e+13],
-       [7.72850000e+00, 1.60213829e+02, 2.65094062e+13],
-       [7.83300000e+00, 1.50938490e+02, 2.81578830e+13],
-       [7.93740000e+00, 1.41416473e+02, 3.00815354e+13],
-       [8.04190000e+00, 1.31856031e+02, 3.22923760e+13],
-       [8.14630000e+00, 1.23310483e+02, 3.45620903e+13],
-       [8.25070000e+00, 1.15797718e+02, 3.68383356e+13],
-       [8.35520000e+00, 1.07176606e+02, 3.98474010e+13],
-       [8.45960000e+00, 9.80392545e+01, 4.36013564e+13],
-       [8.56410000e+00, 8.91456180e+01, 4.80286080e+13],
-       [8.66850000e+00, 8.03896245e+01, 5.33334895e+13],
-       [8.77290000e+00, 7.26607707e+01, 5.91017037e+13],
-       [8.87740000e+00, 6.56749877e+01, 6.54786927e+13],
-       [8.98180000e+00, 5.86948504e+01, 7.34006659e+13],
-       [9.08630000e+00, 5.17249405e+01, 8.34257270e+13],
-       [9.19070000e+00, 4.51336025e+01, 9.58296716e+13],
-       [9.29510000e+00, 3.90211442e+01, 1.11096404e+14],
-       [9.39960000e+00, 3.35274096e+01, 1.29628352e+14],
-       [9.50400000e+00, 2.87872381e+01, 1.51356125e+14],
-       [9.60840000e+00, 2.46944865e+01, 1.76888663e+14],
-       [9.71290000e+00, 2.09266639e+01, 2.09363032e+14],
-       [9.81730000e+00, 1.71395731e+01, 2.56566530e+14],
-       [9.92180000e+00, 1.38739460e+01, 3.18199872e+14],
-       [1.00262000e+01, 1.10611428e+01, 4.00959031e+14],
-       [1.01306000e+01, 8.72569443e+00, 5.10975409e+14],
-       [1.02351000e+01, 6.70347509e+00, 6.69422029e+14],
-       [1.03395000e+01, 4.82169794e+00, 9.38858192e+14],
-       [1.04440000e+01, 3.45859732e+00, 1.32281771e+15],
-       [1.05484000e+01, 2.46263473e+00, 1.88104853e+15],
-       [1.06528000e+01, 1.53073496e+00, 3.09456778e+15],
-       [1.07573000e+01, 8.89610704e-01, 5.51569191e+15],
-       [1.08617000e+01, 5.09565481e-01, 1.01671680e+16],
-       [1.09662000e+01, 2.79962588e-01, 2.03001852e+16],
-       [1.10706000e+01, 1.38292937e-01, 4.96706679e+16],
-       [1.11750000e+01, 6.74528028e-02, 1.43615065e+17],
-       [1.12795000e+01, 3.87703749e-02, 3.74196740e+17],
-       [1.13839000e+01, 3.00676856e-02, 6.01727694e+17],
-       [1.14884000e+01, 2.71831637e-02, 7.29289566e+17],
-       [1.15928000e+01, 2.62663665e-02, 7.78394933e+17],
-       [1.16972000e+01, 2.58226019e-02, 8.04451749e+17],
-       [1.18017000e+01, 2.58642566e-02, 8.02047335e+17],
-       [1.19061000e+01, 2.59477676e-02, 7.97076491e+17],
-       [1.20106000e+01, 2.61276290e-02, 7.86683425e+17],
-       [1.21150000e+01, 2.62603192e-02, 7.79112191e+17],
-       [1.22194000e+01, 2.62482286e-02, 7.79471068e+17],
-       [1.23239000e+01, 2.62301032e-02, 7.80728440e+17],
-       [1.24283000e+01, 2.62603192e-02, 7.79112191e+17],
-       [1.25328000e+01, 2.62845169e-02, 7.77499288e+17],
-       [1.26372000e+01, 2.62845169e-02, 7.77499288e+17],
-       [1.27416000e+01, 2.62724153e-02, 7.78394933e+17],
-       [1.28461000e+01, 2.61878594e-02, 7.83249272e+17],
-       [1.29505000e+01, 2.61818301e-02, 7.83429643e+17],
-       [1.30550000e+01, 2.62966242e-02, 7.76783514e+17],
-       [1.31594000e+01, 2.61818301e-02, 7.83429643e+17],
-       [1.32638000e+01, 2.60855501e-02, 7.89041780e+17],
-       [1.33683000e+01, 2.61095869e-02, 7.87589649e+17],
-       [1.34727000e+01, 2.61396639e-02, 7.85778244e+17],
-       [1.35772000e+01, 2.61758022e-02, 7.83610055e+17],
-       [1.36816000e+01, 2.62119904e-02, 7.81627805e+17],
-       [1.37860000e+01, 2.61878594e-02, 7.83068943e+17],
-       [1.38905000e+01, 2.61155995e-02, 7.87408321e+17],
-       [1.39949000e+01, 2.60255550e-02, 7.92501330e+17],
-       [1.40994000e+01, 2.59836406e-02, 7.94877127e+17],
-       [1.42038000e+01, 2.59597198e-02, 7.96159350e+17],
-       [1.43082000e+01, 2.59597198e-02, 7.96342694e+17],
-       [1.44127000e+01, 2.59597198e-02, 7.96342694e+17],
-       [1.45171000e+01, 2.58761703e-02, 8.01308962e+17],
-       [1.46216000e+01, 2.57869513e-02, 8.06491882e+17],
-       [1.47260000e+01, 2.62905699e-02, 7.77141319e+17],
-       [1.48304000e+01, 2.67670186e-02, 7.51103871e+17],
-       [1.49349000e+01, 2.67239100e-02, 7.53182117e+17],
-       [1.50393000e+01, 2.60255550e-02, 7.92318871e+17]])
-
-# Data storage
-data_lib = {
-
-
-    "pcal":{
-        "resistivity_allowed":True,
-        "data_cc":np.c_[data_c_pcal[:,0],data_c_pcal[:,1]],
-        "data_res":np.c_[data_c_pcal[:,0],data_c_pcal[:,2]],
-    },
-    "ncal":{
-        "resistivity_allowed":True,
-        "data_cc":np.c_[data_c_ncal[:,0],data_c_ncal[:,1]],
-        "data_res":np.c_[data_c_ncal[:,0],data_c_ncal[:,2]],
-    },
-    "CS01":{
-        "resistivity_allowed":False,
-        "data_cc":np.c_[data_c_CS01[:,0],data_c_CS01[:,1]],
-    },
-    "pcs1":{
-        "resistivity_allowed":True,
-        "data_cc":np.c_[data_c_pcs1[:,0],data_c_pcs1[:,1]],
-        "data_res":np.c_[data_c_pcs1[:,0],data_c_pcs1[:,2]],
-    },
-    "ppsc2":{
-        "resistivity_allowed":True,
-        "data_cc":np.c_[data_c_ppsc2[:,0],data_c_ppsc2[:,2]],
-        "data_res":np.c_[data_c_ppsc2[:,0],data_c_ppsc2[:,1]],
-    },
-    "npsc1":{
-        "resistivity_allowed":True,
-        "data_cc":np.c_[data_c_npsc1[:,0],data_c_npsc1[:,1]],
-        "data_res":np.c_[data_c_npsc1[:,0],data_c_npsc1[:,2]],
-    },
-    "npsc2":{
-        "resistivity_allowed":True,
-        "data_cc":np.c_[data_c_npsc2[:,0],data_c_npsc2[:,2]],
-        "data_res":np.c_[data_c_npsc2[:,0],data_c_npsc2[:,1]],
-    },
-    "GS":{
-        "resistivity_allowed":False,
-        "data_cc":np.c_[data_c_GS[:,0],data_c_GS[:,1]],
-    },
-    "Own Sample":{
-        "resistivity_allowed":True,
-        "data_cc":None,
-        "data_res":None
-    }
-}
-
-preset_lib = {
-    "pcal":{
-        "Charge carriers -- default":{
-            "-flip_cal_data-":False,
-            "-cal_setting-":1,
-            "-dopant_type-":"B",
-            "-num_steps-":5,
-            "-step_distance-":1,
-            "-stretch-":[-5,5],
-            "-fitpoints-":[0,0,0,0],
-            '-scale_cal-':False
-        },
-        "Resistivity -- default":{
-            "-flip_cal_data-":False,
-            "-cal_setting-":2,
-            "-dopant_type-":"B",
-            "-num_steps-":5,
-            "-step_distance-":1,
-            "-stretch-":[-5,5],
-            "-fitpoints-":[0,0,0,0],
-            '-scale_cal-':False
-        },
-    },
-    "pcs1":{
-        "Charge carriers -- default":{
-            "-flip_cal_data-":False,
-            "-cal_setting-":1,
-            "-dopant_type-":"B",
-            "-num_steps-":7,
-            "-step_distance-":0.3,
-            "-stretch-":[0,8],
-            "-fitpoints-":[0,0,0,0,0,0],
-            '-scale_cal-':False
-        },
-        "Resistivity -- default":{
-            "-flip_cal_data-":False,
-            "-cal_setting-":2,
-            "-dopant_type-":"B",
-            "-num_steps-":7,
-            "-step_distance-":0.3,
-            "-stretch-":[0,8],
-            "-fitpoints-":[0,0,0,0,0,0],
-            '-scale_cal-':False
-        },
-     },
-    "npsc2":{
-        "Charge carriers -- default":{
-            "-flip_cal_data-":False,
-            "-cal_setting-":1,
-            "-dopant_type-":"As",
-            "-num_steps-":5,
-            "-step_distance-":0.3,
-            "-stretch-":[0,8],
-            "-fitpoints-":[0,0,0,0,0,0],
-            '-scale_cal-':False
-        },
-
-        "Resistivity -- default":{
-            "-flip_cal_data-":False,
-            "-cal_setting-":2,
-            "-dopant_type-":"As",
-            "-num_steps-":5,
-            "-step_distance-":0.3,
-            "-stretch-":[0,8],
-            "-fitpoints-":[0,0,0,0,0,0],
-            '-scale_cal-':False
-        },
-    
-    },
-    "npsc1":{
-        "Charge carriers -- default":{
-            "-flip_cal_data-":False,
-            "-cal_setting-":1,
-            "-dopant_type-":"As",
-            "-num_steps-":7,
-            "-step_distance-":0.3,
-            "-stretch-":[0,8],
-            "-fitpoints-":[0,0,0,0,0,0],
-            '-scale_cal-':False
-        },
-
-        "Resistivity -- default":{
-            "-flip_cal_data-":False,
-            "-cal_setting-":2,
-            "-dopant_type-":"As",
-            "-num_steps-":7,
-            "-step_distance-":0.3,
-            "-stretch-":[0,8],
-            "-fitpoints-":[0,0,0,0,0,0],
-            '-scale_cal-':False
-        },
-    
-    },
-    "ppsc2":{
-        "Charge carriers -- default":{
-            "-flip_cal_data-":False,
-            "-cal_setting-":1,
-            "-dopant_type-":"B",
-            "-num_steps-":5,
-            "-step_distance-":0.6,
-            "-stretch-":[-5,5],
-            "-fitpoints-":[0,0,0,0,0,0],
-            '-scale_cal-':False
-        },
-        "Resistivity -- default":{
-            "-flip_cal_data-":False,
-            "-cal_setting-":2,
-            "-dopant_type-":"B",
-            "-num_steps-":5,
-            "-step_distance-":0.6,
-            "-stretch-":[-5,5],
-            "-fitpoints-":[0,0,0,0,0,0],
-            '-scale_cal-':False
-        },
-    },
-    "ncal":{
-        "Charge carriers -- default":{
-            "-flip_cal_data-":False,
-            "-cal_setting-":1,
-            "-dopant_type-":"As",
-            "-num_steps-":5,
-            "-step_distance-":1,
-            "-stretch-":[5,12],
-            "-fitpoints-":[0,1,2,2],
-            '-scale_cal-':False
-        },
-        "Resistivity -- default":{
-            "-flip_cal_data-":False,
-            "-cal_setting-":2,
-            "-dopant_type-":"As",
-            "-num_steps-":5,
-            "-step_distance-":1,
-            "-stretch-":[5,12],
-            "-fitpoints-":[0,1,2,2],
-            '-scale_cal-':False
-        },
-
-    },
-    "CS01":{
-        "Charge carriers -- default":{
-            "-flip_cal_data-":False,
-            "-cal_setting-":1,
-            "-dopant_type-":"As",
-            "-num_steps-":5,
-            "-step_distance-":0.2,
-            "-stretch-":[-5,5],
-            "-fitpoints-":[0,0,0,0],
-            '-scale_cal-':False
-        },
-    },
-    "GS":{
-        "Charge carriers -- default":{
-            "-flip_cal_data-":False,
-            "-cal_setting-":1,
-            "-dopant_type-":"As",
-            "-num_steps-":10,
-            "-step_distance-":3.5,
-            "-stretch-":[-5,5],
-            "-fitpoints-":[0,0,0,0],
-            '-scale_cal-':False
-        },
-    },
-    "Own Sample":{
-        "Charge carriers -- default":{
-            "-flip_cal_data-":False,
-            "-cal_setting-":1,
-            "-dopant_type-":"As",
-            "-num_steps-":5,
-            "-step_distance-":1,
-            "-stretch-":[-5,5],
-            "-fitpoints-":[0,0,0,0],
-            '-scale_cal-':False
-         }
-    },
-    
-
-}
+from app.data_io import DataImportError, read_xy, xy_cache
+from app.reference_profiles import data_lib, preset_lib
 
 
 
@@ -5222,44 +116,16 @@ class SelectCalibrationTab:
             QMessageBox.critical(self.main_window, "Error", f"File is not readable: {path_data}")
             return False
 
-        # Preview
-        try:
-            with open(path_data, 'r') as f:
-                lines = f.readlines()[:5]
-                print("File preview (first 5 lines):")
-                for i, line in enumerate(lines):
-                    print(f"Line {i+1}: {line.strip()}")
-        except Exception as e:
-            print(f"Error reading file preview: {str(e)}")
-
         successful_data_import = False
         data = None
 
-        # Try whitespace delimiter first
+        # Sniff delimiter/header and parse once
         try:
-            print("Trying delimiter: auto (whitespace)")
-            data = np.loadtxt(path_data, delimiter=None, skiprows=1, usecols=(0, 1))
+            data = read_xy(path_data, self.G_data_separators, exact_columns=False, cache=xy_cache())
             print(f"Data shape after load: {data.shape}")
-            if len(data.shape) != 2 or data.shape[1] != 2:
-                raise ValueError(f"Expected 2 columns, got shape {data.shape}")
             successful_data_import = True
-        except Exception as e:
-            print(f"Failed with auto delimiter: {str(e)}")
-
-        # Fallback to other delimiters
-        if not successful_data_import:
-            for delim in self.G_data_separators:
-                print(f"Trying delimiter: '{delim}'")
-                try:
-                    data = np.loadtxt(path_data, delimiter=delim, skiprows=1, usecols=(0, 1))
-                    print(f"Data shape after load: {data.shape}")
-                    if len(data.shape) != 2 or data.shape[1] != 2:
-                        raise ValueError(f"Expected 2 columns, got shape {data.shape}")
-                    successful_data_import = True
-                    break
-                except Exception as e:
-                    print(f"Failed with delimiter '{delim}': {str(e)}")
-                    continue
+        except (DataImportError, OSError) as e:
+            print(f"Failed to read calibration data: {str(e)}")
 
         if successful_data_import:
             try:
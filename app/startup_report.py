@@ -0,0 +1,95 @@
+"""Startup timing for `python main.py --startup-report`: per-module import cost and time-to-window."""
+
+import builtins
+import sys
+import time
+
+
+STARTUP_REPORT_FLAG = "--startup-report"
+STARTUP_BUDGET_FLAG = "--startup-budget"  # --startup-budget=SECONDS
+STARTUP_BUDGET_S = 4.0  # time-to-window target on the lab PCs
+REPORT_TOP_MODULES = 25
+
+
+class StartupReport:
+    """Times every first import (through builtins.__import__) and named startup phases.
+
+    Per module, 'total' includes the modules it imports first, 'self' excludes
+    them. Imports of modules that are already loaded cost nothing and are not
+    recorded.
+    """
+
+    def __init__(self, budget_s=STARTUP_BUDGET_S):
+        self.budget_s = budget_s
+        self.start = time.perf_counter()
+        self.modules = {}  # name -> [total s, self s, depth]
+        self.phases = []  # (name, seconds since start)
+        self.stack = []
+        self.original_import = None
+
+    @classmethod
+    def from_argv(cls, argv):
+        """StartupReport installed if argv requests it (flags are removed from argv), else None."""
+        if STARTUP_REPORT_FLAG not in argv:
+            return None
+        budget_s = STARTUP_BUDGET_S
+        for arg in list(argv):
+            if arg.startswith(STARTUP_BUDGET_FLAG + "="):
+                try:
+                    budget_s = float(arg.split("=", 1)[1])
+                except ValueError:
+                    print(f"Warning: invalid {arg}, using the default budget of {STARTUP_BUDGET_S} s")
+                argv.remove(arg)
+        argv.remove(STARTUP_REPORT_FLAG)
+        report = cls(budget_s)
+        report.install()
+        return report
+
+    def install(self):
+        self.original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def uninstall(self):
+        if self.original_import is not None:
+            builtins.__import__ = self.original_import
+            self.original_import = None
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if level or name in sys.modules:
+            return self.original_import(name, globals, locals, fromlist, level)
+        self.stack.append(0.)
+        start = time.perf_counter()
+        try:
+            return self.original_import(name, globals, locals, fromlist, level)
+        finally:
+            total = time.perf_counter() - start
+            children = self.stack.pop()
+            if self.stack:
+                self.stack[-1] += total
+            if name not in self.modules:
+                self.modules[name] = [total, total - children, len(self.stack)]
+
+    def mark(self, phase):
+        """Record that a startup phase ended now."""
+        self.phases.append((phase, time.perf_counter() - self.start))
+
+    def print_report(self, top=REPORT_TOP_MODULES):
+        """Print phases, the slowest imports and the time-to-window against the budget."""
+        self.uninstall()
+        print("PyQt - Startup report")
+        previous = 0.
+        for phase, at in self.phases:
+            print("  %-28s %7.3f s (+%.3f s)" % (phase, at, at - previous))
+            previous = at
+
+        print("  %-40s %9s %9s" % ("first import (by self time)", "self [s]", "total [s]"))
+        ranked = sorted(self.modules.items(), key=lambda item: item[1][1], reverse=True)
+        for name, (total, own, depth) in ranked[:top]:
+            print("  %-40s %9.3f %9.3f" % (name, own, total))
+        top_level = sum(total for total, _, depth in self.modules.values() if depth == 0)
+        print("  %d modules imported, %.3f s in top-level imports" % (len(self.modules), top_level))
+
+        if self.phases:
+            elapsed = self.phases[-1][1]
+            verdict = "within" if elapsed <= self.budget_s else "OVER"
+            print("  time to window %.3f s, %s the budget of %.1f s" % (elapsed, verdict, self.budget_s))
@@ -1,55 +1,38 @@
 import sys
 import os
+import multiprocessing
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))  # Add project root to path
-from PyQt5.QtCore import Qt
-from PyQt5.QtWidgets import QApplication, QMainWindow
-from PyQt5 import uic
-from generated_ui.main_window import Ui_MainWindow
-from app.import_measurement_tab import ImportMeasurementTab
-from app.import_parameters import ImportParametersDialog
-from app.select_calibration_tab import SelectCalibrationTab
-from app.alignment import AlignmentTab
-from app.fitpoints import FitpointsTab
-from app.calibration import CalibrationTab
+# Only the standard library is imported at module level: with the "spawn" start method (Windows)
+# every worker process re-imports this module and must not load PyQt5, matplotlib and the tabs.
 
-class MainApp(QMainWindow):
-    """Main application class coordinating all tabs."""
-    def __init__(self):
-        """Initialize the main window and tab controllers."""
-        super().__init__()
-        self.ui = Ui_MainWindow()
-        self.ui.setupUi(self)
 
-        # Center the window on the screen
-        screen = QApplication.primaryScreen().geometry()
-        size = self.geometry()
-        self.move((screen.width() - size.width()) // 2, (screen.height() - size.height()) // 2)
-
-        # Initialize tab controllers
-        self.import_measurement_tab = ImportMeasurementTab(self.ui, self)
-        self.import_parameters = ImportParametersDialog(self)
-        self.select_calibration_tab = SelectCalibrationTab(self.ui, self)
-        self.alignment_tab = AlignmentTab(self.ui, self)
-        self.fitpoints_tab = FitpointsTab(self.ui, self)
-        self.calibration_tab = CalibrationTab(self.ui, self)
-
-        # Connect calibration start button
-        try:
-            self.ui.calibration_startt_pushButton.clicked.connect(self.calibration_tab.calibration_start)
-            print("PyQt - calibration_startt_pushButton connected")
-        except AttributeError as e:
-            print(f"Error: {e}. Ensure calibration_startt_pushButton exists in UI.")
-            raise SystemExit(1)
-
-        # Initialize UI after all tabs are set
-        self.select_calibration_tab.update_calibration_sample("pcal")
-        
-
-if __name__ == "__main__":
+def main():
     """Entry point for the application."""
+    from app.startup_report import StartupReport
+    startup_report = StartupReport.from_argv(sys.argv)  # python main.py --startup-report [--startup-budget=SECONDS]
+    from PyQt5.QtCore import Qt, QTimer
+    from PyQt5.QtWidgets import QApplication
+    from app.main_app import MainApp
+    from app import calibration_queries, database
+
     # Set high DPI scaling before creating QApplication
     QApplication.setAttribute(Qt.AA_EnableHighDpiScaling)
     app = QApplication(sys.argv)
+    if startup_report:
+        startup_report.mark("imports + QApplication")
     main_window = MainApp()
+    app.aboutToQuit.connect(main_window.alignment_tab.shutdown_fine_pool)
+    app.aboutToQuit.connect(database.shutdown)  # writes or spools queued database documents
     main_window.show()
-    sys.exit(app.exec_())
\ No newline at end of file
+    if startup_report:
+        startup_report.mark("main window built")
+        # Runs once the event loop has painted the window for the first time
+        QTimer.singleShot(0, lambda: (startup_report.mark("window shown"), startup_report.print_report()))
+    QTimer.singleShot(0, calibration_queries.ensure_indexes_in_background)  # database query indexes
+    sys.exit(app.exec_())
+
+
+if __name__ == "__main__":
+    # Needed for the fine-alignment worker processes in frozen (pyinstaller) builds
+    multiprocessing.freeze_support()
+    main()